@@ -312,6 +312,7 @@ class AdminServer(BaseAdminServer):
         async def setup_context(request: web.Request, handler):
             authorization_header = request.headers.get("Authorization")
             profile = self.root_profile
+            acquired = False
 
             # Multitenancy context setup
             if self.multitenant_manager and authorization_header:
@@ -323,34 +324,40 @@ class AdminServer(BaseAdminServer):
                         )
 
                     profile = await self.multitenant_manager.get_profile_for_token(
-                        self.context, token
+                        self.context, token, acquire=True
                     )
+                    acquired = True
                 except MultitenantManagerError as err:
                     raise web.HTTPUnauthorized(err.roll_up)
                 except (jwt.InvalidTokenError, StorageNotFoundError):
                     raise web.HTTPUnauthorized()
 
-            # Create a responder with the request specific context
-            responder = AdminResponder(
-                profile,
-                self.outbound_message_router,
-                self.send_webhook,
-            )
-            profile.context.injector.bind_instance(BaseResponder, responder)
+            # hold the tenant profile open while the request is handled
+            try:
+                # Create a responder with the request specific context
+                responder = AdminResponder(
+                    profile,
+                    self.outbound_message_router,
+                    self.send_webhook,
+                )
+                profile.context.injector.bind_instance(BaseResponder, responder)
 
-            # TODO may dynamically adjust the profile used here according to
-            # headers or other parameters
-            admin_context = AdminRequestContext(profile)
+                # TODO may dynamically adjust the profile used here according to
+                # headers or other parameters
+                admin_context = AdminRequestContext(profile)
 
-            request["context"] = admin_context
-            request["outbound_message_router"] = responder.send
+                request["context"] = admin_context
+                request["outbound_message_router"] = responder.send
 
-            if collector:
-                handler = collector.wrap_coro(handler, [handler.__qualname__])
-            if self.task_queue:
-                task = await self.task_queue.put(handler(request))
-                return await task
-            return await handler(request)
+                if collector:
+                    handler = collector.wrap_coro(handler, [handler.__qualname__])
+                if self.task_queue:
+                    task = await self.task_queue.put(handler(request))
+                    return await task
+                return await handler(request)
+            finally:
+                if acquired:
+                    self.multitenant_manager.release_profile(profile)
 
         middlewares.append(setup_context)
 
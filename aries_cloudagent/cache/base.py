@@ -57,6 +57,11 @@ class BaseCache(ABC):
     async def flush(self):
         """Remove all items from the cache."""
 
+    @property
+    def stats(self) -> dict:
+        """Accessor for cache usage statistics, if tracked by the implementation."""
+        return {}
+
     def acquire(self, key: Text):
         """Acquire a lock on a given cache key."""
         result = CacheKeyLock(self, key)
@@ -0,0 +1,163 @@
+"""Bounded in-memory cache with LRU eviction."""
+
+import heapq
+import sys
+import time
+
+from collections import OrderedDict
+from typing import Any, Mapping, Sequence, Text, Union
+
+from .base import BaseCache
+
+
+def estimate_size(value: Any) -> int:
+    """Approximate the memory footprint of a cached value, in bytes."""
+    size = sys.getsizeof(value)
+    if isinstance(value, Mapping):
+        size += sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(estimate_size(v) for v in value)
+    return size
+
+
+class LRUCache(BaseCache):
+    """
+    In-memory cache bounded by entry count and/or approximate byte size.
+
+    Entries are kept in access order so the least recently used entry can be
+    evicted in constant time. Expiry times are tracked in a min-heap, so only
+    entries which are actually due are inspected when purging expired items.
+    """
+
+    def __init__(self, max_entries: int = None, max_bytes: int = None):
+        """
+        Initialize a `LRUCache` instance.
+
+        Args:
+            max_entries: the maximum number of keys to retain
+            max_bytes: the maximum approximate size of all cached values
+
+        """
+        super().__init__()
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        # looks like { "key": (<expires>, <size>, <value>) }
+        self._cache = OrderedDict()
+        # looks like [ (<expires>, "key"), ... ]
+        self._expiry = []
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @property
+    def size(self) -> int:
+        """Accessor for the approximate size of the cached values."""
+        return self._size
+
+    @property
+    def stats(self) -> dict:
+        """Accessor for the cache hit, miss and eviction counters."""
+        return {
+            "cache_entries": len(self._cache),
+            "cache_bytes": self._size,
+            "cache_hits": self.hits,
+            "cache_misses": self.misses,
+            "cache_evictions": self.evictions,
+            "cache_expirations": self.expirations,
+        }
+
+    def _remove(self, key: Text):
+        """Remove a key from the cache, updating the total size."""
+        entry = self._cache.pop(key, None)
+        if entry:
+            self._size -= entry[1]
+
+    def _remove_expired_cache_items(self):
+        """Remove all expired items from cache."""
+        now = time.perf_counter()
+        while self._expiry and self._expiry[0][0] <= now:
+            expires, key = heapq.heappop(self._expiry)
+            entry = self._cache.get(key)
+            # skip stale heap entries for keys that were reset or removed
+            if entry and entry[0] == expires:
+                self._remove(key)
+                self.expirations += 1
+        if len(self._expiry) > 2 * len(self._cache) + 64:
+            self._expiry = [
+                (entry[0], key)
+                for key, entry in self._cache.items()
+                if entry[0] is not None
+            ]
+            heapq.heapify(self._expiry)
+
+    def _evict(self):
+        """Evict least recently used items until within the configured limits."""
+        while self._cache and (
+            (self.max_entries and len(self._cache) > self.max_entries)
+            or (self.max_bytes and self._size > self.max_bytes)
+        ):
+            key = next(iter(self._cache))
+            self._remove(key)
+            self.evictions += 1
+
+    async def get(self, key: Text):
+        """
+        Get an item from the cache.
+
+        Args:
+            key: the key to retrieve an item for
+
+        Returns:
+            The record found or `None`
+
+        """
+        self._remove_expired_cache_items()
+        entry = self._cache.get(key)
+        if not entry:
+            self.misses += 1
+            return None
+        self._cache.move_to_end(key)
+        self.hits += 1
+        return entry[2]
+
+    async def set(self, keys: Union[Text, Sequence[Text]], value: Any, ttl: int = None):
+        """
+        Add an item to the cache with an optional ttl.
+
+        Overwrites existing cache entries and evicts the least recently used
+        entries when the cache limits are exceeded.
+
+        Args:
+            keys: the key or keys for which to set an item
+            value: the value to store in the cache
+            ttl: number of seconds that the record should persist
+
+        """
+        self._remove_expired_cache_items()
+        expires_ts = time.perf_counter() + ttl if ttl else None
+        size = estimate_size(value) if self.max_bytes else 0
+        for key in [keys] if isinstance(keys, Text) else keys:
+            self._remove(key)
+            self._cache[key] = (expires_ts, size, value)
+            self._size += size
+            if expires_ts is not None:
+                heapq.heappush(self._expiry, (expires_ts, key))
+        self._evict()
+
+    async def clear(self, key: Text):
+        """
+        Remove an item from the cache, if present.
+
+        Args:
+            key: the key to remove
+
+        """
+        self._remove(key)
+
+    async def flush(self):
+        """Remove all items from the cache."""
+        self._cache = OrderedDict()
+        self._expiry = []
+        self._size = 0
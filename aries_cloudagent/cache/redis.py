@@ -0,0 +1,404 @@
+"""Shared cache implementation speaking the Redis wire protocol."""
+
+import asyncio
+import json
+import logging
+import ssl
+import time
+
+from typing import Any, List, Optional, Sequence, Text, Tuple, Union
+from urllib.parse import unquote, urlparse
+from uuid import uuid4
+
+from .base import BaseCache, CacheError, CacheKeyLock
+
+LOGGER = logging.getLogger(__name__)
+
+
+class RedisProtocolError(CacheError):
+    """Error raised for invalid or error replies from the cache server."""
+
+
+class RedisConnection:
+    """A single connection to the cache server."""
+
+    def __init__(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, timeout: float
+    ):
+        """Initialize a `RedisConnection` instance."""
+        self.reader = reader
+        self.writer = writer
+        self.timeout = timeout
+
+    @property
+    def closed(self) -> bool:
+        """Accessor for the connection state."""
+        return self.writer.is_closing()
+
+    def close(self):
+        """Close the connection."""
+        self.writer.close()
+
+    async def _read_reply(self):
+        """Read and decode a single reply from the server."""
+        line = await self.reader.readline()
+        if not line.endswith(b"\r\n"):
+            raise ConnectionError("Connection closed by cache server")
+        prefix, body = line[:1], line[1:-2]
+        if prefix == b"+":
+            return body.decode("utf-8")
+        if prefix == b"-":
+            return RedisProtocolError(body.decode("utf-8"))
+        if prefix == b":":
+            return int(body)
+        if prefix == b"$":
+            length = int(body)
+            if length < 0:
+                return None
+            data = await self.reader.readexactly(length + 2)
+            return data[:-2]
+        if prefix == b"*":
+            length = int(body)
+            if length < 0:
+                return None
+            return [await self._read_reply() for _ in range(length)]
+        raise RedisProtocolError(f"Unexpected reply from cache server: {line!r}")
+
+    async def request(self, *args):
+        """
+        Send a command and read the reply.
+
+        Error replies are returned rather than raised, as they leave the
+        connection usable.
+        """
+        self.writer.write(RedisClient.encode_command(*args))
+        await self.writer.drain()
+        return await asyncio.wait_for(self._read_reply(), self.timeout)
+
+
+class RedisClient:
+    """
+    Minimal asyncio client for the Redis serialization protocol (RESP).
+
+    Commands are executed on a pool of connections, so that concurrent
+    callers do not wait for each other's round trips to the server.
+    """
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 6379,
+        db: int = 0,
+        password: str = None,
+        use_tls: bool = False,
+        timeout: float = 10.0,
+        max_connections: int = 10,
+    ):
+        """Initialize a `RedisClient` instance."""
+        self.host = host
+        self.port = port
+        self.db = db
+        self.password = password
+        self.use_tls = use_tls
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self._idle: List[RedisConnection] = []
+        self._slots: asyncio.Semaphore = None
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs) -> "RedisClient":
+        """Create a client from a `redis://[:password@]host[:port][/db]` URL."""
+        parsed = urlparse(url)
+        if parsed.scheme not in ("redis", "rediss"):
+            raise CacheError(f"Unsupported cache URL scheme: {parsed.scheme}")
+        path = parsed.path.strip("/")
+        return cls(
+            host=parsed.hostname or "localhost",
+            port=parsed.port or 6379,
+            db=int(path) if path else 0,
+            password=unquote(parsed.password) if parsed.password else None,
+            use_tls=(parsed.scheme == "rediss"),
+            **kwargs,
+        )
+
+    @property
+    def idle_connections(self) -> int:
+        """Accessor for the number of open connections not currently in use."""
+        return len(self._idle)
+
+    async def _connect(self) -> RedisConnection:
+        """Open a connection and perform authentication and db selection."""
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(
+                self.host,
+                self.port,
+                ssl=ssl.create_default_context() if self.use_tls else None,
+            ),
+            self.timeout,
+        )
+        conn = RedisConnection(reader, writer, self.timeout)
+        commands = []
+        if self.password:
+            commands.append(("AUTH", self.password))
+        if self.db:
+            commands.append(("SELECT", self.db))
+        try:
+            for command in commands:
+                reply = await conn.request(*command)
+                if isinstance(reply, RedisProtocolError):
+                    raise reply
+        except BaseException:
+            conn.close()
+            raise
+        return conn
+
+    def _take_idle(self) -> Optional[RedisConnection]:
+        """Take an open connection from the pool, if any."""
+        while self._idle:
+            conn = self._idle.pop()
+            if not conn.closed:
+                return conn
+        return None
+
+    async def close(self):
+        """Close the idle connections to the server."""
+        while self._idle:
+            self._idle.pop().close()
+
+    @staticmethod
+    def encode_command(*args) -> bytes:
+        """Encode a command as a RESP array of bulk strings."""
+        parts = [b"*%d\r\n" % len(args)]
+        for arg in args:
+            if isinstance(arg, str):
+                arg = arg.encode("utf-8")
+            elif not isinstance(arg, bytes):
+                arg = str(arg).encode("utf-8")
+            parts.append(b"$%d\r\n%s\r\n" % (len(arg), arg))
+        return b"".join(parts)
+
+    async def execute(self, *args):
+        """Execute a command on a pooled connection, reconnecting once if lost."""
+        if not self._slots:
+            self._slots = asyncio.Semaphore(self.max_connections)
+        async with self._slots:
+            for attempt in (1, 2):
+                # an idle connection may have been dropped by the server
+                conn = self._take_idle() if attempt == 1 else None
+                try:
+                    if not conn:
+                        conn = await self._connect()
+                    reply = await conn.request(*args)
+                except (ConnectionError, OSError, asyncio.IncompleteReadError) as err:
+                    if conn:
+                        conn.close()
+                    if attempt == 2:
+                        raise CacheError(
+                            "Error communicating with cache server"
+                        ) from err
+                    continue
+                except asyncio.TimeoutError as err:
+                    if conn:
+                        conn.close()
+                    raise CacheError("Timed out waiting for cache server") from err
+                except BaseException:
+                    # the reply may still be pending on this connection
+                    if conn:
+                        conn.close()
+                    raise
+                self._idle.append(conn)
+                if isinstance(reply, RedisProtocolError):
+                    raise reply
+                return reply
+
+
+class RedisCacheKeyLock(CacheKeyLock):
+    """
+    A cache key lock shared between processes.
+
+    Waiters in the same process are coordinated through the parent lock as
+    usual; across processes a server-side lock key ensures that only one
+    instance produces the value while the others wait for it to be cached.
+    """
+
+    def __init__(self, cache: "RedisCache", key: Text):
+        """Initialize the key lock."""
+        super().__init__(cache, key)
+        self._lock_token: str = None
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        await super().__aenter__()
+        if not self.done:
+            token, found = await self.cache.acquire_remote(self.key)
+            if token:
+                self._lock_token = token
+            elif found is not None:
+                self._future.set_result(found)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit, releasing the shared lock key."""
+        await super().__aexit__(exc_type, exc_val, exc_tb)
+        if self._lock_token:
+            token, self._lock_token = self._lock_token, None
+            await self.cache.release_remote(self.key, token)
+
+
+class RedisCache(BaseCache):
+    """
+    Cache shared between agent instances through a Redis-compatible server.
+
+    Values are stored as JSON, so only JSON-compatible values may be cached:
+    tuples are returned as lists, and other values are rejected by `set`.
+    """
+
+    # delete the lock key only if it still holds the caller's token
+    RELEASE_SCRIPT = (
+        'if redis.call("GET", KEYS[1]) == ARGV[1] then '
+        'return redis.call("DEL", KEYS[1]) else return 0 end'
+    )
+
+    def __init__(
+        self,
+        client: RedisClient,
+        prefix: str = "acapy:",
+        lock_ttl: float = 30.0,
+        lock_poll_interval: float = 0.05,
+    ):
+        """
+        Initialize a `RedisCache` instance.
+
+        Args:
+            client: the client connection to use
+            prefix: the prefix applied to all cache keys
+            lock_ttl: number of seconds a producer may hold a key lock
+            lock_poll_interval: seconds between checks while waiting on a lock
+
+        """
+        super().__init__()
+        self.client = client
+        self.prefix = prefix
+        self.lock_ttl = lock_ttl
+        self.lock_poll_interval = lock_poll_interval
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def stats(self) -> dict:
+        """Accessor for the cache hit and miss counters."""
+        return {"cache_hits": self.hits, "cache_misses": self.misses}
+
+    def _key(self, key: Text) -> str:
+        return self.prefix + key
+
+    def _lock_key(self, key: Text) -> str:
+        return self.prefix + "lock:" + key
+
+    async def get(self, key: Text):
+        """
+        Get an item from the cache.
+
+        Args:
+            key: the key to retrieve an item for
+
+        Returns:
+            The record found or `None`
+
+        """
+        value = await self.client.execute("GET", self._key(key))
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(value)
+
+    async def set(self, keys: Union[Text, Sequence[Text]], value: Any, ttl: int = None):
+        """
+        Add an item to the cache with an optional ttl.
+
+        Overwrites existing cache entries.
+
+        Args:
+            keys: the key or keys for which to set an item
+            value: the value to store in the cache
+            ttl: number of seconds that the record should persist
+
+        Raises:
+            CacheError: If the value cannot be encoded as JSON
+
+        """
+        try:
+            data = json.dumps(value)
+        except (TypeError, ValueError) as err:
+            raise CacheError("Value cannot be stored in the shared cache") from err
+        for key in [keys] if isinstance(keys, Text) else keys:
+            if ttl:
+                await self.client.execute(
+                    "SET", self._key(key), data, "PX", max(int(ttl * 1000), 1)
+                )
+            else:
+                await self.client.execute("SET", self._key(key), data)
+
+    async def clear(self, key: Text):
+        """
+        Remove an item from the cache, if present.
+
+        Args:
+            key: the key to remove
+
+        """
+        await self.client.execute("DEL", self._key(key))
+
+    async def flush(self):
+        """Remove all items with this cache's prefix from the cache."""
+        cursor = b"0"
+        while True:
+            cursor, keys = await self.client.execute(
+                "SCAN", cursor, "MATCH", self.prefix + "*", "COUNT", 1000
+            )
+            if keys:
+                await self.client.execute("DEL", *keys)
+            if cursor in (b"0", 0):
+                break
+
+    def acquire(self, key: Text):
+        """Acquire a lock on a given cache key."""
+        result = RedisCacheKeyLock(self, key)
+        first = self._key_locks.setdefault(key, result)
+        if first is not result:
+            result.parent = first
+        return result
+
+    async def acquire_remote(self, key: Text) -> Tuple[str, Any]:
+        """
+        Acquire the shared lock for a key, or wait for another producer.
+
+        Returns:
+            A tuple of the lock token if the lock was acquired, and the value
+            produced by another instance while waiting. Both are `None` if
+            the lock could not be obtained before it expired
+
+        """
+        token = uuid4().hex
+        lock_key = self._lock_key(key)
+        deadline = time.perf_counter() + self.lock_ttl
+        while True:
+            if await self.client.execute(
+                "SET", lock_key, token, "NX", "PX", int(self.lock_ttl * 1000)
+            ):
+                return token, None
+            await asyncio.sleep(self.lock_poll_interval)
+            value = await self.client.execute("GET", self._key(key))
+            if value is not None:
+                self.hits += 1
+                return None, json.loads(value)
+            if time.perf_counter() >= deadline:
+                LOGGER.warning("Timed out waiting for shared cache lock: %s", key)
+                return None, None
+
+    async def release_remote(self, key: Text, token: str):
+        """Release the shared lock for a key if it is still held by this token."""
+        await self.client.execute(
+            "EVAL", self.RELEASE_SCRIPT, 1, self._lock_key(key), token
+        )
@@ -0,0 +1,113 @@
+from asyncio import sleep
+import pytest
+
+from ..lru import LRUCache, estimate_size
+
+
+@pytest.fixture()
+async def cache():
+    cache = LRUCache(max_entries=3)
+    await cache.set("valid key", "value")
+    return cache
+
+
+class TestLRUCache:
+    @pytest.mark.asyncio
+    async def test_get_none(self, cache):
+        item = await cache.get("doesn't exist")
+        assert item is None
+        assert cache.misses == 1
+
+    @pytest.mark.asyncio
+    async def test_get_valid(self, cache):
+        item = await cache.get("valid key")
+        assert item == "value"
+        assert cache.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_set_multi(self, cache):
+        await cache.set([f"key{i}" for i in range(2)], {"dictkey": "dval"})
+        for key in [f"key{i}" for i in range(2)]:
+            assert await cache.get(key) == {"dictkey": "dval"}
+
+    @pytest.mark.asyncio
+    async def test_evict_lru(self, cache):
+        await cache.set("key1", "one")
+        await cache.set("key2", "two")
+        assert await cache.get("valid key") == "value"  # now most recently used
+        await cache.set("key3", "three")
+
+        assert await cache.get("key1") is None
+        assert await cache.get("valid key") == "value"
+        assert await cache.get("key3") == "three"
+        assert cache.evictions == 1
+        assert len(cache._cache) == 3
+
+    @pytest.mark.asyncio
+    async def test_evict_max_bytes(self):
+        cache = LRUCache(max_bytes=2 * estimate_size("x" * 100))
+        for i in range(3):
+            await cache.set(f"key{i}", "x" * 100)
+        assert await cache.get("key0") is None
+        assert await cache.get("key2") is not None
+        assert cache.size <= cache.max_bytes
+        assert cache.evictions == 1
+
+    @pytest.mark.asyncio
+    async def test_set_expires(self, cache):
+        await cache.set("key", {"dictkey": "dval"}, 0.05)
+        assert await cache.get("key") == {"dictkey": "dval"}
+
+        await sleep(0.05)
+
+        assert await cache.get("key") is None
+        assert cache.expirations == 1
+
+    @pytest.mark.asyncio
+    async def test_reset_expires(self, cache):
+        await cache.set("key", "value", 0.05)
+        await cache.set("key", "value")
+
+        await sleep(0.05)
+
+        assert await cache.get("key") == "value"
+        assert cache.expirations == 0
+
+    @pytest.mark.asyncio
+    async def test_expiry_heap_compacted(self):
+        cache = LRUCache(max_entries=2)
+        for i in range(200):
+            await cache.set("key", i, 60)
+        assert len(cache._expiry) <= 2 * len(cache._cache) + 64 + 1
+        assert await cache.get("key") == 199
+
+    @pytest.mark.asyncio
+    async def test_clear_flush(self, cache):
+        await cache.set("key", "value")
+        await cache.clear("key")
+        assert await cache.get("key") is None
+        await cache.flush()
+        assert await cache.get("valid key") is None
+        assert cache.size == 0
+
+    @pytest.mark.asyncio
+    async def test_stats(self, cache):
+        await cache.get("valid key")
+        await cache.get("missing")
+        stats = cache.stats
+        assert stats["cache_entries"] == 1
+        assert stats["cache_hits"] == 1
+        assert stats["cache_misses"] == 1
+        assert stats["cache_evictions"] == 0
+
+    @pytest.mark.asyncio
+    async def test_acquire_release_with_waiter(self, cache):
+        test_key = "test_key"
+        lock = cache.acquire(test_key)
+        await lock.__aenter__()
+        lock2 = cache.acquire(test_key)
+        assert lock2.parent is lock
+        await lock.set_result("test_result")
+        await lock.__aexit__(None, None, None)
+        assert await cache.get(test_key) == "test_result"
+        assert await lock2 == "test_result"
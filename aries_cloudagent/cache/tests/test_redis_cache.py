@@ -0,0 +1,241 @@
+import asyncio
+import fnmatch
+import time
+
+import pytest
+
+from ..base import CacheError
+from ..redis import RedisCache, RedisClient, RedisProtocolError
+
+
+class FakeRedisServer:
+    """Minimal in-process server answering a subset of Redis commands."""
+
+    def __init__(self):
+        self.data = {}
+        self.server = None
+        self.port = None
+        self.commands = []
+        self.connections = 0
+        self.writers = set()
+        self.delay = 0
+
+    async def start(self):
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    def _get(self, key):
+        entry = self.data.get(key)
+        if entry and entry[1] is not None and entry[1] <= time.time():
+            del self.data[key]
+            entry = None
+        return entry[0] if entry else None
+
+    @staticmethod
+    def _bulk(value):
+        if value is None:
+            return b"$-1\r\n"
+        return b"$%d\r\n%s\r\n" % (len(value), value)
+
+    async def handle(self, reader, writer):
+        self.connections += 1
+        self.writers.add(writer)
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                args = []
+                for _ in range(int(line[1:-2])):
+                    length = int((await reader.readline())[1:-2])
+                    args.append((await reader.readexactly(length + 2))[:-2])
+                if self.delay:
+                    await asyncio.sleep(self.delay)
+                writer.write(self.dispatch(args))
+                await writer.drain()
+        finally:
+            self.writers.discard(writer)
+            writer.close()
+
+    def dispatch(self, args):
+        cmd = args[0].upper().decode()
+        self.commands.append(cmd)
+        if cmd in ("PING", "SELECT", "AUTH"):
+            return b"+OK\r\n"
+        if cmd == "GET":
+            return self._bulk(self._get(args[1]))
+        if cmd == "SET":
+            key, value, opts = args[1], args[2], [a.upper() for a in args[3:]]
+            expires = None
+            if b"PX" in opts:
+                expires = time.time() + int(opts[opts.index(b"PX") + 1]) / 1000
+            if b"NX" in opts and self._get(key) is not None:
+                return b"$-1\r\n"
+            self.data[key] = (value, expires)
+            return b"+OK\r\n"
+        if cmd == "DEL":
+            count = sum(1 for key in args[1:] if self.data.pop(key, None))
+            return b":%d\r\n" % count
+        if cmd == "EVAL":
+            # only the compare-and-delete lock release script is supported
+            key, token = args[3], args[4]
+            if self._get(key) != token:
+                return b":0\r\n"
+            del self.data[key]
+            return b":1\r\n"
+        if cmd == "SCAN":
+            pattern = args[args.index(b"MATCH") + 1].decode()
+            keys = [k for k in self.data if fnmatch.fnmatch(k.decode(), pattern)]
+            return b"*2\r\n$1\r\n0\r\n*%d\r\n%s" % (
+                len(keys),
+                b"".join(self._bulk(k) for k in keys),
+            )
+        return b"-ERR unknown command\r\n"
+
+
+@pytest.fixture()
+async def server():
+    server = FakeRedisServer()
+    await server.start()
+    yield server
+    await server.stop()
+
+
+@pytest.fixture()
+async def cache(server):
+    cache = RedisCache(
+        RedisClient(port=server.port), lock_ttl=1.0, lock_poll_interval=0.01
+    )
+    yield cache
+    await cache.client.close()
+
+
+class TestRedisCache:
+    def test_from_url(self):
+        client = RedisClient.from_url("rediss://:s%40cret@cache.local:6380/2")
+        assert client.host == "cache.local"
+        assert client.port == 6380
+        assert client.db == 2
+        assert client.password == "s@cret"
+        assert client.use_tls
+
+        with pytest.raises(CacheError):
+            RedisClient.from_url("http://localhost")
+
+    @pytest.mark.asyncio
+    async def test_get_set(self, cache):
+        assert await cache.get("key") is None
+        await cache.set(["key", "key2"], {"dictkey": "dval"})
+        assert await cache.get("key") == {"dictkey": "dval"}
+        assert await cache.get("key2") == {"dictkey": "dval"}
+        assert cache.stats == {"cache_hits": 2, "cache_misses": 1}
+
+    @pytest.mark.asyncio
+    async def test_set_not_json(self, cache):
+        with pytest.raises(CacheError):
+            await cache.set("key", {"value": object()})
+        await cache.set("key", {"value": (1, 2)})
+        assert await cache.get("key") == {"value": [1, 2]}
+
+    @pytest.mark.asyncio
+    async def test_set_expires(self, cache):
+        await cache.set("key", "value", 0.05)
+        assert await cache.get("key") == "value"
+        await asyncio.sleep(0.06)
+        assert await cache.get("key") is None
+
+    @pytest.mark.asyncio
+    async def test_clear_flush(self, cache, server):
+        server.data[b"other"] = (b"1", None)
+        await cache.set("key", "value")
+        await cache.set("key2", "value")
+        await cache.clear("key")
+        assert await cache.get("key") is None
+        await cache.flush()
+        assert await cache.get("key2") is None
+        assert b"other" in server.data
+
+    @pytest.mark.asyncio
+    async def test_error_reply(self, cache):
+        with pytest.raises(RedisProtocolError):
+            await cache.client.execute("UNKNOWN")
+
+    @pytest.mark.asyncio
+    async def test_reconnect(self, cache, server):
+        await cache.set("key", "value")
+        assert cache.client.idle_connections == 1
+        for writer in list(server.writers):
+            writer.close()
+        await asyncio.sleep(0.01)
+        assert await cache.get("key") == "value"
+        assert server.connections == 2
+
+    @pytest.mark.asyncio
+    async def test_connection_pool(self, server):
+        client = RedisClient(port=server.port, max_connections=3)
+        server.delay = 0.02
+        await asyncio.gather(*(client.execute("PING") for _ in range(6)))
+        assert server.connections == 3
+        assert client.idle_connections == 3
+        await client.execute("PING")
+        assert server.connections == 3
+        await client.close()
+        assert client.idle_connections == 0
+
+    @pytest.mark.asyncio
+    async def test_error_reply_keeps_connection(self, cache, server):
+        await cache.set("key", "value")
+        with pytest.raises(RedisProtocolError):
+            await cache.client.execute("UNKNOWN")
+        assert await cache.get("key") == "value"
+        assert server.connections == 1
+
+    @pytest.mark.asyncio
+    async def test_connection_error(self):
+        cache = RedisCache(RedisClient(port=1, timeout=1.0))
+        with pytest.raises(CacheError):
+            await cache.get("key")
+
+    @pytest.mark.asyncio
+    async def test_acquire_shared(self, cache, server):
+        other = RedisCache(
+            RedisClient(port=server.port), lock_ttl=1.0, lock_poll_interval=0.01
+        )
+        produced = []
+
+        async def produce(instance):
+            async with instance.acquire("key") as entry:
+                if not entry.result:
+                    await asyncio.sleep(0.05)
+                    produced.append(instance)
+                    await entry.set_result("value", 10)
+                return entry.result
+
+        results = await asyncio.gather(produce(cache), produce(other))
+        assert results == ["value", "value"]
+        assert len(produced) == 1
+        assert not [k for k in server.data if b"lock:" in k]
+        await other.client.close()
+
+    @pytest.mark.asyncio
+    async def test_acquire_lock_timeout(self, cache, server):
+        server.data[b"acapy:lock:key"] = (b"token", None)
+        cache.lock_ttl = 0.05
+        async with cache.acquire("key") as entry:
+            assert not entry.done
+            await entry.set_result("value")
+        assert await cache.get("key") == "value"
+        assert server.data[b"acapy:lock:key"][0] == b"token"
+
+    @pytest.mark.asyncio
+    async def test_release_remote(self, cache, server):
+        server.data[b"acapy:lock:key"] = (b"token", None)
+        await cache.release_remote("key", "other")
+        assert server.data[b"acapy:lock:key"][0] == b"token"
+        await cache.release_remote("key", "token")
+        assert b"acapy:lock:key" not in server.data
+        assert "GET" not in server.commands
@@ -7,7 +7,7 @@ from configargparse import ArgumentParser, Namespace, YAMLConfigFileParser
 from typing import Type
 
 from .error import ArgsParseError
-from .util import ByteSize
+from .util import ByteSize, PositiveInt
 from ..utils.tracing import trace_event
 
 CAT_PROVISION = "general"
@@ -479,6 +479,76 @@ class GeneralGroup(ArgumentGroup):
             help="Sets the base url of the tails server for upload, defaulting to the\
             tails server base url.",
         )
+        parser.add_argument(
+            "--rev-reg-standby-count",
+            type=PositiveInt(),
+            metavar="<count>",
+            env_var="ACAPY_REV_REG_STANDBY_COUNT",
+            help="Set the number of posted revocation registries held ready for\
+            each credential definition besides the active one, so that issuance\
+            can move to a new registry without waiting on the ledger. Default: 1.",
+        )
+        parser.add_argument(
+            "--rev-reg-standby-threshold",
+            type=float,
+            metavar="<fraction>",
+            env_var="ACAPY_REV_REG_STANDBY_THRESHOLD",
+            help="Set the fill level of the active revocation registry, between\
+            0 and 1, at which standby registries are provisioned. Default: 0.8.",
+        )
+        parser.add_argument(
+            "--revocation-batch-interval",
+            type=float,
+            metavar="<seconds>",
+            env_var="ACAPY_REVOCATION_BATCH_INTERVAL",
+            help="Hold credential revocations in memory for up to this many seconds\
+            and publish those requested together, as a single entry for each\
+            revocation registry. Default: disabled, each revocation is saved and\
+            published as it is requested.",
+        )
+        parser.add_argument(
+            "--revocation-batch-size",
+            type=PositiveInt(),
+            metavar="<count>",
+            env_var="ACAPY_REVOCATION_BATCH_SIZE",
+            help="Save and publish held revocations against a revocation registry\
+            early once this many are held. Implies --revocation-batch-interval.\
+            Default: 1000.",
+        )
+        parser.add_argument(
+            "--cache-max-entries",
+            type=PositiveInt(),
+            metavar="<count>",
+            env_var="ACAPY_CACHE_MAX_ENTRIES",
+            help="Limit the number of entries held in the shared in-memory cache,\
+            evicting the least recently used entries first. Default: unlimited.",
+        )
+        parser.add_argument(
+            "--cache-max-bytes",
+            type=ByteSize(min_size=1024),
+            metavar="<size>",
+            env_var="ACAPY_CACHE_MAX_BYTES",
+            help="Limit the approximate size in bytes of the values held in the\
+            shared in-memory cache, evicting the least recently used entries first.\
+            Default: unlimited.",
+        )
+        parser.add_argument(
+            "--cache-url",
+            type=str,
+            metavar="<redis-url>",
+            env_var="ACAPY_CACHE_URL",
+            help="Use a Redis-compatible server as the shared cache, for example\
+            'redis://:password@localhost:6379/0'. Agent instances sharing the same\
+            server and prefix share cached connection and ledger lookups.",
+        )
+        parser.add_argument(
+            "--cache-prefix",
+            type=str,
+            metavar="<prefix>",
+            env_var="ACAPY_CACHE_PREFIX",
+            help="Prefix applied to all keys in the shared cache server.\
+            Default: 'acapy:'.",
+        )
 
     def get_settings(self, args: Namespace) -> dict:
         """Extract general settings."""
@@ -503,6 +573,26 @@ class GeneralGroup(ArgumentGroup):
             settings["tails_server_upload_url"] = args.tails_server_base_url
         if args.tails_server_upload_url:
             settings["tails_server_upload_url"] = args.tails_server_upload_url
+        if args.rev_reg_standby_count:
+            settings["revocation.standby_count"] = args.rev_reg_standby_count
+        if args.rev_reg_standby_threshold:
+            if not 0 < args.rev_reg_standby_threshold <= 1:
+                raise ArgsParseError(
+                    "Parameter --rev-reg-standby-threshold must be between 0 and 1"
+                )
+            settings["revocation.standby_threshold"] = args.rev_reg_standby_threshold
+        if args.revocation_batch_interval:
+            settings["revocation.batch_interval"] = args.revocation_batch_interval
+        if args.revocation_batch_size:
+            settings["revocation.batch_size"] = args.revocation_batch_size
+        if args.cache_max_entries:
+            settings["cache.max_entries"] = args.cache_max_entries
+        if args.cache_max_bytes:
+            settings["cache.max_bytes"] = args.cache_max_bytes
+        if args.cache_url:
+            settings["cache.url"] = args.cache_url
+        if args.cache_prefix:
+            settings["cache.prefix"] = args.cache_prefix
         return settings
 
 
@@ -879,6 +969,26 @@ class TransportGroup(ArgumentGroup):
             to hold messages for delivery to agents without an endpoint. This\
             option will require additional memory to store messages in the queue.",
         )
+        parser.add_argument(
+            "--undelivered-queue-path",
+            type=str,
+            metavar="<path>",
+            env_var="ACAPY_UNDELIVERED_QUEUE_PATH",
+            help="Persist the undelivered queue in a SQLite database at this\
+            path, so that held messages survive an agent restart. Only encoded\
+            messages are stored, along with their recipient keys and endpoints,\
+            in a file readable by the agent user only. Messages which are not\
+            encoded yet are held in memory. Requires --enable-undelivered-queue.",
+        )
+        parser.add_argument(
+            "--undelivered-queue-max-per-key",
+            type=PositiveInt(),
+            metavar="<count>",
+            env_var="ACAPY_UNDELIVERED_QUEUE_MAX_PER_KEY",
+            help="Set the maximum number of undelivered messages held for a\
+            single recipient key. Once reached, the oldest message for the key\
+            is dropped. Default: no limit.",
+        )
         parser.add_argument(
             "--max-outbound-retry",
             default=4,
@@ -888,6 +998,59 @@ class TransportGroup(ArgumentGroup):
             messages. Increasing this number might cause to increase the\
             accumulated messages in message queue. Default value is 4.",
         )
+        parser.add_argument(
+            "--outbound-max-per-endpoint",
+            type=PositiveInt(),
+            metavar="<count>",
+            env_var="ACAPY_OUTBOUND_MAX_PER_ENDPOINT",
+            help="Set the maximum number of concurrent outbound connections\
+            to a single endpoint. Default: 50 for HTTP, 10 for websockets.",
+        )
+        parser.add_argument(
+            "--outbound-keepalive",
+            type=float,
+            metavar="<seconds>",
+            env_var="ACAPY_OUTBOUND_KEEPALIVE",
+            help="Set the number of seconds an idle outbound HTTP or websocket\
+            connection is kept open for reuse. Default: 15 for HTTP, 30 for\
+            websockets.",
+        )
+        parser.add_argument(
+            "--outbound-queue-path",
+            type=str,
+            metavar="<path>",
+            env_var="ACAPY_OUTBOUND_QUEUE_PATH",
+            help="Persist encoded outbound messages awaiting delivery or retry\
+            in a SQLite database at this path, so that they are delivered after\
+            the agent restarts. The file is readable by the agent user only.",
+        )
+        parser.add_argument(
+            "--outbound-queue-max",
+            type=PositiveInt(),
+            metavar="<count>",
+            env_var="ACAPY_OUTBOUND_QUEUE_MAX",
+            help="Set the maximum number of outbound messages held for delivery.\
+            Once reached, new outbound messages wait until deliveries complete.\
+            Default: no limit.",
+        )
+        parser.add_argument(
+            "--crypto-executor",
+            type=str,
+            choices=("thread", "process"),
+            metavar="<mode>",
+            env_var="ACAPY_CRYPTO_EXECUTOR",
+            help="Run message pack and unpack cryptography for the in-memory\
+            wallet in a pool of worker threads or processes instead of the\
+            default executor. One of 'thread' or 'process'.",
+        )
+        parser.add_argument(
+            "--crypto-workers",
+            type=PositiveInt(),
+            metavar="<count>",
+            env_var="ACAPY_CRYPTO_WORKERS",
+            help="Set the number of workers used by --crypto-executor.\
+            Default: the number of CPU cores.",
+        )
 
     def get_settings(self, args: Namespace):
         """Extract transport settings."""
@@ -901,6 +1064,12 @@ class TransportGroup(ArgumentGroup):
         else:
             raise ArgsParseError("-ot/--outbound-transport is required")
         settings["transport.enable_undelivered_queue"] = args.enable_undelivered_queue
+        if args.undelivered_queue_path:
+            settings["transport.undelivered_queue_path"] = args.undelivered_queue_path
+        if args.undelivered_queue_max_per_key:
+            settings[
+                "transport.undelivered_queue_max_per_key"
+            ] = args.undelivered_queue_max_per_key
 
         if args.label:
             settings["default_label"] = args.label
@@ -910,6 +1079,20 @@ class TransportGroup(ArgumentGroup):
             settings["transport.max_message_size"] = args.max_message_size
         if args.max_outbound_retry:
             settings["transport.max_outbound_retry"] = args.max_outbound_retry
+        if args.outbound_max_per_endpoint:
+            settings["transport.outbound_max_per_endpoint"] = (
+                args.outbound_max_per_endpoint
+            )
+        if args.outbound_keepalive:
+            settings["transport.outbound_keepalive"] = args.outbound_keepalive
+        if args.outbound_queue_path:
+            settings["transport.outbound_queue_path"] = args.outbound_queue_path
+        if args.outbound_queue_max:
+            settings["transport.outbound_queue_max"] = args.outbound_queue_max
+        if args.crypto_executor:
+            settings["crypto.executor"] = args.crypto_executor
+        if args.crypto_workers:
+            settings["crypto.workers"] = args.crypto_workers
 
         return settings
 
@@ -1158,6 +1341,24 @@ class MultitenantGroup(ArgumentGroup):
             env_var="ACAPY_MULTITENANT_ADMIN",
             help="Specify whether to enable the multitenant admin api.",
         )
+        parser.add_argument(
+            "--multitenant-max-profiles",
+            type=PositiveInt(),
+            metavar="<count>",
+            env_var="ACAPY_MULTITENANT_MAX_PROFILES",
+            help="Set the maximum number of subwallet profiles kept open. The least\
+            recently used subwallets not currently in use are closed once the limit\
+            is exceeded. Default: 100.",
+        )
+        parser.add_argument(
+            "--multitenant-profile-idle-timeout",
+            type=float,
+            metavar="<seconds>",
+            env_var="ACAPY_MULTITENANT_PROFILE_IDLE_TIMEOUT",
+            help="Close subwallet profiles which have not been used for this number\
+            of seconds. Default: subwallet profiles are only closed to stay within\
+            --multitenant-max-profiles.",
+        )
 
     def get_settings(self, args: Namespace):
         """Extract multitenant settings."""
@@ -1174,4 +1375,10 @@ class MultitenantGroup(ArgumentGroup):
 
             if args.multitenant_admin:
                 settings["multitenant.admin_enabled"] = True
+            if args.multitenant_max_profiles:
+                settings["multitenant.max_profiles"] = args.multitenant_max_profiles
+            if args.multitenant_profile_idle_timeout:
+                settings[
+                    "multitenant.profile_idle_timeout"
+                ] = args.multitenant_profile_idle_timeout
         return settings
@@ -6,6 +6,8 @@ from .provider import CachedProvider, ClassProvider
 
 from ..cache.base import BaseCache
 from ..cache.in_memory import InMemoryCache
+from ..cache.lru import LRUCache
+from ..cache.redis import RedisCache, RedisClient
 from ..core.plugin_registry import PluginRegistry
 from ..core.profile import ProfileManager, ProfileManagerProvider
 from ..core.protocol_registry import ProtocolRegistry
@@ -17,9 +19,15 @@ from ..protocols.actionmenu.v1_0.driver_service import DriverMenuService
 from ..protocols.didcomm_prefix import DIDCommPrefix
 from ..protocols.introduction.v0_1.base_service import BaseIntroductionService
 from ..protocols.introduction.v0_1.demo_service import DemoIntroductionService
+from ..protocols.routing.v1_0.route_table import RouteTable
+from ..revocation.provisioner import RevRegProvisioner
+from ..revocation.scheduler import RevocationScheduler
 
+from ..transport.outbound.queue.base import BaseOutboundQueueStore
+from ..transport.outbound.queue.sqlite import SqliteOutboundQueueStore
 from ..transport.wire_format import BaseWireFormat
 from ..utils.stats import Collector
+from ..wallet.crypto_executor import CryptoExecutor
 
 
 class DefaultContextBuilder(ContextBuilder):
@@ -35,8 +43,58 @@ class DefaultContextBuilder(ContextBuilder):
             collector = Collector(log_path=timing_log)
             context.injector.bind_instance(Collector, collector)
 
-        # Shared in-memory cache
-        context.injector.bind_instance(BaseCache, InMemoryCache())
+        # Shared cache: external server, bounded or basic in-memory
+        cache_url = context.settings.get("cache.url")
+        max_entries = context.settings.get("cache.max_entries")
+        max_bytes = context.settings.get("cache.max_bytes")
+        if cache_url:
+            cache = RedisCache(
+                RedisClient.from_url(cache_url),
+                prefix=context.settings.get("cache.prefix", "acapy:"),
+            )
+        elif max_entries or max_bytes:
+            cache = LRUCache(max_entries=max_entries, max_bytes=max_bytes)
+        else:
+            cache = InMemoryCache()
+        context.injector.bind_instance(BaseCache, cache)
+
+        # Durable store for outbound messages pending delivery
+        outbound_queue_path = context.settings.get("transport.outbound_queue_path")
+        if outbound_queue_path:
+            context.injector.bind_instance(
+                BaseOutboundQueueStore, SqliteOutboundQueueStore(outbound_queue_path)
+            )
+
+        # Worker pool for envelope cryptography
+        executor_mode = context.settings.get("crypto.executor")
+        if executor_mode:
+            context.injector.bind_instance(
+                CryptoExecutor,
+                CryptoExecutor(
+                    executor_mode, max_workers=context.settings.get("crypto.workers")
+                ),
+            )
+
+        # Recipient key lookup for mediated routes
+        context.injector.bind_instance(RouteTable, RouteTable())
+
+        # Standby revocation registries for issuance
+        context.injector.bind_instance(
+            RevRegProvisioner,
+            RevRegProvisioner(
+                standby_count=context.settings.get("revocation.standby_count"),
+                threshold=context.settings.get("revocation.standby_threshold"),
+            ),
+        )
+
+        # Batched publication of revocations
+        batch_interval = context.settings.get("revocation.batch_interval")
+        batch_size = context.settings.get("revocation.batch_size")
+        if batch_interval or batch_size:
+            context.injector.bind_instance(
+                RevocationScheduler,
+                RevocationScheduler(interval=batch_interval, batch_size=batch_size),
+            )
 
         # Global protocol registry
         context.injector.bind_instance(ProtocolRegistry, ProtocolRegistry())
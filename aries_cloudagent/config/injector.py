@@ -3,6 +3,7 @@
 from typing import Mapping, Optional, Type
 
 from .base import BaseProvider, BaseInjector, InjectionError, InjectType
+from .layered import LayeredDict
 from .provider import InstanceProvider, CachedProvider
 from .settings import Settings
 
@@ -15,7 +16,7 @@ class Injector(BaseInjector):
     ):
         """Initialize an `Injector`."""
         self.enforce_typing = enforce_typing
-        self._providers = {}
+        self._providers = LayeredDict()
         self._settings = Settings(settings)
 
     @property
@@ -94,10 +95,10 @@ class Injector(BaseInjector):
         return result
 
     def copy(self) -> BaseInjector:
-        """Produce a copy of the injector instance."""
-        result = Injector(self.settings)
-        result.enforce_typing = self.enforce_typing
-        result._providers = self._providers.copy()
+        """Produce a copy of the injector instance, sharing its bindings."""
+        result = Injector(enforce_typing=self.enforce_typing)
+        result._settings = self.settings.copy()
+        result._providers = self._providers.derive()
         return result
 
     def __repr__(self) -> str:
@@ -0,0 +1,105 @@
+"""Copy-on-write mapping shared between derived configuration scopes."""
+
+from typing import Iterator, Mapping, MutableMapping, Tuple
+
+MAX_DEPTH = 8
+
+_DELETED = object()
+
+
+class LayeredDict(MutableMapping):
+    """
+    Dictionary whose contents can be shared with derived instances.
+
+    A derived instance starts out referencing the layers of its parent and only
+    stores its own changes, so deriving costs nothing regardless of the size of
+    the parent. Shared layers are never modified: the next change made by the
+    parent goes into a private copy of its own layer, so a derived instance
+    behaves as a snapshot of the parent at the time it was derived.
+    """
+
+    def __init__(self, values: Mapping = None):
+        """Initialize a `LayeredDict` instance."""
+        self._layer = {}
+        self._parents: Tuple[dict, ...] = ()
+        self._shared = False
+        if values:
+            self._layer.update(values)
+
+    def derive(self) -> "LayeredDict":
+        """Produce a copy sharing the current contents of this instance."""
+        result = LayeredDict()
+        if self._layer:
+            self._shared = True
+            parents = (self._layer,) + self._parents
+        else:
+            parents = self._parents
+        if len(parents) > MAX_DEPTH:
+            # keep lookups short for instances derived many times over
+            parents = (dict(self.items()),)
+        result._parents = parents
+        return result
+
+    def _writable(self) -> dict:
+        """Get this instance's own layer, copying it first if it is shared."""
+        if self._shared:
+            self._layer = self._layer.copy()
+            self._shared = False
+        return self._layer
+
+    def __getitem__(self, key):
+        """Look up a value in the layers of this instance."""
+        if key in self._layer:
+            value = self._layer[key]
+        else:
+            for parent in self._parents:
+                if key in parent:
+                    value = parent[key]
+                    break
+            else:
+                raise KeyError(key)
+        if value is _DELETED:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        """Set a value in this instance's own layer."""
+        self._writable()[key] = value
+
+    def __delitem__(self, key):
+        """Remove a value, hiding it from the shared layers if necessary."""
+        if key not in self:
+            raise KeyError(key)
+        layer = self._writable()
+        if any(key in parent for parent in self._parents):
+            layer[key] = _DELETED
+        else:
+            del layer[key]
+
+    def __contains__(self, key) -> bool:
+        """Check whether a key is defined."""
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self) -> Iterator:
+        """Iterate the defined keys."""
+        seen = set()
+        for layer in (self._layer,) + self._parents:
+            for key, value in layer.items():
+                if key not in seen:
+                    seen.add(key)
+                    if value is not _DELETED:
+                        yield key
+
+    def __len__(self) -> int:
+        """Count the defined keys."""
+        if not self._parents:
+            return len(self._layer)
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        """Provide a human readable representation of this object."""
+        return f"<{self.__class__.__name__}({dict(self.items())})>"
@@ -3,10 +3,16 @@
 from typing import Mapping
 
 from .base import BaseSettings
+from .layered import LayeredDict
 
 
 class Settings(BaseSettings):
-    """Mutable settings implementation."""
+    """
+    Mutable settings implementation.
+
+    Copies and extensions share the values of the original instance and only
+    store their own changes.
+    """
 
     def __init__(self, values: Mapping[str, object] = None):
         """Initialize a Settings object.
@@ -14,9 +20,7 @@ class Settings(BaseSettings):
         Args:
             values: An optional dictionary of settings
         """
-        self._values = {}
-        if values:
-            self._values.update(values)
+        self._values = LayeredDict(values)
 
     def get_value(self, *var_names, default=None):
         """Fetch a setting.
@@ -26,8 +30,10 @@ class Settings(BaseSettings):
             default: The default value to return if none are defined
         """
         for k in var_names:
-            if k in self._values:
+            try:
                 return self._values[k]
+            except KeyError:
+                pass
         return default
 
     def set_value(self, var_name: str, value):
@@ -88,13 +94,15 @@ class Settings(BaseSettings):
 
     def copy(self) -> BaseSettings:
         """Produce a copy of the settings instance."""
-        return Settings(self._values)
+        result = Settings()
+        result._values = self._values.derive()
+        return result
 
     def extend(self, other: Mapping[str, object]) -> BaseSettings:
         """Merge another settings instance to produce a new instance."""
-        vals = self._values.copy()
-        vals.update(other)
-        return Settings(vals)
+        result = self.copy()
+        result._values.update(other)
+        return result
 
     def update(self, other: Mapping[str, object]):
         """Update the settings in place."""
@@ -3,7 +3,7 @@ from configargparse import ArgumentTypeError
 from asynctest import TestCase as AsyncTestCase, mock as async_mock
 
 from .. import argparse
-from ..util import ByteSize
+from ..util import ByteSize, PositiveInt
 
 
 class TestArgParse(AsyncTestCase):
@@ -41,6 +41,15 @@ class TestArgParse(AsyncTestCase):
                 "http",
                 "--max-outbound-retry",
                 "5",
+                "--outbound-queue-path",
+                "outbound.db",
+                "--outbound-queue-max",
+                "1000",
+                "--enable-undelivered-queue",
+                "--undelivered-queue-path",
+                "undelivered.db",
+                "--undelivered-queue-max-per-key",
+                "100",
             ]
         )
 
@@ -52,6 +61,10 @@ class TestArgParse(AsyncTestCase):
         assert settings.get("transport.inbound_configs") == [["http", "0.0.0.0", "80"]]
         assert settings.get("transport.outbound_configs") == ["http"]
         assert result.max_outbound_retry == 5
+        assert settings.get("transport.outbound_queue_path") == "outbound.db"
+        assert settings.get("transport.outbound_queue_max") == 1000
+        assert settings.get("transport.undelivered_queue_path") == "undelivered.db"
+        assert settings.get("transport.undelivered_queue_max_per_key") == 100
 
     async def test_general_settings_file(self):
         """Test file argument parsing."""
@@ -79,6 +92,65 @@ class TestArgParse(AsyncTestCase):
         assert settings.get("external_plugins") == ["foo"]
         assert settings.get("storage_type") == "bar"
 
+    async def test_revocation_settings(self):
+        """Test revocation registry and batching argument parsing."""
+
+        parser = argparse.create_argument_parser()
+        group = argparse.GeneralGroup()
+        group.add_arguments(parser)
+
+        result = parser.parse_args(
+            [
+                "--endpoint",
+                "localhost",
+                "--rev-reg-standby-count",
+                "3",
+                "--rev-reg-standby-threshold",
+                "0.5",
+                "--revocation-batch-interval",
+                "2.5",
+                "--revocation-batch-size",
+                "500",
+            ]
+        )
+
+        settings = group.get_settings(result)
+
+        assert settings.get("revocation.standby_count") == 3
+        assert settings.get("revocation.standby_threshold") == 0.5
+        assert settings.get("revocation.batch_interval") == 2.5
+        assert settings.get("revocation.batch_size") == 500
+
+        result = parser.parse_args(
+            ["--endpoint", "localhost", "--rev-reg-standby-threshold", "1.5"]
+        )
+        with self.assertRaises(argparse.ArgsParseError):
+            group.get_settings(result)
+
+    async def test_multitenant_settings(self):
+        """Test multitenant profile pool argument parsing."""
+
+        parser = argparse.create_argument_parser()
+        group = argparse.MultitenantGroup()
+        group.add_arguments(parser)
+
+        result = parser.parse_args(
+            [
+                "--multitenant",
+                "--jwt-secret",
+                "secret",
+                "--multitenant-max-profiles",
+                "500",
+                "--multitenant-profile-idle-timeout",
+                "300",
+            ]
+        )
+
+        settings = group.get_settings(result)
+
+        assert settings.get("multitenant.max_profiles") == 500
+        assert settings.get("multitenant.profile_idle_timeout") == 300.0
+
     async def test_transport_settings_file(self):
         """Test file argument parsing."""
 
@@ -131,6 +203,22 @@ class TestArgParse(AsyncTestCase):
 
         assert repr(bs) == "ByteSize"
 
+    def test_positive_int(self):
+        pi = PositiveInt()
+        with self.assertRaises(ArgumentTypeError):
+            pi(None)
+        with self.assertRaises(ArgumentTypeError):
+            pi("")
+        with self.assertRaises(ArgumentTypeError):
+            pi("1k")
+        with self.assertRaises(ArgumentTypeError):
+            pi("0")
+        with self.assertRaises(ArgumentTypeError):
+            pi("-1")
+        assert pi("101") == 101
+
+        assert repr(pi) == "PositiveInt"
+
     async def test_mediation_x_clear_and_default(self):
         parser = argparse.create_argument_parser()
         group = argparse.MediationGroup()
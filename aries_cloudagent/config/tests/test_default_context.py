@@ -3,6 +3,8 @@ from tempfile import NamedTemporaryFile
 from asynctest import TestCase as AsyncTestCase
 
 from ...cache.base import BaseCache
+from ...cache.lru import LRUCache
+from ...cache.redis import RedisCache
 from ...core.profile import ProfileManager
 from ...core.protocol_registry import ProtocolRegistry
 from ...transport.wire_format import BaseWireFormat
@@ -36,3 +38,24 @@ class TestDefaultContext(AsyncTestCase):
         )
         result = await builder.build_context()
         assert isinstance(result, InjectionContext)
+
+    async def test_build_context_lru_cache(self):
+        """Test context init with a bounded cache."""
+
+        builder = DefaultContextBuilder(settings={"cache.max_entries": 100})
+        result = await builder.build_context()
+        cache = result.inject(BaseCache)
+        assert isinstance(cache, LRUCache)
+        assert cache.max_entries == 100
+
+    async def test_build_context_redis_cache(self):
+        """Test context init with a shared cache server."""
+
+        builder = DefaultContextBuilder(
+            settings={"cache.url": "redis://localhost:6379/1", "cache.prefix": "a:"}
+        )
+        result = await builder.build_context()
+        cache = result.inject(BaseCache)
+        assert isinstance(cache, RedisCache)
+        assert cache.prefix == "a:"
+        assert cache.client.db == 1
@@ -51,6 +51,24 @@ class TestInjector(AsyncTestCase):
         self.test_instance.bind_instance(str, self.test_value)
         assert self.test_instance.inject(str) is self.test_value
 
+    def test_copy(self):
+        """Test copies share bindings and settings without affecting the original."""
+        self.test_instance.bind_instance(str, self.test_value)
+        copied = self.test_instance.copy()
+        assert copied.inject(str) is self.test_value
+        assert copied.settings[self.test_key] == self.test_value
+
+        copied.bind_instance(int, 1)
+        copied.clear_binding(str)
+        copied.settings["OTHER"] = "OTHER"
+        assert self.test_instance.inject(str) is self.test_value
+        assert self.test_instance.inject(int, required=False) is None
+        assert "OTHER" not in self.test_instance.settings
+
+        self.test_instance.bind_instance(float, 1.0)
+        assert copied.inject(float, required=False) is None
+        assert copied.inject(int) == 1
+
     def test_inject_x(self):
         """Test injection failure on null base class."""
         with self.assertRaises(InjectionError):
@@ -0,0 +1,67 @@
+from unittest import TestCase
+
+from .. import layered as test_module
+from ..layered import LayeredDict
+
+
+class TestLayeredDict(TestCase):
+    def test_derive(self):
+        base = LayeredDict({"a": 1, "b": 2})
+        derived = base.derive()
+        assert derived == {"a": 1, "b": 2}
+        assert not derived._layer
+
+        derived["c"] = 3
+        assert derived == {"a": 1, "b": 2, "c": 3}
+        assert "c" not in base
+        assert len(derived) == 3 and len(base) == 2
+
+    def test_snapshot(self):
+        base = LayeredDict({"a": 1})
+        derived = base.derive()
+        layer = base._layer
+
+        base["a"] = 10
+        base["b"] = 20
+        del base["a"]
+        assert derived == {"a": 1}
+        assert base == {"b": 20}
+        assert layer == {"a": 1}
+
+        # the parent layer is only copied once
+        layer = base._layer
+        base["c"] = 30
+        assert base._layer is layer
+
+    def test_delete(self):
+        base = LayeredDict({"a": 1, "b": 2})
+        derived = base.derive()
+        del derived["a"]
+        assert "a" not in derived and "a" in base
+        assert list(derived) == ["b"]
+        assert len(derived) == 1
+        with self.assertRaises(KeyError):
+            derived["a"]
+        with self.assertRaises(KeyError):
+            del derived["a"]
+
+        derived["a"] = 3
+        assert derived["a"] == 3
+        derived["d"] = 4
+        del derived["d"]
+        assert "d" not in derived._layer
+
+        # deletions carry over to instances derived in turn
+        del derived["b"]
+        assert derived.derive() == {"a": 3}
+
+    def test_max_depth(self):
+        values = LayeredDict()
+        for i in range(test_module.MAX_DEPTH + 2):
+            values[i] = i
+            if i == 1:
+                del values[0]
+            values = values.derive()
+        assert len(values._parents) <= test_module.MAX_DEPTH
+        assert dict(values) == {i: i for i in range(1, test_module.MAX_DEPTH + 2)}
+        assert "LayeredDict" in repr(values)
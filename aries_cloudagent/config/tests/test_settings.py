@@ -59,3 +59,17 @@ class TestSettings(TestCase):
         assert self.test_instance[self.test_key] == self.test_value
         self.test_instance.set_default("BOOL", "True")
         assert self.test_instance["BOOL"] == "True"
+
+    def test_copy_extend(self):
+        """Test copies and extensions are independent of the original."""
+        copied = self.test_instance.copy()
+        extended = self.test_instance.extend({"OTHER": "OTHER"})
+        assert extended["OTHER"] == "OTHER"
+        assert "OTHER" not in self.test_instance
+
+        self.test_instance[self.test_key] = "CHANGED"
+        del extended[self.test_key]
+        assert copied[self.test_key] == self.test_value
+        assert self.test_key not in extended
+        assert self.test_instance[self.test_key] == "CHANGED"
+        assert dict(extended) == {"OTHER": "OTHER"}
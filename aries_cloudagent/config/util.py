@@ -56,3 +56,22 @@ class ByteSize:
     def __repr__(self):
         """Format for in error reporting."""
         return self.__class__.__name__
+
+
+class PositiveInt:
+    """Argument value parser for positive integers."""
+
+    def __call__(self, arg: str) -> int:
+        """Interpret the argument value."""
+        if not arg:
+            raise ArgumentTypeError("Expected value")
+        if not re.match(r"^\d+$", arg):
+            raise ArgumentTypeError("Invalid format")
+        value = int(arg)
+        if value < 1:
+            raise ArgumentTypeError("Value must be greater than or equal to 1")
+        return value
+
+    def __repr__(self):
+        """Format for in error reporting."""
+        return self.__class__.__name__
@@ -12,8 +12,11 @@ import hashlib
 import json
 import logging
 
+from typing import Callable, Optional
+
 from ..admin.base_server import BaseAdminServer
 from ..admin.server import AdminResponder, AdminServer
+from ..cache.base import BaseCache
 from ..config.default_context import ContextBuilder
 from ..config.injection_context import InjectionContext
 from ..config.ledger import get_genesis_transactions, ledger_config
@@ -36,15 +39,17 @@ from ..protocols.coordinate_mediation.v1_0.models.mediation_record import (
 )
 from ..protocols.out_of_band.v1_0.manager import OutOfBandManager
 from ..protocols.out_of_band.v1_0.messages.invitation import InvitationMessage
+from ..revocation.scheduler import RevocationScheduler
 from ..transport.inbound.manager import InboundTransportManager
 from ..transport.inbound.message import InboundMessage
-from ..transport.outbound.base import OutboundDeliveryError
-from ..transport.outbound.manager import OutboundTransportManager, QueuedOutboundMessage
+from ..transport.outbound.base import OutboundDeliveryError, OutboundQueueFullError
+from ..transport.outbound.manager import OutboundTransportManager
 from ..transport.outbound.message import OutboundMessage
 from ..transport.wire_format import BaseWireFormat
 from ..utils.stats import Collector
 from ..utils.task_queue import CompletedTask, TaskQueue
 from ..wallet.base import DIDInfo
+from ..wallet.crypto_executor import CryptoExecutor
 from .dispatcher import Dispatcher
 
 LOGGER = logging.getLogger(__name__)
@@ -107,7 +112,7 @@ class Conductor:
 
         # Register all outbound transports
         self.outbound_transport_manager = OutboundTransportManager(
-            context, self.handle_not_delivered
+            context, self.handle_not_delivered, self.hold_profile
         )
         await self.outbound_transport_manager.setup()
 
@@ -123,6 +128,7 @@ class Conductor:
         if context.settings.get("multitenant.enabled"):
             multitenant_mgr = MultitenantManager(self.root_profile)
             context.injector.bind_instance(MultitenantManager, multitenant_mgr)
+            await multitenant_mgr.load_routes()
 
         # Admin API
         if context.settings.get("admin.enabled"):
@@ -334,17 +340,25 @@ class Conductor:
         if self.outbound_transport_manager:
             shutdown.run(self.outbound_transport_manager.stop())
 
+        # write out revocations held in memory before closing profiles
+        scheduler = self.context.inject(RevocationScheduler, required=False)
+        if scheduler:
+            await scheduler.close()
+
         # close multitenant profiles
         multitenant_mgr = self.context.inject(MultitenantManager, required=False)
         if multitenant_mgr:
-            for profile in multitenant_mgr._instances.values():
-                shutdown.run(profile.close())
+            shutdown.run(multitenant_mgr.close())
 
         if self.root_profile:
             shutdown.run(self.root_profile.close())
 
         await shutdown.complete(timeout)
 
+        executor = self.context.inject(CryptoExecutor, required=False)
+        if executor:
+            executor.shutdown(wait=False)
+
     def inbound_message_router(
         self,
         profile: Profile,
@@ -370,15 +384,25 @@ class Conductor:
         # Note: at this point we could send the message to a shared queue
         # if this pod is too busy to process it
 
+        # keep a tenant profile open until its message has been handled
+        release = self.hold_profile(profile)
+
+        def complete(completed: CompletedTask):
+            if release:
+                release()
+            self.dispatch_complete(message, completed)
+
         try:
             self.dispatcher.queue_message(
                 profile,
                 message,
                 self.outbound_message_router,
                 self.admin_server and self.admin_server.send_webhook,
-                lambda completed: self.dispatch_complete(message, completed),
+                complete,
             )
         except (LedgerConfigError, LedgerTransactionError) as e:
+            if release:
+                release()
             LOGGER.error("Shutdown on ledger error %s", str(e))
             if self.admin_server:
                 self.admin_server.notify_fatal_error()
@@ -412,18 +436,22 @@ class Conductor:
         """Get the current stats tracked by the conductor."""
         stats = {
             "in_sessions": len(self.inbound_transport_manager.sessions),
-            "out_encode": 0,
-            "out_deliver": 0,
+            "out_encode": len(self.outbound_transport_manager.outbound_encoding),
+            "out_deliver": len(self.outbound_transport_manager.outbound_delivering),
             "task_active": self.dispatcher.task_queue.current_active,
             "task_done": self.dispatcher.task_queue.total_done,
             "task_failed": self.dispatcher.task_queue.total_failed,
             "task_pending": self.dispatcher.task_queue.current_pending,
         }
-        for m in self.outbound_transport_manager.outbound_buffer:
-            if m.state == QueuedOutboundMessage.STATE_ENCODE:
-                stats["out_encode"] += 1
-            if m.state == QueuedOutboundMessage.STATE_DELIVER:
-                stats["out_deliver"] += 1
+        cache = self.context.inject(BaseCache, required=False)
+        if cache:
+            stats.update(cache.stats)
+        scheduler = self.context.inject(RevocationScheduler, required=False)
+        if scheduler:
+            stats.update(scheduler.stats)
+        multitenant_mgr = self.context.inject(MultitenantManager, required=False)
+        if multitenant_mgr:
+            stats.update(multitenant_mgr.stats)
         return stats
 
     async def outbound_message_router(
@@ -450,11 +478,31 @@ class Conductor:
         if not outbound.to_session_only:
             await self.queue_outbound(profile, outbound, inbound)
 
+    def hold_profile(self, profile: Profile) -> Optional[Callable[[], None]]:
+        """
+        Keep a tenant profile open while a message for it is processed.
+
+        Args:
+            profile: The profile associated with the message
+
+        Returns:
+            A callback releasing the profile, or None if it is not pooled
+
+        """
+        multitenant_mgr = self.context.inject(MultitenantManager, required=False)
+        return multitenant_mgr and multitenant_mgr.hold_profile(profile)
+
     def handle_not_returned(self, profile: Profile, outbound: OutboundMessage):
         """Handle a message that failed delivery via an inbound session."""
+        release = self.hold_profile(profile)
         try:
-            self.dispatcher.run_task(self.queue_outbound(profile, outbound))
+            self.dispatcher.run_task(
+                self.queue_outbound(profile, outbound),
+                release and (lambda completed: release()),
+            )
         except (LedgerConfigError, LedgerTransactionError) as e:
+            if release:
+                release()
             LOGGER.error("Shutdown on ledger error %s", str(e))
             if self.admin_server:
                 self.admin_server.notify_fatal_error()
@@ -497,7 +545,14 @@ class Conductor:
                 del conn_mgr
 
         try:
-            self.outbound_transport_manager.enqueue_message(profile, outbound)
+            while True:
+                # other waiters may take the capacity first, wait again if so
+                await self.outbound_transport_manager.wait_for_capacity()
+                try:
+                    self.outbound_transport_manager.enqueue_message(profile, outbound)
+                except OutboundQueueFullError:
+                    continue
+                break
         except OutboundDeliveryError:
             LOGGER.warning("Cannot queue message for delivery, no supported transport")
             self.handle_not_delivered(profile, outbound)
@@ -21,6 +21,7 @@ from ..messaging.responder import BaseResponder
 from ..messaging.util import datetime_now
 from ..protocols.connections.v1_0.manager import ConnectionManager
 from ..protocols.problem_report.v1_0.message import ProblemReport
+from ..protocols.routing.v1_0.relay import is_forward, relay_forward
 from ..transport.inbound.message import InboundMessage
 from ..transport.outbound.message import OutboundMessage
 from ..utils.stats import Collector
@@ -132,6 +133,24 @@ class Dispatcher:
         """
         r_time = get_timer()
 
+        if is_forward(profile, inbound_message.payload):
+            # relay forward messages without building the message instance
+            outbound = await relay_forward(profile, inbound_message)
+            if outbound:
+                trace_event(
+                    self.profile.settings,
+                    inbound_message.payload,
+                    outcome="Dispatcher.handle_message.START",
+                )
+                await send_outbound(profile, outbound, inbound_message)
+                trace_event(
+                    self.profile.settings,
+                    inbound_message.payload,
+                    outcome="Dispatcher.handle_message.END",
+                    perf_counter=r_time,
+                )
+                return
+
         error_result = None
         try:
             message = await self.make_message(inbound_message.payload)
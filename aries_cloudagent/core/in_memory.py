@@ -4,7 +4,8 @@ from collections import OrderedDict
 from typing import Any, Mapping, Type
 
 from ..config.injection_context import InjectionContext
-from ..storage.base import BaseStorage
+from ..storage.base import BaseStorage, BaseStorageSearch
+from ..storage.in_memory_index import InMemoryRecordIndex
 from ..utils.classloader import DeferLoad
 from ..wallet.base import BaseWallet
 
@@ -30,8 +31,10 @@ class InMemoryProfile(Profile):
         super().__init__(context=context, name=name, created=True)
         self.keys = {}
         self.local_dids = {}
+        self.local_did_verkeys = {}
         self.pair_dids = {}
         self.records = OrderedDict()
+        self.record_index = InMemoryRecordIndex()
 
     def session(self, context: InjectionContext = None) -> "ProfileSession":
         """Start a new interactive session with no transaction support requested."""
@@ -91,7 +94,9 @@ class InMemoryProfileSession(ProfileSession):
 
     def _init_context(self):
         """Initialize the session context."""
-        self._context.injector.bind_instance(BaseStorage, STORAGE_CLASS(self.profile))
+        storage = STORAGE_CLASS(self.profile)
+        self._context.injector.bind_instance(BaseStorage, storage)
+        self._context.injector.bind_instance(BaseStorageSearch, storage)
         self._context.injector.bind_instance(BaseWallet, WALLET_CLASS(self.profile))
 
     @property
@@ -3,6 +3,8 @@ from asynctest import TestCase as AsyncTestCase
 from asynctest import mock as async_mock
 
 from ...admin.base_server import BaseAdminServer
+from ...cache.base import BaseCache
+from ...cache.lru import LRUCache
 from ...config.base_context import ContextBuilder
 from ...config.injection_context import InjectionContext
 from ...connections.models.connection_target import ConnectionTarget
@@ -169,14 +171,17 @@ class TestConductor(AsyncTestCase, Config, TestDIDs):
         ) as mock_logger:
 
             mock_inbound_mgr.return_value.sessions = ["dummy"]
-            mock_outbound_mgr.return_value.outbound_buffer = [
-                async_mock.MagicMock(state=QueuedOutboundMessage.STATE_ENCODE),
-                async_mock.MagicMock(state=QueuedOutboundMessage.STATE_DELIVER),
-            ]
+            mock_outbound_mgr.return_value.outbound_encoding = {
+                async_mock.MagicMock(state=QueuedOutboundMessage.STATE_ENCODE)
+            }
+            mock_outbound_mgr.return_value.outbound_delivering = {
+                async_mock.MagicMock(state=QueuedOutboundMessage.STATE_DELIVER)
+            }
 
             await conductor.setup()
 
             stats = await conductor.get_stats()
+            assert stats["out_encode"] == 1 and stats["out_deliver"] == 1
             assert all(
                 x in stats
                 for x in [
@@ -190,6 +195,31 @@ class TestConductor(AsyncTestCase, Config, TestDIDs):
                 ]
             )
 
+    async def test_stats_cache(self):
+        builder: ContextBuilder = StubContextBuilder(self.test_settings)
+        conductor = test_module.Conductor(builder)
+
+        with async_mock.patch.object(
+            test_module, "InboundTransportManager", autospec=True
+        ) as mock_inbound_mgr, async_mock.patch.object(
+            test_module, "OutboundTransportManager", autospec=True
+        ) as mock_outbound_mgr, async_mock.patch.object(
+            test_module, "LoggingConfigurator", autospec=True
+        ) as mock_logger:
+            mock_inbound_mgr.return_value.sessions = []
+            mock_outbound_mgr.return_value.outbound_encoding = set()
+            mock_outbound_mgr.return_value.outbound_delivering = set()
+
+            await conductor.setup()
+            cache = LRUCache(max_entries=10)
+            conductor.context.injector.bind_instance(BaseCache, cache)
+            await cache.get("missing")
+
+            stats = await conductor.get_stats()
+            assert stats["cache_misses"] == 1
+            assert stats["cache_hits"] == 0
+            assert stats["cache_evictions"] == 0
+
     async def test_setup_x(self):
         builder: ContextBuilder = StubContextBuilder(self.test_settings)
         builder.update_settings(
@@ -239,6 +269,38 @@ class TestConductor(AsyncTestCase, Config, TestDIDs):
             assert mock_dispatch_q.call_args[0][3] is None  # admin webhook router
             assert callable(mock_dispatch_q.call_args[0][4])
 
+    async def test_inbound_message_handler_holds_profile(self):
+        builder: ContextBuilder = StubContextBuilder(self.test_settings)
+        conductor = test_module.Conductor(builder)
+
+        await conductor.setup()
+
+        multitenant_mgr = async_mock.MagicMock(
+            test_module.MultitenantManager, autospec=True
+        )
+        release = async_mock.MagicMock()
+        multitenant_mgr.hold_profile.return_value = release
+        conductor.context.injector.bind_instance(
+            test_module.MultitenantManager, multitenant_mgr
+        )
+        profile = async_mock.MagicMock()
+
+        with async_mock.patch.object(
+            conductor.dispatcher, "queue_message", autospec=True
+        ) as mock_dispatch_q, async_mock.patch.object(
+            conductor, "dispatch_complete", async_mock.MagicMock()
+        ) as mock_dispatch_complete:
+            message = InboundMessage("{}", MessageReceipt())
+            conductor.inbound_message_router(profile, message)
+
+            multitenant_mgr.hold_profile.assert_called_once_with(profile)
+            release.assert_not_called()
+
+            completed = async_mock.MagicMock()
+            mock_dispatch_q.call_args[0][4](completed)
+            release.assert_called_once_with()
+            mock_dispatch_complete.assert_called_once_with(message, completed)
+
     async def test_inbound_message_handler_ledger_x(self):
         builder: ContextBuilder = StubContextBuilder(self.test_settings_admin)
         conductor = test_module.Conductor(builder)
@@ -378,6 +440,7 @@ class TestConductor(AsyncTestCase, Config, TestDIDs):
             mock_outbound_mgr.return_value = async_mock.MagicMock(
                 setup=async_mock.CoroutineMock(),
                 enqueue_message=async_mock.MagicMock(),
+                wait_for_capacity=async_mock.CoroutineMock(),
             )
 
             payload = "{}"
@@ -410,6 +473,33 @@ class TestConductor(AsyncTestCase, Config, TestDIDs):
                 await conductor.queue_outbound(conductor.root_profile, message)
                 mock_run_task.assert_called_once()
 
+    async def test_queue_outbound_full_retry(self):
+        builder: ContextBuilder = StubContextBuilder(self.test_settings)
+        conductor = test_module.Conductor(builder)
+
+        with async_mock.patch.object(
+            test_module, "OutboundTransportManager", async_mock.MagicMock()
+        ) as mock_outbound_mgr:
+            mock_outbound_mgr.return_value = async_mock.MagicMock(
+                setup=async_mock.CoroutineMock(),
+                enqueue_message=async_mock.MagicMock(
+                    side_effect=[test_module.OutboundQueueFullError(), None]
+                ),
+                wait_for_capacity=async_mock.CoroutineMock(),
+            )
+            await conductor.setup()
+
+            message = OutboundMessage(payload="{}")
+            with async_mock.patch.object(
+                conductor, "handle_not_delivered", async_mock.MagicMock()
+            ) as mock_not_delivered:
+                await conductor.queue_outbound(conductor.root_profile, message)
+                mock_not_delivered.assert_not_called()
+
+            outbound_mgr = mock_outbound_mgr.return_value
+            assert outbound_mgr.wait_for_capacity.await_count == 2
+            assert outbound_mgr.enqueue_message.call_count == 2
+
     async def test_handle_not_returned_ledger_x(self):
         builder: ContextBuilder = StubContextBuilder(self.test_settings_admin)
         conductor = test_module.Conductor(builder)
@@ -858,12 +948,16 @@ class TestConductor(AsyncTestCase, Config, TestDIDs):
 
             multitenant_mgr = conductor.context.inject(MultitenantManager)
 
-            multitenant_mgr._instances = {
-                "test1": async_mock.MagicMock(close=async_mock.CoroutineMock()),
-                "test2": async_mock.MagicMock(close=async_mock.CoroutineMock()),
-            }
+            profiles = [
+                async_mock.MagicMock(close=async_mock.CoroutineMock())
+                for _ in range(2)
+            ]
+            multitenant_mgr._instances.put("test1", profiles[0])
+            multitenant_mgr._instances.put("test2", profiles[1])
+            assert multitenant_mgr.stats["multitenant_profiles_open"] == 2
 
             await conductor.stop()
 
-            multitenant_mgr._instances["test1"].close.assert_called_once_with()
-            multitenant_mgr._instances["test2"].close.assert_called_once_with()
+            profiles[0].close.assert_called_once_with()
+            profiles[1].close.assert_called_once_with()
+            assert not multitenant_mgr._instances
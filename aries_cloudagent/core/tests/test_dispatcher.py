@@ -18,6 +18,10 @@ from ...utils.stats import Collector
 
 from ...protocols.didcomm_prefix import DIDCommPrefix
 from ...protocols.problem_report.v1_0.message import ProblemReport
+from ...protocols.routing.v1_0.message_types import (
+    FORWARD,
+    MESSAGE_TYPES as ROUTING_MESSAGE_TYPES,
+)
 
 from ...transport.inbound.message import InboundMessage
 from ...transport.inbound.receipt import MessageReceipt
@@ -123,6 +127,40 @@ class TestDispatcher(AsyncTestCase):
                 handler_mock.call_args[0][2], test_module.DispatcherResponder
             )
 
+    async def test_dispatch_forward_relay(self):
+        profile = make_profile()
+        registry = profile.inject(ProtocolRegistry)
+        registry.register_message_types(ROUTING_MESSAGE_TYPES)
+        dispatcher = test_module.Dispatcher(profile)
+        await dispatcher.setup()
+        rcv = Receiver()
+        message = {
+            "@type": DIDCommPrefix.qualify_current(FORWARD),
+            "to": "recipient-key",
+            "msg": {"protected": "dummy"},
+        }
+        outbound = OutboundMessage(payload=None, enc_payload=b"{}")
+
+        with async_mock.patch.object(
+            test_module,
+            "relay_forward",
+            async_mock.CoroutineMock(return_value=outbound),
+        ) as relay, async_mock.patch.object(
+            test_module, "ConnectionManager", autospec=True
+        ) as conn_mgr_mock, async_mock.patch.object(
+            test_module, "trace_event", async_mock.MagicMock()
+        ) as mock_trace:
+            await dispatcher.queue_message(
+                dispatcher.profile, make_inbound(message), rcv.send
+            )
+            await dispatcher.task_queue
+            relay.assert_awaited_once()
+            conn_mgr_mock.assert_not_called()
+            assert rcv.messages and rcv.messages[0][1] is outbound
+            assert [
+                call[1]["outcome"] for call in mock_trace.call_args_list
+            ] == ["Dispatcher.handle_message.START", "Dispatcher.handle_message.END"]
+
     async def test_dispatch_versioned_message(self):
         profile = make_profile()
         registry = profile.inject(ProtocolRegistry)
@@ -15,6 +15,7 @@ class IndyHolder(ABC, metaclass=ABCMeta):
     """Base class for holder."""
 
     RECORD_TYPE_MIME_TYPES = "attribute-mime-types"
+    RECORD_TYPE_REV_STATE = "revocation-state"
     CHUNK = 256
 
     def __repr__(self) -> str:
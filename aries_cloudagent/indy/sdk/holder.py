@@ -353,6 +353,11 @@ class IndySdkHolder(IndyHolder):
             pass  # MIME types record not present: carry on
 
         try:
+            credential = json.loads(
+                await indy.anoncreds.prover_get_credential(
+                    self.wallet.handle, credential_id
+                )
+            )
             await indy.anoncreds.prover_delete_credential(
                 self.wallet.handle, credential_id
             )
@@ -368,6 +373,20 @@ class IndySdkHolder(IndyHolder):
                     err, "Error when deleting credential", IndyHolderError
                 ) from err
 
+        rev_reg_id = credential.get("rev_reg_id")
+        cred_rev_id = credential.get("cred_rev_id")
+        if rev_reg_id and cred_rev_id:
+            try:
+                await indy_stor.delete_record(
+                    StorageRecord(
+                        type=IndyHolder.RECORD_TYPE_REV_STATE,
+                        value=None,
+                        id=self._rev_state_record_id(rev_reg_id, cred_rev_id),
+                    )
+                )
+            except StorageNotFoundError:
+                pass  # no revocation state cached for the credential
+
     async def get_mime_type(
         self, credential_id: str, attr: str = None
     ) -> Union[dict, str]:
@@ -447,16 +466,118 @@ class IndySdkHolder(IndyHolder):
 
         """
 
+        # only deltas from registry creation can be compared with earlier ones
+        delta_value = rev_reg_delta.get("value") or {}
+        rev_reg_id = "prevAccum" not in delta_value and rev_reg_def.get("id")
+        cached = rev_reg_id and await self._get_cached_revocation_state(
+            rev_reg_id, cred_rev_id
+        )
+        if cached and cached["timestamp"] == timestamp:
+            if cached["delta"].get("accum") == delta_value.get("accum"):
+                return cached["rev_state"]
+
         with IndyErrorHandler(
             "Error when constructing revocation state", IndyHolderError
         ):
             tails_file_reader = await create_tails_reader(tails_file_path)
-            rev_state_json = await indy.anoncreds.create_revocation_state(
-                tails_file_reader,
-                rev_reg_def_json=json.dumps(rev_reg_def),
-                cred_rev_id=cred_rev_id,
-                rev_reg_delta_json=json.dumps(rev_reg_delta),
-                timestamp=timestamp,
-            )
+            if cached and cached["timestamp"] < timestamp:
+                # bring the earlier witness up to date with the changes since
+                rev_state_json = await indy.anoncreds.update_revocation_state(
+                    tails_file_reader,
+                    rev_state_json=cached["rev_state"],
+                    rev_reg_def_json=json.dumps(rev_reg_def),
+                    rev_reg_delta_json=json.dumps(
+                        revocation_delta_since(cached["delta"], rev_reg_delta)
+                    ),
+                    timestamp=timestamp,
+                    cred_rev_id=cred_rev_id,
+                )
+            else:
+                rev_state_json = await indy.anoncreds.create_revocation_state(
+                    tails_file_reader,
+                    rev_reg_def_json=json.dumps(rev_reg_def),
+                    cred_rev_id=cred_rev_id,
+                    rev_reg_delta_json=json.dumps(rev_reg_delta),
+                    timestamp=timestamp,
+                )
 
+        if rev_reg_id and (not cached or cached["timestamp"] <= timestamp):
+            await self._cache_revocation_state(
+                rev_reg_id, cred_rev_id, rev_reg_delta, timestamp, rev_state_json
+            )
         return rev_state_json
+
+    @staticmethod
+    def _rev_state_record_id(rev_reg_id: str, cred_rev_id: str) -> str:
+        """Get the storage record ID of a cached revocation state."""
+        return f"{IndyHolder.RECORD_TYPE_REV_STATE}::{rev_reg_id}::{cred_rev_id}"
+
+    async def _get_cached_revocation_state(
+        self, rev_reg_id: str, cred_rev_id: str
+    ) -> dict:
+        """Load a previously created revocation state, if any."""
+        try:
+            record = await IndySdkStorage(self.wallet).get_record(
+                IndyHolder.RECORD_TYPE_REV_STATE,
+                self._rev_state_record_id(rev_reg_id, cred_rev_id),
+            )
+        except StorageError:
+            return None
+        return json.loads(record.value)
+
+    async def _cache_revocation_state(
+        self,
+        rev_reg_id: str,
+        cred_rev_id: str,
+        rev_reg_delta: dict,
+        timestamp: int,
+        rev_state_json: str,
+    ):
+        """Store a revocation state along with the delta it was created from."""
+        value = json.dumps(
+            {
+                "delta": rev_reg_delta["value"],
+                "rev_state": rev_state_json,
+                "timestamp": timestamp,
+            }
+        )
+        tags = {"rev_reg_id": rev_reg_id, "cred_rev_id": cred_rev_id}
+        record = StorageRecord(
+            type=IndyHolder.RECORD_TYPE_REV_STATE,
+            value=value,
+            tags=tags,
+            id=self._rev_state_record_id(rev_reg_id, cred_rev_id),
+        )
+        indy_stor = IndySdkStorage(self.wallet)
+        try:
+            await indy_stor.update_record(record, value, tags)
+        except StorageNotFoundError:
+            await indy_stor.add_record(record)
+
+
+def revocation_delta_since(prior: dict, rev_reg_delta: dict) -> dict:
+    """
+    Derive the delta between two accumulated revocation registry deltas.
+
+    Args:
+        prior: The value of the earlier delta from registry creation
+        rev_reg_delta: The later delta from registry creation
+
+    Returns:
+        The delta covering the changes after the earlier delta
+
+    """
+    value = rev_reg_delta["value"]
+    return {
+        **rev_reg_delta,
+        "value": {
+            "prevAccum": prior.get("accum"),
+            "accum": value.get("accum"),
+            "issued": sorted(
+                set(value.get("issued") or ()) - set(prior.get("issued") or ())
+            ),
+            "revoked": sorted(
+                set(value.get("revoked") or ()) - set(prior.get("revoked") or ())
+            ),
+        },
+    }
@@ -409,6 +409,7 @@ class TestIndySdkHolder(AsyncTestCase):
             result = await self.holder.credential_revoked(self.ledger, "credential_id")
             assert result
 
+    @async_mock.patch("indy.anoncreds.prover_get_credential")
     @async_mock.patch("indy.anoncreds.prover_delete_credential")
     @async_mock.patch("indy.non_secrets.get_wallet_record")
     @async_mock.patch("indy.non_secrets.delete_wallet_record")
@@ -417,7 +418,11 @@ class TestIndySdkHolder(AsyncTestCase):
         mock_nonsec_del_wallet_record,
         mock_nonsec_get_wallet_record,
         mock_prover_del_cred,
+        mock_prover_get_cred,
     ):
+        mock_prover_get_cred.return_value = json.dumps(
+            {"referent": "credential_id", "rev_reg_id": "rr-id", "cred_rev_id": "1"}
+        )
         mock_nonsec_get_wallet_record.return_value = json.dumps(
             {
                 "type": "typ",
@@ -432,7 +437,40 @@ class TestIndySdkHolder(AsyncTestCase):
         mock_prover_del_cred.assert_called_once_with(
             self.wallet.handle, "credential_id"
         )
+        # the MIME types record and the cached revocation state
+        assert mock_nonsec_del_wallet_record.call_count == 2
+        mock_nonsec_del_wallet_record.assert_called_with(
+            self.wallet.handle,
+            IndyHolder.RECORD_TYPE_REV_STATE,
+            f"{IndyHolder.RECORD_TYPE_REV_STATE}::rr-id::1",
+        )
 
+    @async_mock.patch("indy.anoncreds.prover_get_credential")
+    @async_mock.patch("indy.anoncreds.prover_delete_credential")
+    @async_mock.patch("indy.non_secrets.get_wallet_record")
+    @async_mock.patch("indy.non_secrets.delete_wallet_record")
+    async def test_delete_credential_no_rev_state(
+        self,
+        mock_nonsec_del_wallet_record,
+        mock_nonsec_get_wallet_record,
+        mock_prover_del_cred,
+        mock_prover_get_cred,
+    ):
+        mock_nonsec_get_wallet_record.side_effect = test_module.StorageNotFoundError()
+        mock_nonsec_del_wallet_record.side_effect = IndyError(
+            error_code=ErrorCode.WalletItemNotFound
+        )
+        mock_prover_get_cred.return_value = json.dumps(
+            {"referent": "credential_id", "rev_reg_id": "rr-id", "cred_rev_id": "1"}
+        )
+
+        await self.holder.delete_credential("credential_id")
+        mock_prover_del_cred.assert_called_once_with(
+            self.wallet.handle, "credential_id"
+        )
+        mock_nonsec_del_wallet_record.assert_called_once()
+
+    @async_mock.patch("indy.anoncreds.prover_get_credential")
     @async_mock.patch("indy.anoncreds.prover_delete_credential")
     @async_mock.patch("indy.non_secrets.get_wallet_record")
     @async_mock.patch("indy.non_secrets.delete_wallet_record")
@@ -441,7 +479,9 @@ class TestIndySdkHolder(AsyncTestCase):
         mock_nonsec_del_wallet_record,
         mock_nonsec_get_wallet_record,
         mock_prover_del_cred,
+        mock_prover_get_cred,
     ):
+        mock_prover_get_cred.return_value = json.dumps({"referent": "credential_id"})
         mock_nonsec_get_wallet_record.side_effect = test_module.StorageNotFoundError()
         mock_prover_del_cred.side_effect = IndyError(
             error_code=ErrorCode.WalletItemNotFound
@@ -515,3 +555,63 @@ class TestIndySdkHolder(AsyncTestCase):
                 rev_reg_delta_json=json.dumps(rev_reg_delta),
                 timestamp=timestamp,
             )
+
+    async def test_create_revocation_state_cached(self):
+        rev_reg_def = {"id": "rr-id"}
+        first_delta = {"ver": "1.0", "value": {"accum": "1 ...", "revoked": [2]}}
+        later_delta = {"ver": "1.0", "value": {"accum": "2 ...", "revoked": [2, 3]}}
+        mock_storage = async_mock.MagicMock(
+            get_record=async_mock.CoroutineMock(
+                side_effect=test_module.StorageNotFoundError()
+            ),
+            update_record=async_mock.CoroutineMock(
+                side_effect=test_module.StorageNotFoundError()
+            ),
+            add_record=async_mock.CoroutineMock(),
+        )
+
+        with async_mock.patch.object(
+            test_module, "create_tails_reader", async_mock.CoroutineMock()
+        ) as mock_create_tails_reader, async_mock.patch.object(
+            test_module, "IndySdkStorage", return_value=mock_storage
+        ), async_mock.patch.object(
+            indy.anoncreds,
+            "create_revocation_state",
+            async_mock.CoroutineMock(return_value='{"state": 1}'),
+        ) as mock_create_rr_state, async_mock.patch.object(
+            indy.anoncreds,
+            "update_revocation_state",
+            async_mock.CoroutineMock(return_value='{"state": 2}'),
+        ) as mock_update_rr_state:
+            result = await self.holder.create_revocation_state(
+                "1", rev_reg_def, first_delta, 1000, "/tmp/some.tails"
+            )
+            assert result == '{"state": 1}'
+            mock_create_rr_state.assert_awaited_once()
+            record = mock_storage.add_record.call_args[0][0]
+            assert record.type == IndyHolder.RECORD_TYPE_REV_STATE
+
+            mock_storage.get_record = async_mock.CoroutineMock(return_value=record)
+            mock_create_tails_reader.reset_mock()
+            result = await self.holder.create_revocation_state(
+                "1", rev_reg_def, first_delta, 1000, "/tmp/some.tails"
+            )
+            assert result == '{"state": 1}'
+            mock_create_tails_reader.assert_not_called()
+
+            mock_storage.update_record = async_mock.CoroutineMock()
+            result = await self.holder.create_revocation_state(
+                "1", rev_reg_def, later_delta, 2000, "/tmp/some.tails"
+            )
+            assert result == '{"state": 2}'
+            mock_create_rr_state.assert_awaited_once()
+            delta_since = json.loads(
+                mock_update_rr_state.call_args[1]["rev_reg_delta_json"]
+            )
+            assert delta_since["value"] == {
+                "prevAccum": "1 ...",
+                "accum": "2 ...",
+                "issued": [],
+                "revoked": [3],
+            }
+            mock_storage.update_record.assert_awaited_once()
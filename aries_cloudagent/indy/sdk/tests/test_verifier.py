@@ -2,6 +2,7 @@ import json
 import pytest
 
 from copy import deepcopy
+from functools import partial
 from time import time
 
 from asynctest import TestCase as AsyncTestCase
@@ -9,6 +10,8 @@ from asynctest import mock as async_mock
 
 from indy.error import IndyError
 
+from ....ledger.base import BaseLedger
+
 from .. import verifier as test_module
 from ..verifier import IndySdkVerifier
 
@@ -314,6 +317,7 @@ class TestIndySdkVerifier(AsyncTestCase):
                 }
             )
         )
+        mock_ledger.batch_read = partial(BaseLedger.batch_read, mock_ledger)
         self.verifier = IndySdkVerifier(mock_ledger)
         assert repr(self.verifier) == "<IndySdkVerifier>"
 
@@ -184,16 +184,23 @@ class IndySdkVerifier(IndyVerifier):
         non_revoc_intervals = indy_proof_req2non_revoc_intervals(pres_req)
 
         # timestamp for irrevocable credential
-        async with self.ledger:
-            for (index, ident) in enumerate(pres["identifiers"]):
-                if ident.get("timestamp"):
-                    cred_def_id = ident["cred_def_id"]
-                    cred_def = await self.ledger.get_credential_definition(cred_def_id)
-                    if not cred_def["value"].get("revocation"):
-                        raise ValueError(
-                            f"Timestamp in presentation identifier #{index} "
-                            f"for irrevocable cred def id {cred_def_id}"
-                        )
+        reads = [
+            ("get_credential_definition", ident["cred_def_id"])
+            for ident in pres["identifiers"]
+            if ident.get("timestamp")
+        ]
+        if reads:
+            async with self.ledger:
+                cred_defs = await self.ledger.batch_read(reads)
+        for (index, ident) in enumerate(pres["identifiers"]):
+            if ident.get("timestamp"):
+                cred_def_id = ident["cred_def_id"]
+                cred_def = cred_defs[("get_credential_definition", cred_def_id)]
+                if not cred_def["value"].get("revocation"):
+                    raise ValueError(
+                        f"Timestamp in presentation identifier #{index} "
+                        f"for irrevocable cred def id {cred_def_id}"
+                    )
 
         # timestamp in the future too far in the past
         for ident in pres["identifiers"]:
@@ -1,14 +1,27 @@
 """Ledger base class."""
 
+import asyncio
 import re
 
 from abc import ABC, abstractmethod, ABCMeta
 from enum import Enum
-from typing import Sequence, Tuple, Union
+from typing import Iterable, Mapping, Sequence, Tuple, Union
 
 from ..indy.issuer import IndyIssuer
 
 from .endpoint_type import EndpointType
+from .error import BadLedgerRequestError
+
+BATCH_READ_CONCURRENCY = 8
+BATCH_READ_METHODS = (
+    "get_credential_definition",
+    "get_endpoint_for_did",
+    "get_key_for_did",
+    "get_revoc_reg_def",
+    "get_revoc_reg_delta",
+    "get_revoc_reg_entry",
+    "get_schema",
+)
 
 
 class BaseLedger(ABC, metaclass=ABCMeta):
@@ -34,6 +47,46 @@ class BaseLedger(ABC, metaclass=ABCMeta):
         """Accessor for the ledger backend name."""
         return self.__class__.BACKEND_NAME
 
+    async def batch_read(
+        self, reads: Iterable[tuple], max_concurrency: int = None
+    ) -> Mapping[tuple, object]:
+        """
+        Perform several independent ledger reads concurrently.
+
+        Each read is a tuple of a read method name and its positional arguments,
+        such as `("get_schema", schema_id)`. Duplicate reads are performed once.
+        If a read fails, the reads still in progress are cancelled.
+
+        Args:
+            reads: The reads to perform
+            max_concurrency: The maximum number of reads in progress at once
+
+        Returns:
+            A mapping of each read to its result
+
+        Raises:
+            BadLedgerRequestError: If a read does not name a read method
+
+        """
+        reads = list(dict.fromkeys(reads))
+        for read in reads:
+            if not read or read[0] not in BATCH_READ_METHODS:
+                raise BadLedgerRequestError(f"Unsupported batch ledger read: {read}")
+        limit = asyncio.Semaphore(max_concurrency or BATCH_READ_CONCURRENCY)
+
+        async def _read(method: str, *args):
+            async with limit:
+                return await getattr(self, method)(*args)
+
+        tasks = [asyncio.ensure_future(_read(*read)) for read in reads]
+        try:
+            results = await asyncio.gather(*tasks)
+        finally:
+            # stop the remaining reads once one has failed
+            for task in tasks:
+                task.cancel()
+        return dict(zip(reads, results))
+
     @property
     @abstractmethod
     def read_only(self) -> bool:
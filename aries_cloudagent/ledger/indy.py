@@ -39,7 +39,7 @@ from .error import (
     LedgerError,
     LedgerTransactionError,
 )
-from .util import TAA_ACCEPTED_RECORD_TYPE
+from .util import TAA_ACCEPTED_RECORD_TYPE, RevocRegDeltaCache
 
 LOGGER = logging.getLogger(__name__)
 
@@ -1133,6 +1133,24 @@ class IndySdkLedger(BaseLedger):
         """
         if to is None:
             to = int(time())
+        if (not fro or fro == to) and to and self.pool.cache:
+            return await RevocRegDeltaCache(
+                self.pool.cache, self.pool.cache_duration
+            ).get_delta(revoc_reg_id, to, self.fetch_revoc_reg_delta)
+        return await self.fetch_revoc_reg_delta(revoc_reg_id, fro, to)
+
+    async def fetch_revoc_reg_delta(
+        self, revoc_reg_id: str, fro: int, to: int
+    ) -> (dict, int):
+        """
+        Fetch a revocation registry delta from the ledger.
+
+        :param revoc_reg_id revocation registry id
+        :param fro earliest EPOCH time of interest
+        :param to latest EPOCH time of interest
+
+        :returns delta response, delta timestamp
+        """
         public_info = await self.wallet.get_public_did()
         with IndyErrorHandler("Exception building rev reg delta request", LedgerError):
             fetch_req = await indy.ledger.build_get_revoc_reg_delta_request(
@@ -0,0 +1,59 @@
+import asyncio
+
+from functools import partial
+
+from asynctest import TestCase as AsyncTestCase
+from asynctest import mock as async_mock
+
+from ..base import BaseLedger
+from ..error import BadLedgerRequestError
+
+
+class TestBaseLedger(AsyncTestCase):
+    def setUp(self):
+        self.in_progress = 0
+        self.max_in_progress = 0
+
+        async def get_schema(schema_id):
+            self.in_progress += 1
+            self.max_in_progress = max(self.max_in_progress, self.in_progress)
+            await asyncio.sleep(0.01)
+            self.in_progress -= 1
+            return {"id": schema_id}
+
+        Ledger = async_mock.MagicMock(BaseLedger, autospec=True)
+        self.ledger = Ledger()
+        self.ledger.get_schema = async_mock.CoroutineMock(side_effect=get_schema)
+        self.ledger.get_revoc_reg_delta = async_mock.CoroutineMock(
+            return_value=({"value": {}}, 1234)
+        )
+        self.ledger.batch_read = partial(BaseLedger.batch_read, self.ledger)
+
+    async def test_batch_read(self):
+        reads = [("get_schema", f"schema-{i}") for i in range(5)]
+        reads.append(("get_schema", "schema-0"))
+        reads.append(("get_revoc_reg_delta", "rev-reg-id", 0, 1234))
+
+        results = await self.ledger.batch_read(reads, max_concurrency=2)
+        assert results[("get_schema", "schema-3")] == {"id": "schema-3"}
+        assert results[("get_revoc_reg_delta", "rev-reg-id", 0, 1234)][1] == 1234
+        assert self.ledger.get_schema.await_count == 5
+        assert self.max_in_progress == 2
+
+    async def test_batch_read_x(self):
+        with self.assertRaises(BadLedgerRequestError):
+            await self.ledger.batch_read([("send_revoc_reg_entry", "rev-reg-id")])
+        self.ledger.get_schema.side_effect = ValueError("not found")
+        with self.assertRaises(ValueError):
+            await self.ledger.batch_read([("get_schema", "schema-0")])
+
+    async def test_batch_read_cancel_pending(self):
+        self.ledger.get_revoc_reg_delta.side_effect = ValueError("not found")
+        reads = [("get_schema", f"schema-{i}") for i in range(4)]
+        reads.append(("get_revoc_reg_delta", "rev-reg-id", 0, 1234))
+
+        with self.assertRaises(ValueError):
+            await self.ledger.batch_read(reads, max_concurrency=8)
+        await asyncio.sleep(0.02)
+        # the schema reads in progress were cancelled, not completed
+        assert self.in_progress == 4
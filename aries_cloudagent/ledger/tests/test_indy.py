@@ -2670,6 +2670,55 @@ class TestIndySdkLedger(AsyncTestCase):
             (result, _) = await ledger.get_revoc_reg_delta("rr-id")
             assert result == {"hello": "world"}
 
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_open")
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_close")
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit")
+    @async_mock.patch("indy.ledger.build_get_revoc_reg_delta_request")
+    @async_mock.patch("indy.ledger.parse_get_revoc_reg_delta_response")
+    async def test_get_revoc_reg_delta_cached(
+        self,
+        mock_indy_parse_get_rrd_resp,
+        mock_indy_build_get_rrd_req,
+        mock_submit,
+        mock_close,
+        mock_open,
+    ):
+        mock_wallet = async_mock.MagicMock()
+        mock_indy_parse_get_rrd_resp.return_value = (
+            "rr-id",
+            '{"value": {"accum": "1", "revoked": [1]}}',
+            1234567890,
+        )
+
+        ledger = IndySdkLedger(
+            IndySdkLedgerPool(
+                "name", checked=True, read_only=True, cache=InMemoryCache()
+            ),
+            mock_wallet,
+        )
+
+        async with ledger:
+            mock_wallet.get_public_did = async_mock.CoroutineMock(
+                return_value=self.test_did_info
+            )
+
+            (result, timestamp) = await ledger.get_revoc_reg_delta(
+                "rr-id", 0, 1234567899
+            )
+            assert result["value"]["revoked"] == [1]
+            assert timestamp == 1234567890
+            (result, timestamp) = await ledger.get_revoc_reg_delta(
+                "rr-id", 0, 1234567895
+            )
+            assert timestamp == 1234567890
+            # a delta from and to the same time is the full delta to that time
+            (result, timestamp) = await ledger.get_revoc_reg_delta(
+                "rr-id", 1234567895, 1234567895
+            )
+            assert result["value"]["revoked"] == [1]
+            assert timestamp == 1234567890
+            mock_submit.assert_awaited_once()
+
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_open")
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedgerPool.context_close")
     @async_mock.patch("aries_cloudagent.ledger.indy.IndySdkLedger._submit")
@@ -0,0 +1,59 @@
+from time import time
+
+from asynctest import TestCase as AsyncTestCase
+from asynctest import mock as async_mock
+
+from ...cache.in_memory import InMemoryCache
+
+from ..util import RevocRegDeltaCache, merge_revoc_reg_deltas
+
+RR_ID = "LjgpST2rjsoxYegQDRm7EL:4:LjgpST2rjsoxYegQDRm7EL:3:CL:18:tag:CL_ACCUM:0"
+
+
+class TestRevocRegDeltaCache(AsyncTestCase):
+    def test_merge(self):
+        base = {"ver": "1.0", "value": {"accum": "1", "issued": [], "revoked": [1, 2]}}
+        update = {
+            "ver": "1.0",
+            "value": {"prevAccum": "1", "accum": "2", "issued": [2], "revoked": [3]},
+        }
+        merged = merge_revoc_reg_deltas(base, update)
+        assert merged == {
+            "ver": "1.0",
+            "value": {"accum": "2", "issued": [2], "revoked": [1, 3]},
+        }
+        assert base["value"]["revoked"] == [1, 2]
+
+    async def test_get_delta(self):
+        now = int(time())
+        fetch = async_mock.CoroutineMock(
+            side_effect=[
+                ({"value": {"accum": "1", "revoked": [1]}}, now - 100),
+                ({"value": {"accum": "2", "revoked": [2]}}, now - 10),
+                ({"value": {"accum": "0", "revoked": []}}, now - 500),
+            ]
+        )
+        delta_cache = RevocRegDeltaCache(InMemoryCache(), 600)
+
+        (delta, timestamp) = await delta_cache.get_delta(RR_ID, now - 50, fetch)
+        assert timestamp == now - 100
+        fetch.assert_awaited_once_with(RR_ID, 0, now - 50)
+
+        # served from the snapshot
+        (delta, timestamp) = await delta_cache.get_delta(RR_ID, now - 60, fetch)
+        assert timestamp == now - 100
+        assert fetch.await_count == 1
+
+        # only the interval since the snapshot is fetched
+        (delta, timestamp) = await delta_cache.get_delta(RR_ID, now, fetch)
+        fetch.assert_awaited_with(RR_ID, now - 50, now)
+        assert timestamp == now - 10
+        assert delta["value"] == {"accum": "2", "issued": [], "revoked": [1, 2]}
+
+        # earlier than any snapshot
+        (delta, timestamp) = await delta_cache.get_delta(RR_ID, now - 400, fetch)
+        fetch.assert_awaited_with(RR_ID, 0, now - 400)
+        assert timestamp == now - 500
+
+        snapshots = await delta_cache.cache.get(RevocRegDeltaCache.cache_key(RR_ID))
+        assert [snap[0] for snap in snapshots] == [now - 500, now - 100, now - 10]
@@ -1,3 +1,113 @@
 """Ledger utilities."""
 
+from time import time
+from typing import Awaitable, Callable, Tuple
+
+from ..cache.base import BaseCache
+
 TAA_ACCEPTED_RECORD_TYPE = "taa_accepted"
+
+
+def merge_revoc_reg_deltas(base: dict, update: dict) -> dict:
+    """
+    Apply a revocation registry delta to an earlier accumulated delta.
+
+    Args:
+        base: The delta from registry creation up to some time
+        update: The delta from that time onward
+
+    Returns:
+        The delta from registry creation to the end of the update
+
+    """
+    base_value = base.get("value") or {}
+    update_value = update.get("value") or {}
+    update_issued = set(update_value.get("issued") or ())
+    update_revoked = set(update_value.get("revoked") or ())
+    issued = (set(base_value.get("issued") or ()) - update_revoked) | update_issued
+    revoked = (set(base_value.get("revoked") or ()) - update_issued) | update_revoked
+
+    value = dict(base_value)
+    value["accum"] = update_value.get("accum", base_value.get("accum"))
+    value["issued"] = sorted(issued)
+    value["revoked"] = sorted(revoked)
+    return {**base, "value": value}
+
+
+class RevocRegDeltaCache:
+    """
+    Cache accumulated revocation registry deltas.
+
+    For each registry a few snapshots are kept, each holding the delta from
+    registry creation to the latest entry at or before the time it was
+    fetched for. A later request is served from a snapshot when it falls
+    within the snapshot's range, and otherwise only the interval since the
+    closest earlier snapshot is read from the ledger and merged locally.
+    """
+
+    MAX_SNAPSHOTS = 8
+
+    def __init__(self, cache: BaseCache, ttl: int = None):
+        """
+        Initialize a `RevocRegDeltaCache` instance.
+
+        Args:
+            cache: The cache holding the snapshots
+            ttl: The time to live for cached snapshots
+
+        """
+        self.cache = cache
+        self.ttl = ttl
+
+    @staticmethod
+    def cache_key(revoc_reg_id: str) -> str:
+        """Get the cache key for a revocation registry."""
+        return f"revoc_reg_delta::{revoc_reg_id}"
+
+    async def get_delta(
+        self,
+        revoc_reg_id: str,
+        to: int,
+        fetch: Callable[[str, int, int], Awaitable[Tuple[dict, int]]],
+    ) -> Tuple[dict, int]:
+        """
+        Get the delta from registry creation up to a time.
+
+        Args:
+            revoc_reg_id: The revocation registry ID
+            to: The latest EPOCH time of interest
+            fetch: Read a delta between two times from the ledger
+
+        Returns:
+            The accumulated delta and its timestamp
+
+        """
+        key = self.cache_key(revoc_reg_id)
+        snapshots = await self.cache.get(key) or []
+        base = None
+        for (timestamp, fetched_to, delta) in snapshots:
+            if timestamp <= to <= fetched_to:
+                return delta, timestamp
+            if fetched_to < to and (not base or base[1] < fetched_to):
+                base = (timestamp, fetched_to, delta)
+
+        if base:
+            (update, timestamp) = await fetch(revoc_reg_id, base[1], to)
+            delta = merge_revoc_reg_deltas(base[2], update)
+        else:
+            (delta, timestamp) = await fetch(revoc_reg_id, 0, to)
+
+        # entries may still be written for times which have not passed yet
+        fetched_to = min(to, int(time()))
+        if timestamp is not None and timestamp <= fetched_to:
+            for (prev_ts, prev_to, _) in snapshots:
+                if prev_ts == timestamp:
+                    fetched_to = max(fetched_to, prev_to)
+            snapshots = sorted(
+                [snap for snap in snapshots if snap[0] != timestamp]
+                + [(timestamp, fetched_to, delta)],
+                key=lambda snap: snap[0],
+            )
+            del snapshots[: -self.MAX_SNAPSHOTS]
+            await self.cache.set(key, snapshots, self.ttl)
+        return delta, timestamp
@@ -26,6 +26,7 @@ from ...revocation.error import RevocationError, RevocationNotSupportedError
 from ...revocation.indy import IndyRevocation
 
 from ...ledger.error import LedgerError
+from ...multitenant.manager import hold_tenant_profile
 
 from .util import CredDefQueryStringSchema, CRED_DEF_TAGS, CRED_DEF_SENT_RECORD_TYPE
 
@@ -190,9 +191,13 @@ async def credential_definitions_send_credential_definition(request: web.BaseReq
                 registry_record.cred_def_id,
                 max_cred_num=registry_record.max_cred_num,
             )
-            ensure_future(
+            # keep a tenant profile open until the registry is staged
+            release_profile = hold_tenant_profile(session.profile)
+            staging = ensure_future(
                 pending_registry_record.stage_pending_registry(session, max_attempts=16)
             )
+            if release_profile:
+                staging.add_done_callback(lambda fut: release_profile())
 
             tails_server = session.inject(BaseTailsServer)
             (upload_success, reason) = await tails_server.upload_tails_file(
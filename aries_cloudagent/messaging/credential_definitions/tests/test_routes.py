@@ -1,3 +1,5 @@
+import asyncio
+
 from asynctest import TestCase as AsyncTestCase
 from asynctest import mock as async_mock
 
@@ -83,11 +85,14 @@ class TestCredentialDefinitionRoutes(AsyncTestCase):
         )
         self.context.injector.bind_instance(BaseTailsServer, mock_tails_server)
 
+        release = async_mock.MagicMock()
         with async_mock.patch.object(
             test_module, "IndyRevocation", async_mock.MagicMock()
         ) as test_indy_revoc, async_mock.patch.object(
             test_module.web, "json_response", async_mock.MagicMock()
-        ) as mock_response:
+        ) as mock_response, async_mock.patch.object(
+            test_module, "hold_tenant_profile", return_value=release
+        ) as mock_hold:
             test_indy_revoc.return_value = async_mock.MagicMock(
                 init_issuer_registry=async_mock.CoroutineMock(
                     return_value=async_mock.MagicMock(
@@ -106,6 +111,9 @@ class TestCredentialDefinitionRoutes(AsyncTestCase):
             mock_response.assert_called_once_with(
                 {"credential_definition_id": CRED_DEF_ID}
             )
+            mock_hold.assert_called_once()
+            await asyncio.sleep(0.01)
+            release.assert_called_once_with()
 
     async def test_send_credential_definition_revoc_no_tails_server_x(self):
         self.request.json = async_mock.CoroutineMock(
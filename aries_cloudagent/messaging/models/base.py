@@ -1,7 +1,10 @@
 """Base classes for Models and Schemas."""
 import logging
+import threading
 from abc import ABC
 import json
+from contextlib import contextmanager
+from functools import lru_cache
 from typing import Union
 
 from marshmallow import Schema, post_dump, pre_load, post_load, ValidationError, EXCLUDE
@@ -32,10 +35,47 @@ def resolve_class(the_cls, relative_cls: type = None):
         resolved = the_cls
     elif isinstance(the_cls, str):
         default_module = relative_cls and relative_cls.__module__
-        resolved = ClassLoader.load_class(the_cls, default_module)
+        resolved = _load_class(the_cls, default_module)
     return resolved
 
 
+@lru_cache(maxsize=1024)
+def _load_class(class_name: str, default_module: str = None) -> type:
+    """Load a class by name, remembering the result."""
+    return ClassLoader.load_class(class_name, default_module)
+
+
+class _SchemaPool(threading.local):
+    """Idle schema instances by schema class, kept separately for each thread."""
+
+    def __init__(self):
+        """Initialize the pool for the current thread."""
+        self.idle = {}
+
+
+_SCHEMA_POOL = _SchemaPool()
+
+
+@contextmanager
+def schema_instance(schema_class: type):
+    """
+    Borrow a reusable schema instance for the duration of a load or dump.
+
+    Instances are not shared between threads, and a nested load or dump of
+    the same schema class receives its own instance.
+
+    Args:
+        schema_class: The schema class to instantiate
+
+    """
+    idle = _SCHEMA_POOL.idle.setdefault(schema_class, [])
+    schema = idle.pop() if idle else schema_class(unknown=EXCLUDE)
+    try:
+        yield schema
+    finally:
+        idle.append(schema)
+
+
 def resolve_meta_property(obj, prop_name: str, defval=None):
     """
     Resolve a meta property.
@@ -122,9 +162,9 @@ class BaseModel(ABC):
             A model instance for this data
 
         """
-        schema = cls._get_schema_class()(unknown=EXCLUDE)
         try:
-            return schema.loads(obj) if isinstance(obj, str) else schema.load(obj)
+            with schema_instance(cls._get_schema_class()) as schema:
+                return schema.loads(obj) if isinstance(obj, str) else schema.load(obj)
         except ValidationError as e:
             LOGGER.exception(f"{cls.__name__} message validation error:")
             raise BaseModelError(f"{cls.__name__} schema validation failed") from e
@@ -140,13 +180,13 @@ class BaseModel(ABC):
             A dict representation of this model, or a JSON string if as_string is True
 
         """
-        schema = self.Schema(unknown=EXCLUDE)
         try:
-            return (
-                schema.dumps(self, separators=(",", ":"))
-                if as_string
-                else schema.dump(self)
-            )
+            with schema_instance(self.Schema) as schema:
+                return (
+                    schema.dumps(self, separators=(",", ":"))
+                    if as_string
+                    else schema.dump(self)
+                )
         except ValidationError as e:
             LOGGER.exception(f"{self.__class__.__name__} message serialization error:")
             raise BaseModelError(
@@ -155,8 +195,16 @@ class BaseModel(ABC):
 
     def validate(self):
         """Validate a constructed model."""
-        schema = self.Schema(unknown=EXCLUDE)
-        errors = schema.validate(self.serialize())
+        with schema_instance(self.Schema) as schema:
+            try:
+                errors = schema.validate(schema.dump(self))
+            except ValidationError as e:
+                LOGGER.exception(
+                    f"{self.__class__.__name__} message serialization error:"
+                )
+                raise BaseModelError(
+                    f"{self.__class__.__name__} schema validation failed"
+                ) from e
         if errors:
             raise ValidationError(errors)
         return self
@@ -5,14 +5,22 @@ import sys
 import uuid
 
 from datetime import datetime
-from typing import Any, Mapping, Sequence, Union
+from typing import Any, AsyncIterator, Mapping, Sequence, Tuple, Union
 
 from marshmallow import fields
 
 from ...cache.base import BaseCache
 from ...core.profile import ProfileSession
-from ...storage.base import BaseStorage, StorageDuplicateError, StorageNotFoundError
+from ...storage.base import (
+    DEFAULT_PAGE_SIZE,
+    BaseStorage,
+    BaseStorageSearch,
+    StorageDuplicateError,
+    StorageNotFoundError,
+)
+from ...storage.error import StorageSearchError
 from ...storage.record import StorageRecord
+from ...wallet.util import b64_to_str, str_to_b64
 
 from .base import BaseModel, BaseModelSchema
 from ..responder import BaseResponder
@@ -60,6 +68,25 @@ def match_post_filter(
     return positive
 
 
+def encode_query_cursor(offset: int) -> str:
+    """Encode the position of a paginated query as an opaque cursor."""
+    return str_to_b64(json.dumps({"offset": offset}), urlsafe=True, pad=False)
+
+
+def decode_query_cursor(cursor: str) -> int:
+    """Decode a cursor produced by `encode_query_cursor` into a position."""
+    if not cursor:
+        return 0
+    try:
+        position = json.loads(b64_to_str(cursor + "=" * (-len(cursor) % 4), True))
+        offset = position["offset"]
+    except (ValueError, TypeError, KeyError) as err:
+        raise StorageSearchError("Invalid query cursor") from err
+    if not isinstance(offset, int) or offset < 0:
+        raise StorageSearchError("Invalid query cursor")
+    return offset
+
+
 class BaseRecord(BaseModel):
     """Represents a single storage record."""
 
@@ -294,6 +321,112 @@ class BaseRecord(BaseModel):
                 result.append(cls.from_storage(record.id, vals))
         return result
 
+    @classmethod
+    async def query_iter(
+        cls,
+        session: ProfileSession,
+        tag_filter: dict = None,
+        *,
+        post_filter_positive: dict = None,
+        post_filter_negative: dict = None,
+        alt: bool = False,
+        page_size: int = None,
+    ) -> AsyncIterator["BaseRecord"]:
+        """Iterate stored records, fetching them from storage one page at a time.
+
+        Args:
+            session: The profile session to use
+            tag_filter: An optional dictionary of tag filter clauses
+            post_filter_positive: Additional value filters to apply matching positively
+            post_filter_negative: Additional value filters to apply matching negatively
+            alt: set to match any (positive=True) value or miss all (positive=False)
+                values in post_filter
+            page_size: The number of storage records to fetch at a time
+        """
+        storage = session.inject(BaseStorageSearch)
+        search = storage.search_records(
+            cls.RECORD_TYPE,
+            cls.prefix_tag_filter(tag_filter),
+            page_size,
+            options={"retrieveTags": False},
+        )
+        try:
+            async for record in search:
+                vals = json.loads(record.value)
+                if match_post_filter(
+                    vals, post_filter_positive, positive=True, alt=alt
+                ) and match_post_filter(
+                    vals, post_filter_negative, positive=False, alt=alt
+                ):
+                    yield cls.from_storage(record.id, vals)
+        finally:
+            await search.close()
+
+    @classmethod
+    async def query_page(
+        cls,
+        session: ProfileSession,
+        tag_filter: dict = None,
+        *,
+        limit: int,
+        cursor: str = None,
+        post_filter_positive: dict = None,
+        post_filter_negative: dict = None,
+        alt: bool = False,
+    ) -> Tuple[Sequence["BaseRecord"], str]:
+        """Query one page of stored records.
+
+        Args:
+            session: The profile session to use
+            tag_filter: An optional dictionary of tag filter clauses
+            limit: The maximum number of records to return
+            cursor: The cursor returned with the previous page, if any
+            post_filter_positive: Additional value filters to apply matching positively
+            post_filter_negative: Additional value filters to apply matching negatively
+            alt: set to match any (positive=True) value or miss all (positive=False)
+                values in post_filter
+
+        Returns:
+            A tuple of the matching records and the cursor for the next page,
+            which is `None` once all records have been returned
+
+        """
+        offset = decode_query_cursor(cursor)
+        limit = max(limit, 1)
+        storage = session.inject(BaseStorageSearch)
+        search = storage.search_records(
+            cls.RECORD_TYPE,
+            cls.prefix_tag_filter(tag_filter),
+            min(limit, DEFAULT_PAGE_SIZE),
+            options={"retrieveTags": False},
+        )
+        result = []
+        try:
+            # resume from the previous position without decoding skipped rows
+            skip = offset
+            while skip > 0:
+                rows = await search.fetch(min(skip, DEFAULT_PAGE_SIZE))
+                if not rows:
+                    return result, None
+                skip -= len(rows)
+            while len(result) < limit:
+                # only fetch the rows needed, so none are lost between pages
+                rows = await search.fetch(min(limit - len(result), DEFAULT_PAGE_SIZE))
+                if not rows:
+                    return result, None
+                for record in rows:
+                    offset += 1
+                    vals = json.loads(record.value)
+                    if match_post_filter(
+                        vals, post_filter_positive, positive=True, alt=alt
+                    ) and match_post_filter(
+                        vals, post_filter_negative, positive=False, alt=alt
+                    ):
+                        result.append(cls.from_storage(record.id, vals))
+        finally:
+            await search.close()
+        return result, encode_query_cursor(offset)
+
     async def save(
         self,
         session: ProfileSession,
@@ -338,6 +471,57 @@ class BaseRecord(BaseModel):
 
         return self._id
 
+    @classmethod
+    async def save_all(
+        cls,
+        session: ProfileSession,
+        records: Sequence["BaseRecord"],
+        *,
+        reason: str = None,
+        webhook: bool = None,
+    ) -> Sequence[str]:
+        """Persist several records to storage using bulk storage operations.
+
+        Args:
+            session: The profile session to use
+            records: The records to create or update
+            reason: A reason to add to the log
+            webhook: Flag to override whether the webhooks are sent
+
+        Returns:
+            The identifiers of the saved records
+
+        """
+        storage = session.inject(BaseStorage)
+        now = time_now()
+        added = []
+        updated = []
+        for record in records:
+            record.updated_at = now
+            if record._id:
+                updated.append(record)
+            else:
+                record._id = str(uuid.uuid4())
+                record.created_at = now
+                added.append(record)
+
+        if added:
+            await storage.add_records([record.storage_record for record in added])
+        if updated:
+            await storage.update_records([record.storage_record for record in updated])
+
+        added_ids = {record._id for record in added}
+        for record in records:
+            new_record = record._id in added_ids
+            log_reason = reason or (
+                "Created record" if new_record else "Updated record"
+            )
+            record.log_state(session, log_reason, {cls.RECORD_TYPE: record.serialize()})
+            await record.post_save(session, new_record, record._last_state, webhook)
+            record._last_state = record.state
+
+        return [record._id for record in records]
+
     async def post_save(
         self,
         session: ProfileSession,
@@ -372,6 +556,19 @@ class BaseRecord(BaseModel):
             await storage.delete_record(self.storage_record)
         # FIXME - update state and send webhook?
 
+    @classmethod
+    async def delete_all(cls, session: ProfileSession, records: Sequence["BaseRecord"]):
+        """Remove several stored records using bulk storage operations.
+
+        Args:
+            session: The profile session to use
+            records: The records to remove
+        """
+        stored = [record.storage_record for record in records if record._id]
+        if stored:
+            storage = session.inject(BaseStorage)
+            await storage.delete_records(stored)
+
     @property
     def webhook_payload(self):
         """Return a JSON-serialized version of the record for the webhook."""
@@ -0,0 +1,42 @@
+"""Class for paginated query parameters."""
+
+from typing import Tuple
+
+from aiohttp.web import BaseRequest
+from marshmallow import fields, validate
+
+from .openapi import OpenAPISchema
+
+MAXIMUM_PAGE_LIMIT = 10000
+
+
+class PaginatedQuerySchema(OpenAPISchema):
+    """Parameters for paginated record list queries."""
+
+    limit = fields.Int(
+        description=(
+            "Maximum number of records to return; "
+            "if omitted, all matching records are returned"
+        ),
+        required=False,
+        validate=validate.Range(min=1, max=MAXIMUM_PAGE_LIMIT),
+        example=100,
+    )
+    cursor = fields.Str(
+        description="Cursor returned with the previous page of results",
+        required=False,
+    )
+
+
+def get_paginated_query_params(request: BaseRequest) -> Tuple[int, str]:
+    """
+    Read the page limit and cursor from a request query string.
+
+    Returns:
+        A tuple of the page limit, or `None` if all records were requested,
+        and the cursor for the page to fetch
+
+    """
+    limit = request.query.get("limit")
+    limit = min(max(int(limit), 1), MAXIMUM_PAGE_LIMIT) if limit else None
+    return limit, request.query.get("cursor") or None
@@ -1,4 +1,5 @@
 import json
+import threading
 
 from asynctest import TestCase as AsyncTestCase, mock as async_mock
 
@@ -11,7 +12,7 @@ from ....storage.base import BaseStorage, StorageRecord
 from ...responder import BaseResponder, MockResponder
 from ...util import time_now
 
-from ..base import BaseModel, BaseModelError, BaseModelSchema
+from ..base import BaseModel, BaseModelError, BaseModelSchema, schema_instance
 
 
 class ModelImpl(BaseModel):
@@ -63,3 +64,25 @@ class TestBase(AsyncTestCase):
         data = "{}{}"
         with self.assertRaises(BaseModelError):
             ModelImpl.from_json(data)
+
+    def test_schema_instance_reused(self):
+        with schema_instance(SchemaImpl) as first:
+            with schema_instance(SchemaImpl) as nested:
+                assert nested is not first
+        with schema_instance(SchemaImpl) as again:
+            assert again is first or again is nested
+
+        model = ModelImpl.deserialize({"attr": "succeeds"})
+        assert model.serialize() == {"attr": "succeeds"}
+        assert model.validate() is model
+
+    def test_schema_instance_threads(self):
+        with schema_instance(SchemaImpl) as local:
+            pass
+        found = []
+        thread = threading.Thread(
+            target=lambda: found.append(schema_instance(SchemaImpl).__enter__())
+        )
+        thread.start()
+        thread.join()
+        assert found and found[0] is not local
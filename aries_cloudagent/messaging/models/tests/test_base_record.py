@@ -5,12 +5,19 @@ from marshmallow import EXCLUDE, fields
 
 from ....cache.base import BaseCache
 from ....core.in_memory import InMemoryProfile
-from ....storage.base import BaseStorage, StorageDuplicateError, StorageRecord
+from ....storage.base import (
+    BaseStorage,
+    BaseStorageSearch,
+    StorageDuplicateError,
+    StorageRecord,
+)
+from ....storage.error import StorageSearchError
+from ....wallet.util import str_to_b64
 
 from ...responder import BaseResponder, MockResponder
 from ...util import time_now
 
-from ..base_record import BaseRecord, BaseRecordSchema
+from ..base_record import BaseRecord, BaseRecordSchema, encode_query_cursor
 
 
 class BaseRecordImpl(BaseRecord):
@@ -151,6 +158,39 @@ class TestBaseRecord(AsyncTestCase):
             with self.assertRaises(ZeroDivisionError):
                 await rec.save(session)
 
+    async def test_save_all_delete_all(self):
+        session = InMemoryProfile.test_session()
+        existing = ARecordImpl(a="1", b="0", code="one")
+        await existing.save(session)
+        existing.b = "updated"
+        records = [existing] + [
+            ARecordImpl(a="1", b=str(i), code="one") for i in range(1, 4)
+        ]
+        mock_storage = session.inject(BaseStorage)
+        with async_mock.patch.object(
+            mock_storage, "add_records", wraps=mock_storage.add_records
+        ) as mock_add, async_mock.patch.object(
+            mock_storage, "update_records", wraps=mock_storage.update_records
+        ) as mock_update, async_mock.patch.object(
+            ARecordImpl, "post_save", async_mock.CoroutineMock()
+        ) as mock_post_save:
+            ids = await ARecordImpl.save_all(session, records)
+            assert len(mock_add.call_args[0][0]) == 3
+            assert len(mock_update.call_args[0][0]) == 1
+            assert [call[0][1] for call in mock_post_save.call_args_list] == [
+                False,
+                True,
+                True,
+                True,
+            ]
+        assert ids == [record._id for record in records]
+        found = await ARecordImpl.query(session, {"code": "one"})
+        assert sorted(rec.b for rec in found) == ["1", "2", "3", "updated"]
+
+        await ARecordImpl.delete_all(session, records[:3] + [ARecordImpl(a="", b="")])
+        found = await ARecordImpl.query(session, {"code": "one"})
+        assert [rec.b for rec in found] == ["3"]
+
     async def test_neq(self):
         a_rec = ARecordImpl(a="1", b="0", code="one")
         b_rec = BaseRecordImpl()
@@ -176,6 +216,93 @@ class TestBaseRecord(AsyncTestCase):
         assert result[0]._id == record_id
         assert result[0].value == record_value
 
+    async def test_query_iter(self):
+        session = InMemoryProfile.test_session()
+        for i in range(5):
+            await ARecordImpl(a="1", b=str(i), code=str(i % 2)).save(session)
+        await ARecordImpl(a="2", b="5", code="0").save(session)
+
+        found = [
+            rec.b
+            async for rec in ARecordImpl.query_iter(
+                session,
+                {"code": "0"},
+                post_filter_positive={"a": "1"},
+                page_size=1,
+            )
+        ]
+        assert found == ["0", "2", "4"]
+
+    async def test_query_page(self):
+        session = InMemoryProfile.test_session()
+        for i in range(7):
+            await ARecordImpl(a=str(i % 2), b=str(i), code="one").save(session)
+
+        found = []
+        cursor = None
+        pages = 0
+        while True:
+            records, cursor = await ARecordImpl.query_page(
+                session,
+                {"code": "one"},
+                limit=2,
+                cursor=cursor,
+                post_filter_negative={"a": "1"},
+            )
+            found.extend(rec.b for rec in records)
+            pages += 1
+            if not cursor:
+                break
+        assert found == ["0", "2", "4", "6"]
+        assert pages == 3
+
+        records, cursor = await ARecordImpl.query_page(
+            session, {"code": "one"}, limit=10, cursor=encode_query_cursor(100)
+        )
+        assert records == [] and cursor is None
+
+        with self.assertRaises(StorageSearchError):
+            await ARecordImpl.query_page(session, limit=1, cursor="not-a-cursor")
+        with self.assertRaises(StorageSearchError):
+            await ARecordImpl.query_page(
+                session, limit=1, cursor=encode_query_cursor(-1)
+            )
+
+    async def test_query_page_repeats_search(self):
+        session = InMemoryProfile.test_session()
+        for i in range(5):
+            await ARecordImpl(a="a", b=str(i), code="one").save(session)
+        storage = session.inject(BaseStorageSearch)
+
+        with async_mock.patch.object(
+            storage, "search_records", wraps=storage.search_records
+        ) as mock_search:
+            records, cursor = await ARecordImpl.query_page(
+                session, {"code": "one"}, limit=2
+            )
+            assert [rec.b for rec in records] == ["0", "1"]
+            records, cursor = await ARecordImpl.query_page(
+                session, {"code": "one"}, limit=2, cursor=cursor
+            )
+            assert [rec.b for rec in records] == ["2", "3"]
+            # each page repeats the search up to its position
+            assert mock_search.call_count == 2
+            for call in mock_search.call_args_list:
+                assert call[0][2] == 2
+
+            # cursors naming a search held by an earlier version still resume
+            records, cursor = await ARecordImpl.query_page(
+                session,
+                {"code": "one"},
+                limit=2,
+                cursor=str_to_b64(
+                    json.dumps({"offset": 4, "search": "0" * 32}),
+                    urlsafe=True,
+                    pad=False,
+                ),
+            )
+            assert [rec.b for rec in records] == ["4"] and cursor is None
+
     async def test_query_post_filter(self):
         session = InMemoryProfile.test_session()
         mock_storage = async_mock.MagicMock(BaseStorage, autospec=True)
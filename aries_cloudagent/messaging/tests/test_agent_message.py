@@ -268,3 +268,23 @@ class TestAgentMessageSchema(AsyncTestCase):
         }
         result = SignedAgentMessage.deserialize(serial)
         result.serialize()
+
+    def test_deserialize_decorators_not_shared(self):
+        class ThreadedMessage(AgentMessage):
+            class Meta:
+                schema_class = "ThreadedMessageSchema"
+                message_type = "threaded-message"
+
+        class ThreadedMessageSchema(AgentMessageSchema):
+            class Meta:
+                model_class = ThreadedMessage
+                unknown = EXCLUDE
+
+        ThreadedMessage.Meta.schema_class = ThreadedMessageSchema
+        first = ThreadedMessage.deserialize(
+            {"@type": "threaded-message", "~thread": {"thid": "first"}}
+        )
+        second = ThreadedMessage.deserialize({"@type": "threaded-message"})
+        assert first._decorators is not second._decorators
+        assert first._thread_id == "first"
+        assert "~thread" not in second.serialize()
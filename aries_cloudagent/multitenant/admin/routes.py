@@ -1,5 +1,9 @@
 """Multitenant admin routes."""
 
+import json
+
+from typing import Tuple
+
 from marshmallow import fields, validate, validates_schema, ValidationError
 from aiohttp import web
 from aiohttp_apispec import docs, request_schema, match_info_schema, response_schema
@@ -28,6 +32,35 @@ def format_wallet_record(wallet_record: WalletRecord):
     return wallet_info
 
 
+def wallet_create_settings(body: dict) -> Tuple[dict, str]:
+    """Build the wallet settings and key management mode for a create request."""
+
+    key_management_mode = body.get("key_management_mode") or WalletRecord.MODE_MANAGED
+    wallet_key = body.get("wallet_key")
+    wallet_webhook_urls = body.get("wallet_webhook_urls") or []
+    wallet_dispatch_type = body.get("wallet_dispatch_type") or "default"
+    # If no webhooks specified, then dispatch only to base webhook targets
+    if wallet_webhook_urls == []:
+        wallet_dispatch_type = "base"
+
+    settings = {
+        "wallet.type": body.get("wallet_type") or "in_memory",
+        "wallet.name": body.get("wallet_name"),
+        "wallet.key": wallet_key,
+        "wallet.webhook_urls": wallet_webhook_urls,
+        "wallet.dispatch_type": wallet_dispatch_type,
+    }
+
+    label = body.get("label")
+    image_url = body.get("image_url")
+    if label:
+        settings["default_label"] = label
+    if image_url:
+        settings["image_url"] = image_url
+
+    return (settings, key_management_mode)
+
+
 class MultitenantModuleResponseSchema(OpenAPISchema):
     """Response schema for multitenant module."""
 
@@ -125,6 +158,28 @@ class CreateWalletResponseSchema(WalletRecordSchema):
     )
 
 
+class CreateWalletsRequestSchema(OpenAPISchema):
+    """Request schema for adding several new wallets."""
+
+    wallets = fields.List(
+        fields.Nested(CreateWalletRequestSchema()),
+        required=True,
+        description="Wallets to create",
+    )
+
+
+class CreateWalletsResultSchema(CreateWalletResponseSchema):
+    """Result schema for one of several created wallets."""
+
+    index = fields.Int(
+        description="Position of the wallet in the request", example=0, required=True
+    )
+    error = fields.Str(
+        description="Reason the wallet could not be created",
+        example="Wallet with name MyNewWallet already exists",
+    )
+
+
 class RemoveWalletRequestSchema(OpenAPISchema):
     """Request schema for removing a wallet."""
 
@@ -230,28 +285,8 @@ async def wallet_create(request: web.BaseRequest):
     context: AdminRequestContext = request["context"]
     body = await request.json()
 
-    key_management_mode = body.get("key_management_mode") or WalletRecord.MODE_MANAGED
-    wallet_key = body.get("wallet_key")
-    wallet_webhook_urls = body.get("wallet_webhook_urls") or []
-    wallet_dispatch_type = body.get("wallet_dispatch_type") or "default"
-    # If no webhooks specified, then dispatch only to base webhook targets
-    if wallet_webhook_urls == []:
-        wallet_dispatch_type = "base"
-
-    settings = {
-        "wallet.type": body.get("wallet_type") or "in_memory",
-        "wallet.name": body.get("wallet_name"),
-        "wallet.key": wallet_key,
-        "wallet.webhook_urls": wallet_webhook_urls,
-        "wallet.dispatch_type": wallet_dispatch_type,
-    }
-
-    label = body.get("label")
-    image_url = body.get("image_url")
-    if label:
-        settings["default_label"] = label
-    if image_url:
-        settings["image_url"] = image_url
+    (settings, key_management_mode) = wallet_create_settings(body)
+    wallet_key = settings["wallet.key"]
 
     async with context.session() as session:
         try:
@@ -272,6 +307,58 @@ async def wallet_create(request: web.BaseRequest):
     return web.json_response(result)
 
 
+@docs(
+    tags=["multitenancy"],
+    summary="Create several subwallets",
+    description="The result for each wallet is streamed as a line of JSON"
+    " (application/x-ndjson), in order of completion.",
+)
+@request_schema(CreateWalletsRequestSchema)
+@response_schema(CreateWalletsResultSchema(), 200, description="")
+async def wallets_create(request: web.BaseRequest):
+    """
+    Request handler for adding several new subwallets for handling by the agent.
+
+    Args:
+        request: aiohttp request object
+    """
+
+    context: AdminRequestContext = request["context"]
+    body = await request.json()
+
+    wallets = [wallet_create_settings(wallet) for wallet in body["wallets"]]
+    wallet_keys = [settings["wallet.key"] for (settings, _) in wallets]
+
+    multitenant_mgr = context.inject(MultitenantManager)
+    try:
+        results = await multitenant_mgr.create_wallets(wallets)
+    except BaseError as err:
+        raise web.HTTPBadRequest(reason=err.roll_up) from err
+
+    try:
+        response = web.StreamResponse()
+        response.content_type = "application/x-ndjson"
+        await response.prepare(request)
+
+        async for (index, wallet_record, error) in results:
+            if error:
+                result = {"index": index, "error": error.roll_up}
+            else:
+                result = {
+                    "index": index,
+                    **format_wallet_record(wallet_record),
+                    "token": multitenant_mgr.create_auth_token(
+                        wallet_record, wallet_keys[index]
+                    ),
+                }
+            await response.write(json.dumps(result).encode() + b"\n")
+
+        await response.write_eof()
+    finally:
+        await results.aclose()
+    return response
+
+
 @docs(tags=["multitenancy"], summary="Get auth token for a subwallet")
 @request_schema(CreateWalletTokenRequestSchema)
 @response_schema(CreateWalletTokenResponseSchema(), 200, description="")
@@ -352,6 +439,7 @@ async def register(app: web.Application):
     app.add_routes(
         [
             web.get("/multitenancy/wallets", wallets_list, allow_head=False),
+            web.post("/multitenancy/wallets", wallets_create),
             web.post("/multitenancy/wallet", wallet_create),
             web.get("/multitenancy/wallet/{wallet_id}", wallet_get, allow_head=False),
             web.post("/multitenancy/wallet/{wallet_id}/token", wallet_create_token),
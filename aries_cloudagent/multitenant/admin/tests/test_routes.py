@@ -1,3 +1,5 @@
+import json
+
 from asynctest import TestCase as AsyncTestCase
 from asynctest import mock as async_mock
 from marshmallow.exceptions import ValidationError
@@ -163,6 +165,103 @@ class TestMultitenantRoutes(AsyncTestCase):
         with self.assertRaises(test_module.web.HTTPBadRequest):
             await test_module.wallet_create(self.request)
 
+    async def test_wallets_create(self):
+        body = {
+            "wallets": [
+                {"wallet_name": "one", "wallet_key": "key1"},
+                {"wallet_name": "two", "wallet_key": "key2"},
+            ]
+        }
+        self.request.json = async_mock.CoroutineMock(return_value=body)
+
+        mock_multitenant_mgr = async_mock.MagicMock(MultitenantManager, autospec=True)
+        self.context.injector.bind_instance(MultitenantManager, mock_multitenant_mgr)
+        wallet_record = WalletRecord(
+            wallet_id="test", settings={"wallet.name": "one", "wallet.key": "key1"}
+        )
+
+        async def results():
+            yield (1, None, MultitenantManagerError("Wallet already exists"))
+            yield (0, wallet_record, None)
+
+        async def create_wallets(wallets):
+            assert [settings["wallet.name"] for (settings, _) in wallets] == [
+                "one",
+                "two",
+            ]
+            assert wallets[0][1] == WalletRecord.MODE_MANAGED
+            return results()
+
+        mock_multitenant_mgr.create_wallets = create_wallets
+        mock_multitenant_mgr.create_auth_token.return_value = "test_token"
+
+        mock_response = async_mock.MagicMock(
+            prepare=async_mock.CoroutineMock(),
+            write=async_mock.CoroutineMock(),
+            write_eof=async_mock.CoroutineMock(),
+        )
+        with async_mock.patch.object(
+            test_module.web, "StreamResponse", return_value=mock_response
+        ):
+            result = await test_module.wallets_create(self.request)
+
+        assert result is mock_response
+        mock_response.prepare.assert_awaited_once_with(self.request)
+        mock_multitenant_mgr.create_auth_token.assert_called_once_with(
+            wallet_record, "key1"
+        )
+        lines = [
+            json.loads(call[0][0].decode())
+            for call in mock_response.write.call_args_list
+        ]
+        assert lines == [
+            {"index": 1, "error": "Wallet already exists."},
+            {
+                "index": 0,
+                **test_module.format_wallet_record(wallet_record),
+                "token": "test_token",
+            },
+        ]
+        mock_response.write_eof.assert_awaited_once_with()
+
+    async def test_wallets_create_x(self):
+        self.request.json = async_mock.CoroutineMock(
+            return_value={"wallets": [{"wallet_name": "one"}]}
+        )
+        mock_multitenant_mgr = async_mock.MagicMock(MultitenantManager, autospec=True)
+        self.context.injector.bind_instance(MultitenantManager, mock_multitenant_mgr)
+        mock_multitenant_mgr.create_wallets = async_mock.CoroutineMock(
+            side_effect=StorageError()
+        )
+
+        with async_mock.patch.object(
+            test_module.web, "StreamResponse", autospec=True
+        ) as mock_response_cls:
+            with self.assertRaises(test_module.web.HTTPBadRequest):
+                await test_module.wallets_create(self.request)
+        mock_response_cls.assert_not_called()
+
+    async def test_wallets_create_prepare_x(self):
+        self.request.json = async_mock.CoroutineMock(
+            return_value={"wallets": [{"wallet_name": "one"}]}
+        )
+        mock_multitenant_mgr = async_mock.MagicMock(MultitenantManager, autospec=True)
+        self.context.injector.bind_instance(MultitenantManager, mock_multitenant_mgr)
+        results = async_mock.MagicMock(aclose=async_mock.CoroutineMock())
+        mock_multitenant_mgr.create_wallets = async_mock.CoroutineMock(
+            return_value=results
+        )
+        mock_response = async_mock.MagicMock(
+            prepare=async_mock.CoroutineMock(side_effect=ConnectionResetError())
+        )
+
+        with async_mock.patch.object(
+            test_module.web, "StreamResponse", return_value=mock_response
+        ):
+            with self.assertRaises(ConnectionResetError):
+                await test_module.wallets_create(self.request)
+        results.aclose.assert_awaited_once_with()
+
     async def test_wallet_create_schema_validation_fails_indy_no_name_key(self):
         incorrect_body = {"wallet_type": "indy"}
 
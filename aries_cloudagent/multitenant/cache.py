@@ -0,0 +1,467 @@
+"""Bounded pool of open tenant profiles."""
+
+import asyncio
+import hashlib
+import logging
+import time
+
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Optional, Set, Tuple
+
+from ..core.in_memory import InMemoryProfile
+from ..core.profile import Profile
+from ..utils.stats import Collector
+from ..wallet.models.wallet_record import WalletRecord
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MAX_PROFILES = 100
+DEFAULT_MAX_TOKENS = 1000
+DEFAULT_MAX_WALLETS = 1000
+
+
+class _PoolEntry:
+    """An open profile held in the pool."""
+
+    def __init__(self, profile: Profile):
+        """Initialize the pool entry."""
+        self.profile = profile
+        # closing an in-memory profile discards its contents
+        self.pinned = profile.backend == InMemoryProfile.BACKEND_NAME
+        self.refs = 0
+        self.expire: asyncio.TimerHandle = None
+
+    @property
+    def evictable(self) -> bool:
+        """Check whether the profile may be closed by the pool."""
+        return not (self.refs or self.pinned)
+
+
+class ProfileCache:
+    """
+    Keep a bounded number of tenant profiles open.
+
+    Profiles are evicted in least recently used order once the pool exceeds its
+    capacity, or once they have been idle for longer than the idle timeout.
+    Evicted profiles are closed in the background. Profiles acquired by a
+    caller are never evicted until they are released again, and in-memory
+    profiles are never evicted at all.
+    """
+
+    def __init__(
+        self,
+        capacity: int = None,
+        idle_timeout: float = None,
+        collector: Collector = None,
+    ):
+        """
+        Initialize a `ProfileCache` instance.
+
+        Args:
+            capacity: The maximum number of profiles to keep open
+            idle_timeout: The number of seconds after which an idle profile is closed
+            collector: The stats collector used to log open latency
+
+        """
+        self.capacity = capacity or DEFAULT_MAX_PROFILES
+        self.idle_timeout = idle_timeout
+        self.collector = collector
+        self._profiles: Dict[str, _PoolEntry] = OrderedDict()
+        self._opening: Dict[str, asyncio.Future] = {}
+        self._waiting: Dict[str, int] = {}
+        self._closing: Set[asyncio.Future] = set()
+        self.opens = 0
+        self.hits = 0
+        self.evictions = 0
+        self.open_time = 0.0
+
+    def __contains__(self, key: str) -> bool:
+        """Check whether a profile is open in the pool."""
+        return key in self._profiles
+
+    def __len__(self) -> int:
+        """Accessor for the number of open profiles."""
+        return len(self._profiles)
+
+    @property
+    def stats(self) -> dict:
+        """Accessor for the pool size and counters."""
+        return {
+            "multitenant_profiles_open": len(self._profiles),
+            "multitenant_profiles_in_use": sum(
+                1 for entry in self._profiles.values() if entry.refs
+            ),
+            "multitenant_profiles_pinned": sum(
+                1 for entry in self._profiles.values() if entry.pinned
+            ),
+            "multitenant_profile_opens": self.opens,
+            "multitenant_profile_hits": self.hits,
+            "multitenant_profile_evictions": self.evictions,
+            "multitenant_profile_open_avg": (
+                self.open_time / self.opens if self.opens else None
+            ),
+        }
+
+    def get(self, key: str) -> Profile:
+        """Get an open profile from the pool without opening it."""
+        entry = self._profiles.get(key)
+        return entry and entry.profile
+
+    def put(self, key: str, profile: Profile):
+        """Add an open profile to the pool."""
+        entry = self._profiles.get(key)
+        if entry:
+            if entry.profile is profile:
+                return
+            self._close_profile(self.remove(key))
+        self._profiles[key] = _PoolEntry(profile)
+        self._touch(key)
+        self._trim()
+
+    async def get_or_open(
+        self,
+        key: str,
+        opener: Callable[[], Awaitable[Profile]],
+        *,
+        acquire: bool = False,
+    ) -> Profile:
+        """
+        Get a profile from the pool, opening it if necessary.
+
+        Concurrent requests for a profile which is not yet open share a single
+        call to the opener.
+
+        Args:
+            key: The pool key, normally the wallet ID
+            opener: A coroutine function opening the profile
+            acquire: Whether to hold the profile open until `release` is called
+
+        Returns:
+            The open profile
+
+        """
+        entry = self._profiles.get(key)
+        if entry:
+            self.hits += 1
+        else:
+            opening = self._opening.get(key)
+            if not opening:
+                opening = self._opening[key] = asyncio.ensure_future(
+                    self._open(key, opener)
+                )
+                opening.add_done_callback(lambda fut: self._opened(key, fut))
+            else:
+                self.hits += 1
+            # the profile is not evicted before the waiting callers have resumed
+            self._waiting[key] = self._waiting.get(key, 0) + 1
+            try:
+                opened = await asyncio.shield(opening)
+            finally:
+                self._waiting[key] -= 1
+                if not self._waiting[key]:
+                    del self._waiting[key]
+            entry = self._profiles.get(key)
+            if not entry:
+                # removed while the opener was running: keep it in the pool so
+                # that it is still closed eventually
+                entry = self._profiles[key] = opened
+        if acquire:
+            entry.refs += 1
+        self._touch(key)
+        self._trim()
+        return entry.profile
+
+    def acquire(self, key: str, profile: Profile = None) -> bool:
+        """
+        Hold a profile which is already open in the pool.
+
+        Args:
+            key: The pool key
+            profile: The expected profile instance, if any
+
+        Returns:
+            Whether the profile was acquired, to be released with `release`
+
+        """
+        entry = self._profiles.get(key)
+        if not entry or (profile and entry.profile is not profile):
+            return False
+        entry.refs += 1
+        self._touch(key)
+        return True
+
+    def release(self, key: str, profile: Profile):
+        """Release a profile previously acquired from the pool."""
+        entry = self._profiles.get(key)
+        if entry and entry.profile is not profile:
+            # the acquired profile is no longer the pooled one
+            return
+        if entry and entry.refs:
+            entry.refs -= 1
+            self._touch(key)
+            self._trim()
+
+    def remove(self, key: str) -> Profile:
+        """Remove a profile from the pool without closing it."""
+        entry = self._profiles.pop(key, None)
+        if entry:
+            if entry.expire:
+                entry.expire.cancel()
+            return entry.profile
+
+    async def close(self):
+        """Close all profiles in the pool."""
+        for key in list(self._profiles):
+            self._close_profile(self.remove(key))
+        if self._closing:
+            await asyncio.wait(list(self._closing))
+
+    async def _open(
+        self, key: str, opener: Callable[[], Awaitable[Profile]]
+    ) -> _PoolEntry:
+        """Open a profile and add it to the pool."""
+        start = time.perf_counter()
+        profile = await opener()
+        elapsed = time.perf_counter() - start
+        self.opens += 1
+        self.open_time += elapsed
+        if self.collector:
+            self.collector.log("multitenant_profile_open", elapsed, start)
+        entry = self._profiles[key] = _PoolEntry(profile)
+        return entry
+
+    def _opened(self, key: str, fut: asyncio.Future):
+        """Clean up after a profile has been opened."""
+        if self._opening.get(key) is fut:
+            del self._opening[key]
+        if not fut.cancelled():
+            fut.exception()
+
+    def _touch(self, key: str):
+        """Mark a profile as most recently used and schedule its idle expiry."""
+        entry = self._profiles[key]
+        self._profiles.move_to_end(key)
+        if entry.expire:
+            entry.expire.cancel()
+            entry.expire = None
+        if self.idle_timeout and entry.evictable:
+            entry.expire = asyncio.get_event_loop().call_later(
+                self.idle_timeout, self._expire, key, entry
+            )
+
+    def _expire(self, key: str, entry: _PoolEntry):
+        """Evict a profile which has been idle for the idle timeout."""
+        if (
+            self._profiles.get(key) is entry
+            and entry.evictable
+            and key not in self._waiting
+        ):
+            LOGGER.debug("Closing idle profile for wallet %s", key)
+            self._evict(key)
+
+    def _trim(self):
+        """Evict least recently used idle profiles until within capacity."""
+        excess = len(self._profiles) - self.capacity
+        if excess <= 0:
+            return
+        # never evict the most recently used profile
+        for key in list(self._profiles)[:-1]:
+            if self._profiles[key].evictable and key not in self._waiting:
+                self._evict(key)
+                excess -= 1
+                if not excess:
+                    break
+
+    def _evict(self, key: str):
+        """Remove a profile from the pool and close it in the background."""
+        self.evictions += 1
+        self._close_profile(self.remove(key))
+
+    def _close_profile(self, profile: Profile):
+        """Close a profile in the background."""
+        closing = asyncio.ensure_future(profile.close())
+        self._closing.add(closing)
+        closing.add_done_callback(self._closed)
+
+    def _closed(self, fut: asyncio.Future):
+        """Clean up after a profile has been closed."""
+        self._closing.discard(fut)
+        if not fut.cancelled() and fut.exception():
+            LOGGER.error("Error closing profile: %s", fut.exception())
+
+
+class TokenCache:
+    """
+    Remember the wallet records resolved for recently verified tenant tokens.
+
+    Tokens are keyed by their SHA-256 digest and evicted in least recently used
+    order once the cache exceeds its capacity.
+    """
+
+    def __init__(self, capacity: int = None):
+        """
+        Initialize a `TokenCache` instance.
+
+        Args:
+            capacity: The maximum number of tokens to remember
+
+        """
+        self.capacity = capacity or DEFAULT_MAX_TOKENS
+        self._tokens: Dict[bytes, Tuple[WalletRecord, dict]] = OrderedDict()
+        self._wallet_tokens: Dict[str, Set[bytes]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Accessor for the number of remembered tokens."""
+        return len(self._tokens)
+
+    @property
+    def stats(self) -> dict:
+        """Accessor for the token cache counters."""
+        return {
+            "multitenant_tokens": len(self._tokens),
+            "multitenant_token_hits": self.hits,
+            "multitenant_token_misses": self.misses,
+        }
+
+    @staticmethod
+    def _digest(token: str) -> bytes:
+        """Compute the cache key for a token."""
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> Optional[Tuple[WalletRecord, dict]]:
+        """
+        Look up a verified token.
+
+        Args:
+            token: The token
+
+        Returns:
+            The wallet record and extra profile settings for the token, if known
+
+        """
+        digest = self._digest(token)
+        resolved = self._tokens.get(digest)
+        if not resolved:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._tokens.move_to_end(digest)
+        (wallet_record, extra_settings) = resolved
+        return (wallet_record, dict(extra_settings))
+
+    def put(self, token: str, wallet_record: WalletRecord, extra_settings: dict):
+        """
+        Remember the wallet record resolved for a verified token.
+
+        Args:
+            token: The token
+            wallet_record: The wallet record the token resolves to
+            extra_settings: Extra profile settings carried by the token
+
+        """
+        digest = self._digest(token)
+        self._discard(digest)
+        self._tokens[digest] = (wallet_record, dict(extra_settings))
+        self._wallet_tokens.setdefault(wallet_record.wallet_id, set()).add(digest)
+        while len(self._tokens) > self.capacity:
+            self._discard(next(iter(self._tokens)))
+
+    def invalidate(self, wallet_id: str):
+        """
+        Forget all tokens resolving to a wallet.
+
+        Args:
+            wallet_id: The wallet id of the wallet record
+
+        """
+        for digest in self._wallet_tokens.pop(wallet_id, ()):
+            del self._tokens[digest]
+
+    def _discard(self, digest: bytes):
+        """Forget a single token."""
+        resolved = self._tokens.pop(digest, None)
+        if resolved:
+            wallet_id = resolved[0].wallet_id
+            digests = self._wallet_tokens[wallet_id]
+            digests.discard(digest)
+            if not digests:
+                del self._wallet_tokens[wallet_id]
+
+
+class WalletCache:
+    """
+    Remember recently resolved wallet records.
+
+    Records are evicted in least recently used order once the cache exceeds its
+    capacity. A record must be invalidated whenever it is updated or removed.
+    """
+
+    def __init__(self, capacity: int = None):
+        """
+        Initialize a `WalletCache` instance.
+
+        Args:
+            capacity: The maximum number of wallet records to remember
+
+        """
+        self.capacity = capacity or DEFAULT_MAX_WALLETS
+        self._wallets: Dict[str, WalletRecord] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Accessor for the number of remembered wallet records."""
+        return len(self._wallets)
+
+    @property
+    def stats(self) -> dict:
+        """Accessor for the wallet record cache counters."""
+        return {
+            "multitenant_wallets": len(self._wallets),
+            "multitenant_wallet_hits": self.hits,
+            "multitenant_wallet_misses": self.misses,
+        }
+
+    def get(self, wallet_id: str) -> Optional[WalletRecord]:
+        """
+        Look up a wallet record.
+
+        Args:
+            wallet_id: The wallet id of the wallet record
+
+        Returns:
+            The wallet record, if known
+
+        """
+        wallet_record = self._wallets.get(wallet_id)
+        if not wallet_record:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._wallets.move_to_end(wallet_id)
+        return wallet_record
+
+    def put(self, wallet_record: WalletRecord):
+        """
+        Remember a wallet record.
+
+        Args:
+            wallet_record: The wallet record
+
+        """
+        self._wallets[wallet_record.wallet_id] = wallet_record
+        self._wallets.move_to_end(wallet_record.wallet_id)
+        while len(self._wallets) > self.capacity:
+            self._wallets.popitem(last=False)
+
+    def invalidate(self, wallet_id: str):
+        """
+        Forget a wallet record.
+
+        Args:
+            wallet_id: The wallet id of the wallet record
+
+        """
+        self._wallets.pop(wallet_id, None)
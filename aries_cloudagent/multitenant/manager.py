@@ -1,8 +1,19 @@
 """Manager for multitenancy."""
 
+import asyncio
 import logging
 import jwt
-from typing import List, Optional, cast
+from typing import (
+    AsyncGenerator,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    cast,
+)
 
 from ..core.profile import (
     Profile,
@@ -16,19 +27,23 @@ from ..wallet.base import BaseWallet
 from ..core.error import BaseError
 from ..protocols.routing.v1_0.manager import RouteNotFoundError, RoutingManager
 from ..protocols.routing.v1_0.models.route_record import RouteRecord
+from ..protocols.routing.v1_0.route_table import RouteTable
 from ..transport.wire_format import BaseWireFormat
-from ..storage.base import BaseStorage
 from ..storage.error import StorageNotFoundError
+from ..utils.stats import Collector
 from ..protocols.coordinate_mediation.v1_0.manager import (
     MediationManager,
     MediationRecord,
 )
 
+from .cache import ProfileCache, TokenCache, WalletCache
 from .error import WalletKeyMissingError
 
 
 LOGGER = logging.getLogger(__name__)
 
+DEFAULT_PROVISION_WORKERS = 8
+
 
 class MultitenantManagerError(BaseError):
     """Generic multitenant error."""
@@ -47,7 +62,13 @@ class MultitenantManager:
         if not profile:
             raise MultitenantManagerError("Missing profile")
 
-        self._instances: dict[str, Profile] = {}
+        self._instances = ProfileCache(
+            profile.settings.get("multitenant.max_profiles"),
+            profile.settings.get("multitenant.profile_idle_timeout"),
+            profile.inject(Collector, required=False),
+        )
+        self._tokens = TokenCache()
+        self._wallets = WalletCache()
 
     @property
     def profile(self) -> Profile:
@@ -60,6 +81,35 @@ class MultitenantManager:
         """
         return self._profile
 
+    @property
+    def stats(self) -> dict:
+        """Accessor for the tenant profile pool, token and wallet cache stats."""
+        return {
+            **self._instances.stats,
+            **self._tokens.stats,
+            **self._wallets.stats,
+        }
+
+    async def close(self):
+        """Close all open tenant profiles."""
+        await self._instances.close()
+
+    async def load_routes(self):
+        """Fill the route table with the subwallet routes of the base wallet.
+
+        Inbound messages for subwallets are then relayed without a storage lookup
+        of their recipient keys. Routes added or removed later keep the route
+        table current.
+        """
+        async with self.profile.session() as session:
+            table = session.inject(RouteTable, required=False)
+            if table is None:
+                return
+            async for route in RouteRecord.query_iter(session):
+                if route.wallet_id:
+                    table.add(self.profile.name, route)
+            LOGGER.debug("Loaded %d routes into the route table", len(table))
+
     async def get_default_mediator(self) -> Optional[MediationRecord]:
         """Retrieve the default mediator used for subwallet routing.
 
@@ -97,6 +147,36 @@ class MultitenantManager:
 
         return False
 
+    async def _wallet_names_exist(
+        self, session: ProfileSession, wallet_names: Sequence[str]
+    ) -> Set[str]:
+        """
+        Check which of several wallet names already exist.
+
+        The wallet record names are checked with a single storage query.
+
+        Args:
+            session: The profile session to use
+            wallet_names: the wallet names to check for
+
+        Returns:
+            The wallet names which already exist
+
+        """
+        existing = set()
+        if not wallet_names:
+            return existing
+
+        base_name = session.settings.get("wallet.name")
+        if base_name in wallet_names:
+            existing.add(base_name)
+
+        wallet_records = await WalletRecord.query(
+            session, {"wallet_name": {"$in": list(wallet_names)}}
+        )
+        existing.update(record.wallet_name for record in wallet_records)
+        return existing
+
     async def get_wallet_profile(
         self,
         base_context: InjectionContext,
@@ -104,21 +184,28 @@ class MultitenantManager:
         extra_settings: dict = {},
         *,
         provision=False,
+        acquire=False,
     ) -> Profile:
         """Get profile for a wallet record.
 
+        Open profiles are kept in a bounded pool. A profile obtained with
+        `acquire` is held open until `release_profile` is called.
+        In-memory profiles are never evicted, as closing them discards their
+        contents.
+
         Args:
             base_context: Base context to extend from
             wallet_record: Wallet record to get the context for
             extra_settings: Any extra context settings
+            provision: Whether to provision the wallet
+            acquire: Whether to hold the profile open until it is released
 
         Returns:
             Profile: Profile for the wallet record
 
         """
-        wallet_id = wallet_record.wallet_id
 
-        if wallet_id not in self._instances:
+        async def open_profile() -> Profile:
             # Extend base context
             context = base_context.copy()
 
@@ -144,21 +231,53 @@ class MultitenantManager:
             elif dispatch_type == "default":
                 extra_settings["admin.webhook_urls"] = webhook_urls
 
-            context.settings = (
-                context.settings.extend(reset_settings)
-                .extend(wallet_record.settings)
-                .extend(extra_settings)
-            )
-
-            context.settings = context.settings.extend(wallet_record.settings).extend(
-                extra_settings
+            # the wallet context only stores its own settings on top of the base
+            context.settings = context.settings.extend(
+                {**reset_settings, **wallet_record.settings, **extra_settings}
             )
 
             # MTODO: add ledger config
             profile, _ = await wallet_config(context, provision=provision)
-            self._instances[wallet_id] = profile
+            return profile
 
-        return self._instances[wallet_id]
+        return await self._instances.get_or_open(
+            wallet_record.wallet_id, open_profile, acquire=acquire
+        )
+
+    def acquire_profile(self, profile: Profile) -> bool:
+        """Hold a tenant profile open while it is in use outside of a request.
+
+        Args:
+            profile: A profile, which may or may not be a pooled tenant profile
+
+        Returns:
+            Whether the profile was acquired, to be released with `release_profile`
+
+        """
+        wallet_id = profile and profile.settings.get("wallet.id")
+        return bool(wallet_id) and self._instances.acquire(wallet_id, profile)
+
+    def release_profile(self, profile: Profile):
+        """Release a tenant profile obtained with `acquire_profile` or `acquire`.
+
+        Args:
+            profile: The acquired profile
+
+        """
+        self._instances.release(profile.settings.get("wallet.id"), profile)
+
+    def hold_profile(self, profile: Profile) -> Optional[Callable[[], None]]:
+        """Hold a tenant profile open until the returned callback is called.
+
+        Args:
+            profile: A profile, which may or may not be a pooled tenant profile
+
+        Returns:
+            A callback releasing the profile, or None if it is not pooled
+
+        """
+        if self.acquire_profile(profile):
+            return lambda: self.release_profile(profile)
 
     async def create_wallet(
         self,
@@ -200,6 +319,147 @@ class MultitenantManager:
 
             await wallet_record.save(session)
 
+        await self._provision_wallet(wallet_record, wallet_key)
+
+        return wallet_record
+
+    async def create_wallets(
+        self,
+        wallets: Sequence[Tuple[dict, str]],
+        *,
+        max_workers: int = None,
+    ) -> AsyncGenerator[Tuple[int, Optional[WalletRecord], Optional[BaseError]], None]:
+        """Create several new wallets and wallet records.
+
+        Wallet names are checked against the stored wallet records with a single
+        query and the wallet records are saved together before this method
+        returns. The wallets are then provisioned concurrently by a bounded
+        number of workers as the results are consumed.
+
+        Args:
+            wallets: The context settings and key management mode of each wallet
+            max_workers: The maximum number of wallets provisioned at once
+
+        Raises:
+            StorageError: If the wallet records could not be saved
+
+        Returns:
+            An async generator yielding, in order of completion, the index of
+            each requested wallet with either its new wallet record or the error
+            which prevented its creation. If it is not run to completion it must
+            be closed with `aclose`, which removes the records of the wallets
+            not provisioned
+
+        """
+        errors: Dict[int, BaseError] = {}
+        records: Dict[int, WalletRecord] = {}
+        wallet_keys: Dict[int, str] = {}
+
+        async with self.profile.session() as session:
+            names: Dict[str, int] = {}
+            for index, (settings, _) in enumerate(wallets):
+                wallet_name = settings.get("wallet.name")
+                if not wallet_name:
+                    continue
+                if wallet_name in names:
+                    errors[index] = MultitenantManagerError(
+                        f"Wallet with name {wallet_name} requested more than once"
+                    )
+                else:
+                    names[wallet_name] = index
+            for wallet_name in await self._wallet_names_exist(session, list(names)):
+                errors[names[wallet_name]] = MultitenantManagerError(
+                    f"Wallet with name {wallet_name} already exists"
+                )
+
+            for index, (settings, key_management_mode) in enumerate(wallets):
+                if index in errors:
+                    continue
+                settings = dict(settings)
+                wallet_keys[index] = settings.get("wallet.key")
+                # In unmanaged mode we don't want to store the wallet key
+                if key_management_mode == WalletRecord.MODE_UNMANAGED:
+                    settings.pop("wallet.key", None)
+                records[index] = WalletRecord(
+                    settings=settings, key_management_mode=key_management_mode
+                )
+            await WalletRecord.save_all(session, list(records.values()))
+
+        results = self._provision_wallets(records, wallet_keys, errors, max_workers)
+        # advance to the first yield so that closing the generator always
+        # removes the records of wallets which were not provisioned
+        await results.__anext__()
+        return results
+
+    async def _provision_wallets(
+        self,
+        records: Dict[int, WalletRecord],
+        wallet_keys: Dict[int, str],
+        errors: Dict[int, BaseError],
+        max_workers: int = None,
+    ) -> AsyncGenerator[Tuple[int, Optional[WalletRecord], Optional[BaseError]], None]:
+        """Provision the wallets for saved wallet records.
+
+        The first item yielded is `None`, once the cleanup of the wallet records
+        is in place; the results for each wallet follow.
+        """
+        pending = asyncio.Queue()
+        for index in records:
+            pending.put_nowait(index)
+        completed = asyncio.Queue()
+        provisioned = set()
+
+        async def provision():
+            while not pending.empty():
+                index = pending.get_nowait()
+                try:
+                    await self._provision_wallet(records[index], wallet_keys[index])
+                except Exception as err:
+                    LOGGER.exception("Error provisioning wallet")
+                    if not isinstance(err, BaseError):
+                        err = MultitenantManagerError("Error provisioning wallet")
+                    completed.put_nowait((index, None, err))
+                else:
+                    provisioned.add(index)
+                    completed.put_nowait((index, records[index], None))
+
+        workers = []
+        try:
+            yield None
+            workers = [
+                asyncio.ensure_future(provision())
+                for _ in range(
+                    min(max_workers or DEFAULT_PROVISION_WORKERS, len(records))
+                )
+            ]
+            for index, error in errors.items():
+                yield (index, None, error)
+            for _ in range(len(records)):
+                yield await completed.get()
+        finally:
+            # when stopped early, finish the wallets already being provisioned
+            while not pending.empty():
+                pending.get_nowait()
+            if workers:
+                await asyncio.wait(workers)
+            failed = [
+                record
+                for index, record in records.items()
+                if index not in provisioned
+            ]
+            if failed:
+                # remove the records of wallets which were not provisioned
+                async with self.profile.session() as session:
+                    await WalletRecord.delete_all(session, failed)
+
+    async def _provision_wallet(self, wallet_record: WalletRecord, wallet_key: str):
+        """Provision the wallet for a new wallet record.
+
+        Args:
+            wallet_record: The saved wallet record
+            wallet_key: The wallet key to open the wallet
+
+        """
         # provision wallet
         profile = await self.get_wallet_profile(
             self.profile.context,
@@ -208,19 +468,23 @@ class MultitenantManager:
                 "wallet.key": wallet_key,
             },
             provision=True,
+            acquire=True,
         )
 
-        # subwallet context
-        async with profile.session() as session:
-            wallet = session.inject(BaseWallet)
-            public_did_info = await wallet.get_public_did()
-
-            if public_did_info:
-                await self.add_key(
-                    wallet_record.wallet_id, public_did_info.verkey, skip_if_exists=True
-                )
-
-        return wallet_record
+        try:
+            # subwallet context
+            async with profile.session() as session:
+                wallet = session.inject(BaseWallet)
+                public_did_info = await wallet.get_public_did()
+
+                if public_did_info:
+                    await self.add_key(
+                        wallet_record.wallet_id,
+                        public_did_info.verkey,
+                        skip_if_exists=True,
+                    )
+        finally:
+            self.release_profile(profile)
 
     async def remove_wallet(self, wallet_id: str, wallet_key: str = None):
         """Remove the wallet with specified wallet id.
@@ -251,14 +515,13 @@ class MultitenantManager:
                 {"wallet.key": wallet_key},
             )
 
-            del self._instances[wallet_id]
+            self._instances.remove(wallet_id)
+            self.invalidate_wallet(wallet_id)
             await profile.remove()
 
             # Remove all routing records associated with wallet
-            storage = session.inject(BaseStorage)
-            await storage.delete_all_records(
-                RouteRecord.RECORD_TYPE, {"wallet_id": wallet.wallet_id}
-            )
+            routes = await RouteRecord.query(session, {"wallet_id": wallet.wallet_id})
+            await RouteRecord.delete_all(session, routes)
 
             await wallet.delete_record(session)
 
@@ -338,13 +601,17 @@ class MultitenantManager:
         return token
 
     async def get_profile_for_token(
-        self, context: InjectionContext, token: str
+        self, context: InjectionContext, token: str, *, acquire: bool = False
     ) -> Profile:
         """Get the profile associated with a JWT header token.
 
+        The wallet records resolved for verified tokens are cached, so that
+        repeated requests with the same token skip verification and storage.
+
         Args:
             context: The context to use for profile creation
             token: The token
+            acquire: Whether to hold the profile open until it is released
 
         Raises:
             WalletKeyMissingError: If the wallet_key is missing for an unmanaged wallet
@@ -354,16 +621,20 @@ class MultitenantManager:
             Profile associated with the token
 
         """
-        jwt_secret = self.profile.context.settings.get("multitenant.jwt_secret")
-        extra_settings = {}
+        resolved = self._tokens.get(token)
+        if resolved:
+            (wallet, extra_settings) = resolved
+        else:
+            jwt_secret = self.profile.context.settings.get("multitenant.jwt_secret")
+            extra_settings = {}
 
-        token_body = jwt.decode(token, jwt_secret, algorithms=["HS256"])
+            token_body = jwt.decode(token, jwt_secret, algorithms=["HS256"])
 
-        wallet_id = token_body.get("wallet_id")
-        wallet_key = token_body.get("wallet_key")
+            wallet_id = token_body.get("wallet_id")
+            wallet_key = token_body.get("wallet_key")
 
-        async with self.profile.session() as session:
-            wallet = await WalletRecord.retrieve_by_id(session, wallet_id)
+            async with self.profile.session() as session:
+                wallet = await WalletRecord.retrieve_by_id(session, wallet_id)
 
             if wallet.requires_external_key:
                 if not wallet_key:
@@ -371,9 +642,25 @@ class MultitenantManager:
 
                 extra_settings["wallet.key"] = wallet_key
 
-            profile = await self.get_wallet_profile(context, wallet, extra_settings)
+            self._tokens.put(token, wallet, extra_settings)
 
-            return profile
+        profile = await self.get_wallet_profile(
+            context, wallet, extra_settings, acquire=acquire
+        )
+
+        return profile
+
+    def invalidate_wallet(self, wallet_id: str):
+        """Forget the cached token resolutions and wallet record of a wallet.
+
+        Called by the wallet record whenever it is updated or deleted.
+
+        Args:
+            wallet_id: The wallet id of the wallet record
+
+        """
+        self._tokens.invalidate(wallet_id)
+        self._wallets.invalidate(wallet_id)
 
     async def _get_wallet_by_key(
         self, session: ProfileSession, recipient_key: str
@@ -390,13 +677,16 @@ class MultitenantManager:
 
         try:
             routing_record = await routing_mgr.get_recipient(recipient_key)
-            wallet = await WalletRecord.retrieve_by_id(
-                session, routing_record.wallet_id
-            )
-
-            return wallet
         except (RouteNotFoundError):
-            pass
+            return None
+
+        wallet_id = routing_record.wallet_id
+        wallet = self._wallets.get(wallet_id)
+        if not wallet:
+            wallet = await WalletRecord.retrieve_by_id(session, wallet_id)
+            self._wallets.put(wallet)
+
+        return wallet
 
     async def get_wallets_by_message(
         self, message_body, wire_format: BaseWireFormat = None
@@ -424,3 +714,17 @@ class MultitenantManager:
                     wallets.append(wallet)
 
             return wallets
+
+
+def hold_tenant_profile(profile: Profile) -> Optional[Callable[[], None]]:
+    """Hold a tenant profile open while a background task uses it.
+
+    Args:
+        profile: A profile, which may or may not be a pooled tenant profile
+
+    Returns:
+        A callback releasing the profile, or None if it is not pooled
+
+    """
+    multitenant_mgr = profile.inject(MultitenantManager, required=False)
+    return multitenant_mgr and multitenant_mgr.hold_profile(profile)
@@ -0,0 +1,259 @@
+import asyncio
+
+from asynctest import TestCase as AsyncTestCase
+from asynctest import mock as async_mock
+
+from ...core.in_memory import InMemoryProfile
+from ...utils.stats import Collector
+from ...wallet.models.wallet_record import WalletRecord
+
+from ..cache import ProfileCache, TokenCache, WalletCache
+
+
+class TestProfileCache(AsyncTestCase):
+    async def setUp(self):
+        self.opened = []
+
+    def make_opener(self, key: str, delay: float = 0):
+        async def opener():
+            await asyncio.sleep(delay)
+            profile = async_mock.MagicMock(close=async_mock.CoroutineMock())
+            profile.name = key
+            self.opened.append(profile)
+            return profile
+
+        return opener
+
+    async def test_get_or_open(self):
+        collector = Collector()
+        cache = ProfileCache(collector=collector)
+
+        profile = await cache.get_or_open("a", self.make_opener("a"))
+        assert "a" in cache and len(cache) == 1
+        assert await cache.get_or_open("a", self.make_opener("a")) is profile
+        assert cache.get("a") is profile
+        assert cache.get("b") is None
+
+        stats = cache.stats
+        assert stats["multitenant_profile_opens"] == 1
+        assert stats["multitenant_profile_hits"] == 1
+        assert stats["multitenant_profile_open_avg"] >= 0
+        assert collector.results["count"]["multitenant_profile_open"] == 1
+
+    async def test_get_or_open_single_flight(self):
+        cache = ProfileCache()
+        profiles = await asyncio.gather(
+            *(cache.get_or_open("a", self.make_opener("a", 0.01)) for _ in range(5))
+        )
+        assert len(self.opened) == 1
+        assert all(profile is self.opened[0] for profile in profiles)
+        assert cache.stats["multitenant_profile_hits"] == 4
+
+    async def test_get_or_open_x(self):
+        cache = ProfileCache()
+
+        async def opener():
+            raise ValueError("bad key")
+
+        with self.assertRaises(ValueError):
+            await cache.get_or_open("a", opener)
+        assert "a" not in cache
+        assert not cache._opening
+
+    async def test_evict_lru(self):
+        cache = ProfileCache(capacity=2)
+        a = await cache.get_or_open("a", self.make_opener("a"))
+        b = await cache.get_or_open("b", self.make_opener("b"))
+        await cache.get_or_open("a", self.make_opener("a"))
+        await cache.get_or_open("c", self.make_opener("c"))
+        await asyncio.sleep(0)
+
+        assert "a" in cache and "b" not in cache and "c" in cache
+        b.close.assert_awaited_once_with()
+        a.close.assert_not_called()
+        assert cache.stats["multitenant_profile_evictions"] == 1
+
+    async def test_acquired_not_evicted(self):
+        cache = ProfileCache(capacity=1)
+        a = await cache.get_or_open("a", self.make_opener("a"), acquire=True)
+        await cache.get_or_open("b", self.make_opener("b"))
+        await asyncio.sleep(0)
+
+        assert "a" in cache and "b" in cache
+        a.close.assert_not_called()
+        assert cache.stats["multitenant_profiles_in_use"] == 1
+
+        cache.release("a", a)
+        cache.release("a", a)
+        await cache.get_or_open("c", self.make_opener("c"))
+        await asyncio.sleep(0)
+        assert "a" not in cache and "b" not in cache and "c" in cache
+        a.close.assert_awaited_once_with()
+
+    async def test_acquire_open(self):
+        cache = ProfileCache(capacity=1)
+        a = await cache.get_or_open("a", self.make_opener("a"))
+        assert not cache.acquire("b")
+        assert not cache.acquire("a", self.opened[0].__class__())
+        assert cache.acquire("a", a)
+
+        await cache.get_or_open("b", self.make_opener("b"))
+        await asyncio.sleep(0)
+        assert "a" in cache
+
+        # releasing a replaced profile leaves the pooled one untouched
+        cache.release("a", self.opened[1])
+        assert cache.stats["multitenant_profiles_in_use"] == 1
+        cache.release("a", a)
+        await cache.get_or_open("c", self.make_opener("c"))
+        await asyncio.sleep(0)
+        assert "a" not in cache and "b" not in cache
+        a.close.assert_awaited_once_with()
+
+    async def test_in_memory_pinned(self):
+        cache = ProfileCache(capacity=1, idle_timeout=0.01)
+        a = InMemoryProfile.test_profile()
+        cache.put("a", a)
+        await cache.get_or_open("b", self.make_opener("b"))
+        await asyncio.sleep(0.03)
+        assert cache.get("a") is a
+        assert "b" not in cache
+        assert cache.stats["multitenant_profiles_pinned"] == 1
+
+    async def test_removed_while_opening(self):
+        cache = ProfileCache()
+        opening = asyncio.ensure_future(
+            cache.get_or_open("a", self.make_opener("a", 0.01), acquire=True)
+        )
+        await asyncio.sleep(0)
+        # remove once the opener has finished, before the caller resumes
+        cache._opening["a"].add_done_callback(lambda fut: cache.remove("a"))
+        profile = await opening
+        assert profile is self.opened[0]
+        assert cache.get("a") is profile
+        assert cache.stats["multitenant_profiles_in_use"] == 1
+
+        await cache.close()
+        profile.close.assert_awaited_once_with()
+
+    async def test_idle_timeout(self):
+        cache = ProfileCache(idle_timeout=0.02)
+        a = await cache.get_or_open("a", self.make_opener("a"))
+        b = await cache.get_or_open("b", self.make_opener("b"), acquire=True)
+        await asyncio.sleep(0.05)
+
+        assert "a" not in cache and "b" in cache
+        a.close.assert_awaited_once_with()
+
+        cache.release("b", self.opened[0])
+        assert "b" in cache
+        cache.release("b", b)
+        await asyncio.sleep(0.05)
+        assert not cache
+        assert cache.stats["multitenant_profile_evictions"] == 2
+
+    async def test_put_remove(self):
+        cache = ProfileCache()
+        a = await self.make_opener("a")()
+        cache.put("a", a)
+        cache.put("a", a)
+        assert cache.remove("a") is a
+        assert cache.remove("a") is None
+        a.close.assert_not_called()
+
+        b = await self.make_opener("b")()
+        cache.put("a", a)
+        cache.put("a", b)
+        await asyncio.sleep(0)
+        assert cache.get("a") is b
+        a.close.assert_awaited_once_with()
+
+    async def test_close(self):
+        cache = ProfileCache(idle_timeout=10)
+        a = await cache.get_or_open("a", self.make_opener("a"), acquire=True)
+        b = await cache.get_or_open("b", self.make_opener("b"))
+        await cache.close()
+
+        assert not cache
+        a.close.assert_awaited_once_with()
+        b.close.assert_awaited_once_with()
+        assert cache.stats["multitenant_profile_evictions"] == 0
+
+
+class TestTokenCache(AsyncTestCase):
+    async def test_get_put(self):
+        cache = TokenCache()
+        record = WalletRecord(wallet_id="a", settings={})
+        assert cache.get("token") is None
+
+        cache.put("token", record, {"wallet.key": "key"})
+        (cached_record, extra_settings) = cache.get("token")
+        assert cached_record is record
+        assert extra_settings == {"wallet.key": "key"}
+        extra_settings["admin.webhook_urls"] = []
+        assert cache.get("token")[1] == {"wallet.key": "key"}
+
+        stats = cache.stats
+        assert stats["multitenant_tokens"] == 1
+        assert stats["multitenant_token_hits"] == 2
+        assert stats["multitenant_token_misses"] == 1
+
+    async def test_capacity(self):
+        cache = TokenCache(capacity=2)
+        for token in ("t1", "t2"):
+            cache.put(token, WalletRecord(wallet_id=token, settings={}), {})
+        cache.get("t1")
+        cache.put("t3", WalletRecord(wallet_id="t3", settings={}), {})
+
+        assert len(cache) == 2
+        assert cache.get("t2") is None
+        assert cache.get("t1") and cache.get("t3")
+        assert "t2" not in cache._wallet_tokens
+
+    async def test_invalidate(self):
+        cache = TokenCache()
+        record = WalletRecord(wallet_id="a", settings={})
+        cache.put("t1", record, {})
+        cache.put("t2", record, {})
+        cache.put("t3", WalletRecord(wallet_id="b", settings={}), {})
+
+        cache.invalidate("a")
+        cache.invalidate("a")
+        assert cache.get("t1") is None and cache.get("t2") is None
+        assert cache.get("t3")
+
+
+class TestWalletCache(AsyncTestCase):
+    async def test_get_put(self):
+        cache = WalletCache()
+        record = WalletRecord(wallet_id="a", settings={})
+        assert cache.get("a") is None
+
+        cache.put(record)
+        assert cache.get("a") is record
+
+        stats = cache.stats
+        assert stats["multitenant_wallets"] == 1
+        assert stats["multitenant_wallet_hits"] == 1
+        assert stats["multitenant_wallet_misses"] == 1
+
+    async def test_capacity(self):
+        cache = WalletCache(capacity=2)
+        for wallet_id in ("a", "b"):
+            cache.put(WalletRecord(wallet_id=wallet_id, settings={}))
+        cache.get("a")
+        cache.put(WalletRecord(wallet_id="c", settings={}))
+
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a") and cache.get("c")
+
+    async def test_invalidate(self):
+        cache = WalletCache()
+        cache.put(WalletRecord(wallet_id="a", settings={}))
+        cache.put(WalletRecord(wallet_id="b", settings={}))
+
+        cache.invalidate("a")
+        cache.invalidate("a")
+        assert cache.get("a") is None
+        assert cache.get("b")
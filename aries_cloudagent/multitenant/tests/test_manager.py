@@ -1,3 +1,5 @@
+import asyncio
+
 from asynctest import TestCase as AsyncTestCase
 from asynctest import mock as async_mock
 
@@ -9,10 +11,10 @@ from ...messaging.responder import BaseResponder
 from ...wallet.models.wallet_record import WalletRecord
 from ...wallet.in_memory import InMemoryWallet
 from ...wallet.base import DIDInfo
-from ...storage.error import StorageNotFoundError
-from ...storage.in_memory import InMemoryStorage
+from ...storage.error import StorageError, StorageNotFoundError
 from ...protocols.routing.v1_0.manager import RoutingManager
 from ...protocols.routing.v1_0.models.route_record import RouteRecord
+from ...protocols.routing.v1_0.route_table import RouteTable
 from ...protocols.coordinate_mediation.v1_0.manager import (
     MediationRecord,
     MediationManager,
@@ -54,7 +56,7 @@ class TestMultitenantManager(AsyncTestCase):
 
     async def test_get_wallet_profile_returns_from_cache(self):
         wallet_record = WalletRecord(wallet_id="test")
-        self.manager._instances["test"] = InMemoryProfile.test_profile()
+        self.manager._instances.put("test", InMemoryProfile.test_profile())
 
         with async_mock.patch(
             "aries_cloudagent.config.wallet.wallet_config"
@@ -62,12 +64,12 @@ class TestMultitenantManager(AsyncTestCase):
             profile = await self.manager.get_wallet_profile(
                 self.profile.context, wallet_record
             )
-            assert profile is self.manager._instances["test"]
+            assert profile is self.manager._instances.get("test")
             wallet_config.assert_not_called()
 
     async def test_get_wallet_profile_not_in_cache(self):
         wallet_record = WalletRecord(wallet_id="test", settings={})
-        self.manager._instances["test"] = InMemoryProfile.test_profile()
+        self.manager._instances.put("test", InMemoryProfile.test_profile())
 
         with async_mock.patch(
             "aries_cloudagent.config.wallet.wallet_config"
@@ -75,9 +77,83 @@ class TestMultitenantManager(AsyncTestCase):
             profile = await self.manager.get_wallet_profile(
                 self.profile.context, wallet_record
             )
-            assert profile is self.manager._instances["test"]
+            assert profile is self.manager._instances.get("test")
             wallet_config.assert_not_called()
 
+    async def test_get_wallet_profile_pooled(self):
+        self.profile.settings["multitenant.max_profiles"] = 1
+        self.manager = MultitenantManager(self.profile)
+        assert self.manager._instances.capacity == 1
+
+        with async_mock.patch(
+            "aries_cloudagent.multitenant.manager.wallet_config"
+        ) as wallet_config:
+            wallet_config.side_effect = lambda context, provision: (
+                async_mock.MagicMock(
+                    backend="indy",
+                    settings=context.settings,
+                    close=async_mock.CoroutineMock(),
+                ),
+                None,
+            )
+
+            profile = await self.manager.get_wallet_profile(
+                self.profile.context,
+                WalletRecord(wallet_id="test1", settings={}),
+                acquire=True,
+            )
+            assert self.manager.acquire_profile(profile)
+            self.manager.release_profile(profile)
+            assert not self.manager.acquire_profile(self.profile)
+            await self.manager.get_wallet_profile(
+                self.profile.context, WalletRecord(wallet_id="test2", settings={})
+            )
+            assert "test1" in self.manager._instances
+
+            # releasing by another profile for the same wallet has no effect
+            self.manager.release_profile(
+                async_mock.MagicMock(settings={"wallet.id": "test1"})
+            )
+            await self.manager.get_wallet_profile(
+                self.profile.context, WalletRecord(wallet_id="test3", settings={})
+            )
+            assert "test1" in self.manager._instances
+
+            self.manager.release_profile(profile)
+            await self.manager.get_wallet_profile(
+                self.profile.context, WalletRecord(wallet_id="test4", settings={})
+            )
+            assert "test1" not in self.manager._instances
+            assert wallet_config.call_count == 4
+            assert profile.settings.get("wallet.id") == "test1"
+
+            stats = self.manager.stats
+            assert stats["multitenant_profile_opens"] == 4
+            assert stats["multitenant_profile_evictions"] == 3
+
+        await self.manager.close()
+        assert not self.manager._instances
+
+    async def test_get_wallet_profile_in_memory_pinned(self):
+        self.profile.settings["multitenant.max_profiles"] = 1
+        self.manager = MultitenantManager(self.profile)
+
+        with async_mock.patch(
+            "aries_cloudagent.multitenant.manager.wallet_config"
+        ) as wallet_config:
+            wallet_config.side_effect = lambda context, provision: (
+                InMemoryProfile(context=context),
+                None,
+            )
+            for wallet_id in ("test1", "test2"):
+                await self.manager.get_wallet_profile(
+                    self.profile.context,
+                    WalletRecord(wallet_id=wallet_id, settings={}),
+                )
+            assert "test1" in self.manager._instances
+            assert self.manager.stats["multitenant_profiles_pinned"] == 2
+            assert self.manager.stats["multitenant_profile_evictions"] == 0
+
     async def test_get_wallet_profile_settings(self):
         extra_settings = {"extra_settings": "extra_settings"}
         wallet_record_settings = {"wallet_record_settings": "wallet_record_settings"}
@@ -257,6 +333,70 @@ class TestMultitenantManager(AsyncTestCase):
 
         assert isinstance(wallet, WalletRecord)
 
+    async def test_get_wallet_by_key_cached(self):
+        session = await self.profile.session()
+        recipient_key = "test-recipient-key"
+
+        wallet_record = WalletRecord(settings={})
+        await wallet_record.save(session)
+        await RouteRecord(
+            wallet_id=wallet_record.wallet_id, recipient_key=recipient_key
+        ).save(session)
+
+        wallet = await self.manager._get_wallet_by_key(session, recipient_key)
+        with async_mock.patch.object(
+            WalletRecord, "retrieve_by_id", async_mock.CoroutineMock()
+        ) as retrieve_by_id:
+            retrieve_by_id.return_value = wallet_record
+            cached = await self.manager._get_wallet_by_key(session, recipient_key)
+            assert cached is wallet
+            retrieve_by_id.assert_not_called()
+
+            self.manager.invalidate_wallet(wallet_record.wallet_id)
+            await self.manager._get_wallet_by_key(session, recipient_key)
+            retrieve_by_id.assert_awaited_once()
+
+    async def test_get_wallet_by_key_updated(self):
+        self.profile.context.injector.bind_instance(MultitenantManager, self.manager)
+        session = await self.profile.session()
+        recipient_key = "test-recipient-key"
+
+        wallet_record = WalletRecord(settings={"wallet.dispatch_type": "base"})
+        await wallet_record.save(session)
+        await RouteRecord(
+            wallet_id=wallet_record.wallet_id, recipient_key=recipient_key
+        ).save(session)
+        wallet = await self.manager._get_wallet_by_key(session, recipient_key)
+        assert wallet.wallet_dispatch_type == "base"
+
+        wallet_record._settings["wallet.dispatch_type"] = "both"
+        await wallet_record.save(session)
+        updated = await self.manager._get_wallet_by_key(session, recipient_key)
+        assert updated.wallet_dispatch_type == "both"
+
+        await wallet_record.delete_record(session)
+        with self.assertRaises(StorageNotFoundError):
+            await self.manager._get_wallet_by_key(session, recipient_key)
+
+    async def test_load_routes(self):
+        session = await self.profile.session()
+        await RouteRecord(wallet_id="test-wallet-id", recipient_key="key1").save(
+            session
+        )
+        await RouteRecord(connection_id="test-conn-id", recipient_key="key2").save(
+            session
+        )
+
+        await self.manager.load_routes()
+
+        table = RouteTable()
+        self.context.injector.bind_instance(RouteTable, table)
+        await self.manager.load_routes()
+
+        assert len(table) == 1
+        assert table.get(self.profile.name, "key1").wallet_id == "test-wallet-id"
+        assert table.get(self.profile.name, "key2") is None
+
     async def test_create_wallet_removes_key_only_unmanaged_mode(self):
         with async_mock.patch.object(
             MultitenantManager, "get_wallet_profile"
@@ -273,6 +413,103 @@ class TestMultitenantManager(AsyncTestCase):
             assert unmanaged_wallet_record.settings.get("wallet.key") is None
             assert managed_wallet_record.settings.get("wallet.key") == "test_key"
 
+    async def test_create_wallets(self):
+        self.profile.settings["wallet.name"] = "base"
+        async with self.profile.session() as session:
+            await WalletRecord(settings={"wallet.name": "existing"}).save(session)
+
+        provisioned = []
+
+        async def provision_wallet(wallet_record, wallet_key):
+            if wallet_record.wallet_name == "bad":
+                raise MultitenantManagerError("Failed to provision")
+            provisioned.append((wallet_record.wallet_name, wallet_key))
+
+        wallets = [
+            ({"wallet.name": "one", "wallet.key": "key1"}, WalletRecord.MODE_MANAGED),
+            ({"wallet.name": "existing"}, WalletRecord.MODE_MANAGED),
+            ({"wallet.name": "one"}, WalletRecord.MODE_MANAGED),
+            ({"wallet.name": "base"}, WalletRecord.MODE_MANAGED),
+            ({"wallet.name": "bad"}, WalletRecord.MODE_MANAGED),
+            ({"wallet.name": "two", "wallet.key": "key2"}, WalletRecord.MODE_UNMANAGED),
+        ]
+        with async_mock.patch.object(
+            self.manager, "_provision_wallet", provision_wallet
+        ):
+            results = {
+                index: (record, error)
+                async for (index, record, error) in await self.manager.create_wallets(
+                    wallets, max_workers=2
+                )
+            }
+
+        assert sorted(results) == list(range(6))
+        for index in (1, 2, 3, 4):
+            assert results[index][0] is None
+            assert isinstance(results[index][1], MultitenantManagerError)
+        assert "already exists" in results[1][1].roll_up
+        assert "more than once" in results[2][1].roll_up
+        assert "already exists" in results[3][1].roll_up
+        assert results[0][0].wallet_name == "one" and not results[0][1]
+        assert results[5][0].settings.get("wallet.key") is None
+        assert sorted(provisioned) == [("one", "key1"), ("two", "key2")]
+
+        async with self.profile.session() as session:
+            names = {record.wallet_name for record in await WalletRecord.query(session)}
+        assert names == {"existing", "one", "two"}
+
+    async def test_create_wallets_stopped(self):
+        provisioned = set()
+
+        async def provision_wallet(wallet_record, wallet_key):
+            await asyncio.sleep(0.01)
+            provisioned.add(wallet_record.wallet_id)
+
+        wallets = [
+            ({"wallet.name": f"wallet{i}"}, WalletRecord.MODE_MANAGED)
+            for i in range(5)
+        ]
+        with async_mock.patch.object(
+            self.manager, "_provision_wallet", provision_wallet
+        ):
+            results = await self.manager.create_wallets(wallets, max_workers=2)
+            (_, record, _) = await results.__anext__()
+            await results.aclose()
+
+        async with self.profile.session() as session:
+            stored = await WalletRecord.query(session)
+        # wallets being provisioned are completed, the others are dropped
+        assert {stored_rec.wallet_id for stored_rec in stored} == provisioned
+        assert record.wallet_id in provisioned
+        assert len(provisioned) < len(wallets)
+
+    async def test_create_wallets_closed_unstarted(self):
+        wallets = [
+            ({"wallet.name": f"wallet{i}"}, WalletRecord.MODE_MANAGED)
+            for i in range(3)
+        ]
+        with async_mock.patch.object(
+            self.manager, "_provision_wallet", async_mock.CoroutineMock()
+        ) as mock_provision:
+            results = await self.manager.create_wallets(wallets)
+            async with self.profile.session() as session:
+                assert len(await WalletRecord.query(session)) == 3
+            await results.aclose()
+
+        mock_provision.assert_not_called()
+        async with self.profile.session() as session:
+            assert await WalletRecord.query(session) == []
+
+    async def test_create_wallets_save_fails(self):
+        with async_mock.patch.object(
+            WalletRecord, "save_all", async_mock.CoroutineMock()
+        ) as mock_save_all:
+            mock_save_all.side_effect = StorageError()
+            with self.assertRaises(StorageError):
+                await self.manager.create_wallets(
+                    [({"wallet.name": "one"}, WalletRecord.MODE_MANAGED)]
+                )
+
     async def test_create_wallet_fails_if_wallet_name_exists(self):
         with async_mock.patch.object(
             MultitenantManager, "_wallet_name_exists"
@@ -309,6 +546,7 @@ class TestMultitenantManager(AsyncTestCase):
                 wallet_record,
                 {"wallet.key": "test_key"},
                 provision=True,
+                acquire=True,
             )
             add_key.assert_not_called()
             assert isinstance(wallet_record, WalletRecord)
@@ -346,6 +584,7 @@ class TestMultitenantManager(AsyncTestCase):
                 wallet_record,
                 {"wallet.key": "test_key"},
                 provision=True,
+                acquire=True,
             )
             assert isinstance(wallet_record, WalletRecord)
             assert wallet_record.wallet_name == "test_wallet"
@@ -373,8 +612,10 @@ class TestMultitenantManager(AsyncTestCase):
         ) as remove_profile, async_mock.patch.object(
             WalletRecord, "delete_record"
         ) as wallet_delete_record, async_mock.patch.object(
-            InMemoryStorage, "delete_all_records"
-        ) as delete_all_records:
+            RouteRecord, "query", async_mock.CoroutineMock()
+        ) as route_query, async_mock.patch.object(
+            RouteRecord, "delete_all", async_mock.CoroutineMock()
+        ) as route_delete_all:
             wallet_record = WalletRecord(
                 wallet_id="test",
                 key_management_mode=WalletRecord.MODE_UNMANAGED,
@@ -382,7 +623,7 @@ class TestMultitenantManager(AsyncTestCase):
             )
             wallet_profile = InMemoryProfile.test_profile()
 
-            self.manager._instances["test"] = wallet_profile
+            self.manager._instances.put("test", wallet_profile)
             retrieve_by_id.return_value = wallet_record
             get_wallet_profile.return_value = wallet_profile
 
@@ -394,9 +635,10 @@ class TestMultitenantManager(AsyncTestCase):
             )
             remove_profile.assert_called_once_with()
             assert wallet_delete_record.call_count == 1
-            delete_all_records.assert_called_once_with(
-                RouteRecord.RECORD_TYPE, {"wallet_id": "test"}
-            )
+            route_query.assert_awaited_once()
+            assert route_query.call_args[0][1] == {"wallet_id": "test"}
+            route_delete_all.assert_awaited_once()
+            assert route_delete_all.call_args[0][1] is route_query.return_value
 
     async def test_add_key_no_mediation(self):
         with async_mock.patch.object(
@@ -553,17 +795,57 @@ class TestMultitenantManager(AsyncTestCase):
             get_wallet_profile.return_value = mock_profile
 
             profile = await self.manager.get_profile_for_token(
-                self.profile.context, token
+                self.profile.context, token, acquire=True
             )
 
             get_wallet_profile.assert_called_once_with(
                 self.profile.context,
                 wallet_record,
                 {},
+                acquire=True,
             )
 
             assert profile == mock_profile
 
+    async def test_get_profile_for_token_cached(self):
+        self.profile.settings["multitenant.jwt_secret"] = "very_secret_jwt"
+        wallet_record = WalletRecord(
+            key_management_mode=WalletRecord.MODE_UNMANAGED,
+            settings={"wallet.type": "indy"},
+        )
+
+        session = await self.profile.session()
+        await wallet_record.save(session)
+
+        token = jwt.encode(
+            {"wallet_id": wallet_record.wallet_id, "wallet_key": "wallet_key"},
+            "very_secret_jwt",
+            algorithm="HS256",
+        ).decode()
+
+        with async_mock.patch.object(
+            MultitenantManager, "get_wallet_profile"
+        ) as get_wallet_profile, async_mock.patch.object(
+            WalletRecord, "retrieve_by_id", async_mock.CoroutineMock()
+        ) as retrieve_by_id:
+            retrieve_by_id.return_value = wallet_record
+            get_wallet_profile.return_value = InMemoryProfile.test_profile()
+
+            for _ in range(2):
+                await self.manager.get_profile_for_token(self.profile.context, token)
+            retrieve_by_id.assert_awaited_once()
+            get_wallet_profile.assert_called_with(
+                self.profile.context,
+                wallet_record,
+                {"wallet.key": "wallet_key"},
+                acquire=False,
+            )
+            assert self.manager.stats["multitenant_token_hits"] == 1
+
+            self.manager.invalidate_wallet(wallet_record.wallet_id)
+            await self.manager.get_profile_for_token(self.profile.context, token)
+            assert retrieve_by_id.await_count == 2
+
     async def test_get_profile_for_token_unmanaged_wallet(self):
         self.profile.settings["multitenant.jwt_secret"] = "very_secret_jwt"
         wallet_record = WalletRecord(
@@ -595,6 +877,7 @@ class TestMultitenantManager(AsyncTestCase):
                 self.profile.context,
                 wallet_record,
                 {"wallet.key": "wallet_key"},
+                acquire=False,
             )
 
             assert profile == mock_profile
@@ -2,6 +2,8 @@
 
 import json
 
+from typing import Sequence, Tuple
+
 from aiohttp import web
 from aiohttp_apispec import (
     docs,
@@ -15,15 +17,20 @@ from marshmallow import fields, validate, validates_schema
 
 from ....admin.request_context import AdminRequestContext
 from ....connections.models.conn_record import ConnRecord, ConnRecordSchema
+from ....core.profile import ProfileSession
 from ....messaging.models.base import BaseModelError
 from ....messaging.models.openapi import OpenAPISchema
+from ....messaging.models.paginated_query import (
+    PaginatedQuerySchema,
+    get_paginated_query_params,
+)
 from ....messaging.valid import (
     ENDPOINT,
     INDY_DID,
     INDY_RAW_PUBLIC_KEY,
     UUIDFour,
 )
-from ....storage.error import StorageError, StorageNotFoundError
+from ....storage.error import StorageError, StorageNotFoundError, StorageSearchError
 from ....wallet.error import WalletError
 
 from .manager import ConnectionManager, ConnectionManagerError
@@ -45,6 +52,10 @@ class ConnectionListSchema(OpenAPISchema):
         fields.Nested(ConnRecordSchema()),
         description="List of connection records",
     )
+    next = fields.Str(
+        description="Cursor for the next page of results, if paginated and not done",
+        required=False,
+    )
 
 
 class ConnectionMetadataSchema(OpenAPISchema):
@@ -161,7 +172,7 @@ class ConnectionStaticResultSchema(OpenAPISchema):
     record = fields.Nested(ConnRecordSchema, required=True)
 
 
-class ConnectionsListQueryStringSchema(OpenAPISchema):
+class ConnectionsListQueryStringSchema(PaginatedQuerySchema):
     """Parameters and validators for connections list request query string."""
 
     alias = fields.Str(
@@ -286,6 +297,77 @@ def connection_sort_key(conn):
     return pfx + conn["created_at"]
 
 
+# connection states in the order of the prefixes of `connection_sort_key`
+CONNECTION_SORT_GROUPS = (
+    [
+        value
+        for state in ConnRecord.State
+        if state not in (ConnRecord.State.INVITATION, ConnRecord.State.ABANDONED)
+        for value in state.value
+    ],
+    list(ConnRecord.State.INVITATION.value),
+    list(ConnRecord.State.ABANDONED.value),
+)
+
+
+async def query_connections_page(
+    session: ProfileSession,
+    tag_filter: dict,
+    post_filter: dict,
+    limit: int,
+    cursor: str = None,
+) -> Tuple[Sequence[dict], str]:
+    """
+    Query one page of connection records in the order of `connection_sort_key`.
+
+    The connections in each group of states are paged through in turn; within
+    a group, each page is sorted by creation time.
+
+    Returns:
+        A tuple of the serialized connection records and the cursor for the next
+        page, which is `None` once all records have been returned
+
+    """
+    group = 0
+    group_cursor = None
+    if cursor:
+        (group, _, group_cursor) = cursor.partition(".")
+        try:
+            group = int(group)
+        except ValueError:
+            raise StorageSearchError("Invalid query cursor")
+        group_cursor = group_cursor or None
+
+    results = []
+    while group < len(CONNECTION_SORT_GROUPS) and len(results) < limit:
+        states = CONNECTION_SORT_GROUPS[group]
+        if "state" in post_filter:
+            states = [state for state in states if state in post_filter["state"]]
+        records = []
+        if states:
+            (records, group_cursor) = await ConnRecord.query_page(
+                session,
+                tag_filter,
+                limit=limit - len(results),
+                cursor=group_cursor,
+                post_filter_positive={**post_filter, "state": states},
+                alt=True,
+            )
+        results.extend(
+            sorted(
+                (record.serialize() for record in records),
+                key=connection_sort_key,
+            )
+        )
+        if not states or not group_cursor:
+            group += 1
+            group_cursor = None
+
+    if group >= len(CONNECTION_SORT_GROUPS):
+        return results, None
+    return results, f"{group}.{group_cursor or ''}"
+
+
 @docs(
     tags=["connection"],
     summary="Query agent-to-agent connections",
@@ -327,8 +409,16 @@ async def connections_list(request: web.BaseRequest):
             v for v in ConnRecord.Role.get(request.query["their_role"]).value
         ]
 
+    limit, cursor = get_paginated_query_params(request)
+
     session = await context.session()
     try:
+        if limit:
+            results, cursor = await query_connections_page(
+                session, tag_filter, post_filter, limit, cursor
+            )
+            return web.json_response({"results": results, "next": cursor})
+
         records = await ConnRecord.query(
             session, tag_filter, post_filter_positive=post_filter, alt=True
         )
@@ -96,6 +96,88 @@ class TestConnectionRoutes(AsyncTestCase):
                     }  # sorted
                 )
 
+    async def test_connections_list_paginated(self):
+        self.request.query = {"my_did": "dummy", "limit": "1", "cursor": "0.abc"}
+
+        with async_mock.patch.object(
+            test_module, "ConnRecord", autospec=True
+        ) as mock_conn_rec, async_mock.patch.object(
+            test_module.web, "json_response"
+        ) as mock_response:
+            mock_conn_rec.State = ConnRecord.State
+            conn = async_mock.MagicMock(
+                serialize=async_mock.MagicMock(
+                    return_value={"state": "active", "created_at": "1234567890"}
+                )
+            )
+            mock_conn_rec.query_page = async_mock.CoroutineMock(
+                return_value=([conn], "next-cursor")
+            )
+
+            await test_module.connections_list(self.request)
+            mock_conn_rec.query_page.assert_awaited_once_with(
+                async_mock.ANY,
+                {"my_did": "dummy"},
+                limit=1,
+                cursor="abc",
+                post_filter_positive={"state": test_module.CONNECTION_SORT_GROUPS[0]},
+                alt=True,
+            )
+            mock_response.assert_called_once_with(
+                {
+                    "results": [{"state": "active", "created_at": "1234567890"}],
+                    "next": "0.next-cursor",
+                }
+            )
+
+    async def test_connections_list_paginated_sorted(self):
+        session = await self.context.session()
+        states = [
+            ConnRecord.State.ABANDONED,
+            ConnRecord.State.COMPLETED,
+            ConnRecord.State.INVITATION,
+            ConnRecord.State.REQUEST,
+            ConnRecord.State.ABANDONED,
+            ConnRecord.State.COMPLETED,
+        ]
+        for state in states:
+            await ConnRecord(state=state).save(session)
+
+        with async_mock.patch.object(test_module.web, "json_response") as response:
+            await test_module.connections_list(self.request)
+            expected = response.call_args[0][0]["results"]
+            assert len(expected) == len(states)
+
+            results = []
+            cursor = None
+            pages = 0
+            while True:
+                self.request.query = {"limit": "2"}
+                if cursor:
+                    self.request.query["cursor"] = cursor
+                await test_module.connections_list(self.request)
+                page = response.call_args[0][0]
+                results.extend(page["results"])
+                cursor = page["next"]
+                pages += 1
+                if not cursor:
+                    break
+            assert results == expected
+            assert pages <= 4
+
+            self.request.query = {"limit": "2", "cursor": "x.abc"}
+            with self.assertRaises(test_module.web.HTTPBadRequest):
+                await test_module.connections_list(self.request)
+
+            # state filters apply within the sort groups
+            self.request.query = {
+                "limit": "5",
+                "state": ConnRecord.State.ABANDONED.rfc160,
+            }
+            await test_module.connections_list(self.request)
+            page = response.call_args[0][0]
+            assert len(page["results"]) == 2 and page["next"] is None
+
     async def test_connections_list_x(self):
         self.request.query = {
             "their_role": ConnRecord.Role.REQUESTER.rfc160,
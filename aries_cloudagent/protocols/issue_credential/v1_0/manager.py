@@ -8,7 +8,7 @@ from typing import Mapping, Tuple
 
 from ....cache.base import BaseCache
 from ....core.error import BaseError
-from ....core.profile import Profile
+from ....core.profile import Profile, ProfileSession
 from ....indy.holder import IndyHolder, IndyHolderError
 from ....indy.issuer import IndyIssuer, IndyIssuerRevocationRegistryFullError
 from ....ledger.base import BaseLedger
@@ -19,6 +19,7 @@ from ....messaging.credential_definitions.util import (
 from ....revocation.indy import IndyRevocation
 from ....revocation.models.revocation_registry import RevocationRegistry
 from ....revocation.models.issuer_rev_reg_record import IssuerRevRegRecord
+from ....revocation.provisioner import RevRegProvisioner
 from ....storage.base import BaseStorage
 from ....storage.error import StorageNotFoundError
 
@@ -74,6 +75,33 @@ class CredentialManager:
             )
         return max(found, key=lambda r: int(r.tags["epoch"])).tags["cred_def_id"]
 
+    async def _stage_rev_regs(self, session: ProfileSession, cred_def_id: str):
+        """Stage revocation registries inline when there is no provisioner."""
+        posted_rev_reg_recs = await IssuerRevRegRecord.query_by_cred_def_id(
+            session,
+            cred_def_id,
+            state=IssuerRevRegRecord.STATE_POSTED,
+        )
+        if not posted_rev_reg_recs:
+            # Send next 2 rev regs, publish tails files in background
+            old_rev_reg_recs = sorted(
+                await IssuerRevRegRecord.query_by_cred_def_id(session, cred_def_id)
+            )  # prefer to reuse prior rev reg size
+            revoc = IndyRevocation(session)
+            for _ in range(2):
+                pending_rev_reg_rec = await revoc.init_issuer_registry(
+                    cred_def_id,
+                    max_cred_num=(
+                        old_rev_reg_recs[0].max_cred_num if old_rev_reg_recs else None
+                    ),
+                )
+                asyncio.ensure_future(
+                    pending_rev_reg_rec.stage_pending_registry(
+                        session,
+                        max_attempts=3,  # fail both in < 2s at worst
+                    )
+                )
+
     async def prepare_send(
         self,
         connection_id: str,
@@ -510,6 +538,7 @@ class CredentialManager:
 
             tails_path = None
             if credential_definition["value"].get("revocation"):
+                provisioner = self._profile.inject(RevRegProvisioner, required=False)
                 async with self._profile.session() as session:
                     revoc = IndyRevocation(session)
                     try:
@@ -525,42 +554,28 @@ class CredentialManager:
                         await rev_reg.get_or_fetch_local_tails_path()
 
                     except StorageNotFoundError:
-                        posted_rev_reg_recs = (
-                            await IssuerRevRegRecord.query_by_cred_def_id(
-                                session,
-                                cred_ex_record.credential_definition_id,
-                                state=IssuerRevRegRecord.STATE_POSTED,
+                        if not provisioner:
+                            await self._stage_rev_regs(
+                                session, cred_ex_record.credential_definition_id
                             )
-                        )
-                        if not posted_rev_reg_recs:
-                            # Send next 2 rev regs, publish tails files in background
-                            old_rev_reg_recs = sorted(
-                                await IssuerRevRegRecord.query_by_cred_def_id(
-                                    session,
+                        if retries > 0:
+                            if provisioner:
+                                LOGGER.info(
+                                    "Waiting on standby rev reg for cred def %s, "
+                                    "retrying",
                                     cred_ex_record.credential_definition_id,
                                 )
-                            )  # prefer to reuse prior rev reg size
-                            for _ in range(2):
-                                pending_rev_reg_rec = await revoc.init_issuer_registry(
+                                await provisioner.wait_standby(
+                                    self._profile,
                                     cred_ex_record.credential_definition_id,
-                                    max_cred_num=(
-                                        old_rev_reg_recs[0].max_cred_num
-                                        if old_rev_reg_recs
-                                        else None
-                                    ),
                                 )
-                                asyncio.ensure_future(
-                                    pending_rev_reg_rec.stage_pending_registry(
-                                        session,
-                                        max_attempts=3,  # fail both in < 2s at worst
-                                    )
+                            else:
+                                LOGGER.info(
+                                    "Waiting 2s on posted rev reg for cred def %s, "
+                                    "retrying",
+                                    cred_ex_record.credential_definition_id,
                                 )
-                        if retries > 0:
-                            LOGGER.info(
-                                "Waiting 2s on posted rev reg for cred def %s, retrying",
-                                cred_ex_record.credential_definition_id,
-                            )
-                            await asyncio.sleep(2)
+                                await asyncio.sleep(2)
                             return await self.issue_credential(
                                 cred_ex_record=cred_ex_record,
                                 comment=comment,
@@ -591,25 +606,35 @@ class CredentialManager:
                     tails_path,
                 )
 
-                # If the rev reg is now full
-                if rev_reg and rev_reg.max_creds == int(cred_ex_record.revocation_id):
-                    async with self._profile.session() as session:
-                        await active_rev_reg_rec.set_state(
-                            session,
-                            IssuerRevRegRecord.STATE_FULL,
-                        )
-
-                        # Send next 1 rev reg, publish tails file in background
-                        revoc = IndyRevocation(session)
-                        pending_rev_reg_rec = await revoc.init_issuer_registry(
-                            active_rev_reg_rec.cred_def_id,
-                            max_cred_num=active_rev_reg_rec.max_cred_num,
-                        )
-                        asyncio.ensure_future(
-                            pending_rev_reg_rec.stage_pending_registry(
+                if rev_reg:
+                    # If the rev reg is now full
+                    if rev_reg.max_creds == int(cred_ex_record.revocation_id):
+                        async with self._profile.session() as session:
+                            await active_rev_reg_rec.set_state(
                                 session,
-                                max_attempts=16,
+                                IssuerRevRegRecord.STATE_FULL,
                             )
+
+                            if not provisioner:
+                                # Send next 1 rev reg, publish tails file in background
+                                revoc = IndyRevocation(session)
+                                pending_rev_reg_rec = await revoc.init_issuer_registry(
+                                    active_rev_reg_rec.cred_def_id,
+                                    max_cred_num=active_rev_reg_rec.max_cred_num,
+                                )
+                                asyncio.ensure_future(
+                                    pending_rev_reg_rec.stage_pending_registry(
+                                        session,
+                                        max_attempts=16,
+                                    )
+                                )
+
+                    if provisioner:
+                        # Top up standby rev regs in background at fill level
+                        provisioner.registry_filled(
+                            self._profile,
+                            active_rev_reg_rec,
+                            cred_ex_record.revocation_id,
                         )
 
             except IndyIssuerRevocationRegistryFullError:
@@ -621,12 +646,24 @@ class CredentialManager:
                     )
 
                 if retries > 0:
-                    # use next rev reg; at worst, lucky instance is putting one up
-                    LOGGER.info(
-                        "Waiting 1s and retrying: revocation registry %s is full",
-                        active_rev_reg_rec.revoc_reg_id,
-                    )
-                    await asyncio.sleep(1)
+                    if provisioner:
+                        # use next rev reg, provisioning one if none is on standby
+                        LOGGER.info(
+                            "Retrying: revocation registry %s is full",
+                            active_rev_reg_rec.revoc_reg_id,
+                        )
+                        await provisioner.wait_standby(
+                            self._profile,
+                            active_rev_reg_rec.cred_def_id,
+                            max_cred_num=active_rev_reg_rec.max_cred_num,
+                        )
+                    else:
+                        # use next rev reg; at worst, lucky instance is putting one up
+                        LOGGER.info(
+                            "Waiting 1s and retrying: revocation registry %s is full",
+                            active_rev_reg_rec.revoc_reg_id,
+                        )
+                        await asyncio.sleep(1)
                     return await self.issue_credential(
                         cred_ex_record=cred_ex_record,
                         comment=comment,
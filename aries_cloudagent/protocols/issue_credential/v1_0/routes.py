@@ -18,6 +18,10 @@ from ....indy.issuer import IndyIssuerError
 from ....ledger.error import LedgerError
 from ....messaging.credential_definitions.util import CRED_DEF_TAGS
 from ....messaging.models.base import BaseModelError, OpenAPISchema
+from ....messaging.models.paginated_query import (
+    PaginatedQuerySchema,
+    get_paginated_query_params,
+)
 from ....messaging.valid import (
     INDY_CRED_DEF_ID,
     INDY_DID,
@@ -53,7 +57,7 @@ class IssueCredentialModuleResponseSchema(OpenAPISchema):
     """Response schema for Issue Credential Module."""
 
 
-class V10CredentialExchangeListQueryStringSchema(OpenAPISchema):
+class V10CredentialExchangeListQueryStringSchema(PaginatedQuerySchema):
     """Parameters and validators for credential exchange list query."""
 
     connection_id = fields.UUID(
@@ -97,6 +101,10 @@ class V10CredentialExchangeListResultSchema(OpenAPISchema):
         fields.Nested(V10CredentialExchangeSchema),
         description="Aries#0036 v1.0 credential exchange records",
     )
+    next = fields.Str(
+        description="Cursor for the next page of results, if paginated and not done",
+        required=False,
+    )
 
 
 class V10CredentialStoreRequestSchema(OpenAPISchema):
@@ -299,17 +307,30 @@ async def credential_exchange_list(request: web.BaseRequest):
         if request.query.get(k, "") != ""
     }
 
+    limit, cursor = get_paginated_query_params(request)
+
     try:
         async with context.session() as session:
-            records = await V10CredentialExchange.query(
-                session=session,
-                tag_filter=tag_filter,
-                post_filter_positive=post_filter,
-            )
+            if limit:
+                records, cursor = await V10CredentialExchange.query_page(
+                    session=session,
+                    tag_filter=tag_filter,
+                    limit=limit,
+                    cursor=cursor,
+                    post_filter_positive=post_filter,
+                )
+            else:
+                records = await V10CredentialExchange.query(
+                    session=session,
+                    tag_filter=tag_filter,
+                    post_filter_positive=post_filter,
+                )
         results = [record.serialize() for record in records]
     except (StorageError, BaseModelError) as err:
         raise web.HTTPBadRequest(reason=err.roll_up) from err
 
+    if limit:
+        return web.json_response({"results": results, "next": cursor})
     return web.json_response({"results": results})
 
 
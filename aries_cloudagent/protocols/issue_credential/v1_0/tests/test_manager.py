@@ -13,6 +13,7 @@ from .....indy.holder import IndyHolder
 from .....indy.issuer import IndyIssuer
 from .....messaging.credential_definitions.util import CRED_DEF_SENT_RECORD_TYPE
 from .....ledger.base import BaseLedger
+from .....revocation.provisioner import RevRegProvisioner
 from .....storage.base import StorageRecord
 from .....storage.error import StorageNotFoundError
 
@@ -120,6 +121,12 @@ class TestCredentialManager(AsyncTestCase):
         )
         self.context.injector.bind_instance(BaseLedger, self.ledger)
 
+        self.provisioner = async_mock.MagicMock(
+            RevRegProvisioner,
+            wait_standby=async_mock.CoroutineMock(return_value=True),
+        )
+        self.context.injector.bind_instance(RevRegProvisioner, self.provisioner)
+
         self.manager = CredentialManager(self.profile)
         assert self.manager.profile
 
@@ -1128,8 +1135,6 @@ class TestCredentialManager(AsyncTestCase):
         self.context.injector.bind_instance(IndyIssuer, issuer)
 
         with async_mock.patch.object(
-            test_module, "IssuerRevRegRecord", autospec=True
-        ) as issuer_rr_rec, async_mock.patch.object(
             test_module, "IndyRevocation", autospec=True
         ) as revoc, async_mock.patch.object(
             V10CredentialExchange, "save", autospec=True
@@ -1137,19 +1142,12 @@ class TestCredentialManager(AsyncTestCase):
             revoc.return_value.get_active_issuer_rev_reg_record = (
                 async_mock.CoroutineMock(side_effect=test_module.StorageNotFoundError())
             )
-            revoc.return_value.init_issuer_registry = async_mock.CoroutineMock(
-                return_value=async_mock.MagicMock(  # pending_rev_reg_rec
-                    stage_pending_registry=async_mock.CoroutineMock()
-                )
-            )
-            issuer_rr_rec.query_by_cred_def_id = async_mock.CoroutineMock(
-                return_value=[]
-            )
             with self.assertRaises(CredentialManagerError) as x_cred_mgr:
                 await self.manager.issue_credential(
                     stored_exchange, comment=comment, retries=0
                 )
                 assert "has no active revocation registry" in x_cred_mgr.message
+            self.provisioner.wait_standby.assert_not_awaited()
 
     async def test_issue_credential_no_active_rr_retry(self):
         connection_id = "test_conn_id"
@@ -1187,8 +1185,6 @@ class TestCredentialManager(AsyncTestCase):
         self.context.injector.bind_instance(IndyIssuer, issuer)
 
         with async_mock.patch.object(
-            test_module, "IssuerRevRegRecord", autospec=True
-        ) as issuer_rr_rec, async_mock.patch.object(
             test_module, "IndyRevocation", autospec=True
         ) as revoc, async_mock.patch.object(
             V10CredentialExchange, "save", autospec=True
@@ -1196,23 +1192,79 @@ class TestCredentialManager(AsyncTestCase):
             revoc.return_value.get_active_issuer_rev_reg_record = (
                 async_mock.CoroutineMock(side_effect=test_module.StorageNotFoundError())
             )
-            issuer_rr_rec.query_by_cred_def_id = async_mock.CoroutineMock(
-                side_effect=[
-                    [],  # posted_rev_reg_recs
-                    [async_mock.MagicMock(max_cred_num=1000)],  # old_rev_reg_recs
-                ]
-                * 2
+            with self.assertRaises(CredentialManagerError) as x_cred_mgr:
+                await self.manager.issue_credential(
+                    stored_exchange, comment=comment, retries=1
+                )
+                assert "has no active revocation registry" in x_cred_mgr.message
+            self.provisioner.wait_standby.assert_awaited_once_with(
+                self.profile, CRED_DEF_ID
+            )
+
+    async def test_issue_credential_no_active_rr_no_provisioner(self):
+        connection_id = "test_conn_id"
+        comment = "comment"
+        cred_values = {"attr": "value"}
+        indy_offer = {"schema_id": SCHEMA_ID, "cred_def_id": CRED_DEF_ID, "nonce": "0"}
+        indy_cred_req = {"schema_id": SCHEMA_ID, "cred_def_id": CRED_DEF_ID}
+        thread_id = "thread-id"
+
+        stored_exchange = V10CredentialExchange(
+            credential_exchange_id="dummy-cxid",
+            connection_id=connection_id,
+            credential_definition_id=CRED_DEF_ID,
+            credential_offer=indy_offer,
+            credential_request=indy_cred_req,
+            credential_proposal_dict=CredentialProposal(
+                credential_proposal=CredentialPreview.deserialize(
+                    {"attributes": [{"name": "attr", "value": "value"}]}
+                ),
+                cred_def_id=CRED_DEF_ID,
+                schema_id=SCHEMA_ID,
+            ).serialize(),
+            initiator=V10CredentialExchange.INITIATOR_SELF,
+            role=V10CredentialExchange.ROLE_ISSUER,
+            state=V10CredentialExchange.STATE_REQUEST_RECEIVED,
+            thread_id=thread_id,
+        )
+
+        issuer = async_mock.MagicMock()
+        cred = {"indy": "credential"}
+        cred_rev_id = "1"
+        issuer.create_credential = async_mock.CoroutineMock(
+            return_value=(json.dumps(cred), cred_rev_id)
+        )
+        self.context.injector.bind_instance(IndyIssuer, issuer)
+        self.context.injector.clear_binding(RevRegProvisioner)
+
+        with async_mock.patch.object(
+            test_module, "IndyRevocation", autospec=True
+        ) as revoc, async_mock.patch.object(
+            V10CredentialExchange, "save", autospec=True
+        ) as save_ex, async_mock.patch.object(
+            test_module.IssuerRevRegRecord,
+            "query_by_cred_def_id",
+            async_mock.CoroutineMock(return_value=[]),
+        ), async_mock.patch.object(
+            test_module.asyncio, "sleep", async_mock.CoroutineMock()
+        ) as mock_sleep:
+            pending_rev_reg_rec = async_mock.MagicMock(
+                stage_pending_registry=async_mock.CoroutineMock()
             )
             revoc.return_value.init_issuer_registry = async_mock.CoroutineMock(
-                return_value=async_mock.MagicMock(  # pending_rev_reg_rec
-                    stage_pending_registry=async_mock.CoroutineMock()
-                )
+                return_value=pending_rev_reg_rec
+            )
+            revoc.return_value.get_active_issuer_rev_reg_record = (
+                async_mock.CoroutineMock(side_effect=test_module.StorageNotFoundError())
             )
             with self.assertRaises(CredentialManagerError) as x_cred_mgr:
                 await self.manager.issue_credential(
                     stored_exchange, comment=comment, retries=1
                 )
                 assert "has no active revocation registry" in x_cred_mgr.message
+            # registries are staged inline, then the issuer waits for them
+            assert revoc.return_value.init_issuer_registry.await_count == 4
+            mock_sleep.assert_awaited_once_with(2)
 
     async def test_issue_credential_rr_full(self):
         connection_id = "test_conn_id"
@@ -46,6 +46,50 @@ class TestCredentialRoutes(AsyncTestCase):
                     {"results": [mock_cred_ex.serialize.return_value]}
                 )
 
+    async def test_credential_exchange_list_paginated(self):
+        self.request.query = {
+            "thread_id": "dummy",
+            "state": "dummy",
+            "limit": "2",
+            "cursor": "abc",
+        }
+
+        with async_mock.patch.object(
+            test_module, "V10CredentialExchange", autospec=True
+        ) as mock_cred_ex, async_mock.patch.object(
+            test_module.web, "json_response"
+        ) as mock_response:
+            mock_cred_ex.serialize = async_mock.MagicMock(
+                return_value={"hello": "world"}
+            )
+            mock_cred_ex.query_page = async_mock.CoroutineMock(
+                return_value=([mock_cred_ex], "next-cursor")
+            )
+
+            await test_module.credential_exchange_list(self.request)
+            mock_cred_ex.query_page.assert_awaited_once_with(
+                session=async_mock.ANY,
+                tag_filter={"thread_id": "dummy"},
+                limit=2,
+                cursor="abc",
+                post_filter_positive={"state": "dummy"},
+            )
+            mock_response.assert_called_once_with(
+                {"results": [{"hello": "world"}], "next": "next-cursor"}
+            )
+
+    async def test_credential_exchange_list_paginated_x(self):
+        self.request.query = {"limit": "2", "cursor": "not-a-cursor"}
+
+        with async_mock.patch.object(
+            test_module, "V10CredentialExchange", autospec=True
+        ) as mock_cred_ex:
+            mock_cred_ex.query_page = async_mock.CoroutineMock(
+                side_effect=test_module.StorageError()
+            )
+            with self.assertRaises(test_module.web.HTTPBadRequest):
+                await test_module.credential_exchange_list(self.request)
+
     async def test_credential_exchange_list_x(self):
         self.request.query = {
             "thread_id": "dummy",
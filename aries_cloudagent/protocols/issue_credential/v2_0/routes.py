@@ -20,6 +20,10 @@ from ....indy.issuer import IndyIssuerError
 from ....ledger.error import LedgerError
 from ....messaging.decorators.attach_decorator import AttachDecorator
 from ....messaging.models.base import BaseModelError, OpenAPISchema
+from ....messaging.models.paginated_query import (
+    PaginatedQuerySchema,
+    get_paginated_query_params,
+)
 from ....messaging.valid import (
     INDY_CRED_DEF_ID,
     INDY_DID,
@@ -52,7 +56,7 @@ class V20IssueCredentialModuleResponseSchema(OpenAPISchema):
     """Response schema for v2.0 Issue Credential Module."""
 
 
-class V20CredExRecordListQueryStringSchema(OpenAPISchema):
+class V20CredExRecordListQueryStringSchema(PaginatedQuerySchema):
     """Parameters and validators for credential exchange record list query."""
 
     connection_id = fields.UUID(
@@ -114,6 +118,10 @@ class V20CredExRecordListResultSchema(OpenAPISchema):
         fields.Nested(V20CredExRecordDetailSchema),
         description="Credential exchange records and corresponding detail records",
     )
+    next = fields.Str(
+        description="Cursor for the next page of results, if paginated and not done",
+        required=False,
+    )
 
 
 class V20CredStoreRequestSchema(OpenAPISchema):
@@ -331,13 +339,24 @@ async def credential_exchange_list(request: web.BaseRequest):
         if request.query.get(k, "") != ""
     }
 
+    limit, cursor = get_paginated_query_params(request)
+
     try:
         async with context.session() as session:
-            cred_ex_records = await V20CredExRecord.query(
-                session=session,
-                tag_filter=tag_filter,
-                post_filter_positive=post_filter,
-            )
+            if limit:
+                cred_ex_records, cursor = await V20CredExRecord.query_page(
+                    session=session,
+                    tag_filter=tag_filter,
+                    limit=limit,
+                    cursor=cursor,
+                    post_filter_positive=post_filter,
+                )
+            else:
+                cred_ex_records = await V20CredExRecord.query(
+                    session=session,
+                    tag_filter=tag_filter,
+                    post_filter_positive=post_filter,
+                )
 
         results = []
         cred_manager = V20CredManager(context.profile)
@@ -361,6 +380,8 @@ async def credential_exchange_list(request: web.BaseRequest):
     except (StorageError, BaseModelError) as err:
         raise web.HTTPBadRequest(reason=err.roll_up) from err
 
+    if limit:
+        return web.json_response({"results": results, "next": cursor})
     return web.json_response({"results": results})
 
 
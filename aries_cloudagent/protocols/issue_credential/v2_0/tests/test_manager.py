@@ -14,6 +14,7 @@ from .....indy.issuer import IndyIssuer
 from .....messaging.credential_definitions.util import CRED_DEF_SENT_RECORD_TYPE
 from .....messaging.decorators.attach_decorator import AttachDecorator
 from .....ledger.base import BaseLedger
+from .....revocation.provisioner import RevRegProvisioner
 from .....storage.base import StorageRecord
 from .....storage.error import StorageNotFoundError
 
@@ -123,6 +124,12 @@ class TestV20CredManager(AsyncTestCase):
         )
         self.context.injector.bind_instance(BaseLedger, self.ledger)
 
+        self.provisioner = async_mock.MagicMock(
+            RevRegProvisioner,
+            wait_standby=async_mock.CoroutineMock(return_value=True),
+        )
+        self.context.injector.bind_instance(RevRegProvisioner, self.provisioner)
+
         self.manager = V20CredManager(self.profile)
         assert self.manager.profile
 
@@ -1366,8 +1373,6 @@ class TestV20CredManager(AsyncTestCase):
         self.context.injector.bind_instance(IndyIssuer, issuer)
 
         with async_mock.patch.object(
-            test_module, "IssuerRevRegRecord", autospec=True
-        ) as issuer_rr_rec, async_mock.patch.object(
             test_module, "IndyRevocation", autospec=True
         ) as revoc, async_mock.patch.object(
             V20CredExRecord, "save", autospec=True
@@ -1375,19 +1380,12 @@ class TestV20CredManager(AsyncTestCase):
             revoc.return_value.get_active_issuer_rev_reg_record = (
                 async_mock.CoroutineMock(side_effect=StorageNotFoundError())
             )
-            revoc.return_value.init_issuer_registry = async_mock.CoroutineMock(
-                return_value=async_mock.MagicMock(  # pending_rev_reg_rec
-                    stage_pending_registry=async_mock.CoroutineMock()
-                )
-            )
-            issuer_rr_rec.query_by_cred_def_id = async_mock.CoroutineMock(
-                return_value=[]
-            )
             with self.assertRaises(V20CredManagerError) as context:
                 await self.manager.issue_credential(
                     stored_cx_rec, comment=comment, retries=0
                 )
             assert "has no active revocation registry" in str(context.exception)
+            self.provisioner.wait_standby.assert_not_awaited()
 
     async def test_issue_credential_no_active_rr_retry(self):
         conn_id = "test_conn_id"
@@ -1459,8 +1457,6 @@ class TestV20CredManager(AsyncTestCase):
         self.context.injector.bind_instance(IndyIssuer, issuer)
 
         with async_mock.patch.object(
-            test_module, "IssuerRevRegRecord", autospec=True
-        ) as issuer_rr_rec, async_mock.patch.object(
             test_module, "IndyRevocation", autospec=True
         ) as revoc, async_mock.patch.object(
             V20CredExRecord, "save", autospec=True
@@ -1468,23 +1464,113 @@ class TestV20CredManager(AsyncTestCase):
             revoc.return_value.get_active_issuer_rev_reg_record = (
                 async_mock.CoroutineMock(side_effect=StorageNotFoundError())
             )
-            issuer_rr_rec.query_by_cred_def_id = async_mock.CoroutineMock(
-                side_effect=[
-                    [],  # posted_rev_reg_recs
-                    [async_mock.MagicMock(max_cred_num=1000)],  # old_rev_reg_recs
-                ]
-                * 2
+            with self.assertRaises(V20CredManagerError) as context:
+                await self.manager.issue_credential(
+                    stored_cx_rec, comment=comment, retries=1
+                )
+            assert "has no active revocation registry" in str(context.exception)
+            self.provisioner.wait_standby.assert_awaited_once_with(
+                self.profile, CRED_DEF_ID
             )
-            revoc.return_value.init_issuer_registry = async_mock.CoroutineMock(
-                return_value=async_mock.MagicMock(  # pending_rev_reg_rec
-                    stage_pending_registry=async_mock.CoroutineMock()
+
+    async def test_issue_credential_no_active_rr_no_provisioner(self):
+        conn_id = "test_conn_id"
+        comment = "comment"
+        attr_values = {
+            "legalName": "value",
+            "jurisdictionId": "value",
+            "incorporationDate": "value",
+        }
+        indy_offer = {
+            "schema_id": SCHEMA_ID,
+            "cred_def_id": CRED_DEF_ID,
+            "nonce": "0",
+            "...": "...",
+        }
+        indy_cred_req = {
+            "schema_id": SCHEMA_ID,
+            "cred_def_id": CRED_DEF_ID,
+            "...": "...",
+        }
+        thread_id = "thread-id"
+
+        cred_preview = V20CredPreview(
+            attributes=[
+                V20CredAttrSpec(name=k, value=v) for (k, v) in attr_values.items()
+            ]
+        )
+        cred_proposal = V20CredProposal(
+            credential_preview=cred_preview,
+            formats=[V20CredFormat(attach_id="0", format_=V20CredFormat.Format.INDY)],
+            filters_attach=[
+                AttachDecorator.from_indy_dict(
+                    {
+                        "schema_id": SCHEMA_ID,
+                        "cred_def_id": CRED_DEF_ID,
+                    },
+                    ident="0",
                 )
+            ],
+        )
+        cred_offer = V20CredOffer(
+            formats=[V20CredFormat(attach_id="0", format_=V20CredFormat.Format.INDY)],
+            offers_attach=[AttachDecorator.from_indy_dict(indy_offer, ident="0")],
+        )
+        cred_offer.assign_thread_id(thread_id)
+        cred_request = V20CredRequest(
+            formats=[V20CredFormat(attach_id="0", format_=V20CredFormat.Format.INDY)],
+            requests_attach=[AttachDecorator.from_indy_dict(indy_cred_req, ident="0")],
+        )
+
+        stored_cx_rec = V20CredExRecord(
+            cred_ex_id="dummy-cxid",
+            conn_id=conn_id,
+            cred_proposal=cred_proposal.serialize(),
+            cred_offer=cred_offer.serialize(),
+            cred_request=cred_request.serialize(),
+            initiator=V20CredExRecord.INITIATOR_SELF,
+            role=V20CredExRecord.ROLE_ISSUER,
+            state=V20CredExRecord.STATE_REQUEST_RECEIVED,
+            thread_id=thread_id,
+        )
+
+        issuer = async_mock.MagicMock()
+        indy_cred = {"indy": "credential"}
+        cred_rev_id = "1"
+        issuer.create_credential = async_mock.CoroutineMock(
+            return_value=(json.dumps(indy_cred), cred_rev_id)
+        )
+        self.context.injector.bind_instance(IndyIssuer, issuer)
+        self.context.injector.clear_binding(RevRegProvisioner)
+
+        with async_mock.patch.object(
+            test_module, "IndyRevocation", autospec=True
+        ) as revoc, async_mock.patch.object(
+            V20CredExRecord, "save", autospec=True
+        ) as mock_save, async_mock.patch.object(
+            test_module.IssuerRevRegRecord,
+            "query_by_cred_def_id",
+            async_mock.CoroutineMock(return_value=[]),
+        ), async_mock.patch.object(
+            test_module.asyncio, "sleep", async_mock.CoroutineMock()
+        ) as mock_sleep:
+            pending_rev_reg_rec = async_mock.MagicMock(
+                stage_pending_registry=async_mock.CoroutineMock()
+            )
+            revoc.return_value.init_issuer_registry = async_mock.CoroutineMock(
+                return_value=pending_rev_reg_rec
+            )
+            revoc.return_value.get_active_issuer_rev_reg_record = (
+                async_mock.CoroutineMock(side_effect=StorageNotFoundError())
             )
             with self.assertRaises(V20CredManagerError) as context:
                 await self.manager.issue_credential(
                     stored_cx_rec, comment=comment, retries=1
                 )
             assert "has no active revocation registry" in str(context.exception)
+            # registries are staged inline, then the issuer waits for them
+            assert revoc.return_value.init_issuer_registry.await_count == 4
+            mock_sleep.assert_awaited_once_with(2)
 
     async def test_issue_credential_rr_full(self):
         conn_id = "test_conn_id"
@@ -87,6 +87,59 @@ class TestV20CredRoutes(AsyncTestCase):
                     }
                 )
 
+    async def test_credential_exchange_list_paginated(self):
+        self.request.query = {
+            "connection_id": "dummy",
+            "limit": "1",
+            "cursor": "abc",
+        }
+
+        with async_mock.patch.object(
+            test_module, "V20CredExRecord", autospec=True
+        ) as mock_cx_rec, async_mock.patch.object(
+            test_module, "V20CredManager", autospec=True
+        ) as mock_cred_mgr, async_mock.patch.object(
+            test_module.web, "json_response"
+        ) as mock_response:
+            mock_cx_rec.query_page = async_mock.CoroutineMock(
+                return_value=([mock_cx_rec], "next-cursor")
+            )
+            mock_cx_rec.serialize = async_mock.MagicMock(
+                return_value={"hello": "world"}
+            )
+            mock_cred_mgr.return_value.get_detail_record = async_mock.CoroutineMock(
+                return_value=None
+            )
+
+            await test_module.credential_exchange_list(self.request)
+            mock_cx_rec.query_page.assert_awaited_once_with(
+                session=async_mock.ANY,
+                tag_filter={},
+                limit=1,
+                cursor="abc",
+                post_filter_positive={"connection_id": "dummy"},
+            )
+            mock_response.assert_called_once_with(
+                {
+                    "results": [
+                        {"cred_ex_record": {"hello": "world"}, "indy": None, "dif": None}
+                    ],
+                    "next": "next-cursor",
+                }
+            )
+
+    async def test_credential_exchange_list_paginated_x(self):
+        self.request.query = {"limit": "1", "cursor": "not-a-cursor"}
+
+        with async_mock.patch.object(
+            test_module, "V20CredExRecord", autospec=True
+        ) as mock_cx_rec:
+            mock_cx_rec.query_page = async_mock.CoroutineMock(
+                side_effect=test_module.StorageError()
+            )
+            with self.assertRaises(test_module.web.HTTPBadRequest):
+                await test_module.credential_exchange_list(self.request)
+
     async def test_credential_exchange_list_x(self):
         self.request.query = {
             "thread_id": "dummy",
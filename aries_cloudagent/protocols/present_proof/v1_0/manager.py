@@ -298,69 +298,92 @@ class PresentationManager:
                     await holder.get_credential(credential_id)
                 )
 
-        # Get all schemas, credential definitions, and revocation registries in use
+        # Plan the revocation registry deltas for the non-revocation interval
+        # defined in "non_revoked" of the presentation request or attributes
+        epoch_now = int(time.time())
+        delta_reads = {}
+        delta_creds = {}
+        for precis in requested_referents.values():  # cred_id, non-revoc interval
+            credential_id = precis["cred_id"]
+            if not credentials[credential_id].get("rev_reg_id"):
+                continue
+            if "timestamp" in precis:
+                continue
+            if credential_id in delta_creds:
+                continue
+            rev_reg_id = credentials[credential_id]["rev_reg_id"]
+            reft_non_revoc_interval = precis.get("non_revoked")
+            if reft_non_revoc_interval:
+                key = (
+                    f"{rev_reg_id}_"
+                    f"{reft_non_revoc_interval.get('from', 0)}_"
+                    f"{reft_non_revoc_interval.get('to', epoch_now)}"
+                )
+                if key not in delta_reads:
+                    delta_reads[key] = (
+                        rev_reg_id,
+                        credential_id,
+                        (
+                            "get_revoc_reg_delta",
+                            rev_reg_id,
+                            reft_non_revoc_interval.get("from", 0),
+                            reft_non_revoc_interval.get("to", epoch_now),
+                        ),
+                    )
+                delta_creds[credential_id] = key
+
+        # Get all schemas, credential definitions, revocation registries
+        # and deltas in use, reading from the ledger concurrently
+        reads = []
+        for credential in credentials.values():
+            reads.append(("get_schema", credential["schema_id"]))
+            reads.append(("get_credential_definition", credential["cred_def_id"]))
+            if credential.get("rev_reg_id"):
+                reads.append(("get_revoc_reg_def", credential["rev_reg_id"]))
+        reads.extend(read for (_, _, read) in delta_reads.values())
+
         ledger = self._session.inject(BaseLedger)
+        async with ledger:
+            ledger_results = await ledger.batch_read(reads)
+
         schemas = {}
         credential_definitions = {}
         revocation_registries = {}
-
-        async with ledger:
-            for credential in credentials.values():
-                schema_id = credential["schema_id"]
-                if schema_id not in schemas:
-                    schemas[schema_id] = await ledger.get_schema(schema_id)
-
-                credential_definition_id = credential["cred_def_id"]
-                if credential_definition_id not in credential_definitions:
-                    credential_definitions[
-                        credential_definition_id
-                    ] = await ledger.get_credential_definition(credential_definition_id)
-
-                if credential.get("rev_reg_id"):
-                    revocation_registry_id = credential["rev_reg_id"]
-                    if revocation_registry_id not in revocation_registries:
-                        revocation_registries[
-                            revocation_registry_id
-                        ] = RevocationRegistry.from_definition(
-                            await ledger.get_revoc_reg_def(revocation_registry_id), True
-                        )
-
-        # Get delta with non-revocation interval defined in "non_revoked"
-        # of the presentation request or attributes
-        epoch_now = int(time.time())
+        for credential in credentials.values():
+            schema_id = credential["schema_id"]
+            schemas[schema_id] = ledger_results[("get_schema", schema_id)]
+
+            credential_definition_id = credential["cred_def_id"]
+            credential_definitions[credential_definition_id] = ledger_results[
+                ("get_credential_definition", credential_definition_id)
+            ]
+
+            revocation_registry_id = credential.get("rev_reg_id")
+            if (
+                revocation_registry_id
+                and revocation_registry_id not in revocation_registries
+            ):
+                revocation_registries[
+                    revocation_registry_id
+                ] = RevocationRegistry.from_definition(
+                    ledger_results[("get_revoc_reg_def", revocation_registry_id)],
+                    True,
+                )
 
         revoc_reg_deltas = {}
-        async with ledger:
-            for precis in requested_referents.values():  # cred_id, non-revoc interval
-                credential_id = precis["cred_id"]
-                if not credentials[credential_id].get("rev_reg_id"):
-                    continue
-                if "timestamp" in precis:
-                    continue
-                rev_reg_id = credentials[credential_id]["rev_reg_id"]
-                reft_non_revoc_interval = precis.get("non_revoked")
-                if reft_non_revoc_interval:
-                    key = (
-                        f"{rev_reg_id}_"
-                        f"{reft_non_revoc_interval.get('from', 0)}_"
-                        f"{reft_non_revoc_interval.get('to', epoch_now)}"
-                    )
-                    if key not in revoc_reg_deltas:
-                        (delta, delta_timestamp) = await ledger.get_revoc_reg_delta(
-                            rev_reg_id,
-                            reft_non_revoc_interval.get("from", 0),
-                            reft_non_revoc_interval.get("to", epoch_now),
-                        )
-                        revoc_reg_deltas[key] = (
-                            rev_reg_id,
-                            credential_id,
-                            delta,
-                            delta_timestamp,
-                        )
-                    for stamp_me in requested_referents.values():
-                        # often one cred satisfies many requested attrs/preds
-                        if stamp_me["cred_id"] == credential_id:
-                            stamp_me["timestamp"] = revoc_reg_deltas[key][3]
+        for (key, (rev_reg_id, credential_id, read)) in delta_reads.items():
+            (delta, delta_timestamp) = ledger_results[read]
+            revoc_reg_deltas[key] = (
+                rev_reg_id,
+                credential_id,
+                delta,
+                delta_timestamp,
+            )
+        for precis in requested_referents.values():
+            # often one cred satisfies many requested attrs/preds
+            key = delta_creds.get(precis["cred_id"])
+            if key:
+                precis["timestamp"] = revoc_reg_deltas[key][3]
 
         # Get revocation states to prove non-revoked
         revocation_states = {}
@@ -523,47 +546,52 @@ class PresentationManager:
         rev_reg_entries = {}
 
         identifiers = indy_proof["identifiers"]
-        ledger = self._session.inject(BaseLedger)
-        async with ledger:
-            for identifier in identifiers:
-                schema_ids.append(identifier["schema_id"])
-                credential_definition_ids.append(identifier["cred_def_id"])
-
-                # Build schemas for anoncreds
-                if identifier["schema_id"] not in schemas:
-                    schemas[identifier["schema_id"]] = await ledger.get_schema(
-                        identifier["schema_id"]
-                    )
-
-                if identifier["cred_def_id"] not in credential_definitions:
-                    credential_definitions[
-                        identifier["cred_def_id"]
-                    ] = await ledger.get_credential_definition(
-                        identifier["cred_def_id"]
+        reads = []
+        for identifier in identifiers:
+            schema_ids.append(identifier["schema_id"])
+            credential_definition_ids.append(identifier["cred_def_id"])
+            reads.append(("get_schema", identifier["schema_id"]))
+            reads.append(("get_credential_definition", identifier["cred_def_id"]))
+            if identifier.get("rev_reg_id"):
+                reads.append(("get_revoc_reg_def", identifier["rev_reg_id"]))
+                if identifier.get("timestamp"):
+                    reads.append(
+                        (
+                            "get_revoc_reg_entry",
+                            identifier["rev_reg_id"],
+                            identifier["timestamp"],
+                        )
                     )
 
-                if identifier.get("rev_reg_id"):
-                    if identifier["rev_reg_id"] not in rev_reg_defs:
-                        rev_reg_defs[
-                            identifier["rev_reg_id"]
-                        ] = await ledger.get_revoc_reg_def(identifier["rev_reg_id"])
-
-                    if identifier.get("timestamp"):
-                        rev_reg_entries.setdefault(identifier["rev_reg_id"], {})
-
-                        if (
-                            identifier["timestamp"]
-                            not in rev_reg_entries[identifier["rev_reg_id"]]
-                        ):
-                            (
-                                found_rev_reg_entry,
-                                _found_timestamp,
-                            ) = await ledger.get_revoc_reg_entry(
-                                identifier["rev_reg_id"], identifier["timestamp"]
-                            )
-                            rev_reg_entries[identifier["rev_reg_id"]][
-                                identifier["timestamp"]
-                            ] = found_rev_reg_entry
+        ledger = self._session.inject(BaseLedger)
+        async with ledger:
+            ledger_results = await ledger.batch_read(reads)
+
+        for identifier in identifiers:
+            # Build schemas for anoncreds
+            schemas[identifier["schema_id"]] = ledger_results[
+                ("get_schema", identifier["schema_id"])
+            ]
+            credential_definitions[identifier["cred_def_id"]] = ledger_results[
+                ("get_credential_definition", identifier["cred_def_id"])
+            ]
+
+            if identifier.get("rev_reg_id"):
+                rev_reg_defs[identifier["rev_reg_id"]] = ledger_results[
+                    ("get_revoc_reg_def", identifier["rev_reg_id"])
+                ]
+
+                if identifier.get("timestamp"):
+                    (found_rev_reg_entry, _found_timestamp) = ledger_results[
+                        (
+                            "get_revoc_reg_entry",
+                            identifier["rev_reg_id"],
+                            identifier["timestamp"],
+                        )
+                    ]
+                    rev_reg_entries.setdefault(identifier["rev_reg_id"], {})[
+                        identifier["timestamp"]
+                    ] = found_rev_reg_entry
 
         verifier = self._session.inject(IndyVerifier)
         presentation_exchange_record.verified = json.dumps(  # tag: needs string value
@@ -21,6 +21,10 @@ from ....ledger.error import LedgerError
 from ....messaging.decorators.attach_decorator import AttachDecorator
 from ....messaging.models.base import BaseModelError
 from ....messaging.models.openapi import OpenAPISchema
+from ....messaging.models.paginated_query import (
+    PaginatedQuerySchema,
+    get_paginated_query_params,
+)
 from ....messaging.valid import (
     INDY_CRED_DEF_ID,
     INDY_CRED_REV_ID,
@@ -60,7 +64,7 @@ class PresentProofModuleResponseSchema(OpenAPISchema):
     """Response schema for Present Proof Module."""
 
 
-class V10PresentationExchangeListQueryStringSchema(OpenAPISchema):
+class V10PresentationExchangeListQueryStringSchema(PaginatedQuerySchema):
     """Parameters and validators for presentation exchange list query."""
 
     connection_id = fields.UUID(
@@ -104,6 +108,10 @@ class V10PresentationExchangeListSchema(OpenAPISchema):
         fields.Nested(V10PresentationExchangeSchema()),
         description="Aries RFC 37 v1.0 presentation exchange records",
     )
+    next = fields.Str(
+        description="Cursor for the next page of results, if paginated and not done",
+        required=False,
+    )
 
 
 class V10PresentationProposalRequestSchema(AdminAPIMessageTracingSchema):
@@ -483,16 +491,29 @@ async def presentation_exchange_list(request: web.BaseRequest):
         if request.query.get(k, "") != ""
     }
 
+    limit, cursor = get_paginated_query_params(request)
+
     try:
-        records = await V10PresentationExchange.query(
-            session=session,
-            tag_filter=tag_filter,
-            post_filter_positive=post_filter,
-        )
+        if limit:
+            records, cursor = await V10PresentationExchange.query_page(
+                session=session,
+                tag_filter=tag_filter,
+                limit=limit,
+                cursor=cursor,
+                post_filter_positive=post_filter,
+            )
+        else:
+            records = await V10PresentationExchange.query(
+                session=session,
+                tag_filter=tag_filter,
+                post_filter_positive=post_filter,
+            )
         results = [record.serialize() for record in records]
     except (StorageError, BaseModelError) as err:
         raise web.HTTPBadRequest(reason=err.roll_up) from err
 
+    if limit:
+        return web.json_response({"results": results, "next": cursor})
     return web.json_response({"results": results})
 
 
@@ -1,5 +1,6 @@
 import json
 
+from functools import partial
 from time import time
 
 from asynctest import TestCase as AsyncTestCase
@@ -87,6 +88,7 @@ class TestPresentationManager(AsyncTestCase):
 
         Ledger = async_mock.MagicMock(BaseLedger, autospec=True)
         self.ledger = Ledger()
+        self.ledger.batch_read = partial(BaseLedger.batch_read, self.ledger)
         self.ledger.get_schema = async_mock.CoroutineMock(
             return_value=async_mock.MagicMock()
         )
@@ -436,6 +438,7 @@ class TestPresentationManager(AsyncTestCase):
     async def test_create_presentation_no_revocation(self):
         Ledger = async_mock.MagicMock(BaseLedger, autospec=True)
         self.ledger = Ledger()
+        self.ledger.batch_read = partial(BaseLedger.batch_read, self.ledger)
         self.ledger.get_schema = async_mock.CoroutineMock(
             return_value=async_mock.MagicMock()
         )
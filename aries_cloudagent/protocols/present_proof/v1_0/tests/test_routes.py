@@ -81,6 +81,62 @@ class TestProofRoutes(AsyncTestCase):
                     {"results": [mock_presentation_exchange.serialize.return_value]}
                 )
 
+    async def test_presentation_exchange_list_paginated(self):
+        self.request.query = {
+            "thread_id": "thread_id_0",
+            "role": "dummy",
+            "limit": "3",
+            "cursor": "abc",
+        }
+
+        with async_mock.patch(
+            "aries_cloudagent.protocols.present_proof.v1_0.models.presentation_exchange.V10PresentationExchange",
+            autospec=True,
+        ) as mock_presentation_exchange:
+
+            # Since we are mocking import
+            importlib.reload(test_module)
+
+            mock_presentation_exchange.query_page = async_mock.CoroutineMock(
+                return_value=([mock_presentation_exchange], None)
+            )
+            mock_presentation_exchange.serialize = async_mock.MagicMock(
+                return_value={"thread_id": "sample-thread-id"}
+            )
+
+            with async_mock.patch.object(
+                test_module.web, "json_response"
+            ) as mock_response:
+                await test_module.presentation_exchange_list(self.request)
+                mock_presentation_exchange.query_page.assert_awaited_once_with(
+                    session=async_mock.ANY,
+                    tag_filter={"thread_id": "thread_id_0"},
+                    limit=3,
+                    cursor="abc",
+                    post_filter_positive={"role": "dummy"},
+                )
+                mock_response.assert_called_once_with(
+                    {"results": [{"thread_id": "sample-thread-id"}], "next": None}
+                )
+
+    async def test_presentation_exchange_list_paginated_x(self):
+        self.request.query = {"limit": "3", "cursor": "not-a-cursor"}
+
+        with async_mock.patch(
+            "aries_cloudagent.protocols.present_proof.v1_0.models.presentation_exchange.V10PresentationExchange",
+            autospec=True,
+        ) as mock_presentation_exchange:
+
+            # Since we are mocking import
+            importlib.reload(test_module)
+
+            mock_presentation_exchange.query_page = async_mock.CoroutineMock(
+                side_effect=test_module.StorageError()
+            )
+
+            with self.assertRaises(test_module.web.HTTPBadRequest):
+                await test_module.presentation_exchange_list(self.request)
+
     async def test_presentation_exchange_list_x(self):
         self.request.query = {
             "thread_id": "thread_id_0",
@@ -14,6 +14,7 @@ from .messages.route_update_request import RouteUpdateRequest
 from .models.route_record import RouteRecord
 from .models.route_update import RouteUpdate
 from .models.route_updated import RouteUpdated
+from .route_table import RouteTable
 
 
 class RoutingManagerError(BaseError):
@@ -65,6 +66,12 @@ class RoutingManager:
         if not recip_verkey:
             raise RoutingManagerError("Must pass non-empty recip_verkey")
 
+        table = self.session.inject(RouteTable, required=False)
+        if table is not None:
+            record = table.get(self.session.profile.name, recip_verkey)
+            if record:
+                return record
+
         try:
             record = await RouteRecord.retrieve_by_recipient_key(
                 self.session, recip_verkey
@@ -78,6 +85,8 @@ class RoutingManager:
                 f"No route found with recipient key: {recip_verkey}"
             )
 
+        if table is not None:
+            table.add(self.session.profile.name, record)
         return record
 
     async def get_routes(
@@ -152,6 +161,45 @@ class RoutingManager:
         await route.save(self.session, reason="Created new route")
         return route
 
+    async def delete_route_records(self, routes: Sequence[RouteRecord]):
+        """Remove several existing route records in one storage operation."""
+        await RouteRecord.delete_all(self.session, routes)
+
+    async def create_route_records(
+        self,
+        client_connection_id: str = None,
+        recipient_keys: Sequence[str] = None,
+        internal_wallet_id: str = None,
+    ) -> Sequence[RouteRecord]:
+        """
+        Create and store several new RouteRecords in one storage operation.
+
+        Args:
+            client_connection_id: The ID of the connection record
+            recipient_keys: The recipient verkeys of the routes
+            internal_wallet_id: The ID of the wallet record. Used for internal routing
+
+        Returns:
+            The new routing records
+
+        """
+        if not (client_connection_id or internal_wallet_id):
+            raise RoutingManagerError(
+                "Either client_connection_id or internal_wallet_id is required"
+            )
+        if not recipient_keys or not all(recipient_keys):
+            raise RoutingManagerError("Missing recipient_key")
+        routes = [
+            RouteRecord(
+                connection_id=client_connection_id,
+                wallet_id=internal_wallet_id,
+                recipient_key=recipient_key,
+            )
+            for recipient_key in recipient_keys
+        ]
+        await RouteRecord.save_all(self.session, routes, reason="Created new route")
+        return routes
+
     async def update_routes(
         self, client_connection_id: str, updates: Sequence[RouteUpdate]
     ) -> Sequence[RouteUpdated]:
@@ -169,6 +217,8 @@ class RoutingManager:
             exist[route.recipient_key] = route
 
         updated = []
+        creates = {}
+        deletes = {}
         for update in updates:
             result = RouteUpdated(
                 recipient_key=update.recipient_key, action=update.action
@@ -177,31 +227,42 @@ class RoutingManager:
             if not recip_key:
                 result.result = RouteUpdated.RESULT_CLIENT_ERROR
             elif update.action == RouteUpdate.ACTION_CREATE:
-                if recip_key in exist:
+                if recip_key in exist or recip_key in creates:
                     result.result = RouteUpdated.RESULT_NO_CHANGE
                 else:
-                    try:
-                        await self.create_route_record(
-                            client_connection_id=client_connection_id,
-                            recipient_key=recip_key,
-                        )
-                    except RoutingManagerError:
-                        result.result = RouteUpdated.RESULT_SERVER_ERROR
-                    else:
-                        result.result = RouteUpdated.RESULT_SUCCESS
+                    creates[recip_key] = result
             elif update.action == RouteUpdate.ACTION_DELETE:
-                if recip_key in exist:
-                    try:
-                        await self.delete_route_record(exist[recip_key])
-                    except StorageError:
-                        result.result = RouteUpdated.RESULT_SERVER_ERROR
-                    else:
-                        result.result = RouteUpdated.RESULT_SUCCESS
+                if recip_key in exist and recip_key not in deletes:
+                    deletes[recip_key] = result
                 else:
                     result.result = RouteUpdated.RESULT_NO_CHANGE
             else:
                 result.result = RouteUpdated.RESULT_CLIENT_ERROR
             updated.append(result)
+
+        if creates:
+            try:
+                await self.create_route_records(
+                    client_connection_id=client_connection_id,
+                    recipient_keys=list(creates),
+                )
+            except (RoutingManagerError, StorageError):
+                outcome = RouteUpdated.RESULT_SERVER_ERROR
+            else:
+                outcome = RouteUpdated.RESULT_SUCCESS
+            for result in creates.values():
+                result.result = outcome
+
+        if deletes:
+            try:
+                await self.delete_route_records([exist[key] for key in deletes])
+            except StorageError:
+                outcome = RouteUpdated.RESULT_SERVER_ERROR
+            else:
+                outcome = RouteUpdated.RESULT_SUCCESS
+            for result in deletes.values():
+                result.result = outcome
+
         return updated
 
     async def send_create_route(
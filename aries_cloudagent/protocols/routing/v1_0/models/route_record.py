@@ -1,5 +1,7 @@
 """An object for containing information on an individual route."""
 
+from typing import Sequence
+
 from marshmallow import EXCLUDE, fields, validates_schema, ValidationError
 
 from .....core.profile import ProfileSession
@@ -95,6 +97,44 @@ class RouteRecord(BaseRecord):
         tag_filter = {"connection_id": connection_id}
         return await cls.retrieve_by_tag_filter(session, tag_filter)
 
+    async def post_save(
+        self,
+        session: ProfileSession,
+        new_record: bool,
+        last_state: str,
+        webhook: bool = None,
+    ):
+        """Update the route table after the record is saved."""
+        await super().post_save(session, new_record, last_state, webhook)
+        table = self.route_table(session)
+        if table is not None:
+            table.add(session.profile.name, self, new_record)
+
+    async def delete_record(self, session: ProfileSession):
+        """Remove the stored record and its route table entry."""
+        await super().delete_record(session)
+        table = self.route_table(session)
+        if table is not None:
+            table.remove(session.profile.name, self)
+
+    @classmethod
+    async def delete_all(
+        cls, session: ProfileSession, records: Sequence["RouteRecord"]
+    ):
+        """Remove several stored records and their route table entries."""
+        await super().delete_all(session, records)
+        table = cls.route_table(session)
+        if table is not None:
+            for record in records:
+                table.remove(session.profile.name, record)
+
+    @staticmethod
+    def route_table(session: ProfileSession):
+        """Get the route table for the session, if any."""
+        from ..route_table import RouteTable
+
+        return session.inject(RouteTable, required=False)
+
     @property
     def record_value(self) -> dict:
         """Accessor for JSON record value."""
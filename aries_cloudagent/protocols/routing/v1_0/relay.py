@@ -0,0 +1,81 @@
+"""Relay of forward messages without building message instances."""
+
+import json
+import logging
+
+from typing import Optional
+
+from ....core.profile import Profile
+from ....core.protocol_registry import ProtocolRegistry
+from ....protocols.connections.v1_0.manager import ConnectionManager
+from ....transport.inbound.message import InboundMessage
+from ....transport.outbound.message import OutboundMessage
+from ...didcomm_prefix import DIDCommPrefix
+
+from .manager import RoutingManager, RoutingManagerError
+from .message_types import FORWARD, PROTOCOL_PACKAGE
+from .messages.forward import Forward
+
+LOGGER = logging.getLogger(__name__)
+
+FORWARD_TYPES = frozenset(
+    DIDCommPrefix.qualify_all({FORWARD: f"{PROTOCOL_PACKAGE}.messages.forward.Forward"})
+)
+
+
+def is_forward(profile: Profile, payload: dict) -> bool:
+    """Check whether a parsed inbound message is handled by the standard relay."""
+    message_type = payload.get("@type")
+    if message_type not in FORWARD_TYPES:
+        return False
+    registry = profile.inject(ProtocolRegistry, required=False)
+    return bool(registry) and registry.resolve_message_class(message_type) is Forward
+
+
+async def relay_forward(
+    profile: Profile, inbound_message: InboundMessage
+) -> Optional[OutboundMessage]:
+    """
+    Prepare the delivery of a forward message directly from its parsed payload.
+
+    Args:
+        profile: The profile which received the message
+        inbound_message: The inbound forward message
+
+    Returns:
+        The outbound message for the forward recipient, or None if the message
+        must be handled by the standard forward handler
+
+    """
+    payload = inbound_message.payload
+    to = payload.get("to")
+    packed = payload.get("msg")
+    if (
+        not inbound_message.receipt.recipient_verkey
+        or not isinstance(to, str)
+        or not isinstance(packed, dict)
+    ):
+        return None
+
+    async with profile.session() as session:
+        try:
+            recipient = await RoutingManager(session).get_recipient(to)
+        except RoutingManagerError:
+            return None
+        if not recipient.connection_id:
+            return None
+        connection_targets = await ConnectionManager(
+            session
+        ).get_connection_targets(connection_id=recipient.connection_id)
+    if not connection_targets or not connection_targets[0].recipient_keys:
+        return None
+
+    packed = json.dumps(packed, separators=(",", ":")).encode("ascii")
+    LOGGER.debug("Relaying forward to connection: %s", recipient.connection_id)
+    return OutboundMessage(
+        connection_id=recipient.connection_id,
+        payload=None,
+        enc_payload=packed,
+        reply_to_verkey=connection_targets[0].recipient_keys[0],
+        target_list=connection_targets,
+    )
@@ -0,0 +1,58 @@
+"""In-memory table of route records indexed by recipient key."""
+
+import copy
+
+from typing import Dict, Optional, Tuple
+
+from .models.route_record import RouteRecord
+
+
+class RouteTable:
+    """
+    Map recipient keys to route records without a storage query.
+
+    Entries are grouped by profile name, so that profiles sharing the table
+    do not resolve each other's routes. The table is filled as routes are
+    saved or looked up, and updated as route records are removed.
+    """
+
+    def __init__(self):
+        """Initialize an empty `RouteTable`."""
+        self._routes: Dict[Tuple[str, str], RouteRecord] = {}
+
+    def __len__(self) -> int:
+        """Get the number of routes in the table."""
+        return len(self._routes)
+
+    def get(self, profile_name: str, recipient_key: str) -> Optional[RouteRecord]:
+        """Look up the route for a recipient key, returning a copy."""
+        route = self._routes.get((profile_name, recipient_key))
+        return route and copy.copy(route)
+
+    def add(self, profile_name: str, route: RouteRecord, new_record: bool = False):
+        """
+        Add or replace the route for its recipient key.
+
+        A new route for a recipient key which already has a different route
+        clears the entry instead, so that the duplicate is reported by the
+        next storage lookup.
+        """
+        if not route.recipient_key:
+            return
+        key = (profile_name, route.recipient_key)
+        existing = self._routes.get(key)
+        if new_record and existing and existing.record_id != route.record_id:
+            del self._routes[key]
+        else:
+            self._routes[key] = copy.copy(route)
+
+    def remove(self, profile_name: str, route: RouteRecord):
+        """Remove the entry for a route, if present."""
+        key = (profile_name, route.recipient_key)
+        existing = self._routes.get(key)
+        if existing and existing.record_id == route.record_id:
+            del self._routes[key]
+
+    def clear(self):
+        """Remove all routes from the table."""
+        self._routes.clear()
@@ -0,0 +1,93 @@
+import json
+
+from asynctest import TestCase as AsyncTestCase
+from asynctest import mock as async_mock
+
+from .....connections.models.connection_target import ConnectionTarget
+from .....core.in_memory import InMemoryProfile
+from .....core.protocol_registry import ProtocolRegistry
+from .....transport.inbound.message import InboundMessage
+from .....transport.inbound.receipt import MessageReceipt
+from ....didcomm_prefix import DIDCommPrefix
+
+from .. import relay as test_module
+from ..message_types import FORWARD, MESSAGE_TYPES
+from ..models.route_record import RouteRecord
+from ..route_table import RouteTable
+
+TEST_CONN_ID = "conn-id"
+TEST_VERKEY = "3Dn1SJNPaCXcvvJvSbsFWP2xaCjMom3can8CQNhWrTRx"
+TEST_ROUTE_VERKEY = "9WCgWKUaAJj3VWxxtzvvMQN3AoFxoBtBDo9ntwJnVVCC"
+TEST_PACKED = {"protected": "p", "iv": "i", "ciphertext": "c", "tag": "t"}
+
+
+class TestForwardRelay(AsyncTestCase):
+    async def setUp(self):
+        self.profile = InMemoryProfile.test_profile()
+        self.registry = ProtocolRegistry()
+        self.registry.register_message_types(MESSAGE_TYPES)
+        self.profile.context.injector.bind_instance(ProtocolRegistry, self.registry)
+        self.table = RouteTable()
+        self.profile.context.injector.bind_instance(RouteTable, self.table)
+        self.target = ConnectionTarget(
+            endpoint="http://localhost", recipient_keys=[TEST_VERKEY]
+        )
+
+    def make_inbound(self, to=TEST_ROUTE_VERKEY, msg=TEST_PACKED, recipient=True):
+        return InboundMessage(
+            {"@type": DIDCommPrefix.qualify_current(FORWARD), "to": to, "msg": msg},
+            MessageReceipt(recipient_verkey=recipient and TEST_VERKEY),
+        )
+
+    def test_is_forward(self):
+        assert test_module.is_forward(self.profile, self.make_inbound().payload)
+        assert not test_module.is_forward(self.profile, {"@type": "other"})
+
+        self.registry.register_message_types(
+            {DIDCommPrefix.qualify_current(FORWARD): object}
+        )
+        assert not test_module.is_forward(self.profile, self.make_inbound().payload)
+
+    async def test_relay(self):
+        async with self.profile.session() as session:
+            await RouteRecord(
+                connection_id=TEST_CONN_ID, recipient_key=TEST_ROUTE_VERKEY
+            ).save(session)
+        assert len(self.table) == 1
+
+        with async_mock.patch.object(
+            test_module, "ConnectionManager", autospec=True
+        ) as mock_conn_mgr, async_mock.patch.object(
+            RouteRecord, "retrieve_by_recipient_key", async_mock.CoroutineMock()
+        ) as mock_retrieve:
+            mock_conn_mgr.return_value.get_connection_targets = (
+                async_mock.CoroutineMock(return_value=[self.target])
+            )
+            outbound = await test_module.relay_forward(
+                self.profile, self.make_inbound()
+            )
+            mock_retrieve.assert_not_called()
+        assert outbound.connection_id == TEST_CONN_ID
+        # the inner envelope is already packed for the next hop: send it as is
+        assert outbound.payload is None
+        assert outbound.enc_payload == json.dumps(
+            TEST_PACKED, separators=(",", ":")
+        ).encode("ascii")
+        assert outbound.target_list == [self.target]
+        assert outbound.reply_to_verkey == TEST_VERKEY
+
+    async def test_relay_fallback(self):
+        assert not await test_module.relay_forward(
+            self.profile, self.make_inbound(recipient=False)
+        )
+        assert not await test_module.relay_forward(
+            self.profile, self.make_inbound(msg="not-an-envelope")
+        )
+        # unknown route
+        assert not await test_module.relay_forward(self.profile, self.make_inbound())
+
+        async with self.profile.session() as session:
+            await RouteRecord(
+                wallet_id="wallet-id", recipient_key=TEST_ROUTE_VERKEY
+            ).save(session)
+        assert not await test_module.relay_forward(self.profile, self.make_inbound())
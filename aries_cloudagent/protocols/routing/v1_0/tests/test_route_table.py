@@ -0,0 +1,63 @@
+from asynctest import TestCase as AsyncTestCase
+
+from .....core.in_memory import InMemoryProfile
+
+from ..manager import RoutingManager, RouteNotFoundError
+from ..models.route_record import RouteRecord
+from ..route_table import RouteTable
+
+TEST_VERKEY = "3Dn1SJNPaCXcvvJvSbsFWP2xaCjMom3can8CQNhWrTRx"
+TEST_ROUTE_VERKEY = "9WCgWKUaAJj3VWxxtzvvMQN3AoFxoBtBDo9ntwJnVVCC"
+
+
+class TestRouteTable(AsyncTestCase):
+    def test_add_get_remove(self):
+        table = RouteTable()
+        route = RouteRecord(
+            record_id="1", connection_id="conn-id", recipient_key=TEST_VERKEY
+        )
+        table.add("profile", route)
+        found = table.get("profile", TEST_VERKEY)
+        assert found == route and found is not route
+        assert table.get("other", TEST_VERKEY) is None
+
+        # a second route for the key clears the entry
+        table.add(
+            "profile",
+            RouteRecord(record_id="2", connection_id="c2", recipient_key=TEST_VERKEY),
+            new_record=True,
+        )
+        assert table.get("profile", TEST_VERKEY) is None
+
+        table.add("profile", route)
+        table.remove("profile", RouteRecord(record_id="2", recipient_key=TEST_VERKEY))
+        assert len(table) == 1
+        table.remove("profile", route)
+        assert len(table) == 0
+
+        table.add("profile", RouteRecord(record_id="3", connection_id="conn-id"))
+        assert len(table) == 0
+        table.add("profile", route)
+        table.clear()
+        assert len(table) == 0
+
+    async def test_routing_manager(self):
+        profile = InMemoryProfile.test_profile()
+        table = RouteTable()
+        profile.context.injector.bind_instance(RouteTable, table)
+        async with profile.session() as session:
+            manager = RoutingManager(session)
+            route = await manager.create_route_record("conn-id", TEST_ROUTE_VERKEY)
+            routes = await manager.create_route_records("conn-id", [TEST_VERKEY])
+            assert len(table) == 2
+
+            table.clear()
+            assert await manager.get_recipient(TEST_ROUTE_VERKEY) == route
+            assert len(table) == 1
+
+            await manager.delete_route_record(route)
+            with self.assertRaises(RouteNotFoundError):
+                await manager.get_recipient(TEST_ROUTE_VERKEY)
+
+            await manager.delete_route_records(routes)
+            assert len(table) == 0
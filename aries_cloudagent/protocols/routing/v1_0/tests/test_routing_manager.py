@@ -9,6 +9,7 @@ from .....storage.error import (
     StorageError,
     StorageNotFoundError,
 )
+from .....storage.base import BaseStorage
 from .....storage.in_memory import InMemoryStorage
 from .....transport.inbound.receipt import MessageReceipt
 
@@ -208,6 +209,40 @@ class TestRoutingManager(AsyncTestCase):
         assert results[0].action == RouteUpdate.ACTION_CREATE
         assert results[0].result == RouteUpdated.RESULT_SUCCESS
 
+    async def test_update_routes_bulk(self):
+        await self.manager.create_route_record(TEST_CONN_ID, TEST_ROUTE_VERKEY)
+        keys = [f"{TEST_ROUTE_VERKEY}{i}" for i in range(10)]
+        storage = self.session.inject(BaseStorage)
+        with async_mock.patch.object(
+            storage, "add_records", wraps=storage.add_records
+        ) as mock_add_records:
+            results = await self.manager.update_routes(
+                client_connection_id=TEST_CONN_ID,
+                updates=[
+                    RouteUpdate(recipient_key=key, action=RouteUpdate.ACTION_CREATE)
+                    for key in keys + keys[:1]
+                ]
+                + [
+                    RouteUpdate(
+                        recipient_key=TEST_ROUTE_VERKEY,
+                        action=RouteUpdate.ACTION_DELETE,
+                    )
+                ],
+            )
+            mock_add_records.assert_called_once()
+        assert [r.result for r in results] == [RouteUpdated.RESULT_SUCCESS] * 10 + [
+            RouteUpdated.RESULT_NO_CHANGE,
+            RouteUpdated.RESULT_SUCCESS,
+        ]
+        routes = await self.manager.get_routes(TEST_CONN_ID)
+        assert sorted(route.recipient_key for route in routes) == sorted(keys)
+
+    async def test_create_route_records_x(self):
+        with self.assertRaises(RoutingManagerError):
+            await self.manager.create_route_records(None, [TEST_ROUTE_VERKEY])
+        with self.assertRaises(RoutingManagerError):
+            await self.manager.create_route_records(TEST_CONN_ID, [])
+
     async def test_update_routes_create_existing(self):
         await self.manager.create_route_record(TEST_CONN_ID, TEST_ROUTE_VERKEY)
         results = await self.manager.update_routes(
@@ -247,9 +282,9 @@ class TestRoutingManager(AsyncTestCase):
 
     async def test_update_routes_create_server_error(self):
         with async_mock.patch.object(
-            self.manager, "create_route_record", async_mock.CoroutineMock()
-        ) as mock_mgr_create_route_record:
-            mock_mgr_create_route_record.side_effect = RoutingManagerError()
+            self.manager, "create_route_records", async_mock.CoroutineMock()
+        ) as mock_mgr_create_route_records:
+            mock_mgr_create_route_records.side_effect = RoutingManagerError()
             results = await self.manager.update_routes(
                 client_connection_id=TEST_CONN_ID,
                 updates=[
@@ -281,9 +316,9 @@ class TestRoutingManager(AsyncTestCase):
     async def test_update_routes_delete_server_error(self):
         await self.manager.create_route_record(TEST_CONN_ID, TEST_ROUTE_VERKEY)
         with async_mock.patch.object(
-            self.manager, "delete_route_record", async_mock.CoroutineMock()
-        ) as mock_mgr_delete_route_record:
-            mock_mgr_delete_route_record.side_effect = StorageError()
+            self.manager, "delete_route_records", async_mock.CoroutineMock()
+        ) as mock_mgr_delete_route_records:
+            mock_mgr_delete_route_records.side_effect = StorageError()
             results = await self.manager.update_routes(
                 client_connection_id=TEST_CONN_ID,
                 updates=[
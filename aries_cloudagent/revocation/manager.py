@@ -12,6 +12,7 @@ from ..storage.error import StorageNotFoundError
 from .indy import IndyRevocation
 from .models.issuer_rev_reg_record import IssuerRevRegRecord
 from .models.issuer_cred_rev_record import IssuerCredRevRecord
+from .scheduler import RevocationScheduler
 
 
 class RevocationManagerError(BaseError):
@@ -91,7 +92,17 @@ class RevocationManager:
                 f"No revocation registry record found for id {rev_reg_id}"
             )
 
-        if publish:
+        scheduler = self._session.inject(RevocationScheduler, required=False)
+        if scheduler:
+            # coalesce with other revocations against the same registry
+            if publish:
+                await scheduler.publish(self._session.profile, rev_reg_id, cred_rev_id)
+            else:
+                await scheduler.mark_pending(
+                    self._session.profile, rev_reg_id, cred_rev_id
+                )
+
+        elif publish:
             rev_reg = await revoc.get_ledger_registry(rev_reg_id)
             await rev_reg.get_or_fetch_local_tails_path()
 
@@ -137,6 +148,10 @@ class RevocationManager:
         result = {}
         issuer: IndyIssuer = self._session.inject(IndyIssuer)
 
+        scheduler = self._session.inject(RevocationScheduler, required=False)
+        if scheduler:
+            await scheduler.checkpoint(self._session.profile)
+
         issuer_rr_recs = await IssuerRevRegRecord.query_by_pending(self._session)
         for issuer_rr_rec in issuer_rr_recs:
             rrid = issuer_rr_rec.revoc_reg_id
@@ -194,6 +209,10 @@ class RevocationManager:
 
         """
         result = {}
+        scheduler = self._session.inject(RevocationScheduler, required=False)
+        if scheduler:
+            await scheduler.checkpoint(self._session.profile)
+
         issuer_rr_recs = await IssuerRevRegRecord.query_by_pending(self._session)
         for issuer_rr_rec in issuer_rr_recs:
             rrid = issuer_rr_rec.revoc_reg_id
@@ -6,6 +6,7 @@ import uuid
 
 from asyncio import shield
 from functools import total_ordering
+from math import ceil
 from os.path import join
 from shutil import move
 from typing import Any, Sequence
@@ -284,16 +285,20 @@ class IssuerRevRegRecord(BaseRecord):
                 session, reason="Published initial revocation registry entry"
             )
 
-    async def mark_pending(self, session: ProfileSession, cred_rev_id: str) -> None:
-        """Mark a credential revocation id as revoked pending publication to ledger.
+    async def mark_pending(
+        self, session: ProfileSession, *cred_rev_ids: str
+    ) -> None:
+        """Mark credential revocation ids as revoked pending publication to ledger.
 
         Args:
             session: The profile session to use
-            cred_rev_id: The credential revocation identifier for credential to revoke
+            cred_rev_ids: The credential revocation identifiers for credentials
+                to revoke
         """
-        if cred_rev_id not in self.pending_pub:
-            self.pending_pub.append(cred_rev_id)
-            self.pending_pub.sort()
+        pending = set(self.pending_pub)
+        pending.update(cred_rev_ids)
+        if len(pending) > len(self.pending_pub):
+            self.pending_pub = sorted(pending)
 
         await self.save(session, reason="Marked pending revocation")
 
@@ -315,6 +320,15 @@ class IssuerRevRegRecord(BaseRecord):
                 self.pending_pub.clear()
             await self.save(session, reason="Cleared pending revocations")
 
+    def reached_fill_level(self, cred_rev_id: str, fill_level: float) -> bool:
+        """Check whether issuing a credential revocation id reaches a fill level.
+
+        Args:
+            cred_rev_id: The credential revocation identifier just issued
+            fill_level: The fraction of the registry size of interest
+        """
+        return int(cred_rev_id) == max(ceil(self.max_cred_num * fill_level), 1)
+
     async def get_registry(self) -> RevocationRegistry:
         """Create a `RevocationRegistry` instance from this record."""
         return RevocationRegistry(
@@ -1,22 +1,49 @@
 """Classes for managing a revocation registry."""
 
+import asyncio
+import hashlib
 import logging
+import os
 import re
 
 from os.path import join
 from pathlib import Path
+from typing import Dict
+
+import base58
 
-from requests import Session
-from requests.exceptions import RequestException
+from aiohttp import ClientError, ClientSession, ClientTimeout
 
 from ...indy.util import indy_client_dir
 
 from ..error import RevocationError
-import hashlib
-import base58
 
 LOGGER = logging.getLogger(__name__)
 
+TAILS_BUFFER_SIZE = 65536  # should be multiple of 32 bytes for sha256
+
+# tails file downloads in progress, by local path
+_TAILS_DOWNLOADS: Dict[str, asyncio.Future] = {}
+
+
+def _open_partial_tails(partial_path: Path, file_hasher) -> int:
+    """Hash the bytes of an earlier partial download, returning their length."""
+    if not partial_path.is_file():
+        partial_path.parent.mkdir(parents=True, exist_ok=True)
+        return 0
+    offset = 0
+    with open(partial_path, "rb") as partial_file:
+        for buf in iter(lambda: partial_file.read(TAILS_BUFFER_SIZE), b""):
+            file_hasher.update(buf)
+            offset += len(buf)
+    return offset
+
+
+def _write_tails_chunk(tails_file, file_hasher, buf: bytes):
+    """Write a downloaded chunk of a tails file and add it to the hash."""
+    tails_file.write(buf)
+    file_hasher.update(buf)
+
 
 class RevocationRegistry:
     """Manage a revocation registry and tails file."""
@@ -154,41 +181,93 @@ class RevocationRegistry:
         return tails_file_path.is_file()
 
     async def retrieve_tails(self):
-        """Fetch the tails file from the public URI."""
+        """
+        Fetch the tails file from the public URI.
+
+        Concurrent calls for the same tails file share a single download.
+        """
         if not self._tails_public_uri:
             raise RevocationError("Tails file public URI is empty")
 
+        tails_file_path = str(self.get_receiving_tails_local_path())
+        download = _TAILS_DOWNLOADS.get(tails_file_path)
+        if not download:
+            download = asyncio.ensure_future(self._download_tails(tails_file_path))
+            _TAILS_DOWNLOADS[tails_file_path] = download
+
+            def done(fut: asyncio.Future):
+                if _TAILS_DOWNLOADS.get(tails_file_path) is fut:
+                    del _TAILS_DOWNLOADS[tails_file_path]
+                if not fut.cancelled():
+                    fut.exception()  # retrieved by the waiting callers, if any
+
+            download.add_done_callback(done)
+
+        # one caller being cancelled must not abort the download for the others
+        await asyncio.shield(download)
+        self.tails_local_path = tails_file_path
+        return self.tails_local_path
+
+    async def _download_tails(self, tails_file_path: str):
+        """
+        Download the tails file to its local path.
+
+        The file is streamed to a partial file alongside the final path, resuming
+        from the end of any earlier partial download. It is only moved into place
+        once its hash has been verified.
+        """
         LOGGER.info(
             "Downloading the tails file for the revocation registry: %s",
             self.registry_id,
         )
 
-        tails_file_path = Path(self.get_receiving_tails_local_path())
-        tails_file_dir = tails_file_path.parent
-        if not tails_file_dir.exists():
-            tails_file_dir.mkdir(parents=True)
-
-        buffer_size = 65536  # should be multiple of 32 bytes for sha256
-        with open(tails_file_path, "wb", buffer_size) as tails_file:
-            file_hasher = hashlib.sha256()
-
-            with Session() as req_session:
-                try:
-                    resp = req_session.get(self._tails_public_uri, stream=True)
-                    for buf in resp.iter_content(chunk_size=buffer_size):
-                        tails_file.write(buf)
-                        file_hasher.update(buf)
-                except RequestException as rx:
-                    raise RevocationError(f"Error retrieving tails file: {rx}")
-
-            download_tails_hash = base58.b58encode(file_hasher.digest()).decode("utf-8")
-            if download_tails_hash != self.tails_hash:
-                raise RevocationError(
-                    "The hash of the downloaded tails file does not match."
-                )
+        loop = asyncio.get_event_loop()
+        partial_path = Path(f"{tails_file_path}.partial")
+        file_hasher = hashlib.sha256()
+        offset = await loop.run_in_executor(
+            None, _open_partial_tails, partial_path, file_hasher
+        )
 
-        self.tails_local_path = tails_file_path
-        return self.tails_local_path
+        headers = {"Range": f"bytes={offset}-"} if offset else None
+        try:
+            async with ClientSession(
+                timeout=ClientTimeout(total=None, sock_read=60)
+            ) as session:
+                async with session.get(
+                    self._tails_public_uri, headers=headers
+                ) as resp:
+                    if offset and resp.status == 416:
+                        # the earlier download was already complete
+                        resp.release()
+                    else:
+                        resp.raise_for_status()
+                        if offset and resp.status != 206:
+                            LOGGER.info("Tails file server ignored range request")
+                            file_hasher = hashlib.sha256()
+                        mode = "ab" if offset and resp.status == 206 else "wb"
+                        tails_file = await loop.run_in_executor(
+                            None, open, partial_path, mode
+                        )
+                        try:
+                            async for buf in resp.content.iter_chunked(
+                                TAILS_BUFFER_SIZE
+                            ):
+                                await loop.run_in_executor(
+                                    None, _write_tails_chunk, tails_file, file_hasher, buf
+                                )
+                        finally:
+                            await loop.run_in_executor(None, tails_file.close)
+        except (ClientError, asyncio.TimeoutError) as err:
+            raise RevocationError(f"Error retrieving tails file: {err}") from err
+
+        download_tails_hash = base58.b58encode(file_hasher.digest()).decode("utf-8")
+        if download_tails_hash != self.tails_hash:
+            await loop.run_in_executor(None, os.remove, partial_path)
+            raise RevocationError(
+                "The hash of the downloaded tails file does not match."
+            )
+
+        await loop.run_in_executor(None, os.replace, partial_path, tails_file_path)
 
     async def get_or_fetch_local_tails_path(self):
         """Get the local tails path, retrieving from the remote if necessary."""
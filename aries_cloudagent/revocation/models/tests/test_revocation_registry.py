@@ -1,7 +1,8 @@
-import json
-
-import pytest
+import asyncio
+import hashlib
 
+from aiohttp import web
+from aiohttp.test_utils import AioHTTPTestCase, unittest_run_loop
 from asynctest import TestCase as AsyncTestCase, mock as async_mock
 from copy import deepcopy
 from pathlib import Path
@@ -95,79 +96,119 @@ class TestRevocationRegistry(AsyncTestCase):
         rmtree(TAILS_DIR, ignore_errors=True)
         assert not rev_reg_loc.has_local_tails_file()
 
-    async def test_retrieve_tails(self):
+    async def test_retrieve_tails_no_uri(self):
         rev_reg = RevocationRegistry.from_definition(REV_REG_DEF, public_def=False)
         with self.assertRaises(RevocationError) as x_retrieve:
             await rev_reg.retrieve_tails()
-            assert x_retrieve.message.contains("Tails file public URI is empty")
+        assert "Tails file public URI is empty" in str(x_retrieve.exception)
+
+
+class TestRetrieveTails(AioHTTPTestCase):
+    async def setUpAsync(self):
+        self.tails = bytes(range(256)) * 1024
+        self.tails_hash = base58.b58encode(hashlib.sha256(self.tails).digest()).decode(
+            "utf-8"
+        )
+        self.requests = []
+        self.ranges = True
+        self.gate = None
+
+    def tearDown(self):
+        super().tearDown()
+        rmtree(TAILS_DIR, ignore_errors=True)
 
+    async def get_application(self):
+        app = web.Application()
+        app.add_routes([web.get("/tails", self.tails_route)])
+        return app
+
+    async def tails_route(self, request):
+        self.requests.append(request.headers.get("Range"))
+        if self.gate:
+            await self.gate.wait()
+        if self.ranges and request.http_range.start:
+            if request.http_range.start >= len(self.tails):
+                raise web.HTTPRequestRangeNotSatisfiable()
+            return web.Response(body=self.tails[request.http_range], status=206)
+        return web.Response(body=self.tails)
+
+    def rev_reg(self, tails_hash: str = None) -> RevocationRegistry:
         rr_def_public = deepcopy(REV_REG_DEF)
-        rr_def_public["value"]["tailsLocation"] = "http://sample.ca:8088/path"
-        rev_reg = RevocationRegistry.from_definition(rr_def_public, public_def=True)
-
-        more_magic = async_mock.MagicMock()
-        with async_mock.patch.object(
-            test_module, "Session", autospec=True
-        ) as mock_session:
-            mock_session.return_value.__enter__ = async_mock.MagicMock(
-                return_value=more_magic
-            )
-            more_magic.get = async_mock.MagicMock(
-                side_effect=test_module.RequestException("Not this time")
-            )
-
-            with self.assertRaises(RevocationError) as x_retrieve:
-                await rev_reg.retrieve_tails()
-                assert x_retrieve.message.contains("Error retrieving tails file")
-
-            rmtree(TAILS_DIR, ignore_errors=True)
-
-        more_magic = async_mock.MagicMock()
-        with async_mock.patch.object(
-            test_module, "Session", autospec=True
-        ) as mock_session:
-            mock_session.return_value.__enter__ = async_mock.MagicMock(
-                return_value=more_magic
-            )
-            more_magic.get = async_mock.MagicMock(
-                return_value=async_mock.MagicMock(
-                    iter_content=async_mock.MagicMock(
-                        side_effect=[(b"abcd1234",), (b"",)]
-                    )
-                )
-            )
-
-            with self.assertRaises(RevocationError) as x_retrieve:
-                await rev_reg.retrieve_tails()
-                assert x_retrieve.message.contains(
-                    "The hash of the downloaded tails file does not match."
-                )
-
-            rmtree(TAILS_DIR, ignore_errors=True)
-
-        more_magic = async_mock.MagicMock()
-        with async_mock.patch.object(
-            test_module, "Session", autospec=True
-        ) as mock_session, async_mock.patch.object(
-            base58, "b58encode", async_mock.MagicMock()
-        ) as mock_b58enc, async_mock.patch.object(
-            Path, "is_file", autospec=True
-        ) as mock_is_file:
-            mock_session.return_value.__enter__ = async_mock.MagicMock(
-                return_value=more_magic
-            )
-            more_magic.get = async_mock.MagicMock(
-                return_value=async_mock.MagicMock(
-                    iter_content=async_mock.MagicMock(
-                        side_effect=[(b"abcd1234",), (b"",)]
-                    )
-                )
-            )
-            mock_is_file.return_value = False
-
-            mock_b58enc.return_value = async_mock.MagicMock(
-                decode=async_mock.MagicMock(return_value=TAILS_HASH)
-            )
-            await rev_reg.get_or_fetch_local_tails_path()
-
-            rmtree(TAILS_DIR, ignore_errors=True)
+        rr_def_public["value"]["tailsLocation"] = (
+            f"http://localhost:{self.server.port}/tails"
+        )
+        rr_def_public["value"]["tailsHash"] = tails_hash or self.tails_hash
+        return RevocationRegistry.from_definition(rr_def_public, public_def=True)
+
+    def write_partial(self, rev_reg: RevocationRegistry, data: bytes):
+        partial_path = Path(f"{rev_reg.get_receiving_tails_local_path()}.partial")
+        partial_path.parent.mkdir(parents=True, exist_ok=True)
+        partial_path.write_bytes(data)
+        return partial_path
+
+    @unittest_run_loop
+    async def test_retrieve_tails(self):
+        rev_reg = self.rev_reg()
+        tails_path = await rev_reg.get_or_fetch_local_tails_path()
+        assert Path(tails_path).read_bytes() == self.tails
+        assert not Path(f"{tails_path}.partial").exists()
+        assert self.requests == [None]
+
+        assert await rev_reg.get_or_fetch_local_tails_path() == tails_path
+        assert len(self.requests) == 1
+
+    @unittest_run_loop
+    async def test_retrieve_tails_single_flight(self):
+        self.gate = asyncio.Event()
+        rev_regs = [self.rev_reg() for _ in range(3)]
+        fetches = [
+            asyncio.ensure_future(rev_reg.get_or_fetch_local_tails_path())
+            for rev_reg in rev_regs
+        ]
+        await asyncio.sleep(0.1)
+        self.gate.set()
+        paths = await asyncio.gather(*fetches)
+        assert len(set(paths)) == 1
+        assert len(self.requests) == 1
+        assert not test_module._TAILS_DOWNLOADS
+
+    @unittest_run_loop
+    async def test_retrieve_tails_resume(self):
+        rev_reg = self.rev_reg()
+        self.write_partial(rev_reg, self.tails[:1000])
+        tails_path = await rev_reg.retrieve_tails()
+        assert Path(tails_path).read_bytes() == self.tails
+        assert self.requests == ["bytes=1000-"]
+
+    @unittest_run_loop
+    async def test_retrieve_tails_resume_complete(self):
+        rev_reg = self.rev_reg()
+        self.write_partial(rev_reg, self.tails)
+        tails_path = await rev_reg.retrieve_tails()
+        assert Path(tails_path).read_bytes() == self.tails
+
+    @unittest_run_loop
+    async def test_retrieve_tails_resume_unsupported(self):
+        self.ranges = False
+        rev_reg = self.rev_reg()
+        self.write_partial(rev_reg, b"garbage")
+        tails_path = await rev_reg.retrieve_tails()
+        assert Path(tails_path).read_bytes() == self.tails
+
+    @unittest_run_loop
+    async def test_retrieve_tails_x_hash(self):
+        rev_reg = self.rev_reg(TAILS_HASH)
+        with self.assertRaises(RevocationError) as x_retrieve:
+            await rev_reg.retrieve_tails()
+        assert "does not match" in str(x_retrieve.exception)
+        tails_path = Path(rev_reg.get_receiving_tails_local_path())
+        assert not tails_path.exists()
+        assert not Path(f"{tails_path}.partial").exists()
+
+    @unittest_run_loop
+    async def test_retrieve_tails_x_request(self):
+        rev_reg = self.rev_reg()
+        rev_reg.tails_public_uri = f"http://localhost:{self.server.port}/missing"
+        with self.assertRaises(RevocationError) as x_retrieve:
+            await rev_reg.retrieve_tails()
+        assert "Error retrieving tails file" in str(x_retrieve.exception)
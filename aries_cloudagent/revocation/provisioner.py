@@ -0,0 +1,180 @@
+"""Background provisioning of standby revocation registries."""
+
+import asyncio
+import logging
+
+from typing import Dict, Tuple
+
+from ..core.profile import Profile
+from ..multitenant.manager import hold_tenant_profile
+
+from .indy import IndyRevocation
+from .models.issuer_rev_reg_record import IssuerRevRegRecord
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_STANDBY_COUNT = 1
+DEFAULT_STANDBY_THRESHOLD = 0.8
+
+
+class RevRegProvisioner:
+    """
+    Keep posted revocation registries on standby for each credential definition.
+
+    Once the active registry of a credential definition reaches a fill level,
+    new registries are generated, posted to the ledger and have their tails files
+    uploaded in the background. When the active registry is full, issuance can
+    move to the next one without waiting on the ledger or tails server.
+    """
+
+    def __init__(self, standby_count: int = None, threshold: float = None):
+        """
+        Initialize a `RevRegProvisioner` instance.
+
+        Args:
+            standby_count: The number of registries to hold ready besides the
+                active one
+            threshold: The fill level of the active registry, between 0 and 1,
+                at which standby registries are provisioned
+
+        """
+        self.standby_count = max(standby_count or DEFAULT_STANDBY_COUNT, 1)
+        self.threshold = threshold or DEFAULT_STANDBY_THRESHOLD
+        self._tasks: Dict[Tuple[str, str], asyncio.Future] = {}
+
+    def ensure_standby(
+        self,
+        profile: Profile,
+        cred_def_id: str,
+        *,
+        max_cred_num: int = None,
+        exclude_rev_reg_id: str = None,
+    ) -> asyncio.Future:
+        """
+        Start provisioning any missing standby registries for a credential definition.
+
+        Concurrent calls for the same profile and credential definition share
+        a single provisioning task.
+
+        Args:
+            profile: The issuer profile
+            cred_def_id: The credential definition ID
+            max_cred_num: The size of new registries, defaulting to the size of
+                the earliest existing registry
+            exclude_rev_reg_id: A registry not to count as standby, such as the
+                one currently being filled
+
+        Returns:
+            The provisioning task
+
+        """
+        key = (profile.name, cred_def_id)
+        task = self._tasks.get(key)
+        if not task:
+            # keep a tenant profile open until provisioning is finished
+            release_profile = hold_tenant_profile(profile)
+            task = asyncio.ensure_future(
+                self._provision(profile, cred_def_id, max_cred_num, exclude_rev_reg_id)
+            )
+            self._tasks[key] = task
+
+            def done(fut: asyncio.Future):
+                if release_profile:
+                    release_profile()
+                if self._tasks.get(key) is fut:
+                    del self._tasks[key]
+                if not fut.cancelled() and fut.exception():
+                    LOGGER.error(
+                        "Failed to provision revocation registry for cred def %s: %s",
+                        cred_def_id,
+                        fut.exception(),
+                    )
+
+            task.add_done_callback(done)
+        return task
+
+    async def wait_standby(
+        self, profile: Profile, cred_def_id: str, *, max_cred_num: int = None
+    ) -> bool:
+        """
+        Wait until a registry is ready for a credential definition with none active.
+
+        Returns:
+            Whether provisioning completed without error
+
+        """
+        task = self.ensure_standby(profile, cred_def_id, max_cred_num=max_cred_num)
+        # the task continues for other callers if this one is cancelled
+        await asyncio.wait([task])
+        return not task.cancelled() and not task.exception()
+
+    def registry_filled(
+        self, profile: Profile, rev_reg_rec: IssuerRevRegRecord, cred_rev_id: str
+    ):
+        """
+        Note the issuance of a credential against a revocation registry.
+
+        Standby registries are provisioned in the background when the registry
+        reaches the fill level threshold, and again once it is full.
+
+        Args:
+            profile: The issuer profile
+            rev_reg_rec: The registry issued against
+            cred_rev_id: The credential revocation ID issued
+
+        """
+        if rev_reg_rec.reached_fill_level(
+            cred_rev_id, self.threshold
+        ) or rev_reg_rec.reached_fill_level(cred_rev_id, 1):
+            self.ensure_standby(
+                profile,
+                rev_reg_rec.cred_def_id,
+                max_cred_num=rev_reg_rec.max_cred_num,
+                exclude_rev_reg_id=rev_reg_rec.revoc_reg_id,
+            )
+
+    async def _provision(
+        self,
+        profile: Profile,
+        cred_def_id: str,
+        max_cred_num: int,
+        exclude_rev_reg_id: str,
+    ):
+        """Stage registries until enough are posted besides the excluded one."""
+        async with profile.session() as session:
+            records = await IssuerRevRegRecord.query_by_cred_def_id(
+                session, cred_def_id
+            )
+        standby = [
+            record
+            for record in records
+            if record.state
+            in (IssuerRevRegRecord.STATE_POSTED, IssuerRevRegRecord.STATE_ACTIVE)
+            and record.revoc_reg_id != exclude_rev_reg_id
+        ]
+        if not max_cred_num and records:
+            max_cred_num = min(records).max_cred_num  # reuse prior rev reg size
+
+        needed = self.standby_count - len(standby)
+        if needed > 0:
+            LOGGER.info(
+                "Provisioning %d standby revocation registries for cred def %s",
+                needed,
+                cred_def_id,
+            )
+            await asyncio.gather(
+                *(
+                    self._stage_registry(profile, cred_def_id, max_cred_num)
+                    for _ in range(needed)
+                )
+            )
+
+    async def _stage_registry(
+        self, profile: Profile, cred_def_id: str, max_cred_num: int
+    ):
+        """Generate and post a new registry, uploading its tails file."""
+        async with profile.session() as session:
+            record = await IndyRevocation(session).init_issuer_registry(
+                cred_def_id, max_cred_num=max_cred_num
+            )
+            await record.stage_pending_registry(session, max_attempts=16)
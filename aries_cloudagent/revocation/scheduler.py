@@ -0,0 +1,258 @@
+"""Batched publication of credential revocations."""
+
+import asyncio
+import json
+import logging
+import time
+
+from typing import Callable, Dict, List, Set, Tuple
+
+from ..core.profile import Profile
+from ..indy.issuer import IndyIssuer
+from ..multitenant.manager import hold_tenant_profile
+from ..utils.stats import Collector
+
+from .indy import IndyRevocation
+from .models.issuer_rev_reg_record import IssuerRevRegRecord
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_BATCH_INTERVAL = 5.0
+DEFAULT_BATCH_SIZE = 1000
+
+
+class _RegistryQueue:
+    """Revocations held in memory for a single revocation registry."""
+
+    def __init__(self, profile: Profile, rev_reg_id: str):
+        """Initialize the registry queue."""
+        self.profile = profile
+        self.rev_reg_id = rev_reg_id
+        self.cred_rev_ids: Set[str] = set()
+        self.waiters: List[asyncio.Future] = []
+        self.full = asyncio.Event()
+        self.lock = asyncio.Lock()
+        self.task: asyncio.Task = None
+        self.release_profile: Callable[[], None] = None
+
+    def take(self) -> Tuple[Set[str], List[asyncio.Future]]:
+        """Remove and return the queued revocations and publication waiters."""
+        cred_rev_ids, self.cred_rev_ids = self.cred_rev_ids, set()
+        waiters, self.waiters = self.waiters, []
+        self.full.clear()
+        return cred_rev_ids, waiters
+
+
+class RevocationScheduler:
+    """
+    Coalesce credential revocations into periodic ledger entries.
+
+    Revocations are held in memory per revocation registry and checkpointed to
+    the pending publications of its `IssuerRevRegRecord` with a single save,
+    once per interval or when the batch size is reached. Revocations requested
+    for publication are published together at the same checkpoint, as a single
+    registry entry carrying the merged delta.
+    """
+
+    def __init__(self, interval: float = None, batch_size: int = None):
+        """
+        Initialize a `RevocationScheduler` instance.
+
+        Args:
+            interval: The maximum number of seconds revocations are held in memory
+            batch_size: The number of revocations against a registry that triggers
+                an early checkpoint
+
+        """
+        self.interval = interval or DEFAULT_BATCH_INTERVAL
+        self.batch_size = batch_size or DEFAULT_BATCH_SIZE
+        self._queues: Dict[Tuple[str, str], _RegistryQueue] = {}
+        self._unsent: Dict[Tuple[str, str], str] = {}
+        self.published = 0
+        self.publish_failures = 0
+        self.publish_time = 0.0
+        self.last_publish_time = None
+        self._closing = False
+
+    @property
+    def queue_depth(self) -> int:
+        """Accessor for the number of revocations held in memory."""
+        return sum(len(queue.cred_rev_ids) for queue in self._queues.values())
+
+    @property
+    def stats(self) -> dict:
+        """Accessor for the queue depth and publication counters."""
+        return {
+            "revocation_queue_depth": self.queue_depth,
+            "revocation_queue_registries": len(self._queues),
+            "revocation_published": self.published,
+            "revocation_publish_failures": self.publish_failures,
+            "revocation_publish_avg": (
+                self.publish_time / self.published if self.published else None
+            ),
+            "revocation_publish_last": self.last_publish_time,
+        }
+
+    def _enqueue(
+        self, profile: Profile, rev_reg_id: str, cred_rev_id: str
+    ) -> _RegistryQueue:
+        """Add a revocation to the queue for its registry."""
+        key = (profile.name, rev_reg_id)
+        queue = self._queues.get(key)
+        if not queue:
+            queue = self._queues[key] = _RegistryQueue(profile, rev_reg_id)
+            # keep a tenant profile open for as long as the queue uses it
+            queue.release_profile = hold_tenant_profile(profile)
+            queue.task = asyncio.ensure_future(self._run(key, queue))
+        queue.cred_rev_ids.add(cred_rev_id)
+        if len(queue.cred_rev_ids) >= self.batch_size:
+            queue.full.set()
+        return queue
+
+    async def mark_pending(self, profile: Profile, rev_reg_id: str, cred_rev_id: str):
+        """
+        Mark a credential revocation as pending publication.
+
+        Args:
+            profile: The issuer profile
+            rev_reg_id: The revocation registry ID
+            cred_rev_id: The credential revocation ID
+
+        """
+        self._enqueue(profile, rev_reg_id, cred_rev_id)
+
+    async def publish(self, profile: Profile, rev_reg_id: str, cred_rev_id: str):
+        """
+        Revoke a credential, waiting for the next publication of its registry.
+
+        Any revocations pending against the registry are published along with it.
+
+        Args:
+            profile: The issuer profile
+            rev_reg_id: The revocation registry ID
+            cred_rev_id: The credential revocation ID
+
+        """
+        queue = self._enqueue(profile, rev_reg_id, cred_rev_id)
+        waiter = asyncio.get_event_loop().create_future()
+        queue.waiters.append(waiter)
+        await waiter
+
+    async def checkpoint(self, profile: Profile):
+        """
+        Write the revocations held in memory for a profile to storage.
+
+        Args:
+            profile: The issuer profile
+
+        """
+        for (profile_name, _), queue in list(self._queues.items()):
+            if profile_name == profile.name:
+                async with queue.lock:
+                    (cred_rev_ids, waiters) = queue.take()
+                    await self._process(queue, cred_rev_ids, waiters)
+
+    async def close(self):
+        """Write out all revocations held in memory."""
+        self._closing = True
+        for queue in list(self._queues.values()):
+            queue.full.set()
+            await asyncio.wait([queue.task])
+
+    async def _run(self, key: Tuple[str, str], queue: _RegistryQueue):
+        """Checkpoint and publish a registry queue until it is empty."""
+        try:
+            while True:
+                if not self._closing:
+                    try:
+                        await asyncio.wait_for(queue.full.wait(), self.interval)
+                    except asyncio.TimeoutError:
+                        pass
+                async with queue.lock:
+                    (cred_rev_ids, waiters) = queue.take()
+                    if not (cred_rev_ids or waiters):
+                        del self._queues[key]
+                        return
+                    await self._process(queue, cred_rev_ids, waiters)
+        finally:
+            if queue.release_profile:
+                queue.release_profile()
+
+    async def _process(
+        self,
+        queue: _RegistryQueue,
+        cred_rev_ids: Set[str],
+        waiters: List[asyncio.Future],
+    ):
+        """Save queued revocations and publish them if requested."""
+        if not (cred_rev_ids or waiters):
+            return
+        start = time.perf_counter()
+        saved = False
+        try:
+            async with queue.profile.session() as session:
+                issuer_rr_rec = await IssuerRevRegRecord.retrieve_by_revoc_reg_id(
+                    session, queue.rev_reg_id
+                )
+                if cred_rev_ids:
+                    await issuer_rr_rec.mark_pending(session, *cred_rev_ids)
+                saved = True
+                if waiters:
+                    await self._publish(queue, session, issuer_rr_rec)
+        except Exception as err:
+            if waiters:
+                self.publish_failures += 1
+            LOGGER.exception(
+                "Failed to process revocations for rev reg %s", queue.rev_reg_id
+            )
+            if not (saved or self._closing):
+                # keep the revocations for the next checkpoint
+                queue.cred_rev_ids.update(cred_rev_ids)
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_exception(err)
+            return
+
+        if waiters:
+            elapsed = time.perf_counter() - start
+            self.published += 1
+            self.publish_time += elapsed
+            self.last_publish_time = elapsed
+            collector = queue.profile.inject(Collector, required=False)
+            if collector:
+                collector.log("revocation_publish", elapsed, start)
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    async def _publish(
+        self, queue: _RegistryQueue, session, issuer_rr_rec: IssuerRevRegRecord
+    ):
+        """Publish all pending revocations of a registry as a single entry."""
+        key = (queue.profile.name, queue.rev_reg_id)
+        issuer: IndyIssuer = session.inject(IndyIssuer)
+
+        rev_reg = await IndyRevocation(session).get_ledger_registry(queue.rev_reg_id)
+        await rev_reg.get_or_fetch_local_tails_path()
+
+        crids = list(issuer_rr_rec.pending_pub)
+        (delta_json, _) = await issuer.revoke_credentials(
+            issuer_rr_rec.revoc_reg_id, issuer_rr_rec.tails_local_path, crids
+        )
+
+        # an entry which could not be sent is carried into the next one
+        unsent = self._unsent.pop(key, None)
+        if unsent:
+            delta_json = (
+                await issuer.merge_revocation_registry_deltas(unsent, delta_json)
+                if delta_json
+                else unsent
+            )
+        if delta_json:
+            issuer_rr_rec.revoc_reg_entry = json.loads(delta_json)
+            try:
+                await issuer_rr_rec.send_entry(session)
+            except Exception:
+                self._unsent[key] = delta_json
+                raise
+        await issuer_rr_rec.clear_pending(session, crids)
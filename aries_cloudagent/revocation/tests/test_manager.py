@@ -18,6 +18,7 @@ from ...storage.base import StorageRecord
 from ...storage.error import StorageNotFoundError
 
 from ..manager import RevocationManager, RevocationManagerError
+from ..scheduler import RevocationScheduler
 
 from .. import manager as test_module
 
@@ -147,6 +148,41 @@ class TestRevocationManager(AsyncTestCase):
                 self.session, CRED_REV_ID
             )
 
+    async def test_revoke_credential_scheduled(self):
+        CRED_REV_ID = "1"
+        scheduler = async_mock.MagicMock(
+            RevocationScheduler,
+            mark_pending=async_mock.CoroutineMock(),
+            publish=async_mock.CoroutineMock(),
+            checkpoint=async_mock.CoroutineMock(),
+        )
+        self.session.context.injector.bind_instance(RevocationScheduler, scheduler)
+        with async_mock.patch.object(
+            test_module, "IndyRevocation", autospec=True
+        ) as revoc:
+            mock_issuer_rev_reg_record = async_mock.MagicMock(
+                mark_pending=async_mock.CoroutineMock()
+            )
+            revoc.return_value.get_issuer_rev_reg_record = async_mock.CoroutineMock(
+                return_value=mock_issuer_rev_reg_record
+            )
+
+            issuer = async_mock.MagicMock(IndyIssuer, autospec=True)
+            self.session.context.injector.bind_instance(IndyIssuer, issuer)
+
+            await self.manager.revoke_credential(REV_REG_ID, CRED_REV_ID, False)
+            scheduler.mark_pending.assert_awaited_once_with(
+                self.session.profile, REV_REG_ID, CRED_REV_ID
+            )
+            await self.manager.revoke_credential(REV_REG_ID, CRED_REV_ID, True)
+            scheduler.publish.assert_awaited_once_with(
+                self.session.profile, REV_REG_ID, CRED_REV_ID
+            )
+            mock_issuer_rev_reg_record.mark_pending.assert_not_called()
+
+            assert await self.manager.publish_pending_revocations() == {}
+            scheduler.checkpoint.assert_awaited_once_with(self.session.profile)
+
     async def test_publish_pending_revocations(self):
         deltas = [
             {
@@ -0,0 +1,136 @@
+import asyncio
+
+from asynctest import TestCase as AsyncTestCase
+from asynctest import mock as async_mock
+
+from ...core.in_memory import InMemoryProfile
+
+from ..models.issuer_rev_reg_record import IssuerRevRegRecord
+from ..provisioner import RevRegProvisioner
+
+from .. import provisioner as test_module
+
+TEST_DID = "FkjWznKwA4N1JEp2iPiKPG"
+CRED_DEF_ID = f"{TEST_DID}:3:CL:1234:default"
+REV_REG_ID = f"{TEST_DID}:4:{CRED_DEF_ID}:CL_ACCUM:0"
+
+
+class TestRevRegProvisioner(AsyncTestCase):
+    async def setUp(self):
+        self.profile = InMemoryProfile.test_profile()
+        self.provisioner = RevRegProvisioner(standby_count=2, threshold=0.5)
+        self.staged = []
+
+        async def init_issuer_registry(cred_def_id, max_cred_num=None):
+            record = IssuerRevRegRecord(
+                cred_def_id=cred_def_id,
+                issuer_did=TEST_DID,
+                max_cred_num=max_cred_num,
+            )
+            record.stage_pending_registry = async_mock.CoroutineMock(
+                side_effect=self.stage
+            )
+            self.staged.append(record)
+            return record
+
+        self.revoc = async_mock.MagicMock(
+            init_issuer_registry=async_mock.CoroutineMock(
+                side_effect=init_issuer_registry
+            )
+        )
+
+    async def stage(self, session, max_attempts):
+        await asyncio.sleep(0.01)
+
+    async def add_record(self, state: str, revoc_reg_id: str, max_cred_num: int = 10):
+        record = IssuerRevRegRecord(
+            cred_def_id=CRED_DEF_ID,
+            issuer_did=TEST_DID,
+            max_cred_num=max_cred_num,
+            revoc_reg_id=revoc_reg_id,
+            state=state,
+        )
+        async with self.profile.session() as session:
+            await record.save(session)
+        return record
+
+    async def test_wait_standby(self):
+        await self.add_record(IssuerRevRegRecord.STATE_FULL, REV_REG_ID, 20)
+
+        with async_mock.patch.object(
+            test_module, "IndyRevocation", return_value=self.revoc
+        ):
+            waits = [
+                self.provisioner.wait_standby(self.profile, CRED_DEF_ID)
+                for _ in range(3)
+            ]
+            assert all(await asyncio.gather(*waits))
+
+        assert len(self.staged) == 2
+        assert all(record.max_cred_num == 20 for record in self.staged)
+        for record in self.staged:
+            record.stage_pending_registry.assert_awaited_once()
+        assert not self.provisioner._tasks
+
+    async def test_wait_standby_holds_profile(self):
+        release = async_mock.MagicMock()
+        with async_mock.patch.object(
+            test_module, "IndyRevocation", return_value=self.revoc
+        ), async_mock.patch.object(
+            test_module, "hold_tenant_profile", return_value=release
+        ) as mock_hold:
+            task = self.provisioner.ensure_standby(self.profile, CRED_DEF_ID)
+            self.provisioner.ensure_standby(self.profile, CRED_DEF_ID)
+            mock_hold.assert_called_once_with(self.profile)
+            release.assert_not_called()
+            await task
+
+        release.assert_called_once_with()
+
+    async def test_wait_standby_x(self):
+        self.revoc.init_issuer_registry.side_effect = ValueError("no ledger")
+        with async_mock.patch.object(
+            test_module, "IndyRevocation", return_value=self.revoc
+        ):
+            assert not await self.provisioner.wait_standby(self.profile, CRED_DEF_ID)
+
+    async def test_registry_filled(self):
+        active = await self.add_record(IssuerRevRegRecord.STATE_ACTIVE, REV_REG_ID)
+        await self.add_record(IssuerRevRegRecord.STATE_ACTIVE, f"{REV_REG_ID}1")
+
+        with async_mock.patch.object(
+            test_module, "IndyRevocation", return_value=self.revoc
+        ):
+            self.provisioner.registry_filled(self.profile, active, "4")
+            assert not self.provisioner._tasks
+
+            self.provisioner.registry_filled(self.profile, active, "5")
+            await self.provisioner._tasks[(self.profile.name, CRED_DEF_ID)]
+
+        assert len(self.staged) == 1
+        assert self.staged[0].max_cred_num == active.max_cred_num
+
+    async def test_registry_filled_standby_ready(self):
+        active = await self.add_record(IssuerRevRegRecord.STATE_ACTIVE, REV_REG_ID)
+        await self.add_record(IssuerRevRegRecord.STATE_ACTIVE, f"{REV_REG_ID}1")
+        await self.add_record(IssuerRevRegRecord.STATE_POSTED, f"{REV_REG_ID}2")
+
+        with async_mock.patch.object(
+            test_module, "IndyRevocation", return_value=self.revoc
+        ):
+            self.provisioner.registry_filled(self.profile, active, "10")
+            await self.provisioner._tasks[(self.profile.name, CRED_DEF_ID)]
+
+        assert not self.staged
+
+    async def test_reached_fill_level(self):
+        record = IssuerRevRegRecord(max_cred_num=5)
+        assert [record.reached_fill_level(i, 0.5) for i in range(1, 6)] == [
+            False,
+            False,
+            True,
+            False,
+            False,
+        ]
+        assert record.reached_fill_level("5", 1)
+        assert IssuerRevRegRecord(max_cred_num=4).reached_fill_level("1", 0.01)
@@ -0,0 +1,162 @@
+import asyncio
+import json
+
+from asynctest import TestCase as AsyncTestCase
+from asynctest import mock as async_mock
+
+from ...core.in_memory import InMemoryProfile
+from ...indy.issuer import IndyIssuer
+from ...utils.stats import Collector
+
+from ..models.issuer_rev_reg_record import IssuerRevRegRecord
+from ..scheduler import RevocationScheduler
+
+from .. import scheduler as test_module
+
+TEST_DID = "FkjWznKwA4N1JEp2iPiKPG"
+CRED_DEF_ID = f"{TEST_DID}:3:CL:1234:default"
+REV_REG_ID = f"{TEST_DID}:4:{CRED_DEF_ID}:CL_ACCUM:0"
+
+
+class TestRevocationScheduler(AsyncTestCase):
+    async def setUp(self):
+        self.profile = InMemoryProfile.test_profile()
+        self.issuer = async_mock.MagicMock(IndyIssuer, autospec=True)
+        self.issuer.revoke_credentials = async_mock.CoroutineMock(
+            side_effect=lambda rrid, tails, crids: (
+                json.dumps({"ver": "1.0", "value": {"revoked": crids}}),
+                [],
+            )
+        )
+        self.issuer.merge_revocation_registry_deltas = async_mock.CoroutineMock(
+            return_value=json.dumps({"ver": "1.0", "value": {"merged": True}})
+        )
+        self.profile.context.injector.bind_instance(IndyIssuer, self.issuer)
+        self.collector = Collector()
+        self.profile.context.injector.bind_instance(Collector, self.collector)
+
+        self.record = IssuerRevRegRecord(
+            cred_def_id=CRED_DEF_ID,
+            issuer_did=TEST_DID,
+            revoc_reg_id=REV_REG_ID,
+            tails_local_path="dummy-path",
+            state=IssuerRevRegRecord.STATE_ACTIVE,
+        )
+        async with self.profile.session() as session:
+            await self.record.save(session)
+
+        self.scheduler = RevocationScheduler(interval=0.05, batch_size=3)
+        self.patch_revoc = async_mock.patch.object(
+            test_module, "IndyRevocation", autospec=True
+        )
+        revoc = self.patch_revoc.start()
+        revoc.return_value.get_ledger_registry = async_mock.CoroutineMock(
+            return_value=async_mock.MagicMock(
+                get_or_fetch_local_tails_path=async_mock.CoroutineMock()
+            )
+        )
+        self.patch_send = async_mock.patch.object(
+            IssuerRevRegRecord, "send_entry", autospec=True
+        )
+        self.send_entry = self.patch_send.start()
+
+    async def tearDown(self):
+        await self.scheduler.close()
+        self.patch_revoc.stop()
+        self.patch_send.stop()
+
+    async def pending(self):
+        async with self.profile.session() as session:
+            record = await IssuerRevRegRecord.retrieve_by_revoc_reg_id(
+                session, REV_REG_ID
+            )
+        return record.pending_pub
+
+    async def test_mark_pending(self):
+        await self.scheduler.mark_pending(self.profile, REV_REG_ID, "1")
+        await self.scheduler.mark_pending(self.profile, REV_REG_ID, "2")
+        assert self.scheduler.queue_depth == 2
+        assert await self.pending() == []
+
+        await asyncio.sleep(0.1)
+        assert await self.pending() == ["1", "2"]
+        assert self.scheduler.queue_depth == 0
+        self.send_entry.assert_not_called()
+
+    async def test_holds_profile(self):
+        release = async_mock.MagicMock()
+        with async_mock.patch.object(
+            test_module, "hold_tenant_profile", return_value=release
+        ) as mock_hold:
+            await self.scheduler.mark_pending(self.profile, REV_REG_ID, "1")
+            await self.scheduler.mark_pending(self.profile, REV_REG_ID, "2")
+            mock_hold.assert_called_once_with(self.profile)
+            release.assert_not_called()
+
+            # the queue ends after an interval without revocations
+            await asyncio.sleep(0.2)
+        assert await self.pending() == ["1", "2"]
+        assert not self.scheduler._queues
+        release.assert_called_once_with()
+
+    async def test_mark_pending_batch_size(self):
+        self.scheduler.interval = 10
+        for crid in ("1", "2", "3"):
+            await self.scheduler.mark_pending(self.profile, REV_REG_ID, crid)
+        await asyncio.sleep(0.01)
+        assert await self.pending() == ["1", "2", "3"]
+
+    async def test_checkpoint(self):
+        self.scheduler.interval = 10
+        await self.scheduler.mark_pending(self.profile, REV_REG_ID, "1")
+        await self.scheduler.checkpoint(self.profile)
+        assert await self.pending() == ["1"]
+        await self.scheduler.close()
+        assert not self.scheduler._queues
+
+    async def test_publish(self):
+        await self.scheduler.mark_pending(self.profile, REV_REG_ID, "1")
+        await asyncio.gather(
+            self.scheduler.publish(self.profile, REV_REG_ID, "2"),
+            self.scheduler.publish(self.profile, REV_REG_ID, "3"),
+        )
+        self.issuer.revoke_credentials.assert_awaited_once_with(
+            REV_REG_ID, "dummy-path", ["1", "2", "3"]
+        )
+        self.send_entry.assert_called_once()
+        assert await self.pending() == []
+
+        stats = self.scheduler.stats
+        assert stats["revocation_published"] == 1
+        assert stats["revocation_publish_last"] is not None
+        assert self.collector.results["avg"]["revocation_publish"] >= 0
+
+    async def test_publish_send_x(self):
+        self.send_entry.side_effect = ValueError("ledger down")
+        with self.assertRaises(ValueError):
+            await self.scheduler.publish(self.profile, REV_REG_ID, "1")
+        assert await self.pending() == ["1"]
+        assert self.scheduler.stats["revocation_publish_failures"] == 1
+
+        # already revoked in the wallet: the unsent entry is carried over
+        self.send_entry.side_effect = None
+        self.issuer.revoke_credentials.side_effect = None
+        self.issuer.revoke_credentials.return_value = (None, ["1"])
+        await self.scheduler.publish(self.profile, REV_REG_ID, "2")
+        self.issuer.merge_revocation_registry_deltas.assert_not_called()
+        assert self.send_entry.call_args[0][0].revoc_reg_entry == {
+            "ver": "1.0",
+            "value": {"revoked": ["1"]},
+        }
+        assert await self.pending() == []
+
+    async def test_publish_merge_unsent(self):
+        self.send_entry.side_effect = [ValueError("ledger down"), None]
+        with self.assertRaises(ValueError):
+            await self.scheduler.publish(self.profile, REV_REG_ID, "1")
+        await self.scheduler.publish(self.profile, REV_REG_ID, "2")
+        self.issuer.merge_revocation_registry_deltas.assert_awaited_once()
+        assert self.send_entry.call_args[0][0].revoc_reg_entry == {
+            "ver": "1.0",
+            "value": {"merged": True},
+        }
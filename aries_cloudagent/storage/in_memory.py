@@ -1,6 +1,6 @@
 """Basic in-memory storage implementation (non-wallet)."""
 
-from typing import Mapping, Sequence
+from typing import Iterator, Mapping, Sequence
 
 from ..core.in_memory import InMemoryProfile
 
@@ -48,6 +48,28 @@ class InMemoryStorage(BaseStorage, BaseStorageSearch):
         if record.id in self.profile.records:
             raise StorageDuplicateError("Duplicate record")
         self.profile.records[record.id] = record
+        self.profile.record_index.add(record)
+
+    async def add_records(self, records: Sequence[StorageRecord]):
+        """
+        Add several new records to the store, either all or none of them.
+
+        Args:
+            records: The `StorageRecord` instances to be stored
+
+        Raises:
+            StorageDuplicateError: If any record ID is already present
+
+        """
+        ids = set()
+        for record in records:
+            validate_record(record)
+            if record.id in self.profile.records or record.id in ids:
+                raise StorageDuplicateError("Duplicate record")
+            ids.add(record.id)
+        for record in records:
+            self.profile.records[record.id] = record
+            self.profile.record_index.add(record)
 
     async def get_record(
         self, record_type: str, record_id: str, options: Mapping = None
@@ -90,7 +112,27 @@ class InMemoryStorage(BaseStorage, BaseStorageSearch):
         oldrec = self.profile.records.get(record.id)
         if not oldrec:
             raise StorageNotFoundError("Record not found: {}".format(record.id))
-        self.profile.records[record.id] = oldrec._replace(value=value, tags=tags)
+        newrec = oldrec._replace(value=value, tags=tags)
+        self.profile.records[record.id] = newrec
+        self.profile.record_index.update(oldrec, newrec)
+
+    async def update_records(self, records: Sequence[StorageRecord]):
+        """
+        Update several existing stored records, either all or none of them.
+
+        Args:
+            records: The `StorageRecord` instances holding the new values and tags
+
+        Raises:
+            StorageNotFoundError: If any record is not found
+
+        """
+        for record in records:
+            validate_record(record)
+            if record.id not in self.profile.records:
+                raise StorageNotFoundError("Record not found: {}".format(record.id))
+        for record in records:
+            await self.update_record(record, record.value, record.tags)
 
     async def delete_record(self, record: StorageRecord):
         """
@@ -106,7 +148,27 @@ class InMemoryStorage(BaseStorage, BaseStorageSearch):
         validate_record(record, delete=True)
         if record.id not in self.profile.records:
             raise StorageNotFoundError("Record not found: {}".format(record.id))
-        del self.profile.records[record.id]
+        self.profile.record_index.remove(self.profile.records.pop(record.id))
+
+    async def delete_records(self, records: Sequence[StorageRecord]):
+        """
+        Delete several records, either all or none of them.
+
+        Args:
+            records: The `StorageRecord` instances to delete
+
+        Raises:
+            StorageNotFoundError: If any record is not found
+
+        """
+        ids = set()
+        for record in records:
+            validate_record(record, delete=True)
+            if record.id not in self.profile.records or record.id in ids:
+                raise StorageNotFoundError("Record not found: {}".format(record.id))
+            ids.add(record.id)
+        for record_id in ids:
+            self.profile.record_index.remove(self.profile.records.pop(record_id))
 
     async def find_all_records(
         self,
@@ -115,11 +177,7 @@ class InMemoryStorage(BaseStorage, BaseStorageSearch):
         options: Mapping = None,
     ):
         """Retrieve all records matching a particular type filter and tag query."""
-        results = []
-        for record in self.profile.records.values():
-            if record.type == type_filter and tag_query_match(record.tags, tag_query):
-                results.append(record)
-        return results
+        return list(query_records(self.profile, type_filter, tag_query))
 
     async def delete_all_records(
         self,
@@ -127,12 +185,8 @@ class InMemoryStorage(BaseStorage, BaseStorageSearch):
         tag_query: Mapping = None,
     ):
         """Remove all records matching a particular type filter and tag query."""
-        ids = []
-        for record_id, record in self.profile.records.items():
-            if record.type == type_filter and tag_query_match(record.tags, tag_query):
-                ids.append(record_id)
-        for record_id in ids:
-            del self.profile.records[record_id]
+        for record in list(query_records(self.profile, type_filter, tag_query)):
+            self.profile.record_index.remove(self.profile.records.pop(record.id))
 
     def search_records(
         self,
@@ -208,6 +262,10 @@ def tag_query_match(tags: dict, tag_query: dict) -> bool:
                     if tag_query_match(tags, opt):
                         chk = True
                         break
+            elif k == "$and":
+                if not isinstance(v, list):
+                    raise StorageSearchError("Expected list for $and filter value")
+                chk = all(tag_query_match(tags, opt) for opt in v)
             elif k == "$not":
                 if not isinstance(v, dict):
                     raise StorageSearchError("Expected dict for $not filter value")
@@ -228,6 +286,16 @@ def tag_query_match(tags: dict, tag_query: dict) -> bool:
     return result
 
 
+def query_records(
+    profile: InMemoryProfile, type_filter: str, tag_query: Mapping = None
+) -> Iterator[StorageRecord]:
+    """Iterate the records matching a type filter and tag query, in stored order."""
+    for record_id in profile.record_index.candidates(type_filter, tag_query):
+        record = profile.records.get(record_id)
+        if record and tag_query_match(record.tags, tag_query):
+            yield record
+
+
 class InMemoryStorageSearch(BaseStorageSearchSession):
     """Represent an active stored records search."""
 
@@ -250,8 +318,8 @@ class InMemoryStorageSearch(BaseStorageSearchSession):
             options: Dictionary of backend-specific options
 
         """
-        self._cache = profile.records.copy()
-        self._iter = iter(self._cache)
+        self._cache = profile.records
+        self._iter = iter(profile.record_index.candidates(type_filter, tag_query))
         self.page_size = page_size or DEFAULT_PAGE_SIZE
         self.tag_query = tag_query
         self.type_filter = type_filter
@@ -275,7 +343,6 @@ class InMemoryStorageSearch(BaseStorageSearchSession):
             raise StorageSearchError("Search query is complete")
 
         ret = []
-        check_type = self.type_filter
         i = max_count or self.page_size
 
         while i > 0:
@@ -283,10 +350,8 @@ class InMemoryStorageSearch(BaseStorageSearchSession):
                 id = next(self._iter)
             except StopIteration:
                 break
-            record = self._cache[id]
-            if record.type == check_type and tag_query_match(
-                record.tags, self.tag_query
-            ):
+            record = self._cache.get(id)
+            if record and tag_query_match(record.tags, self.tag_query):
                 ret.append(record)
                 i -= 1
 
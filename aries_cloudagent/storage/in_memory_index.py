@@ -0,0 +1,122 @@
+"""Secondary indexes over in-memory storage records."""
+
+from typing import Iterable, Mapping, Optional, Set
+
+from .record import StorageRecord
+
+
+class InMemoryRecordIndex:
+    """
+    Index in-memory records by type and by tag name and value.
+
+    The index narrows a tag query to a set of candidate record IDs; callers
+    are expected to apply the full tag query to the candidates, as operators
+    such as `$neq` or `$gt` cannot be answered from the index.
+    """
+
+    def __init__(self):
+        """Initialize the index."""
+        self._seq = 0
+        # looks like { "record_id": <insertion sequence> }
+        self._order = {}
+        # looks like { "type": { "record_id": None } }, kept in insertion order
+        self._by_type = {}
+        # looks like { ("type", "name", "value"): { "record_id", ... } }
+        self._by_tag = {}
+
+    def add(self, record: StorageRecord):
+        """Add a newly stored record to the index."""
+        self._seq += 1
+        self._order[record.id] = self._seq
+        self._by_type.setdefault(record.type, {})[record.id] = None
+        self._add_tags(record)
+
+    def update(self, old: StorageRecord, new: StorageRecord):
+        """Update the tag index for a record, retaining its position."""
+        self._remove_tags(old)
+        self._add_tags(new)
+
+    def remove(self, record: StorageRecord):
+        """Remove a deleted record from the index."""
+        self._order.pop(record.id, None)
+        type_ids = self._by_type.get(record.type)
+        if type_ids is not None:
+            type_ids.pop(record.id, None)
+            if not type_ids:
+                del self._by_type[record.type]
+        self._remove_tags(record)
+
+    def _add_tags(self, record: StorageRecord):
+        for name, value in (record.tags or {}).items():
+            if isinstance(value, str):
+                key = (record.type, name, value)
+                self._by_tag.setdefault(key, set()).add(record.id)
+
+    def _remove_tags(self, record: StorageRecord):
+        for name, value in (record.tags or {}).items():
+            key = (record.type, name, value)
+            ids = self._by_tag.get(key) if isinstance(value, str) else None
+            if ids is not None:
+                ids.discard(record.id)
+                if not ids:
+                    del self._by_tag[key]
+
+    def _tag_ids(self, type_filter: str, name: str, value: str) -> Set[str]:
+        return self._by_tag.get((type_filter, name, value), set())
+
+    def _query_ids(self, type_filter: str, tag_query: Mapping) -> Optional[Set[str]]:
+        """
+        Find the candidate record IDs for a tag query.
+
+        Returns:
+            A superset of the matching record IDs, or `None` if the query
+            cannot be narrowed using the index
+
+        """
+        if not isinstance(tag_query, Mapping):
+            return None
+        clauses = []
+        for k, v in tag_query.items():
+            ids = None
+            if k in ("$and", "$or"):
+                if not isinstance(v, list):
+                    return None
+                subs = [self._query_ids(type_filter, opt) for opt in v]
+                if k == "$and":
+                    subs = [s for s in subs if s is not None]
+                    if subs:
+                        ids = set.intersection(*sorted(subs, key=len))
+                elif subs and None not in subs:
+                    ids = set().union(*subs)
+            elif k[:1] == "$":
+                continue
+            elif isinstance(v, str):
+                ids = self._tag_ids(type_filter, k, v)
+            elif isinstance(v, dict) and len(v) == 1 and "$in" in v:
+                if isinstance(v["$in"], list):
+                    ids = set().union(
+                        *(
+                            self._tag_ids(type_filter, k, opt)
+                            for opt in v["$in"]
+                            if isinstance(opt, str)
+                        )
+                    )
+            if ids is not None:
+                if not ids:
+                    return set()
+                clauses.append(ids)
+        if not clauses:
+            return None
+        clauses.sort(key=len)
+        return clauses[0].intersection(*clauses[1:])
+
+    def candidates(self, type_filter: str, tag_query: Mapping = None) -> Iterable[str]:
+        """
+        List the IDs of records possibly matching a type and tag query.
+
+        The results are returned in insertion order.
+        """
+        ids = self._query_ids(type_filter, tag_query) if tag_query else None
+        if ids is None:
+            return list(self._by_type.get(type_filter, ()))
+        return sorted(ids, key=self._order.__getitem__)
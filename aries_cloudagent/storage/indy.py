@@ -3,7 +3,7 @@
 import asyncio
 import json
 import logging
-from typing import Mapping, Sequence
+from typing import Callable, Mapping, Sequence, Tuple
 
 from indy import non_secrets
 from indy.error import IndyError, ErrorCode
@@ -26,6 +26,9 @@ from ..indy.sdk.wallet_setup import IndyOpenWallet
 
 LOGGER = logging.getLogger(__name__)
 
+# maximum number of wallet calls kept in flight by bulk operations
+BULK_CONCURRENCY = 32
+
 
 class IndySdkStorage(BaseStorage, BaseStorageSearch):
     """Indy Non-Secrets interface."""
@@ -66,6 +69,82 @@ class IndySdkStorage(BaseStorage, BaseStorageSearch):
                 ) from x_indy
             raise StorageError(str(x_indy)) from x_indy
 
+    async def _run_bulk(
+        self, method: Callable, records: Sequence[StorageRecord]
+    ) -> Tuple[Sequence[StorageRecord], Exception]:
+        """
+        Apply a single-record method to several records concurrently.
+
+        Returns:
+            A tuple of the records for which the method completed successfully,
+            and the first error raised for any record
+
+        """
+        lock = asyncio.Semaphore(BULK_CONCURRENCY)
+
+        async def apply(record: StorageRecord):
+            async with lock:
+                await method(record)
+
+        results = await asyncio.gather(
+            *(apply(record) for record in records), return_exceptions=True
+        )
+        done = [rec for (rec, res) in zip(records, results) if res is None]
+        error = next((res for res in results if res is not None), None)
+        return done, error
+
+    async def add_records(self, records: Sequence[StorageRecord]):
+        """
+        Add several new records to the store.
+
+        The wallet calls are issued concurrently. Libindy has no transactions,
+        so if any record cannot be added, the records which were added are
+        removed again before the error is raised.
+
+        Args:
+            records: The `StorageRecord` instances to be stored
+
+        """
+        for record in records:
+            validate_record(record)
+        added, error = await self._run_bulk(self.add_record, records)
+        if error:
+            if added:
+                await self._run_bulk(self.delete_record, added)
+            raise error
+
+    async def update_records(self, records: Sequence[StorageRecord]):
+        """
+        Update several existing stored records to their current value and tags.
+
+        The wallet calls are issued concurrently; updates are not atomic.
+
+        Args:
+            records: The `StorageRecord` instances holding the new values and tags
+
+        """
+
+        async def update(record: StorageRecord):
+            await self.update_record(record, record.value, record.tags)
+
+        _, error = await self._run_bulk(update, records)
+        if error:
+            raise error
+
+    async def delete_records(self, records: Sequence[StorageRecord]):
+        """
+        Delete several existing records.
+
+        The wallet calls are issued concurrently; deletions are not atomic.
+
+        Args:
+            records: The `StorageRecord` instances to delete
+
+        """
+        _, error = await self._run_bulk(self.delete_record, records)
+        if error:
+            raise error
+
     async def get_record(
         self, record_type: str, record_id: str, options: Mapping = None
     ) -> StorageRecord:
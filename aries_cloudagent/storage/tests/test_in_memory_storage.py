@@ -144,6 +144,45 @@ class TestInMemoryStorage:
         assert found.value == record.value
         assert found.tags == record.tags
 
+    @pytest.mark.asyncio
+    async def test_bulk_add_update_delete(self, store):
+        records = [test_record({"tag": str(i)}) for i in range(3)]
+        await store.add_records(records)
+        for record in records:
+            assert await store.get_record(record.type, record.id)
+
+        updated = [record._replace(value="UPDATED") for record in records]
+        await store.update_records(updated)
+        for record in records:
+            result = await store.get_record(record.type, record.id)
+            assert result.value == "UPDATED"
+
+        await store.delete_records(records[:2])
+        rows = await store.find_all_records("TYPE", {})
+        assert [row.id for row in rows] == [records[2].id]
+
+        with pytest.raises(StorageNotFoundError):
+            await store.delete_records(records[1:])
+
+    @pytest.mark.asyncio
+    async def test_bulk_add_duplicate(self, store):
+        record = test_record()
+        await store.add_record(record)
+        new_record = test_record()
+        with pytest.raises(StorageDuplicateError):
+            await store.add_records([new_record, record])
+        with pytest.raises(StorageNotFoundError):
+            await store.get_record(new_record.type, new_record.id)
+
+    @pytest.mark.asyncio
+    async def test_bulk_update_missing(self, store):
+        record = test_record()
+        await store.add_record(record)
+        with pytest.raises(StorageNotFoundError):
+            await store.update_records(
+                [record._replace(value="UPDATED"), test_missing_record()]
+            )
+
     @pytest.mark.asyncio
     async def test_delete_all(self, store):
         record = test_record({"tag": "one"})
@@ -254,12 +293,18 @@ class TestInMemoryTagQuery:
         assert not tag_query_match(None, {"a": "aardvark"})
         assert tag_query_match(TAGS, {"$or": [{"a": "aardvark"}, {"a": "alligator"}]})
         assert tag_query_match(TAGS, {"$not": {"a": "alligator"}})
+        assert tag_query_match(TAGS, {"$and": [{"a": "aardvark"}, {"b": "bear"}]})
+        assert not tag_query_match(TAGS, {"$and": [{"a": "aardvark"}, {"b": "cat"}]})
         assert tag_query_match(TAGS, {"z": {"$gt": "-1"}})
 
         with pytest.raises(StorageSearchError) as excinfo:
             tag_query_match(TAGS, {"$or": "-1"})
         assert "Expected list" in str(excinfo.value)
 
+        with pytest.raises(StorageSearchError) as excinfo:
+            tag_query_match(TAGS, {"$and": "-1"})
+        assert "Expected list" in str(excinfo.value)
+
         with pytest.raises(StorageSearchError) as excinfo:
             tag_query_match(TAGS, {"$not": [{"z": "-1"}, {"z": "1"}]})
         assert "Expected dict for $not filter value" in str(excinfo.value)
@@ -271,3 +316,70 @@ class TestInMemoryTagQuery:
         with pytest.raises(StorageSearchError) as excinfo:
             tag_query_match(TAGS, {"a": -1})
         assert "Expected string or dict for filter value" in str(excinfo.value)
+
+
+class TestInMemoryRecordIndex:
+    @pytest.mark.asyncio
+    async def test_indexed_queries(self, store):
+        records = [
+            StorageRecord(type="TYPE", value="v", tags={"a": str(i % 3), "b": "x"})
+            for i in range(9)
+        ]
+        for record in records:
+            await store.add_record(record)
+        await store.add_record(StorageRecord(type="OTHER", value="v", tags={"a": "0"}))
+
+        rows = await store.find_all_records("TYPE", {"a": "0"})
+        assert [row.id for row in rows] == [records[i].id for i in (0, 3, 6)]
+
+        rows = await store.find_all_records("TYPE", {"a": {"$in": ["1", "2"]}})
+        assert len(rows) == 6
+        rows = await store.find_all_records(
+            "TYPE", {"$or": [{"a": "1"}, {"$and": [{"a": "2"}, {"b": "x"}]}]}
+        )
+        assert len(rows) == 6
+        rows = await store.find_all_records("TYPE", {"a": "0", "b": {"$neq": "x"}})
+        assert rows == []
+        rows = await store.find_all_records("TYPE", {"a": {"$neq": "0"}})
+        assert len(rows) == 6
+        assert await store.find_all_records("TYPE", {"a": "3"}) == []
+
+        index = store.profile.record_index
+        assert index.candidates("TYPE", {"a": "0", "c": "y"}) == []
+        assert len(index.candidates("TYPE", {"a": "0", "b": "x"})) == 3
+
+    @pytest.mark.asyncio
+    async def test_index_update_delete(self, store):
+        record = test_record({"a": "one"})
+        await store.add_record(record)
+        other = test_record({"a": "one"})
+        await store.add_record(other)
+
+        await store.update_record(record, record.value, {"a": "two"})
+        assert await store.find_all_records("TYPE", {"a": "one"}) == [
+            store.profile.records[other.id]
+        ]
+        rows = await store.find_all_records("TYPE", {"a": "two"})
+        assert [row.id for row in rows] == [record.id]
+
+        # update retains stored order
+        rows = await store.find_all_records("TYPE", {"a": {"$in": ["one", "two"]}})
+        assert [row.id for row in rows] == [record.id, other.id]
+
+        await store.delete_record(record)
+        assert await store.find_all_records("TYPE", {"a": "two"}) == []
+        await store.delete_all_records("TYPE", {"a": "one"})
+        assert await store.find_all_records("TYPE") == []
+        assert not store.profile.record_index._by_tag
+        assert not store.profile.record_index._by_type
+
+    @pytest.mark.asyncio
+    async def test_indexed_search(self, store_search):
+        for i in range(5):
+            await store_search.add_record(test_record({"a": str(i % 2)}))
+        search = store_search.search_records("TYPE", {"a": "1"})
+        rows = await search.fetch(1)
+        assert len(rows) == 1
+        rows += await search.fetch(10)
+        assert len(rows) == 2
+        assert all(row.tags["a"] == "1" for row in rows)
@@ -5,9 +5,20 @@ The delivery queue holds and manages messages that have not yet
 been delivered to their intended destination.
 
 """
+import base64
+import heapq
+import itertools
+import logging
 import time
 
+from collections import OrderedDict
+from typing import Dict, Iterable, Sequence
+
+from ...connections.models.connection_target import ConnectionTarget
 from ..outbound.message import OutboundMessage
+from ..outbound.queue.base import BaseOutboundQueueStore
+
+LOGGER = logging.getLogger(__name__)
 
 
 class QueuedMessage:
@@ -25,6 +36,8 @@ class QueuedMessage:
         """
         self.msg = msg
         self.timestamp = time.time()
+        self.keys = set()
+        self.store_id: str = None
 
     def older_than(self, compare_timestamp: float) -> bool:
         """
@@ -37,6 +50,57 @@ class QueuedMessage:
         """
         return self.timestamp < compare_timestamp
 
+    def to_store_entry(self) -> dict:
+        """
+        Serialize a queued message for the delivery queue store.
+
+        Only the encoded payload is stored, the unpacked payload is never
+        written to disk.
+        """
+        enc_payload = self.msg.enc_payload
+        binary = isinstance(enc_payload, bytes)
+        if binary:
+            enc_payload = base64.b64encode(enc_payload).decode("ascii")
+        return {
+            "connection_id": self.msg.connection_id,
+            "keys": sorted(self.keys),
+            "reply_from_verkey": self.msg.reply_from_verkey,
+            "reply_thread_id": self.msg.reply_thread_id,
+            "reply_to_verkey": self.msg.reply_to_verkey,
+            "target": self.msg.target and self.msg.target.serialize(),
+            "target_list": [target.serialize() for target in self.msg.target_list],
+            "timestamp": self.timestamp,
+            "enc_payload": enc_payload,
+            "enc_payload_binary": binary,
+        }
+
+    @classmethod
+    def from_store_entry(cls, entry_id: str, entry: dict) -> "QueuedMessage":
+        """Restore a queued message from the delivery queue store."""
+        enc_payload = entry["enc_payload"]
+        if entry.get("enc_payload_binary"):
+            enc_payload = base64.b64decode(enc_payload)
+        target = entry.get("target")
+        queued = cls(
+            OutboundMessage(
+                connection_id=entry.get("connection_id"),
+                reply_from_verkey=entry.get("reply_from_verkey"),
+                reply_thread_id=entry.get("reply_thread_id"),
+                reply_to_verkey=entry.get("reply_to_verkey"),
+                target=target and ConnectionTarget.deserialize(target),
+                target_list=[
+                    ConnectionTarget.deserialize(target)
+                    for target in entry.get("target_list") or ()
+                ],
+                payload=None,
+                enc_payload=enc_payload,
+            )
+        )
+        queued.keys = set(entry.get("keys") or ())
+        queued.store_id = entry_id
+        queued.timestamp = entry.get("timestamp") or queued.timestamp
+        return queued
+
 
 class DeliveryQueue:
     """
@@ -45,15 +109,78 @@ class DeliveryQueue:
     Manages undelivered messages.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        store: BaseOutboundQueueStore = None,
+        max_per_key: int = None,
+        ttl_seconds: int = None,
+    ) -> None:
         """
         Initialize an instance of DeliveryQueue.
 
-        This uses an in memory structure to queue messages.
+        Messages are held in memory, ordered by arrival for each recipient key.
+        When a store is provided the queue is also written through to it and
+        restored from it, so that queued messages survive a restart. Only
+        messages which are already encoded are stored, others are held in
+        memory only.
+
+        Args:
+            store: Optional store for persisting the queued messages
+            max_per_key: Optional limit on the messages held for each key,
+                after which the oldest message for the key is dropped
+            ttl_seconds: Optional override of the message time to live
         """
 
-        self.queue_by_key = {}
-        self.ttl_seconds = 604800  # one week
+        self.queue_by_key: Dict[str, OrderedDict] = {}
+        self.ttl_seconds = ttl_seconds or 604800  # one week
+        self.max_per_key = max_per_key
+        self.store = store
+        self._by_msg: Dict[int, QueuedMessage] = {}
+        self._expiry = []
+        self._seq = itertools.count()
+        if store:
+            for entry_id, entry in store.load():
+                if entry.get("enc_payload") is None:
+                    # drop unpacked messages stored by earlier versions
+                    store.remove(entry_id)
+                    continue
+                self._index(QueuedMessage.from_store_entry(entry_id, entry))
+            self.expire_messages()
+
+    def _index(self, wrapped_msg: QueuedMessage):
+        """Add a queued message under each of its keys and the time index."""
+        self._by_msg[id(wrapped_msg.msg)] = wrapped_msg
+        heapq.heappush(
+            self._expiry, (wrapped_msg.timestamp, next(self._seq), wrapped_msg)
+        )
+        for key in wrapped_msg.keys:
+            queue = self.queue_by_key.get(key)
+            if queue is None:
+                queue = self.queue_by_key[key] = OrderedDict()
+            queue[id(wrapped_msg.msg)] = wrapped_msg
+            if self.max_per_key and len(queue) > self.max_per_key:
+                _, dropped = queue.popitem(last=False)
+                LOGGER.warning("Delivery queue limit reached for key %s", key)
+                self._release(dropped, (key,))
+
+    def _release(self, wrapped_msg: QueuedMessage, keys: Iterable[str]):
+        """Detach a message from some of its keys, forgetting it once unused."""
+        wrapped_msg.keys.difference_update(keys)
+        for key in keys:
+            queue = self.queue_by_key.get(key)
+            if queue is not None:
+                queue.pop(id(wrapped_msg.msg), None)
+                if not queue:
+                    del self.queue_by_key[key]
+        if wrapped_msg.keys:
+            if self.store and wrapped_msg.store_id:
+                self.store.update(wrapped_msg.store_id, wrapped_msg.to_store_entry())
+        else:
+            # expiry heap entries are dropped lazily
+            self._by_msg.pop(id(wrapped_msg.msg), None)
+            if self.store and wrapped_msg.store_id:
+                self.store.remove(wrapped_msg.store_id)
+                wrapped_msg.store_id = None
 
     def expire_messages(self, ttl=None):
         """
@@ -65,10 +192,10 @@ class DeliveryQueue:
 
         ttl_seconds = ttl or self.ttl_seconds
         horizon = time.time() - ttl_seconds
-        for key in self.queue_by_key.keys():
-            self.queue_by_key[key] = [
-                wm for wm in self.queue_by_key[key] if not wm.older_than(horizon)
-            ]
+        while self._expiry and self._expiry[0][0] < horizon:
+            _, _, wrapped_msg = heapq.heappop(self._expiry)
+            if self._by_msg.get(id(wrapped_msg.msg)) is wrapped_msg:
+                self._release(wrapped_msg, list(wrapped_msg.keys))
 
     def add_message(self, msg: OutboundMessage):
         """
@@ -84,11 +211,14 @@ class DeliveryQueue:
             keys.update(msg.target.recipient_keys)
         if msg.reply_to_verkey:
             keys.add(msg.reply_to_verkey)
+        if not keys or id(msg) in self._by_msg:
+            return
+        self.expire_messages()
         wrapped_msg = QueuedMessage(msg)
-        for recipient_key in keys:
-            if recipient_key not in self.queue_by_key:
-                self.queue_by_key[recipient_key] = []
-            self.queue_by_key[recipient_key].append(wrapped_msg)
+        wrapped_msg.keys = keys
+        if self.store and msg.enc_payload is not None:
+            wrapped_msg.store_id = self.store.add(wrapped_msg.to_store_entry())
+        self._index(wrapped_msg)
 
     def has_message_for_key(self, key: str):
         """
@@ -121,9 +251,11 @@ class DeliveryQueue:
             key: The key to use for lookup
         """
         if key in self.queue_by_key:
-            return self.queue_by_key[key].pop(0).msg
+            wrapped_msg = next(iter(self.queue_by_key[key].values()))
+            self._release(wrapped_msg, (key,))
+            return wrapped_msg.msg
 
-    def inspect_all_messages_for_key(self, key: str):
+    def inspect_all_messages_for_key(self, key: str) -> Sequence[OutboundMessage]:
         """
         Return all messages for key.
 
@@ -131,8 +263,8 @@ class DeliveryQueue:
             key: The key to use for lookup
         """
         if key in self.queue_by_key:
-            for wrapped_msg in self.queue_by_key[key]:
-                yield wrapped_msg.msg
+            return [wrapped_msg.msg for wrapped_msg in self.queue_by_key[key].values()]
+        return []
 
     def remove_message_for_key(self, key: str, msg: OutboundMessage):
         """
@@ -142,10 +274,12 @@ class DeliveryQueue:
             key: The key to use for lookup
             msg: The message to remove from the queue
         """
-        if key in self.queue_by_key:
-            for wrapped_msg in self.queue_by_key[key]:
-                if wrapped_msg.msg == msg:
-                    self.queue_by_key[key].remove(wrapped_msg)
-                    if not self.queue_by_key[key]:
-                        del self.queue_by_key[key]
-                    break  # exit processing loop
+        queue = self.queue_by_key.get(key)
+        wrapped_msg = queue and queue.get(id(msg))
+        if wrapped_msg:
+            self._release(wrapped_msg, (key,))
+
+    def close(self):
+        """Release the delivery queue store, if any."""
+        if self.store:
+            self.store.close()
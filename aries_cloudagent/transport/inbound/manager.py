@@ -11,6 +11,7 @@ from ...utils.classloader import ClassLoader, ModuleLoadError, ClassNotFoundErro
 from ...utils.task_queue import CompletedTask, TaskQueue
 
 from ..outbound.message import OutboundMessage
+from ..outbound.queue.sqlite import SqliteOutboundQueueStore
 from ..wire_format import BaseWireFormat
 
 from .base import (
@@ -20,7 +21,7 @@ from .base import (
 )
 from .delivery_queue import DeliveryQueue
 from .message import InboundMessage
-from .session import InboundSession
+from .session import InboundSession, SessionIndex
 
 LOGGER = logging.getLogger(__name__)
 MODULE_BASE_PATH = "aries_cloudagent.transport.inbound"
@@ -43,6 +44,7 @@ class InboundTransportManager:
         self.registered_transports = {}
         self.running_transports = {}
         self.sessions = OrderedDict()
+        self.session_index = SessionIndex()
         self.session_limit: asyncio.Semaphore = None
         self.task_queue = TaskQueue()
         self.undelivered_queue: DeliveryQueue = None
@@ -65,8 +67,14 @@ class InboundTransportManager:
             )
 
         # Setup queue for undelivered messages
-        if self.profile.context.settings.get("transport.enable_undelivered_queue"):
-            self.undelivered_queue = DeliveryQueue()
+        settings = self.profile.context.settings
+        if settings.get("transport.enable_undelivered_queue"):
+            queue_path = settings.get("transport.undelivered_queue_path")
+            self.undelivered_queue = DeliveryQueue(
+                store=queue_path
+                and SqliteOutboundQueueStore(queue_path, table="delivery_queue"),
+                max_per_key=settings.get("transport.undelivered_queue_max_per_key"),
+            )
 
         # self.session_limit = asyncio.Semaphore(50)
 
@@ -142,6 +150,8 @@ class InboundTransportManager:
         await self.task_queue.complete(None if wait else 0)
         for transport in self.running_transports.values():
             await transport.stop()
+        if self.undelivered_queue:
+            self.undelivered_queue.close()
 
     async def create_session(
         self,
@@ -174,6 +184,7 @@ class InboundTransportManager:
             close_handler=self.closed_session,
             inbound_handler=self.receive_inbound,
             session_id=str(uuid.uuid4()),
+            session_index=self.session_index,
             transport_type=transport_type,
             wire_format=wire_format,
         )
@@ -194,6 +205,8 @@ class InboundTransportManager:
         """
         if session.session_id in self.sessions:
             del self.sessions[session.session_id]
+            self.session_index.remove_session(session)
+            session.session_index = None
             if self.session_limit:
                 self.session_limit.release()
         if session.response_buffer:
@@ -211,8 +224,11 @@ class InboundTransportManager:
             session = self.sessions[outbound.reply_session_id]
             accepted = session.accept_response(outbound)
 
-        if not accepted:
-            for session in self.sessions.values():
+        if not accepted and outbound.reply_to_verkey:
+            # only sessions holding the reply verkey can accept the message
+            for session in self.session_index.find(
+                outbound.reply_to_verkey, outbound.reply_thread_id
+            ):
                 if session.session_id != outbound.reply_session_id:
                     accepted = session.accept_response(outbound)
                     if accepted:
@@ -2,7 +2,7 @@
 
 import asyncio
 import logging
-from typing import Callable, Sequence, Union
+from typing import Callable, Dict, Iterable, Sequence, Union
 
 from ...core.profile import Profile
 from ...multitenant.manager import MultitenantManager
@@ -30,6 +30,70 @@ class AcceptResult:
         return self.accepted
 
 
+class SessionIndex:
+    """Index open sessions by their reply verkeys and reply thread IDs."""
+
+    def __init__(self):
+        """Initialize the `SessionIndex` instance."""
+        self.verkeys: Dict[str, Dict[str, "InboundSession"]] = {}
+        self.thread_ids: Dict[str, Dict[str, "InboundSession"]] = {}
+
+    @staticmethod
+    def _add(index: dict, keys: Iterable[str], session: "InboundSession"):
+        """Add a session to the index under each key."""
+        for key in keys:
+            index.setdefault(key, {})[session.session_id] = session
+
+    @staticmethod
+    def _remove(index: dict, keys: Iterable[str], session: "InboundSession"):
+        """Remove a session from the index under each key."""
+        for key in keys:
+            entry = index.get(key)
+            if entry and entry.pop(session.session_id, None) and not entry:
+                del index[key]
+
+    def add_verkeys(self, session: "InboundSession", verkeys: Iterable[str]):
+        """Index a session by reply verkeys."""
+        self._add(self.verkeys, verkeys, session)
+
+    def remove_verkeys(self, session: "InboundSession", verkeys: Iterable[str]):
+        """Remove reply verkeys of a session from the index."""
+        self._remove(self.verkeys, verkeys, session)
+
+    def add_thread_ids(self, session: "InboundSession", thread_ids: Iterable[str]):
+        """Index a session by reply thread IDs."""
+        self._add(self.thread_ids, thread_ids, session)
+
+    def remove_thread_ids(
+        self, session: "InboundSession", thread_ids: Iterable[str]
+    ):
+        """Remove reply thread IDs of a session from the index."""
+        self._remove(self.thread_ids, thread_ids, session)
+
+    def remove_session(self, session: "InboundSession"):
+        """Remove all index entries for a session."""
+        self.remove_verkeys(session, session.reply_verkeys)
+        self.remove_thread_ids(session, session.reply_thread_ids)
+
+    def find(self, verkey: str, thread_id: str = None) -> Sequence["InboundSession"]:
+        """
+        Find the sessions which may accept a reply.
+
+        Sessions tracking the reply thread are listed first, followed by the
+        other sessions for the verkey in the order they were indexed.
+        """
+        by_verkey = self.verkeys.get(verkey)
+        if not by_verkey:
+            return []
+        by_thread = thread_id and self.thread_ids.get(thread_id)
+        if not by_thread:
+            return list(by_verkey.values())
+        first = [sess for sess_id, sess in by_thread.items() if sess_id in by_verkey]
+        return first + [
+            sess for sess_id, sess in by_verkey.items() if sess_id not in by_thread
+        ]
+
+
 class InboundSession:
     """Track an open transport connection for direct routing of outbound messages."""
 
@@ -47,6 +111,7 @@ class InboundSession:
         reply_mode: str = None,
         reply_thread_ids: Sequence[str] = None,
         reply_verkeys: Sequence[str] = None,
+        session_index: SessionIndex = None,
         transport_type: str = None,
     ):
         """Initialize the inbound session."""
@@ -60,13 +125,14 @@ class InboundSession:
         self.close_handler = close_handler
         self.response_buffer: OutboundMessage = None
         self.response_event = asyncio.Event()
+        self.session_index = session_index
         self.transport_type = transport_type
 
         self._can_respond = can_respond
         self._closed = False
         self._reply_mode = None
-        self._reply_verkeys = None
-        self._reply_thread_ids = None
+        self._reply_verkeys = set()
+        self._reply_thread_ids = set()
 
         # If multitenancy is enabled we need to relay the message by changing
         # the context/profile to the wallet associated with the message.
@@ -74,6 +140,7 @@ class InboundSession:
         self._check_relay_context = profile.context.settings.get(
             "multitenant.enabled", False
         )
+        self._relay_profile: Profile = None
 
         # call setters
         self.reply_thread_ids = reply_thread_ids
@@ -99,6 +166,10 @@ class InboundSession:
         """Setter for the session closed state."""
         self._closed = True
         self.response_event.set()  # end wait_response if blocked
+        if self._relay_profile:
+            multitenant_mgr = self.profile.context.inject(MultitenantManager)
+            multitenant_mgr.release_profile(self._relay_profile)
+            self._relay_profile = None
         if self.close_handler:
             self.close_handler(self)
 
@@ -128,7 +199,11 @@ class InboundSession:
     @reply_verkeys.setter
     def reply_verkeys(self, verkeys: Sequence[str]):
         """Setter for the reply verkeys."""
+        if self.session_index:
+            self.session_index.remove_verkeys(self, self._reply_verkeys)
         self._reply_verkeys = set(verkeys) if verkeys else set()
+        if self.session_index:
+            self.session_index.add_verkeys(self, self._reply_verkeys)
 
     @property
     def reply_thread_ids(self):
@@ -138,17 +213,27 @@ class InboundSession:
     @reply_thread_ids.setter
     def reply_thread_ids(self, thread_ids: Sequence[str]):
         """Setter for the reply thread IDs."""
+        if self.session_index:
+            self.session_index.remove_thread_ids(self, self._reply_thread_ids)
         self._reply_thread_ids = set(thread_ids) if thread_ids else set()
+        if self.session_index:
+            self.session_index.add_thread_ids(self, self._reply_thread_ids)
 
     def add_reply_thread_ids(self, *thids):
         """Add a thread ID to the set of potential reply targets."""
         for thid in filter(None, thids):
-            self._reply_thread_ids.add(thid)
+            if thid not in self._reply_thread_ids:
+                self._reply_thread_ids.add(thid)
+                if self.session_index:
+                    self.session_index.add_thread_ids(self, (thid,))
 
     def add_reply_verkeys(self, *verkeys):
         """Add a verkey to the set of potential reply targets."""
         for verkey in filter(None, verkeys):
-            self._reply_verkeys.add(verkey)
+            if verkey not in self._reply_verkeys:
+                self._reply_verkeys.add(verkey)
+                if self.session_index:
+                    self.session_index.add_verkeys(self, (verkey,))
 
     @property
     def response_buffered(self) -> bool:
@@ -165,9 +250,11 @@ class InboundSession:
             )
 
             if wallet.is_managed:
+                # hold the wallet profile open until the session is closed
                 profile = await multitenant_mgr.get_wallet_profile(
-                    self.profile.context, wallet
+                    self.profile.context, wallet, acquire=True
                 )
+                self._relay_profile = profile
 
                 # overwrite session profile with wallet profile
                 self.profile = profile
@@ -230,7 +317,7 @@ class InboundSession:
         reply_verkey = message.reply_to_verkey
         reply_thread_id = message.reply_thread_id
 
-        if reply_verkey and reply_verkey in self.reply_verkeys:
+        if reply_verkey and reply_verkey in self._reply_verkeys:
             if mode == MessageReceipt.REPLY_MODE_ALL:
                 return True
             elif (
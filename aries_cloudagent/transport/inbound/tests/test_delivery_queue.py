@@ -6,9 +6,14 @@ from asynctest import mock as async_mock
 
 from ....connections.models.connection_target import ConnectionTarget
 from ....transport.outbound.message import OutboundMessage
+from ....transport.outbound.queue.sqlite import SqliteOutboundQueueStore
 
 from ..delivery_queue import DeliveryQueue
 
+KEY_A = "3Dn1SJNPaCXcvvJvSbsFWP2xaCjMom3can8CQNhWrTRx"
+KEY_B = "GjZWsBLgZCR18aL468JAT7w9CZRiBnpxUPPgyQxh4voa"
+KEY_C = "8q7VmAhvsdnVuEu2UPCq4KZGvtyBHtnKK3cEWsKqRz1Y"
+
 
 class TestDeliveryQueue(AsyncTestCase):
     async def test_message_add_and_check(self):
@@ -64,3 +69,82 @@ class TestDeliveryQueue(AsyncTestCase):
     async def test_count_zero_with_no_items(self):
         queue = DeliveryQueue()
         assert queue.message_count_for_key("aaa") == 0
+
+    async def test_message_add_multiple_keys(self):
+        queue = DeliveryQueue()
+
+        t = ConnectionTarget(recipient_keys=["aaa", "bbb"])
+        msgs = [OutboundMessage(payload=str(i), target=t) for i in range(3)]
+        for msg in msgs:
+            queue.add_message(msg)
+        assert queue.message_count_for_key("aaa") == 3
+        assert queue.get_one_message_for_key("aaa") is msgs[0]
+        queue.remove_message_for_key("aaa", msgs[2])
+        assert queue.inspect_all_messages_for_key("aaa") == [msgs[1]]
+        assert queue.inspect_all_messages_for_key("bbb") == msgs
+
+    async def test_max_per_key(self):
+        queue = DeliveryQueue(max_per_key=2)
+
+        msgs = [
+            OutboundMessage(payload=str(i), reply_to_verkey="aaa") for i in range(3)
+        ]
+        for msg in msgs:
+            queue.add_message(msg)
+        assert queue.inspect_all_messages_for_key("aaa") == msgs[1:]
+
+    async def test_store(self):
+        store = SqliteOutboundQueueStore(":memory:", table="delivery_queue")
+        queue = DeliveryQueue(store=store)
+
+        t = ConnectionTarget(endpoint="http://localhost", recipient_keys=[KEY_A, KEY_B])
+        queue.add_message(OutboundMessage(payload="x", enc_payload="enc-x", target=t))
+        queue.add_message(
+            OutboundMessage(
+                payload="z",
+                enc_payload="enc-z",
+                target_list=[ConnectionTarget(recipient_keys=[KEY_C])],
+                reply_to_verkey=KEY_C,
+            )
+        )
+        queue.add_message(
+            OutboundMessage(payload="y", enc_payload=b"enc", reply_to_verkey=KEY_A)
+        )
+        assert queue.get_one_message_for_key(KEY_B).payload == "x"
+        # the unpacked payloads are not written to the store
+        assert all("payload" not in entry for (_, entry) in store.load())
+
+        restored = DeliveryQueue(store=store)
+        assert restored.message_count_for_key(KEY_A) == 2
+        assert not restored.has_message_for_key(KEY_B)
+        first, second = restored.inspect_all_messages_for_key(KEY_A)
+        assert first.payload is None and first.enc_payload == "enc-x"
+        assert first.target.endpoint == "http://localhost"
+        assert first.target.recipient_keys == [KEY_A, KEY_B]
+        (other,) = restored.inspect_all_messages_for_key(KEY_C)
+        assert other.target is None
+        assert other.target_list[0].recipient_keys == [KEY_C]
+        restored.remove_message_for_key(KEY_C, other)
+        assert second.enc_payload == b"enc"
+        assert second.reply_to_verkey == KEY_A
+
+        restored.remove_message_for_key(KEY_A, first)
+        restored.expire_messages(ttl=-10)
+        assert not restored.has_message_for_key(KEY_A)
+        assert not store.load()
+
+    async def test_store_unpacked(self):
+        store = SqliteOutboundQueueStore(":memory:", table="delivery_queue")
+        queue = DeliveryQueue(store=store)
+
+        # unpacked messages are only held in memory
+        msg = OutboundMessage(payload="x", reply_to_verkey=KEY_A)
+        queue.add_message(msg)
+        assert queue.inspect_all_messages_for_key(KEY_A) == [msg]
+        assert not store.load()
+        assert not DeliveryQueue(store=store).has_message_for_key(KEY_A)
+
+        # unpacked messages stored by earlier versions are dropped
+        store.add({"keys": [KEY_A], "payload": "x", "reply_to_verkey": KEY_A})
+        assert not DeliveryQueue(store=store).has_message_for_key(KEY_A)
+        assert not store.load()
@@ -9,6 +9,7 @@ from ...outbound.message import OutboundMessage
 from ...wire_format import BaseWireFormat
 from ..base import InboundTransportConfiguration, InboundTransportRegistrationError
 from ..manager import InboundTransportManager
+from ..receipt import MessageReceipt
 
 
 class TestInboundTransportManager(AsyncTestCase):
@@ -58,6 +59,20 @@ class TestInboundTransportManager(AsyncTestCase):
 
         assert mgr.undelivered_queue
 
+    async def test_setup_undelivered_store(self):
+        self.profile.context.update_settings(
+            {
+                "transport.enable_undelivered_queue": True,
+                "transport.undelivered_queue_path": ":memory:",
+                "transport.undelivered_queue_max_per_key": 5,
+            }
+        )
+        mgr = InboundTransportManager(self.profile, None)
+        await mgr.setup()
+        assert mgr.undelivered_queue.store.table == "delivery_queue"
+        assert mgr.undelivered_queue.max_per_key == 5
+        await mgr.stop()
+
     async def test_start_stop(self):
         transport = async_mock.MagicMock()
         transport.start = async_mock.CoroutineMock()
@@ -122,6 +137,15 @@ class TestInboundTransportManager(AsyncTestCase):
         test_outbound = OutboundMessage(payload=None)
         test_outbound.reply_session_id = None
 
+        with async_mock.patch.object(
+            session, "accept_response", return_value=True
+        ) as mock_accept:
+            assert mgr.return_to_session(test_outbound) is False
+            mock_accept.assert_not_called()
+
+        test_outbound.reply_to_verkey = "test-verkey"
+        session.add_reply_verkeys(test_outbound.reply_to_verkey)
+
         with async_mock.patch.object(
             session, "accept_response", return_value=False
         ) as mock_accept:
@@ -134,6 +158,43 @@ class TestInboundTransportManager(AsyncTestCase):
             assert mgr.return_to_session(test_outbound) is True
             mock_accept.assert_called_once_with(test_outbound)
 
+    async def test_return_to_session_index(self):
+        mgr = InboundTransportManager(self.profile, None)
+        test_wire_format = async_mock.MagicMock()
+        sessions = [
+            await mgr.create_session(
+                "ws", can_respond=True, wire_format=test_wire_format
+            )
+            for _ in range(3)
+        ]
+        for session in sessions:
+            session.reply_mode = MessageReceipt.REPLY_MODE_ALL
+        sessions[1].add_reply_verkeys("verkey-1")
+        sessions[2].add_reply_verkeys("verkey-1", "verkey-2")
+        sessions[2].reply_mode = MessageReceipt.REPLY_MODE_THREAD
+        sessions[2].add_reply_thread_ids("thread-1")
+
+        assert mgr.session_index.find("verkey-1") == sessions[1:]
+        assert mgr.session_index.find("verkey-1", "thread-1") == [
+            sessions[2],
+            sessions[1],
+        ]
+        assert mgr.session_index.find("verkey-3") == []
+
+        test_outbound = OutboundMessage(payload=None, reply_to_verkey="verkey-2")
+        test_outbound.reply_thread_id = "thread-1"
+        assert mgr.return_to_session(test_outbound)
+        assert sessions[2].response_buffer is test_outbound
+
+        sessions[2].close()
+        assert mgr.session_index.find("verkey-1") == [sessions[1]]
+        assert "verkey-2" not in mgr.session_index.verkeys
+        assert "thread-1" not in mgr.session_index.thread_ids
+
+        sessions[1].reply_verkeys = ["verkey-3"]
+        assert not mgr.session_index.verkeys.get("verkey-1")
+        assert mgr.session_index.find("verkey-3") == [sessions[1]]
+
     async def test_close_return(self):
         test_return = async_mock.MagicMock()
         mgr = InboundTransportManager(self.profile, None, return_inbound=test_return)
@@ -2,7 +2,7 @@
 
 import asyncio
 from abc import ABC, abstractmethod
-from typing import Union
+from typing import Mapping, Union
 
 from ...core.profile import Profile
 from ...utils.stats import Collector
@@ -17,6 +17,7 @@ class BaseOutboundTransport(ABC):
     def __init__(self, wire_format: BaseWireFormat = None) -> None:
         """Initialize a `BaseOutboundTransport` instance."""
         self._collector = None
+        self._settings = {}
         self._wire_format = wire_format
 
     @property
@@ -29,6 +30,16 @@ class BaseOutboundTransport(ABC):
         """Assign a new stats collector instance."""
         self._collector = coll
 
+    @property
+    def settings(self) -> Mapping[str, object]:
+        """Accessor for the application settings."""
+        return self._settings
+
+    @settings.setter
+    def settings(self, settings: Mapping[str, object]):
+        """Assign the application settings."""
+        self._settings = settings or {}
+
     async def __aenter__(self):
         """Async context manager enter."""
         await self.start()
@@ -86,3 +97,7 @@ class OutboundTransportRegistrationError(OutboundTransportError):
 
 class OutboundDeliveryError(OutboundTransportError):
     """Base exception when a message cannot be delivered via an outbound transport."""
+
+
+class OutboundQueueFullError(OutboundDeliveryError):
+    """The outbound queue has reached its high-water mark."""
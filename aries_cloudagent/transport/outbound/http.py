@@ -11,6 +11,9 @@ from ..stats import StatsTracer
 
 from .base import BaseOutboundTransport, OutboundTransportError
 
+DEFAULT_MAX_PER_ENDPOINT = 50
+DEFAULT_KEEPALIVE = 15.0
+
 
 class HttpTransport(BaseOutboundTransport):
     """Http outbound transport class."""
@@ -27,7 +30,13 @@ class HttpTransport(BaseOutboundTransport):
     async def start(self):
         """Start the transport."""
         session_args = {}
-        self.connector = TCPConnector(limit=200, limit_per_host=50)
+        self.connector = TCPConnector(
+            limit=200,
+            limit_per_host=self.settings.get("transport.outbound_max_per_endpoint")
+            or DEFAULT_MAX_PER_ENDPOINT,
+            keepalive_timeout=self.settings.get("transport.outbound_keepalive")
+            or DEFAULT_KEEPALIVE,
+        )
         if self.collector:
             session_args["trace_configs"] = [
                 StatsTracer(self.collector, "outbound-http:")
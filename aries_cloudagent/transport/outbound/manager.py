@@ -1,10 +1,13 @@
 """Outbound transport manager."""
 
 import asyncio
+import base64
+import heapq
 import json
 import logging
 import time
 
+from collections import deque
 from typing import Callable, Type, Union
 from urllib.parse import urlparse
 
@@ -22,9 +25,11 @@ from ..wire_format import BaseWireFormat
 from .base import (
     BaseOutboundTransport,
     OutboundDeliveryError,
+    OutboundQueueFullError,
     OutboundTransportRegistrationError,
 )
 from .message import OutboundMessage
+from .queue.base import BaseOutboundQueueStore
 
 LOGGER = logging.getLogger(__name__)
 MODULE_BASE_PATH = "aries_cloudagent.transport.outbound"
@@ -61,6 +66,49 @@ class QueuedOutboundMessage:
         self.transport_id: str = transport_id
         self.metadata: dict = None
         self.api_key: str = None
+        self.store_id: str = None
+        self.release_profile: Callable[[], None] = None
+
+    def to_store_entry(self) -> dict:
+        """Serialize an encoded message for the outbound queue store."""
+        payload = self.payload
+        binary = isinstance(payload, bytes)
+        if binary:
+            payload = base64.b64encode(payload).decode("ascii")
+        retry_at = None
+        if self.state == self.STATE_RETRY and self.retry_at is not None:
+            # perf_counter values do not survive a restart, keep wall clock time
+            retry_at = time.time() + self.retry_at - time.perf_counter()
+        return {
+            "api_key": self.api_key,
+            "binary": binary,
+            "endpoint": self.endpoint,
+            "metadata": self.metadata,
+            "payload": payload,
+            "retries": self.retries,
+            "retry_at": retry_at,
+            "transport_id": self.transport_id,
+        }
+
+    @classmethod
+    def from_store_entry(cls, entry_id: str, entry: dict) -> "QueuedOutboundMessage":
+        """Restore an encoded message from the outbound queue store."""
+        queued = cls(None, None, None, entry["transport_id"])
+        queued.api_key = entry.get("api_key")
+        queued.endpoint = entry["endpoint"]
+        queued.metadata = entry.get("metadata")
+        queued.payload = entry["payload"]
+        if entry.get("binary"):
+            queued.payload = base64.b64decode(queued.payload)
+        queued.retries = entry.get("retries") or 0
+        queued.store_id = entry_id
+        retry_at = entry.get("retry_at")
+        if retry_at:
+            queued.state = cls.STATE_RETRY
+            queued.retry_at = time.perf_counter() + max(retry_at - time.time(), 0)
+        else:
+            queued.state = cls.STATE_PENDING
+        return queued
 
 
 class OutboundTransportManager:
@@ -69,7 +117,10 @@ class OutboundTransportManager:
     MAX_RETRY_COUNT = 4
 
     def __init__(
-        self, context: InjectionContext, handle_not_delivered: Callable = None
+        self,
+        context: InjectionContext,
+        handle_not_delivered: Callable = None,
+        hold_profile: Callable[[Profile], Callable[[], None]] = None,
     ):
         """
         Initialize a `OutboundTransportManager` instance.
@@ -77,18 +128,30 @@ class OutboundTransportManager:
         Args:
             context: The application context
             handle_not_delivered: An optional handler for undelivered messages
+            hold_profile: An optional handler keeping a profile open until
+                messages queued for it are encoded, returning the release callback
 
         """
         self.context = context
         self.loop = asyncio.get_event_loop()
         self.handle_not_delivered = handle_not_delivered
-        self.outbound_buffer = []
+        self.hold_profile = hold_profile
+        self.outbound_delivering = set()
+        self.outbound_done = deque()
+        self.outbound_encoding = set()
         self.outbound_event = asyncio.Event()
         self.outbound_new = []
+        self.outbound_pending = deque()
+        self.outbound_retry = []
+        self._retry_seq = 0
         self.registered_schemes = {}
         self.registered_transports = {}
         self.running_transports = {}
         self.task_queue = TaskQueue(max_active=200)
+        self.store = self.context.inject(BaseOutboundQueueStore, required=False)
+        self.max_queued = self.context.settings.get("transport.outbound_queue_max")
+        self.capacity_event = asyncio.Event()
+        self.capacity_event.set()
         self._process_task: asyncio.Task = None
         if self.context.settings.get("transport.max_outbound_retry"):
             self.MAX_RETRY_COUNT = self.context.settings["transport.max_outbound_retry"]
@@ -174,13 +237,44 @@ class OutboundTransportManager:
         """Start a registered transport."""
         transport = self.registered_transports[transport_id]()
         transport.collector = self.context.inject(Collector, required=False)
+        transport.settings = self.context.settings
         await transport.start()
         self.running_transports[transport_id] = transport
 
     async def start(self):
         """Start all transports and feed messages from the queue."""
-        for transport_id in self.registered_transports:
+        starting = [
             self.task_queue.run(self.start_transport(transport_id))
+            for transport_id in self.registered_transports
+        ]
+        if self.store:
+            if starting:
+                await asyncio.wait(starting)
+            self.replay_stored()
+
+    def replay_stored(self):
+        """Queue the messages left pending in the outbound queue store."""
+        replayed = 0
+        for entry_id, entry in self.store.load():
+            queued = QueuedOutboundMessage.from_store_entry(entry_id, entry)
+            if queued.transport_id not in self.running_transports:
+                try:
+                    queued.transport_id = self.get_running_transport_for_endpoint(
+                        queued.endpoint
+                    )
+                except OutboundDeliveryError:
+                    LOGGER.warning(
+                        "Dropping stored outbound message to %s, no supported transport",
+                        queued.endpoint,
+                    )
+                    self.store.remove(entry_id)
+                    continue
+            self.outbound_new.append(queued)
+            replayed += 1
+        if replayed:
+            LOGGER.info("Replaying %d stored outbound message(s)", replayed)
+            self._update_capacity()
+            self.process_queued()
 
     async def stop(self, wait: bool = True):
         """Stop all running transports."""
@@ -190,6 +284,52 @@ class OutboundTransportManager:
         for transport in self.running_transports.values():
             await transport.stop()
         self.running_transports = {}
+        if self.store:
+            self.store.close()
+
+    @property
+    def queued_count(self) -> int:
+        """Accessor for the number of messages held in memory for delivery."""
+        return (
+            len(self.outbound_new)
+            + len(self.outbound_pending)
+            + len(self.outbound_encoding)
+            + len(self.outbound_delivering)
+            + len(self.outbound_retry)
+        )
+
+    def _update_capacity(self):
+        """Update the capacity event after the queue size has changed."""
+        if self.max_queued and self.queued_count >= self.max_queued:
+            self.capacity_event.clear()
+        else:
+            self.capacity_event.set()
+
+    async def wait_for_capacity(self):
+        """Wait until the outbound queue is below its high-water mark."""
+        await self.capacity_event.wait()
+
+    def _persist(self, queued: QueuedOutboundMessage):
+        """Save or update an encoded message in the outbound queue store."""
+        if not self.store:
+            return
+        try:
+            if queued.store_id:
+                self.store.update(queued.store_id, queued.to_store_entry())
+            else:
+                queued.store_id = self.store.add(queued.to_store_entry())
+        except Exception:
+            LOGGER.exception("Error persisting outbound message")
+
+    def _unpersist(self, queued: QueuedOutboundMessage):
+        """Remove a finished message from the outbound queue store."""
+        if not (self.store and queued.store_id):
+            return
+        try:
+            self.store.remove(queued.store_id)
+        except Exception:
+            LOGGER.exception("Error removing outbound message from store")
+        queued.store_id = None
 
     def get_registered_transport_for_scheme(self, scheme: str) -> str:
         """Find the registered transport ID for a given scheme."""
@@ -241,7 +381,15 @@ class OutboundTransportManager:
         Args:
             profile: The active profile for the request
             outbound: The outbound message to deliver
+
+        Raises:
+            OutboundDeliveryError: if no supported transport is running
+            OutboundQueueFullError: if the queue has reached its high-water mark
+
         """
+        if self.max_queued and self.queued_count >= self.max_queued:
+            self.capacity_event.clear()
+            raise OutboundQueueFullError("Outbound queue is full")
         targets = [outbound.target] if outbound.target else (outbound.target_list or [])
         transport_id = None
         for target in targets:
@@ -257,7 +405,10 @@ class OutboundTransportManager:
 
         queued = QueuedOutboundMessage(profile, outbound, target, transport_id)
         queued.retries = self.MAX_RETRY_COUNT
+        if not outbound.enc_payload and self.hold_profile:
+            queued.release_profile = self.hold_profile(profile)
         self.outbound_new.append(queued)
+        self._update_capacity()
         self.process_queued()
 
     def enqueue_webhook(
@@ -294,7 +445,9 @@ class OutboundTransportManager:
         queued.payload = json.dumps(payload)
         queued.state = QueuedOutboundMessage.STATE_PENDING
         queued.retries = 4 if max_attempts is None else max_attempts - 1
+        self._persist(queued)
         self.outbound_new.append(queued)
+        self._update_capacity()
         self.process_queued()
 
     def process_queued(self) -> asyncio.Task:
@@ -306,7 +459,12 @@ class OutboundTransportManager:
         """
         if self._process_task and not self._process_task.done():
             self.outbound_event.set()
-        elif self.outbound_new or self.outbound_buffer:
+        elif (
+            self.outbound_new
+            or self.outbound_pending
+            or self.outbound_retry
+            or self.outbound_done
+        ):
             self._process_task = self.loop.create_task(self._process_loop())
             self._process_task.add_done_callback(lambda task: self._process_done(task))
         return self._process_task
@@ -321,6 +479,11 @@ class OutboundTransportManager:
         if self._process_task and self._process_task.done():
             self._process_task = None
 
+    def schedule_retry(self, queued: QueuedOutboundMessage):
+        """Add a message in the retry state to the retry heap."""
+        self._retry_seq += 1
+        heapq.heappush(self.outbound_retry, (queued.retry_at, self._retry_seq, queued))
+
     async def _process_loop(self):
         """Continually kick off encoding and delivery on outbound messages."""
         # Note: this method should not call async methods apart from
@@ -328,53 +491,24 @@ class OutboundTransportManager:
 
         while True:
             self.outbound_event.clear()
-            loop_time = get_timer()
-            upd_buffer = []
-            retry_count = 0
-
-            for queued in self.outbound_buffer:
-                if queued.state == QueuedOutboundMessage.STATE_DONE:
-                    if queued.error:
-                        LOGGER.exception(
-                            "Outbound message could not be delivered to %s",
-                            queued.endpoint,
-                            exc_info=queued.error,
-                        )
-                        if self.handle_not_delivered:
-                            self.handle_not_delivered(queued.profile, queued.message)
-                    continue  # remove from buffer
-
-                deliver = False
 
-                if queued.state == QueuedOutboundMessage.STATE_PENDING:
-                    deliver = True
-                elif queued.state == QueuedOutboundMessage.STATE_RETRY:
-                    if queued.retry_at < loop_time:
-                        queued.retry_at = None
-                        deliver = True
-                    else:
-                        retry_count += 1
-
-                if deliver:
-                    queued.state = QueuedOutboundMessage.STATE_DELIVER
-                    p_time = trace_event(
-                        self.context.settings,
-                        queued.message if queued.message else queued.payload,
-                        outcome="OutboundTransportManager.DELIVER.START."
-                        + queued.endpoint,
-                    )
-                    self.deliver_queued_message(queued)
-                    trace_event(
-                        self.context.settings,
-                        queued.message if queued.message else queued.payload,
-                        outcome="OutboundTransportManager.DELIVER.END."
-                        + queued.endpoint,
-                        perf_counter=p_time,
+            while self.outbound_done:
+                queued = self.outbound_done.popleft()
+                if queued.error:
+                    LOGGER.exception(
+                        "Outbound message could not be delivered to %s",
+                        queued.endpoint,
+                        exc_info=queued.error,
                     )
+                    if not queued.message:
+                        # webhooks and replayed messages are only held encoded,
+                        # there is no message left to return to the sender
+                        LOGGER.warning(
+                            "Dropping undeliverable message to %s", queued.endpoint
+                        )
+                    elif self.handle_not_delivered:
+                        self.handle_not_delivered(queued.profile, queued.message)
 
-                upd_buffer.append(queued)
-
-            new_pending = 0
             new_messages = self.outbound_new
             self.outbound_new = []
 
@@ -383,7 +517,8 @@ class OutboundTransportManager:
                     if queued.message and queued.message.enc_payload:
                         queued.payload = queued.message.enc_payload
                         queued.state = QueuedOutboundMessage.STATE_PENDING
-                        new_pending += 1
+                        self._persist(queued)
+                        self.outbound_pending.append(queued)
                     else:
                         queued.state = QueuedOutboundMessage.STATE_ENCODE
                         p_time = trace_event(
@@ -391,6 +526,7 @@ class OutboundTransportManager:
                             queued.message if queued.message else queued.payload,
                             outcome="OutboundTransportManager.ENCODE.START",
                         )
+                        self.outbound_encoding.add(queued)
                         self.encode_queued_message(queued)
                         trace_event(
                             self.context.settings,
@@ -398,21 +534,58 @@ class OutboundTransportManager:
                             outcome="OutboundTransportManager.ENCODE.END",
                             perf_counter=p_time,
                         )
+                elif queued.state == QueuedOutboundMessage.STATE_PENDING:
+                    self.outbound_pending.append(queued)
+                elif queued.state == QueuedOutboundMessage.STATE_RETRY:
+                    self.schedule_retry(queued)
+                elif queued.state == QueuedOutboundMessage.STATE_DONE:
+                    self.outbound_done.append(queued)
+                elif queued.state == QueuedOutboundMessage.STATE_ENCODE:
+                    self.outbound_encoding.add(queued)
                 else:
-                    new_pending += 1
+                    self.outbound_delivering.add(queued)
 
-                upd_buffer.append(queued)
+            loop_time = get_timer()
+            while self.outbound_retry and self.outbound_retry[0][0] < loop_time:
+                queued = heapq.heappop(self.outbound_retry)[2]
+                queued.retry_at = None
+                self.outbound_pending.append(queued)
+
+            while self.outbound_pending:
+                queued = self.outbound_pending.popleft()
+                queued.state = QueuedOutboundMessage.STATE_DELIVER
+                p_time = trace_event(
+                    self.context.settings,
+                    queued.message if queued.message else queued.payload,
+                    outcome="OutboundTransportManager.DELIVER.START."
+                    + queued.endpoint,
+                )
+                self.outbound_delivering.add(queued)
+                self.deliver_queued_message(queued)
+                trace_event(
+                    self.context.settings,
+                    queued.message if queued.message else queued.payload,
+                    outcome="OutboundTransportManager.DELIVER.END." + queued.endpoint,
+                    perf_counter=p_time,
+                )
 
-            self.outbound_buffer = upd_buffer
-            if self.outbound_buffer:
-                if (not new_pending) and (not retry_count):
-                    await self.outbound_event.wait()
-                elif retry_count:
-                    # only retries - yield here so we don't hog resources
-                    await asyncio.sleep(0.05)
-            else:
+            self._update_capacity()
+            if self.outbound_done:
+                continue
+            if not (
+                self.outbound_encoding or self.outbound_delivering or self.outbound_retry
+            ):
                 break
 
+            # sleep until the next message state change or the next retry is due
+            timeout = None
+            if self.outbound_retry:
+                timeout = max(self.outbound_retry[0][0] - get_timer(), 0)
+            try:
+                await asyncio.wait_for(self.outbound_event.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
     def encode_queued_message(self, queued: QueuedOutboundMessage) -> asyncio.Task:
         """Kick off encoding of a queued message."""
         queued.task = self.task_queue.run(
@@ -436,11 +609,18 @@ class OutboundTransportManager:
 
     def finished_encode(self, queued: QueuedOutboundMessage, completed: CompletedTask):
         """Handle completion of queued message encoding."""
+        self.outbound_encoding.discard(queued)
+        if queued.release_profile:
+            queued.release_profile()
+            queued.release_profile = None
         if completed.exc_info:
             queued.error = completed.exc_info
             queued.state = QueuedOutboundMessage.STATE_DONE
+            self.outbound_done.append(queued)
         else:
             queued.state = QueuedOutboundMessage.STATE_PENDING
+            self._persist(queued)
+            self.outbound_pending.append(queued)
         queued.task = None
         self.process_queued()
 
@@ -461,6 +641,7 @@ class OutboundTransportManager:
 
     def finished_deliver(self, queued: QueuedOutboundMessage, completed: CompletedTask):
         """Handle completion of queued message delivery."""
+        self.outbound_delivering.discard(queued)
         if completed.exc_info:
             queued.error = completed.exc_info
 
@@ -488,15 +669,20 @@ class OutboundTransportManager:
                 queued.retries -= 1
                 queued.state = QueuedOutboundMessage.STATE_RETRY
                 queued.retry_at = time.perf_counter() + 10
+                self._persist(queued)
+                self.schedule_retry(queued)
             else:
                 LOGGER.exception(
                     ">>> Outbound message failed to deliver, NOT Re-queued.",
                     exc_info=queued.error,
                 )
                 queued.state = QueuedOutboundMessage.STATE_DONE
+                self._unpersist(queued)
+                self.outbound_done.append(queued)
         else:
             queued.error = None
             queued.state = QueuedOutboundMessage.STATE_DONE
+            self._unpersist(queued)
         queued.task = None
         self.process_queued()
 
@@ -0,0 +1,63 @@
+"""Abstract store for persisting outbound messages pending delivery."""
+
+from abc import ABC, abstractmethod
+from typing import Sequence, Tuple
+
+
+class BaseOutboundQueueStore(ABC):
+    """
+    Abstract outbound queue store class.
+
+    Entries are plain dictionaries holding an encoded message ready for
+    delivery, so that they can be replayed after the agent restarts. The
+    methods are synchronous as they are called from the delivery callbacks
+    of the outbound transport manager, so changes must not block the event
+    loop: implementations are expected to write them in the background.
+    """
+
+    @abstractmethod
+    def add(self, entry: dict) -> str:
+        """
+        Persist a new entry.
+
+        Args:
+            entry: The entry to store
+
+        Returns:
+            The identifier of the stored entry
+
+        """
+
+    @abstractmethod
+    def update(self, entry_id: str, entry: dict):
+        """
+        Replace a stored entry.
+
+        Args:
+            entry_id: The identifier of the entry
+            entry: The new entry value
+
+        """
+
+    @abstractmethod
+    def remove(self, entry_id: str):
+        """
+        Remove a stored entry.
+
+        Args:
+            entry_id: The identifier of the entry
+
+        """
+
+    @abstractmethod
+    def load(self) -> Sequence[Tuple[str, dict]]:
+        """
+        Load all stored entries in insertion order.
+
+        Returns:
+            A list of (entry identifier, entry) pairs
+
+        """
+
+    def close(self):
+        """Release any resources held by the store."""
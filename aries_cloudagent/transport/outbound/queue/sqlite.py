@@ -0,0 +1,133 @@
+"""SQLite-backed outbound queue store."""
+
+import json
+import logging
+import os
+import queue
+import sqlite3
+import threading
+
+from typing import Sequence, Tuple
+from uuid import uuid4
+
+from .base import BaseOutboundQueueStore
+
+LOGGER = logging.getLogger(__name__)
+
+
+class SqliteOutboundQueueStore(BaseOutboundQueueStore):
+    """
+    Outbound queue store persisting entries in a SQLite database file.
+
+    Changes are handed to a writer thread which applies all the changes pending
+    at a time in a single transaction, so that callers on the event loop never
+    wait for the disk. The database uses write-ahead logging, so each committed
+    batch is a short append which survives a crash of the agent process.
+    """
+
+    def __init__(self, path: str, table: str = "outbound_queue"):
+        """
+        Initialize a `SqliteOutboundQueueStore` instance.
+
+        Args:
+            path: The path of the database file, or ':memory:'
+            table: The name of the table holding the entries
+
+        """
+        if not table.isidentifier():
+            raise ValueError(f"Invalid table name: {table}")
+        self.path = path
+        self.table = table
+        if path != ":memory:":
+            # queued messages and their targets are readable by the owner only,
+            # SQLite gives its journal files the same permissions
+            os.close(os.open(path, os.O_RDWR | os.O_CREAT, 0o600))
+            os.chmod(path, 0o600)
+        self._conn = sqlite3.connect(
+            path, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} "
+            "(seq INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "id TEXT NOT NULL UNIQUE, entry TEXT NOT NULL)"
+        )
+        self._lock = threading.Lock()
+        self._pending = queue.Queue()
+        self._writer = threading.Thread(
+            target=self._write_loop, name=f"{table}-writer", daemon=True
+        )
+        self._writer.start()
+
+    def add(self, entry: dict) -> str:
+        """Persist a new entry."""
+        entry_id = uuid4().hex
+        self._pending.put(
+            (
+                f"INSERT INTO {self.table} (id, entry) VALUES (?, ?)",
+                (entry_id, json.dumps(entry)),
+            )
+        )
+        return entry_id
+
+    def update(self, entry_id: str, entry: dict):
+        """Replace a stored entry."""
+        self._pending.put(
+            (
+                f"UPDATE {self.table} SET entry = ? WHERE id = ?",
+                (json.dumps(entry), entry_id),
+            )
+        )
+
+    def remove(self, entry_id: str):
+        """Remove a stored entry."""
+        self._pending.put((f"DELETE FROM {self.table} WHERE id = ?", (entry_id,)))
+
+    def flush(self):
+        """Wait until all pending changes have been written."""
+        self._pending.join()
+
+    def load(self) -> Sequence[Tuple[str, dict]]:
+        """Load all stored entries in insertion order."""
+        self.flush()
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT id, entry FROM {self.table} ORDER BY seq"
+            ).fetchall()
+        return [(entry_id, json.loads(entry)) for (entry_id, entry) in rows]
+
+    def _write_loop(self):
+        """Apply pending changes in batches until the store is closed."""
+        while True:
+            batch = [self._pending.get()]
+            while True:
+                try:
+                    batch.append(self._pending.get_nowait())
+                except queue.Empty:
+                    break
+            changes = [change for change in batch if change]
+            if changes:
+                with self._lock:
+                    try:
+                        self._conn.execute("BEGIN")
+                        for sql, params in changes:
+                            self._conn.execute(sql, params)
+                        self._conn.execute("COMMIT")
+                    except sqlite3.Error:
+                        LOGGER.exception("Error writing outbound queue store")
+                        if self._conn.in_transaction:
+                            self._conn.execute("ROLLBACK")
+            for _ in batch:
+                self._pending.task_done()
+            if len(changes) < len(batch):
+                # closed
+                return
+
+    def close(self):
+        """Write any pending changes and close the database connection."""
+        if self._conn:
+            self._pending.put(None)
+            self._writer.join()
+            self._conn.close()
+            self._conn = None
@@ -0,0 +1,57 @@
+import os
+import tempfile
+import threading
+
+from asynctest import TestCase as AsyncTestCase
+
+from ..sqlite import SqliteOutboundQueueStore
+
+
+class TestSqliteOutboundQueueStore(AsyncTestCase):
+    def test_add_update_remove(self):
+        store = SqliteOutboundQueueStore(":memory:")
+        first = store.add({"payload": "one"})
+        second = store.add({"payload": "two"})
+        assert store.load() == [(first, {"payload": "one"}), (second, {"payload": "two"})]
+
+        store.update(first, {"payload": "one", "retries": 3})
+        store.remove(second)
+        assert store.load() == [(first, {"payload": "one", "retries": 3})]
+        store.close()
+        store.close()
+
+    def test_reopen(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "outbound.db")
+            store = SqliteOutboundQueueStore(path)
+            entry_id = store.add({"payload": "pending"})
+            store.close()
+
+            store = SqliteOutboundQueueStore(path)
+            assert store.load() == [(entry_id, {"payload": "pending"})]
+            store.close()
+
+    def test_background_writes(self):
+        store = SqliteOutboundQueueStore(":memory:")
+        # hold the connection: changes are still accepted without blocking
+        with store._lock:
+            entry_ids = [store.add({"payload": str(i)}) for i in range(10)]
+            store.remove(entry_ids[0])
+            assert store._writer is not threading.current_thread()
+        store.flush()
+        assert [entry_id for (entry_id, _) in store.load()] == entry_ids[1:]
+
+        store.update("unknown", {"payload": "x"})
+        store.close()
+        assert not store._writer.is_alive()
+
+    def test_owner_only(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "outbound.db")
+            with open(path, "w"):
+                pass
+            os.chmod(path, 0o644)
+            store = SqliteOutboundQueueStore(path)
+            store.add({"payload": "pending"})
+            store.close()
+            assert os.stat(path).st_mode & 0o777 == 0o600
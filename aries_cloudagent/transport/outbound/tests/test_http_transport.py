@@ -88,6 +88,18 @@ class TestHttpTransport(AioHTTPTestCase):
             "outbound-http:POST": 1,
         }
 
+    @unittest_run_loop
+    async def test_connection_settings(self):
+        transport = HttpTransport()
+        transport.settings = {
+            "transport.outbound_max_per_endpoint": 5,
+            "transport.outbound_keepalive": 60,
+        }
+        await transport.start()
+        assert transport.connector.limit_per_host == 5
+        assert transport.connector._keepalive_timeout == 60
+        await transport.stop()
+
     @unittest_run_loop
     async def test_transport_coverage(self):
         transport = HttpTransport()
@@ -1,3 +1,4 @@
+import asyncio
 import json
 
 from asynctest import TestCase as AsyncTestCase, mock as async_mock
@@ -9,11 +10,14 @@ from ....core.in_memory import InMemoryProfile
 from .. import manager as test_module
 from ..manager import (
     OutboundDeliveryError,
+    OutboundQueueFullError,
     OutboundTransportManager,
     OutboundTransportRegistrationError,
     QueuedOutboundMessage,
 )
 from ..message import OutboundMessage
+from ..queue.base import BaseOutboundQueueStore
+from ..queue.sqlite import SqliteOutboundQueueStore
 
 
 class TestOutboundTransportManager(AsyncTestCase):
@@ -122,6 +126,132 @@ class TestOutboundTransportManager(AsyncTestCase):
         assert mgr.get_running_transport_for_scheme("http") is None
         transport.stop.assert_awaited_once_with()
 
+    def make_transport(self):
+        transport = async_mock.MagicMock()
+        transport.handle_message = async_mock.CoroutineMock()
+        transport.start = async_mock.CoroutineMock()
+        transport.stop = async_mock.CoroutineMock()
+        transport.schemes = ["http"]
+        transport_cls = async_mock.MagicMock()
+        transport_cls.schemes = ["http"]
+        transport_cls.return_value = transport
+        return transport_cls
+
+    async def test_store_replay(self):
+        store = SqliteOutboundQueueStore(":memory:")
+        context = InjectionContext()
+        context.injector.bind_instance(BaseOutboundQueueStore, store)
+        mgr = OutboundTransportManager(context)
+        transport_cls = self.make_transport()
+        transport = transport_cls.return_value
+        mgr.register_class(transport_cls, "transport_cls")
+        await mgr.start()
+        transport.start.assert_awaited_once_with()
+
+        # delivery fails: message is kept in the store for retry
+        transport.handle_message.side_effect = KeyError("unreachable")
+        message = OutboundMessage(payload="{}", enc_payload=b"packed")
+        message.target = ConnectionTarget(endpoint="http://localhost")
+        mgr.enqueue_message(InMemoryProfile.test_profile(), message)
+        mgr.enqueue_webhook("topic", {"test": "payload"}, "http://localhost#key")
+        while transport.handle_message.await_count < 2:
+            await asyncio.sleep(0.01)
+        stored = {entry["endpoint"]: entry for (_, entry) in store.load()}
+        stored_msg = stored["http://localhost"]
+        stored_hook = stored["http://localhost/topic/topic/"]
+        assert stored_msg["payload"] == "cGFja2Vk" and stored_msg["binary"]
+        assert stored_msg["retries"] == mgr.MAX_RETRY_COUNT - 1
+        assert stored_msg["retry_at"]
+        assert stored_hook["api_key"] == "key"
+        mgr._process_task.cancel()
+        await mgr.task_queue
+
+        # after a restart the stored messages are delivered and removed
+        mgr = OutboundTransportManager(context)
+        transport_cls = self.make_transport()
+        transport = transport_cls.return_value
+        mgr.register_class(transport_cls, "transport_cls")
+        with async_mock.patch.object(test_module.time, "time") as mock_time:
+            mock_time.return_value = stored_msg["retry_at"] + 1
+            await mgr.start()
+        await mgr.flush()
+        transport.handle_message.assert_any_await(
+            None, b"packed", "http://localhost", None, None
+        )
+        assert transport.handle_message.await_count == 2
+        assert store.load() == []
+
+        await mgr.stop()
+        assert store._conn is None
+
+    async def test_store_replay_no_transport(self):
+        store = SqliteOutboundQueueStore(":memory:")
+        store.add({"transport_id": "gone", "endpoint": "xmpp://host", "payload": "x"})
+        context = InjectionContext()
+        context.injector.bind_instance(BaseOutboundQueueStore, store)
+        mgr = OutboundTransportManager(context)
+        await mgr.start()
+        assert not mgr.outbound_new
+        assert store.load() == []
+
+    async def test_queue_max(self):
+        context = InjectionContext()
+        context.update_settings({"transport.outbound_queue_max": 1})
+        mgr = OutboundTransportManager(context)
+        mgr.register_class(self.make_transport(), "transport_cls")
+        await mgr.start()
+        await mgr.task_queue
+
+        message = OutboundMessage(payload="{}", enc_payload="packed")
+        message.target = ConnectionTarget(endpoint="http://localhost")
+        with async_mock.patch.object(mgr, "process_queued", async_mock.MagicMock()):
+            await mgr.wait_for_capacity()
+            mgr.enqueue_message(None, message)
+            assert not mgr.capacity_event.is_set()
+            with self.assertRaises(OutboundQueueFullError):
+                mgr.enqueue_message(None, message)
+
+        waiter = asyncio.ensure_future(mgr.wait_for_capacity())
+        await mgr.flush()
+        await asyncio.wait_for(waiter, 1)
+        assert mgr.queued_count == 0
+
+    async def test_hold_profile(self):
+        release = async_mock.MagicMock()
+        hold_profile = async_mock.MagicMock(return_value=release)
+        mgr = OutboundTransportManager(InjectionContext(), hold_profile=hold_profile)
+        transport_cls = self.make_transport()
+        transport = transport_cls.return_value
+        transport.wire_format.encode_message = async_mock.CoroutineMock()
+        mgr.register_class(transport_cls, "transport_cls")
+        await mgr.start()
+        await mgr.task_queue
+
+        send_session = InMemoryProfile.test_session()
+        send_profile = send_session.profile
+        setattr(
+            send_profile, "session", async_mock.MagicMock(return_value=send_session)
+        )
+        target = ConnectionTarget(endpoint="http://localhost")
+
+        # already packed messages do not need the profile
+        mgr.enqueue_message(
+            send_profile,
+            OutboundMessage(payload=None, enc_payload=b"packed", target=target),
+        )
+        hold_profile.assert_not_called()
+
+        message = OutboundMessage(payload="{}", target=target)
+        with async_mock.patch.object(mgr, "process_queued", async_mock.MagicMock()):
+            mgr.enqueue_message(send_profile, message)
+        hold_profile.assert_called_once_with(send_profile)
+        release.assert_not_called()
+
+        mgr.process_queued()
+        await mgr.flush()
+        release.assert_called_once_with()
+        transport.wire_format.encode_message.assert_awaited_once()
+
     async def test_stop_cancel(self):
         context = InjectionContext()
         context.update_settings({"transport.outbound_configs": ["http"]})
@@ -196,6 +326,22 @@ class TestOutboundTransportManager(AsyncTestCase):
             mgr.finished_deliver(mock_queued, mock_task)
             mgr.finished_deliver(mock_queued, mock_task)
 
+    async def test_process_loop_done_without_message(self):
+        # replayed from the store: only the encoded payload is known
+        queued = QueuedOutboundMessage.from_store_entry(
+            "1",
+            {"transport_id": "t", "endpoint": "http://localhost", "payload": "x"},
+        )
+        queued.error = KeyError("unreachable")
+        queued.state = QueuedOutboundMessage.STATE_DONE
+
+        mock_handle_not_delivered = async_mock.MagicMock()
+        mgr = OutboundTransportManager(InjectionContext(), mock_handle_not_delivered)
+        mgr.outbound_done.append(queued)
+        await mgr._process_loop()
+        mock_handle_not_delivered.assert_not_called()
+        assert not mgr.outbound_done
+
     async def test_process_loop_retry_now(self):
         mock_queued = async_mock.MagicMock(
             state=QueuedOutboundMessage.STATE_RETRY,
@@ -205,7 +351,7 @@ class TestOutboundTransportManager(AsyncTestCase):
         context = InjectionContext()
         mock_handle_not_delivered = async_mock.MagicMock()
         mgr = OutboundTransportManager(context, mock_handle_not_delivered)
-        mgr.outbound_buffer.append(mock_queued)
+        mgr.schedule_retry(mock_queued)
 
         with async_mock.patch.object(
             test_module, "trace_event", async_mock.MagicMock()
@@ -224,15 +370,43 @@ class TestOutboundTransportManager(AsyncTestCase):
         context = InjectionContext()
         mock_handle_not_delivered = async_mock.MagicMock()
         mgr = OutboundTransportManager(context, mock_handle_not_delivered)
-        mgr.outbound_buffer.append(mock_queued)
+        mgr.schedule_retry(mock_queued)
 
         with async_mock.patch.object(
-            test_module.asyncio, "sleep", async_mock.CoroutineMock()
-        ) as mock_sleep_x:
-            mock_sleep_x.side_effect = KeyError()
+            test_module.asyncio, "wait_for", async_mock.CoroutineMock()
+        ) as mock_wait_for:
+            mock_wait_for.side_effect = KeyError()
             with self.assertRaises(KeyError):  # cover retry logic and bail
                 await mgr._process_loop()
             assert mock_queued.retry_at is not None
+            # sleeps until the retry is due rather than polling
+            assert 3500 < mock_wait_for.call_args[0][1] <= 3600
+            mock_wait_for.call_args[0][0].close()
+
+    async def test_process_loop_retry_heap(self):
+        context = InjectionContext()
+        mgr = OutboundTransportManager(context)
+        mgr.register_class(self.make_transport(), "transport_cls")
+        await mgr.start()
+        await mgr.task_queue
+        transport = mgr.get_transport_instance("transport_cls")
+
+        now = test_module.get_timer()
+        for delay in (0.09, 0.03, 0.06):
+            queued = QueuedOutboundMessage(None, None, None, "transport_cls")
+            queued.endpoint = "http://localhost"
+            queued.payload = str(delay)
+            queued.state = QueuedOutboundMessage.STATE_RETRY
+            queued.retry_at = now + delay
+            mgr.outbound_new.append(queued)
+        await asyncio.wait_for(mgr.flush(), 1)
+
+        assert [call[0][1] for call in transport.handle_message.call_args_list] == [
+            "0.03",
+            "0.06",
+            "0.09",
+        ]
+        assert mgr.queued_count == 0
 
     async def test_process_loop_new(self):
         context = InjectionContext()
@@ -291,9 +465,12 @@ class TestOutboundTransportManager(AsyncTestCase):
         context = InjectionContext()
         mock_handle_not_delivered = async_mock.MagicMock()
         mgr = OutboundTransportManager(context, mock_handle_not_delivered)
-        mgr.outbound_buffer.append(mock_queued)
+        mgr.outbound_done.append(mock_queued)
 
         await mgr._process_loop()
+        mock_handle_not_delivered.assert_called_once_with(
+            mock_queued.profile, mock_queued.message
+        )
 
     async def test_finished_deliver_x_log_debug(self):
         mock_queued = async_mock.MagicMock(
@@ -304,7 +481,7 @@ class TestOutboundTransportManager(AsyncTestCase):
         context = InjectionContext()
         mock_handle_not_delivered = async_mock.MagicMock()
         mgr = OutboundTransportManager(context, mock_handle_not_delivered)
-        mgr.outbound_buffer.append(mock_queued)
+        mgr.outbound_delivering.add(mock_queued)
         with async_mock.patch.object(
             test_module.LOGGER, "exception", async_mock.MagicMock()
         ) as mock_logger_exception, async_mock.patch.object(
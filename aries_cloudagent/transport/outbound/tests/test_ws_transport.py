@@ -13,10 +13,12 @@ class TestWsTransport(AioHTTPTestCase):
     async def setUpAsync(self):
         self.context = InjectionContext()
         self.message_results = []
+        self.connections = []
 
     async def receive_message(self, request):
         ws = web.WebSocketResponse()
         await ws.prepare(request)
+        self.connections.append(ws)
 
         async for msg in ws:
             if msg.type in (WSMsgType.TEXT, WSMsgType.BINARY):
@@ -52,3 +54,57 @@ class TestWsTransport(AioHTTPTestCase):
             send_message(transport, b"{}", endpoint=server_addr), 5.0
         )
         assert self.message_results == [{}]
+
+    async def wait_for_results(self, count: int):
+        while len(self.message_results) < count:
+            await asyncio.sleep(0.01)
+
+    @unittest_run_loop
+    async def test_connection_reuse(self):
+        server_addr = f"ws://localhost:{self.server.port}"
+        transport = WsTransport()
+        transport.settings = {"transport.outbound_keepalive": 60}
+        async with transport:
+            pool = transport.pool
+            for idx in range(3):
+                await transport.handle_message(
+                    self.context, json.dumps({"idx": idx}), server_addr
+                )
+            await asyncio.wait_for(self.wait_for_results(3), 5.0)
+            assert self.message_results == [{"idx": 0}, {"idx": 1}, {"idx": 2}]
+            assert len(self.connections) == 1
+            assert transport.pool.open_count == 1
+
+            # headers select a separate connection
+            await transport.handle_message(
+                self.context, "{}", server_addr, api_key="test-key"
+            )
+            assert len(self.connections) == 2
+
+            # the server dropping a pooled connection triggers a reconnect
+            await self.connections[0].close()
+            await asyncio.sleep(0.05)
+            await transport.handle_message(self.context, '{"idx": 3}', server_addr)
+            await asyncio.wait_for(self.wait_for_results(5), 5.0)
+            assert self.message_results[-1] == {"idx": 3}
+            assert len(self.connections) == 3
+            assert pool._sweep_timer
+        assert transport.pool is None
+        # stopping the transport cancels the pending sweep
+        assert not pool._sweep_timer
+
+    @unittest_run_loop
+    async def test_idle_timeout(self):
+        server_addr = f"ws://localhost:{self.server.port}"
+        transport = WsTransport()
+        async with transport:
+            transport.pool.idle_timeout = 0.01
+            await transport.handle_message(self.context, "{}", server_addr)
+            await asyncio.sleep(0.02)
+            await transport.handle_message(self.context, "{}", server_addr)
+            await asyncio.wait_for(self.wait_for_results(2), 5.0)
+            assert len(self.connections) == 2
+            # idle connections are closed without further traffic
+            await asyncio.sleep(0.05)
+            assert transport.pool.open_count == 0
+            assert not transport.pool._idle and not transport.pool._sweep_timer
@@ -1,14 +1,171 @@
 """Websockets outbound transport."""
 
+import asyncio
 import logging
-from typing import Union
+import time
+from typing import Dict, List, Tuple, Union
 
-from aiohttp import ClientSession, DummyCookieJar
+from aiohttp import ClientError, ClientSession, ClientWebSocketResponse, DummyCookieJar
 
 from ...core.profile import Profile
 
 from .base import BaseOutboundTransport
 
+DEFAULT_MAX_PER_ENDPOINT = 10
+DEFAULT_IDLE_TIMEOUT = 30.0
+
+
+class WsConnectionPool:
+    """Pool of open websocket connections, grouped by endpoint and headers."""
+
+    def __init__(
+        self,
+        client_session: ClientSession,
+        max_per_endpoint: int = DEFAULT_MAX_PER_ENDPOINT,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+    ):
+        """
+        Initialize a `WsConnectionPool` instance.
+
+        Args:
+            client_session: The session used to open connections
+            max_per_endpoint: The maximum number of concurrent sends per endpoint
+            idle_timeout: The number of seconds an unused connection is kept open
+
+        """
+        self.client_session = client_session
+        self.idle_timeout = idle_timeout
+        self.max_per_endpoint = max_per_endpoint
+        self.logger = logging.getLogger(__name__)
+        self._idle: Dict[tuple, List[Tuple[ClientWebSocketResponse, float]]] = {}
+        self._limits: Dict[tuple, asyncio.Semaphore] = {}
+        self._readers: Dict[ClientWebSocketResponse, asyncio.Task] = {}
+        self._sweep_timer: asyncio.TimerHandle = None
+
+    @staticmethod
+    def pool_key(endpoint: str, headers: dict = None) -> tuple:
+        """Derive the pool key for an endpoint and its request headers."""
+        return (endpoint, tuple(sorted((headers or {}).items())))
+
+    @property
+    def open_count(self) -> int:
+        """Accessor for the number of open connections."""
+        return len(self._readers)
+
+    async def send(self, endpoint: str, payload: Union[str, bytes], headers: dict):
+        """
+        Send a message over a pooled connection, opening one if needed.
+
+        A pooled connection which fails is discarded and the message is sent
+        once more over a new connection.
+        """
+        key = self.pool_key(endpoint, headers)
+        limit = self._limits.get(key)
+        if not limit:
+            limit = self._limits[key] = asyncio.Semaphore(self.max_per_endpoint)
+        async with limit:
+            ws = self._acquire(key)
+            if ws:
+                try:
+                    await self._send(ws, payload)
+                except (ClientError, ConnectionError, RuntimeError) as e:
+                    self.logger.debug("Reconnecting to %s after error: %s", endpoint, e)
+                    await self._discard(ws)
+                    ws = None
+            if not ws:
+                ws = await self.client_session.ws_connect(endpoint, headers=headers)
+                self._readers[ws] = asyncio.ensure_future(self._drain(ws))
+                try:
+                    await self._send(ws, payload)
+                except Exception:
+                    await self._discard(ws)
+                    raise
+            self._release(key, ws)
+
+    @staticmethod
+    async def _send(ws: ClientWebSocketResponse, payload: Union[str, bytes]):
+        """Send a payload on an open websocket."""
+        if ws.closed:
+            raise ConnectionError("Websocket is closed")
+        if isinstance(payload, bytes):
+            await ws.send_bytes(payload)
+        else:
+            await ws.send_str(payload)
+
+    async def _drain(self, ws: ClientWebSocketResponse):
+        """Read from a connection to answer pings and detect when it closes."""
+        try:
+            async for _ in ws:
+                pass
+        except Exception:
+            self.logger.debug("Error reading pooled websocket", exc_info=True)
+        finally:
+            self._readers.pop(ws, None)
+
+    def _acquire(self, key: tuple) -> ClientWebSocketResponse:
+        """Take an open, recently used connection from the pool."""
+        idle = self._idle.get(key)
+        expired = time.perf_counter() - self.idle_timeout
+        while idle:
+            ws, last_used = idle.pop()
+            if not ws.closed and last_used > expired:
+                return ws
+            asyncio.ensure_future(self._discard(ws))
+        return None
+
+    def _release(self, key: tuple, ws: ClientWebSocketResponse):
+        """Return a connection to the pool."""
+        if not ws.closed:
+            self._idle.setdefault(key, []).append((ws, time.perf_counter()))
+            if not self._sweep_timer:
+                self._schedule_sweep(self.idle_timeout)
+
+    def _schedule_sweep(self, delay: float):
+        """Schedule the next sweep of idle connections."""
+        self._sweep_timer = asyncio.get_event_loop().call_later(delay, self._sweep)
+
+    def _sweep(self):
+        """Close connections which have been idle too long."""
+        self._sweep_timer = None
+        expired = time.perf_counter() - self.idle_timeout
+        next_expiry = None
+        for key in list(self._idle):
+            keep = []
+            for ws, last_used in self._idle[key]:
+                if ws.closed or last_used <= expired:
+                    asyncio.ensure_future(self._discard(ws))
+                else:
+                    keep.append((ws, last_used))
+                    if next_expiry is None or last_used < next_expiry:
+                        next_expiry = last_used
+            if keep:
+                self._idle[key] = keep
+            else:
+                del self._idle[key]
+                limit = self._limits.get(key)
+                if limit and not limit.locked():
+                    del self._limits[key]
+        if next_expiry is not None:
+            # run again once the oldest remaining connection expires
+            self._schedule_sweep(next_expiry - expired)
+
+    async def _discard(self, ws: ClientWebSocketResponse):
+        """Close a connection and stop its reader."""
+        reader = self._readers.pop(ws, None)
+        if not ws.closed:
+            await ws.close()
+        if reader and not reader.done():
+            reader.cancel()
+
+    async def close(self):
+        """Close all pooled connections."""
+        if self._sweep_timer:
+            self._sweep_timer.cancel()
+            self._sweep_timer = None
+        self._idle = {}
+        for ws in list(self._readers):
+            await self._discard(ws)
+
 
 class WsTransport(BaseOutboundTransport):
     """Websockets outbound transport class."""
@@ -18,15 +175,26 @@ class WsTransport(BaseOutboundTransport):
     def __init__(self) -> None:
         """Initialize an `WsTransport` instance."""
         super().__init__()
+        self.client_session: ClientSession = None
+        self.pool: WsConnectionPool = None
         self.logger = logging.getLogger(__name__)
 
     async def start(self):
         """Start the outbound transport."""
         self.client_session = ClientSession(cookie_jar=DummyCookieJar())
+        self.pool = WsConnectionPool(
+            self.client_session,
+            max_per_endpoint=self.settings.get("transport.outbound_max_per_endpoint")
+            or DEFAULT_MAX_PER_ENDPOINT,
+            idle_timeout=self.settings.get("transport.outbound_keepalive")
+            or DEFAULT_IDLE_TIMEOUT,
+        )
         return self
 
     async def stop(self):
         """Stop the outbound transport."""
+        await self.pool.close()
+        self.pool = None
         await self.client_session.close()
         self.client_session = None
 
@@ -36,6 +204,7 @@ class WsTransport(BaseOutboundTransport):
         payload: Union[str, bytes],
         endpoint: str,
         metadata: dict = None,
+        api_key: str = None,
     ):
         """
         Handle message from queue.
@@ -45,10 +214,9 @@ class WsTransport(BaseOutboundTransport):
             payload: message payload in string or byte format
             endpoint: URI endpoint for delivery
             metadata: Additional metadata associated with the payload
+            api_key: API key for the endpoint
         """
-        # aiohttp should automatically handle websocket sessions
-        async with self.client_session.ws_connect(endpoint, headers=metadata) as ws:
-            if isinstance(payload, bytes):
-                await ws.send_bytes(payload)
-            else:
-                await ws.send_str(payload)
+        headers = dict(metadata or {})
+        if api_key is not None:
+            headers["x-api-key"] = api_key
+        await self.pool.send(endpoint, payload, headers)
@@ -3,7 +3,7 @@
 import json
 
 from collections import OrderedDict
-from typing import Callable, Optional, Sequence, Tuple
+from typing import Callable, Mapping, Optional, Sequence, Tuple
 
 import nacl.bindings
 import nacl.exceptions
@@ -408,6 +408,45 @@ def decode_pack_message(
     return message, sender_vk, recip_vk
 
 
+def decode_pack_message_with_keys(
+    enc_message: bytes, recip_secrets: Mapping[str, bytes]
+) -> Tuple[str, Optional[str], str]:
+    """
+    Decode a packed message given the private keys of its candidate recipients.
+
+    Unlike `decode_pack_message`, the arguments can be sent to another process.
+
+    Args:
+        enc_message: The encrypted message
+        recip_secrets: Mapping of recipient verkey to private key
+
+    Returns:
+        A tuple of (message, sender_vk, recip_vk)
+
+    """
+    return decode_pack_message(enc_message, recip_secrets.get)
+
+
+def extract_pack_recipient_keys(enc_message: bytes) -> Sequence[str]:
+    """
+    Extract the recipient verkeys from a packed message without decrypting it.
+
+    Args:
+        enc_message: The encrypted message
+
+    Raises:
+        ValueError: If the packed message is invalid
+
+    """
+    try:
+        wrapper = json.loads(enc_message)
+        recips_json = b64_to_bytes(wrapper["protected"], urlsafe=True)
+        recipients = json.loads(recips_json)["recipients"]
+        return [recip["header"]["kid"] for recip in recipients]
+    except (KeyError, TypeError, ValueError):
+        raise ValueError("Invalid packed message")
+
+
 def decode_pack_message_outer(enc_message: bytes) -> Tuple[dict, dict, bool]:
     """
     Decode the outer wrapper of a packed message and extract the recipients.
@@ -0,0 +1,155 @@
+"""Executor for running envelope cryptography off the event loop."""
+
+import asyncio
+import os
+
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Mapping, Optional, Sequence, Tuple
+
+from .crypto import decode_pack_message_with_keys, encode_pack_message
+from .error import WalletError
+
+EXECUTOR_MODES = ("thread", "process")
+
+
+def run_batch(
+    calls: Sequence[Tuple[Callable, tuple]]
+) -> Sequence[Tuple[bool, object]]:
+    """
+    Run a batch of calls in a worker, capturing each result or exception.
+
+    Args:
+        calls: A sequence of (function, arguments) pairs
+
+    Returns:
+        A list of (success, result or exception) pairs in the same order
+
+    """
+    results = []
+    for fn, args in calls:
+        try:
+            results.append((True, fn(*args)))
+        except Exception as e:
+            results.append((False, e))
+    return results
+
+
+class CryptoExecutor:
+    """
+    Run CPU-bound pack and unpack operations in a thread or process pool.
+
+    Calls submitted during the same event loop iteration are gathered into
+    batches, so that a busy agent hands work to the pool in a few large
+    submissions rather than one per message.
+    """
+
+    def __init__(
+        self, mode: str = "thread", max_workers: int = None, batch_size: int = 32
+    ):
+        """
+        Initialize a `CryptoExecutor` instance.
+
+        Args:
+            mode: One of 'thread' or 'process'
+            max_workers: The size of the worker pool, defaulting to the CPU count
+            batch_size: The maximum number of calls handed to a worker at once
+
+        """
+        if mode not in EXECUTOR_MODES:
+            raise WalletError(f"Unsupported crypto executor mode: {mode}")
+        self.mode = mode
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.batch_size = max(batch_size, 1)
+        self._executor: Optional[Executor] = None
+        self._pending = []
+        self._flush_scheduled = False
+
+    @property
+    def executor(self) -> Executor:
+        """Accessor for the underlying pool, created on first use."""
+        if not self._executor:
+            pool_cls = (
+                ThreadPoolExecutor if self.mode == "thread" else ProcessPoolExecutor
+            )
+            self._executor = pool_cls(max_workers=self.max_workers)
+        return self._executor
+
+    async def run(self, fn: Callable, *args):
+        """
+        Run a picklable module-level function in the pool.
+
+        Args:
+            fn: The function to run
+            args: Positional arguments for the function
+
+        Returns:
+            The result of the function
+
+        """
+        loop = asyncio.get_event_loop()
+        future = loop.create_future()
+        self._pending.append((fn, args, future))
+        if len(self._pending) >= self.batch_size:
+            self._flush()
+        elif not self._flush_scheduled:
+            self._flush_scheduled = True
+            loop.call_soon(self._flush)
+        return await future
+
+    def _flush(self):
+        """Hand the pending calls to the pool in batches."""
+        self._flush_scheduled = False
+        pending, self._pending = self._pending, []
+        loop = asyncio.get_event_loop()
+        while pending:
+            batch = pending[: self.batch_size]
+            del pending[: self.batch_size]
+            calls = [(fn, args) for (fn, args, _) in batch]
+            futures = [fut for (_, _, fut) in batch]
+            try:
+                task = loop.run_in_executor(self.executor, run_batch, calls)
+            except RuntimeError as e:
+                for fut in futures:
+                    if not fut.done():
+                        fut.set_exception(WalletError(str(e)))
+                continue
+            task.add_done_callback(
+                lambda done, futures=futures: self._resolve(done, futures)
+            )
+
+    @staticmethod
+    def _resolve(done: asyncio.Future, futures: Sequence[asyncio.Future]):
+        """Distribute the results of a completed batch to the waiting callers."""
+        exc = done.exception() if not done.cancelled() else asyncio.CancelledError()
+        if exc:
+            for fut in futures:
+                if not fut.done():
+                    fut.set_exception(exc)
+            return
+        for fut, (success, value) in zip(futures, done.result()):
+            if fut.done():
+                continue
+            if success:
+                fut.set_result(value)
+            else:
+                fut.set_exception(value)
+
+    async def pack(
+        self, message: str, to_verkeys: Sequence[bytes], from_secret: bytes = None
+    ) -> bytes:
+        """Encode a packed message in the pool."""
+        return await self.run(encode_pack_message, message, to_verkeys, from_secret)
+
+    async def unpack(
+        self, enc_message: bytes, recip_secrets: Mapping[str, bytes]
+    ) -> Tuple[str, Optional[str], str]:
+        """Decode a packed message in the pool given the candidate recipient keys."""
+        return await self.run(
+            decode_pack_message_with_keys, enc_message, dict(recip_secrets)
+        )
+
+    def shutdown(self, wait: bool = True):
+        """Shut down the worker pool."""
+        if self._executor:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
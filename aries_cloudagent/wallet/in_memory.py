@@ -14,7 +14,9 @@ from .crypto import (
     verify_signed_message,
     encode_pack_message,
     decode_pack_message,
+    extract_pack_recipient_keys,
 )
+from .crypto_executor import CryptoExecutor
 from .error import WalletError, WalletDuplicateError, WalletNotFoundError
 from .util import b58_to_bytes, bytes_to_b58
 
@@ -141,6 +143,7 @@ class InMemoryWallet(BaseWallet):
             raise WalletError("Key rotation not in progress for DID: {}".format(did))
         verkey_enc = temp_keys[0]
 
+        old_verkey = self.profile.local_dids[did]["verkey"]
         self.profile.local_dids[did].update(
             {
                 "seed": self.profile.keys[verkey_enc]["seed"],
@@ -149,6 +152,8 @@ class InMemoryWallet(BaseWallet):
             }
         )
         self.profile.keys.pop(verkey_enc)
+        self._unindex_verkey(did, old_verkey)
+        self.profile.local_did_verkeys.setdefault(verkey_enc, did)
         return DIDInfo(did, verkey_enc, self.profile.local_dids[did]["metadata"].copy())
 
     async def create_local_did(
@@ -185,8 +190,20 @@ class InMemoryWallet(BaseWallet):
             "verkey": verkey_enc,
             "metadata": metadata.copy() if metadata else {},
         }
+        self.profile.local_did_verkeys.setdefault(verkey_enc, did)
         return DIDInfo(did, verkey_enc, self.profile.local_dids[did]["metadata"].copy())
 
+    def _unindex_verkey(self, did: str, verkey: str):
+        """Remove a DID's former verkey from the verkey index."""
+        index = self.profile.local_did_verkeys
+        if index.get(verkey) == did:
+            del index[verkey]
+            # another local DID may share the verkey
+            for other_did, info in self.profile.local_dids.items():
+                if info["verkey"] == verkey:
+                    index[verkey] = other_did
+                    break
+
     def _get_did_info(self, did: str) -> DIDInfo:
         """
         Convert internal DID record to DIDInfo.
@@ -244,10 +261,10 @@ class InMemoryWallet(BaseWallet):
             WalletNotFoundError: If the verkey is not found
 
         """
-        for did, info in self.profile.local_dids.items():
-            if info["verkey"] == verkey:
-                return self._get_did_info(did)
-        raise WalletNotFoundError("Verkey not found: {}".format(verkey))
+        did = self.profile.local_did_verkeys.get(verkey)
+        if did is None:
+            raise WalletNotFoundError("Verkey not found: {}".format(verkey))
+        return self._get_did_info(did)
 
     async def replace_local_did_metadata(self, did: str, metadata: dict):
         """
@@ -279,16 +296,34 @@ class InMemoryWallet(BaseWallet):
             WalletError: If the private key is not found
 
         """
-
-        keys_and_dids = list(self.profile.local_dids.values()) + list(
-            self.profile.keys.values()
-        )
-        for info in keys_and_dids:
-            if info["verkey"] == verkey:
-                return info["secret"]
+        did = self.profile.local_did_verkeys.get(verkey)
+        if did is not None:
+            return self.profile.local_dids[did]["secret"]
+        if verkey in self.profile.keys:
+            return self.profile.keys[verkey]["secret"]
 
         raise WalletError("Private key not found for verkey: {}".format(verkey))
 
+    def _get_recipient_secrets(self, verkeys: Sequence[str]) -> dict:
+        """
+        Resolve the private keys held by this wallet for a set of verkeys.
+
+        Args:
+            verkeys: The candidate recipient verkeys
+
+        Returns:
+            A mapping of verkey to private key for the keys found
+
+        """
+        secrets = {}
+        for verkey in verkeys:
+            did = self.profile.local_did_verkeys.get(verkey)
+            if did is not None:
+                secrets[verkey] = self.profile.local_dids[did]["secret"]
+            elif verkey in self.profile.keys:
+                secrets[verkey] = self.profile.keys[verkey]["secret"]
+        return secrets
+
     async def sign_message(self, message: bytes, from_verkey: str) -> bytes:
         """
         Sign a message using the private key associated with a given verkey.
@@ -366,6 +401,12 @@ class InMemoryWallet(BaseWallet):
 
         keys_bin = [b58_to_bytes(key) for key in to_verkeys]
         secret = self._get_private_key(from_verkey) if from_verkey else None
+        executor = self.profile.inject(CryptoExecutor, required=False)
+        if executor:
+            try:
+                return await executor.pack(message, keys_bin, secret)
+            except ValueError as e:
+                raise WalletError("Message could not be packed: {}".format(str(e)))
         result = await asyncio.get_event_loop().run_in_executor(
             None, lambda: encode_pack_message(message, keys_bin, secret)
         )
@@ -388,6 +429,16 @@ class InMemoryWallet(BaseWallet):
         """
         if not enc_message:
             raise WalletError("Message not provided")
+        executor = self.profile.inject(CryptoExecutor, required=False)
+        if executor:
+            # resolve keys here, as the wallet state is not shared with the pool
+            try:
+                recip_secrets = self._get_recipient_secrets(
+                    extract_pack_recipient_keys(enc_message)
+                )
+                return await executor.unpack(enc_message, recip_secrets)
+            except ValueError as e:
+                raise WalletError("Message could not be unpacked: {}".format(str(e)))
         try:
             (
                 message,
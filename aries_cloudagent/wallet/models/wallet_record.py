@@ -1,11 +1,12 @@
 """Wallet record."""
 
-from typing import Any, Optional
+from typing import Any, Optional, Sequence
 
 from marshmallow import fields
 from marshmallow import validate
 from marshmallow.utils import EXCLUDE
 
+from ...core.profile import ProfileSession
 from ...messaging.models.base_record import (
     BaseRecord,
     BaseRecordSchema,
@@ -106,6 +107,41 @@ class WalletRecord(BaseRecord):
         else:
             return True
 
+    async def post_save(
+        self,
+        session: ProfileSession,
+        new_record: bool,
+        last_state: str,
+        webhook: bool = None,
+    ):
+        """Forget cached copies of the record once it is updated."""
+        await super().post_save(session, new_record, last_state, webhook)
+        if not new_record:
+            self.invalidate_cached(session, [self])
+
+    async def delete_record(self, session: ProfileSession):
+        """Remove the stored record and forget cached copies of it."""
+        await super().delete_record(session)
+        self.invalidate_cached(session, [self])
+
+    @classmethod
+    async def delete_all(
+        cls, session: ProfileSession, records: Sequence["WalletRecord"]
+    ):
+        """Remove several stored records and forget cached copies of them."""
+        await super().delete_all(session, records)
+        cls.invalidate_cached(session, records)
+
+    @staticmethod
+    def invalidate_cached(session: ProfileSession, records: Sequence["WalletRecord"]):
+        """Forget the copies of wallet records cached by the multitenant manager."""
+        from ...multitenant.manager import MultitenantManager
+
+        multitenant_mgr = session.inject(MultitenantManager, required=False)
+        if multitenant_mgr:
+            for record in records:
+                multitenant_mgr.invalidate_wallet(record.wallet_id)
+
     def __eq__(self, other: Any) -> bool:
         """Comparison between records."""
         return super().__eq__(other)
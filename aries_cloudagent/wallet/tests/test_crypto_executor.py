@@ -0,0 +1,69 @@
+import asyncio
+import pytest
+
+from ...core.in_memory import InMemoryProfile
+from ..crypto_executor import CryptoExecutor, run_batch
+from ..error import WalletError
+from ..in_memory import InMemoryWallet
+
+
+def fail(message):
+    raise ValueError(message)
+
+
+class TestCryptoExecutor:
+    test_seed = "testseed000000000000000000000001"
+    test_verkey = "3Dn1SJNPaCXcvvJvSbsFWP2xaCjMom3can8CQNhWrTRx"
+    test_target_seed = "testseed000000000000000000000002"
+    test_target_verkey = "9WCgWKUaAJj3VWxxtzvvMQN3AoFxoBtBDo9ntwJnVVCC"
+    test_message = "test message"
+
+    def test_bad_mode(self):
+        with pytest.raises(WalletError):
+            CryptoExecutor("fibers")
+
+    def test_run_batch(self):
+        (ok, size), (failed, exc) = run_batch([(len, ("abc",)), (fail, ("oops",))])
+        assert ok and size == 3
+        assert not failed and isinstance(exc, ValueError)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("mode", ["thread", "process"])
+    async def test_wallet_pack_unpack(self, mode):
+        profile = InMemoryProfile.test_profile()
+        executor = CryptoExecutor(mode, max_workers=2, batch_size=4)
+        profile.context.injector.bind_instance(CryptoExecutor, executor)
+        wallet = InMemoryWallet(profile)
+        await wallet.create_local_did(self.test_seed)
+        await wallet.create_local_did(self.test_target_seed)
+
+        try:
+            packed = await asyncio.gather(
+                *[
+                    wallet.pack_message(
+                        f"{self.test_message} {idx}",
+                        [self.test_target_verkey],
+                        self.test_verkey,
+                    )
+                    for idx in range(10)
+                ]
+            )
+            unpacked = await asyncio.gather(
+                *[wallet.unpack_message(msg) for msg in packed]
+            )
+            for idx, (message, from_verkey, to_verkey) in enumerate(unpacked):
+                assert message == f"{self.test_message} {idx}"
+                assert from_verkey == self.test_verkey
+                assert to_verkey == self.test_target_verkey
+
+            with pytest.raises(WalletError):
+                await wallet.unpack_message(b"bad")
+            with pytest.raises(WalletError):
+                await wallet.unpack_message(
+                    await wallet.pack_message(
+                        self.test_message,
+                        ["JAfHCRDH9ZW5E7m4mofjr8cpAHaZdiRQ94it75aXUPK3"],
+                    )
+                )
+        finally:
+            executor.shutdown()
@@ -112,6 +112,14 @@ class TestInMemoryWallet:
         assert new_info.did == self.test_did
         assert new_info.verkey != info.verkey
 
+        found = await wallet.get_local_did_for_verkey(new_verkey)
+        assert found.did == self.test_did
+        with pytest.raises(WalletNotFoundError):
+            await wallet.get_local_did_for_verkey(info.verkey)
+        assert await wallet.sign_message(b"message", new_verkey)
+        with pytest.raises(WalletError):
+            await wallet.sign_message(b"message", info.verkey)
+
     @pytest.mark.asyncio
     async def test_create_local_with_did(self, wallet):
         info = await wallet.create_local_did(None, self.test_did)
@@ -0,0 +1,71 @@
+"""
+Microbenchmark for model serialization and deserialization.
+
+Compares building a new schema instance per call with the pooled schema
+instances used by BaseModel. Run from the repository root:
+
+    PYTHONPATH=. python scripts/bench_models.py [iterations]
+"""
+
+import sys
+import timeit
+
+from marshmallow import EXCLUDE
+
+from aries_cloudagent.connections.models.conn_record import ConnRecord
+from aries_cloudagent.protocols.basicmessage.v1_0.messages.basicmessage import (
+    BasicMessage,
+)
+
+
+def uncached_serialize(model):
+    """Serialize a model with a newly built schema."""
+    return model.Schema(unknown=EXCLUDE).dump(model)
+
+
+def uncached_deserialize(cls, data):
+    """Deserialize a model with a newly built schema."""
+    return cls._get_schema_class()(unknown=EXCLUDE).load(dict(data))
+
+
+def main(iterations: int):
+    """Time each case and print the per-call results."""
+    message = BasicMessage(content="Hello")
+    message.assign_thread_id("thread-id")
+    message_data = message.serialize()
+    record = ConnRecord(
+        my_did="55GkHamhTU1ZbTbV2ab9DE",
+        their_did="4rBdLmLiGCdKZ7yZpmiakG",
+        their_label="Bob",
+        state=ConnRecord.State.COMPLETED.rfc160,
+    )
+
+    cases = (
+        (
+            "BasicMessage.serialize",
+            lambda: uncached_serialize(message),
+            message.serialize,
+        ),
+        (
+            "BasicMessage.deserialize",
+            lambda: uncached_deserialize(BasicMessage, message_data),
+            lambda: BasicMessage.deserialize(dict(message_data)),
+        ),
+        (
+            "ConnRecord.serialize",
+            lambda: uncached_serialize(record),
+            record.serialize,
+        ),
+    )
+    for name, before, after in cases:
+        t_before = timeit.timeit(before, number=iterations)
+        t_after = timeit.timeit(after, number=iterations)
+        print(
+            f"{name:28} new schema {t_before / iterations * 1e6:8.1f}us"
+            f"  pooled {t_after / iterations * 1e6:8.1f}us"
+            f"  ({t_before / t_after:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)